@@ -0,0 +1,62 @@
+"""
+Per-Request Agent Copy Performance Evaluation
+=============================================
+
+Compares the cost of deep_copy() with shallow_copy(), used by AgentOS to isolate each request.
+"""
+
+from typing import Literal
+
+from agno.agent import Agent
+from agno.eval.performance import PerformanceEval
+from agno.models.openai import OpenAIChat
+from agno.tools.calculator import CalculatorTools
+
+
+# ---------------------------------------------------------------------------
+# Create Benchmark Agent
+# ---------------------------------------------------------------------------
+def get_weather(city: Literal["nyc", "sf"]):
+    """Use this to get weather information."""
+    if city == "nyc":
+        return "It might be cloudy in nyc"
+    elif city == "sf":
+        return "It's always sunny in sf"
+
+
+agent = Agent(
+    model=OpenAIChat(id="gpt-4o"),
+    tools=[get_weather, CalculatorTools()],
+    instructions=["Answer in one sentence."],
+    session_state={"shopping_list": []},
+    metadata={"team": "benchmarks"},
+)
+
+
+# ---------------------------------------------------------------------------
+# Create Benchmark Functions
+# ---------------------------------------------------------------------------
+def deep_copy_agent():
+    return agent.deep_copy()
+
+
+def shallow_copy_agent():
+    return agent.shallow_copy()
+
+
+# ---------------------------------------------------------------------------
+# Create Evaluations
+# ---------------------------------------------------------------------------
+deep_copy_perf = PerformanceEval(
+    name="Agent deep_copy", func=deep_copy_agent, num_iterations=1000
+)
+shallow_copy_perf = PerformanceEval(
+    name="Agent shallow_copy", func=shallow_copy_agent, num_iterations=1000
+)
+
+# ---------------------------------------------------------------------------
+# Run Evaluations
+# ---------------------------------------------------------------------------
+if __name__ == "__main__":
+    deep_copy_perf.run(print_results=True, print_summary=True)
+    shallow_copy_perf.run(print_results=True, print_summary=True)
@@ -1030,6 +1030,7 @@ def handle_model_response_stream(
         tools=tools,
         tool_choice=agent.tool_choice,
         tool_call_limit=agent.tool_call_limit,
+        tool_call_concurrency=agent.tool_call_concurrency,
         stream_model_response=stream_model_response,
         run_response=run_response,
         send_media_to_model=agent.send_media_to_model,
@@ -502,6 +502,7 @@ def _run(
                     tools=_tools,
                     tool_choice=agent.tool_choice,
                     tool_call_limit=agent.tool_call_limit,
+                    tool_call_concurrency=agent.tool_call_concurrency,
                     response_format=response_format,
                     run_response=run_response,
                     send_media_to_model=agent.send_media_to_model,
@@ -2851,6 +2852,7 @@ def _continue_run(
                     tools=tools,
                     tool_choice=agent.tool_choice,
                     tool_call_limit=agent.tool_call_limit,
+                    tool_call_concurrency=agent.tool_call_concurrency,
                     run_response=run_response,
                     send_media_to_model=agent.send_media_to_model,
                     compression_manager=agent.compression_manager if agent.compress_tool_results else None,
@@ -120,13 +120,21 @@ async def aget_last_run_output(agent: Agent, session_id: Optional[str] = None) -
 
 
 def read_session(
-    agent: Agent, session_id: str, session_type: SessionType = SessionType.AGENT, user_id: Optional[str] = None
+    agent: Agent,
+    session_id: str,
+    session_type: SessionType = SessionType.AGENT,
+    user_id: Optional[str] = None,
+    last_n_runs: Optional[int] = None,
 ) -> Optional[Union[AgentSession, TeamSession, WorkflowSession]]:
     """Get a Session from the database."""
     try:
         if not agent.db:
             raise ValueError("Db not initialized")
-        return agent.db.get_session(session_id=session_id, session_type=session_type, user_id=user_id)  # type: ignore
+        # Only pass the run window when set, so custom db implementations without it keep working
+        window_kwargs: Dict[str, Any] = {"last_n_runs": last_n_runs} if last_n_runs is not None else {}
+        return agent.db.get_session(  # type: ignore
+            session_id=session_id, session_type=session_type, user_id=user_id, **window_kwargs
+        )
     except Exception as e:
         import traceback
 
@@ -136,7 +144,11 @@ def read_session(
 
 
 async def aread_session(
-    agent: Agent, session_id: str, session_type: SessionType = SessionType.AGENT, user_id: Optional[str] = None
+    agent: Agent,
+    session_id: str,
+    session_type: SessionType = SessionType.AGENT,
+    user_id: Optional[str] = None,
+    last_n_runs: Optional[int] = None,
 ) -> Optional[Union[AgentSession, TeamSession, WorkflowSession]]:
     """Get a Session from the database."""
     from agno.agent import _init
@@ -144,10 +156,16 @@ async def aread_session(
     try:
         if not agent.db:
             raise ValueError("Db not initialized")
+        # Only pass the run window when set, so custom db implementations without it keep working
+        window_kwargs: Dict[str, Any] = {"last_n_runs": last_n_runs} if last_n_runs is not None else {}
         if _init.has_async_db(agent):
-            return await agent.db.get_session(session_id=session_id, session_type=session_type, user_id=user_id)  # type: ignore
+            return await agent.db.get_session(  # type: ignore
+                session_id=session_id, session_type=session_type, user_id=user_id, **window_kwargs
+            )
         else:
-            return agent.db.get_session(session_id=session_id, session_type=session_type, user_id=user_id)  # type: ignore
+            return agent.db.get_session(  # type: ignore
+                session_id=session_id, session_type=session_type, user_id=user_id, **window_kwargs
+            )
     except Exception as e:
         import traceback
 
@@ -251,6 +269,23 @@ def get_session_metrics_internal(agent: Agent, session: AgentSession):
         return Metrics()
 
 
+def get_history_runs_window(agent: Agent) -> Optional[int]:
+    """Get the number of history runs a run needs loaded from the session, or None if it needs all runs."""
+    if not agent.add_history_to_context or agent.num_history_runs is None or agent.num_history_messages is not None:
+        return None
+    # Cached sessions outlive the run, and these features read runs beyond the history window
+    if (
+        agent.cache_session
+        or agent.read_chat_history
+        or agent.read_tool_call_history
+        or agent.search_session_history
+        or agent.enable_session_summaries
+        or agent.add_session_summary_to_context
+    ):
+        return None
+    return agent.num_history_runs
+
+
 def read_or_create_session(
     agent: Agent,
     session_id: str,
@@ -272,7 +307,10 @@ def read_or_create_session(
     if agent.db is not None and agent.team_id is None and agent.workflow_id is None:
         log_debug(f"Reading AgentSession: {session_id}")
 
-        agent_session = cast(AgentSession, read_session(agent, session_id=session_id, user_id=user_id))
+        agent_session = cast(
+            AgentSession,
+            read_session(agent, session_id=session_id, user_id=user_id, last_n_runs=get_history_runs_window(agent)),
+        )
 
     if agent_session is None:
         # Creating new session if none found
@@ -335,9 +373,17 @@ async def aread_or_create_session(
     if agent.db is not None and agent.team_id is None and agent.workflow_id is None:
         log_debug(f"Reading AgentSession: {session_id}")
         if _init.has_async_db(agent):
-            agent_session = cast(AgentSession, await aread_session(agent, session_id=session_id, user_id=user_id))
+            agent_session = cast(
+                AgentSession,
+                await aread_session(
+                    agent, session_id=session_id, user_id=user_id, last_n_runs=get_history_runs_window(agent)
+                ),
+            )
         else:
-            agent_session = cast(AgentSession, read_session(agent, session_id=session_id, user_id=user_id))
+            agent_session = cast(
+                AgentSession,
+                read_session(agent, session_id=session_id, user_id=user_id, last_n_runs=get_history_runs_window(agent)),
+            )
 
     if agent_session is None:
         # Creating new session if none found
@@ -531,6 +577,8 @@ def to_dict(agent: Agent) -> Dict[str, Any]:
 
     if agent.tool_call_limit is not None:
         config["tool_call_limit"] = agent.tool_call_limit
+    if agent.tool_call_concurrency is not None:
+        config["tool_call_concurrency"] = agent.tool_call_concurrency
     if agent.tool_choice is not None:
         config["tool_choice"] = agent.tool_choice
 
@@ -879,6 +927,7 @@ def from_dict(cls: Type[Agent], data: Dict[str, Any], registry: Optional[Registr
         # --- Tools ---
         tools=config.get("tools"),
         tool_call_limit=config.get("tool_call_limit"),
+        tool_call_concurrency=config.get("tool_call_concurrency"),
         tool_choice=config.get("tool_choice"),
         # --- Reasoning settings ---
         reasoning=config.get("reasoning", False),
@@ -155,6 +155,56 @@ def deep_copy(agent: Agent, *, update: Optional[Dict[str, Any]] = None) -> Agent
         raise
 
 
+# Fields a run or the caller may mutate in place, copied by shallow_copy
+SHALLOW_COPY_STATE_FIELDS = ("session_state", "dependencies", "metadata")
+
+
+def shallow_copy(agent: Agent, *, update: Optional[Dict[str, Any]] = None) -> Agent:
+    """Create and return a lightweight copy of this Agent for a single run, optionally updating fields.
+
+    Unlike deep_copy, this does not run __init__ or copy the configuration: models, knowledge, hooks
+    and the other settings are shared with the original, which must not be modified while copies are in use.
+    Only the state a run may mutate is isolated: session_state, dependencies, metadata and the tools are
+    copied like deep_copy does, sharing MCP tools, and the internal run state is reset.
+
+    Args:
+        agent: The Agent instance to copy.
+        update (Optional[Dict[str, Any]]): Optional dictionary of fields for the new Agent.
+
+    Returns:
+        Agent: A new Agent instance.
+    """
+    from copy import copy
+
+    new_agent = copy(agent)
+
+    for field_name in SHALLOW_COPY_STATE_FIELDS:
+        field_value = getattr(agent, field_name, None)
+        if field_value is not None:
+            setattr(new_agent, field_name, deep_copy_field(agent, field_name, field_value))
+    if isinstance(agent.tools, list):
+        # Toolkits may keep per-run state, so each copy gets its own
+        new_agent.tools = deep_copy_field(agent, "tools", agent.tools)
+    if agent.reasoning_agent is not None:
+        new_agent.reasoning_agent = agent.reasoning_agent.shallow_copy()
+
+    # Reset the internal run state
+    new_agent._cached_session = None
+    new_agent._tool_instructions = None
+    new_agent._mcp_tools_initialized_on_run = []
+    new_agent._connectable_tools_initialized_on_run = []
+    new_agent._callable_tools_cache = {}
+    new_agent._callable_knowledge_cache = {}
+    # Share the background thread pool instead of starting one per copy
+    new_agent._background_executor = agent.background_executor
+
+    if update:
+        for field_name, field_value in update.items():
+            setattr(new_agent, field_name, field_value)
+
+    return new_agent
+
+
 def deep_copy_field(agent: Agent, field_name: str, field_value: Any) -> Any:
     """Helper function to deep copy a field based on its type."""
     from copy import copy, deepcopy
@@ -160,6 +160,9 @@ class Agent:
 
     # Maximum number of tool calls allowed.
     tool_call_limit: Optional[int] = None
+    # Maximum number of tool calls from a single model response to run in parallel threads.
+    # Only applies to sync runs, async runs always run tool calls concurrently. Tool calls run sequentially if not set.
+    tool_call_concurrency: Optional[int] = None
     # Controls which (if any) tool is called by the model.
     # "none" means the model will not call a tool and instead generates a message.
     # "auto" means the model can pick between generating a message or calling a tool.
@@ -400,6 +403,7 @@ class Agent:
         metadata: Optional[Dict[str, Any]] = None,
         tools: Optional[Union[Sequence[Union[Toolkit, Callable, Function, Dict]], Callable[..., List]]] = None,
         tool_call_limit: Optional[int] = None,
+        tool_call_concurrency: Optional[int] = None,
         tool_choice: Optional[Union[str, Dict[str, Any]]] = None,
         tool_hooks: Optional[List[Callable]] = None,
         pre_hooks: Optional[List[Union[Callable[..., Any], BaseGuardrail, BaseEval]]] = None,
@@ -549,6 +553,7 @@ class Agent:
         else:
             self.tools = list(tools)  # type: ignore[arg-type]
         self.tool_call_limit = tool_call_limit
+        self.tool_call_concurrency = tool_call_concurrency
         self.tool_choice = tool_choice
         self.tool_hooks = tool_hooks
 
@@ -831,6 +836,9 @@ class Agent:
     def deep_copy(self, *, update: Optional[Dict[str, Any]] = None) -> Agent:
         return _utils.deep_copy(self, update=update)
 
+    def shallow_copy(self, *, update: Optional[Dict[str, Any]] = None) -> Agent:
+        return _utils.shallow_copy(self, update=update)
+
     # ---------------------------------------------------------------
     # _storage module delegates
     # ---------------------------------------------------------------
@@ -11,6 +11,7 @@ from agno.db.schemas import UserMemory
 from agno.db.schemas.culture import CulturalKnowledge
 from agno.db.schemas.evals import EvalFilterType, EvalRunRecord, EvalType
 from agno.db.schemas.knowledge import KnowledgeRow
+from agno.db.utils import filter_session_runs, find_session_run, get_stored_session_runs
 from agno.session import Session
 
 
@@ -50,6 +51,7 @@ class BaseDb(ABC):
         schedules_table: Optional[str] = None,
         schedule_runs_table: Optional[str] = None,
         approvals_table: Optional[str] = None,
+        runs_table: Optional[str] = None,
         id: Optional[str] = None,
     ):
         self.id = id or str(uuid4())
@@ -69,6 +71,8 @@ class BaseDb(ABC):
         self.schedules_table_name = schedules_table or "agno_schedules"
         self.schedule_runs_table_name = schedule_runs_table or "agno_schedule_runs"
         self.approvals_table_name = approvals_table or "agno_approvals"
+        # Runs are stored in the session row unless a separate runs table is configured
+        self.runs_table_name: Optional[str] = runs_table
 
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -161,6 +165,7 @@ class BaseDb(ABC):
         session_type: SessionType,
         user_id: Optional[str] = None,
         deserialize: Optional[bool] = True,
+        last_n_runs: Optional[int] = None,
     ) -> Optional[Union[Session, Dict[str, Any]]]:
         raise NotImplementedError
 
@@ -208,6 +213,44 @@ class BaseDb(ABC):
         """Bulk upsert multiple sessions for improved performance on large datasets."""
         raise NotImplementedError
 
+    # --- Runs ---
+    def get_run(self, run_id: str, session_id: str, session_type: SessionType) -> Optional[Dict[str, Any]]:
+        """Read a single run of a session, as a dictionary, without deserializing the session.
+
+        Databases that can look up a run directly override this. By default the run is found in the stored session.
+
+        Args:
+            run_id (str): ID of the run to read.
+            session_id (str): ID of the session the run belongs to.
+            session_type (SessionType): Type of the session.
+
+        Returns:
+            Optional[Dict[str, Any]]: The serialized run, or None if not found.
+        """
+        session = self.get_session(session_id=session_id, session_type=session_type, deserialize=False)
+        return find_session_run(get_stored_session_runs(session, session_type), run_id)
+
+    def list_runs(
+        self,
+        session_id: str,
+        session_type: SessionType,
+        status: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Read the runs of a session, as dictionaries, without deserializing the session.
+
+        Args:
+            session_id (str): ID of the session to read the runs of.
+            session_type (SessionType): Type of the session.
+            status (Optional[str]): Only return the runs with this status, e.g. "RUNNING".
+            limit (Optional[int]): Maximum number of runs to return. The most recent runs are kept.
+
+        Returns:
+            List[Dict[str, Any]]: The serialized runs, in session order.
+        """
+        session = self.get_session(session_id=session_id, session_type=session_type, deserialize=False)
+        return filter_session_runs(get_stored_session_runs(session, session_type), status=status, limit=limit)
+
     # --- Memory ---
     @abstractmethod
     def clear_memories(self) -> None:
@@ -396,6 +439,17 @@ class BaseDb(ABC):
         """
         raise NotImplementedError
 
+    def upsert_traces(self, traces: List["Trace"]) -> None:
+        """Create or update multiple trace records in the database.
+
+        Databases supporting it override this to write all traces at once.
+
+        Args:
+            traces: The Trace objects to store (one per trace_id).
+        """
+        for trace in traces:
+            self.upsert_trace(trace)
+
     @abstractmethod
     def get_trace(
         self,
@@ -501,7 +555,7 @@ class BaseDb(ABC):
 
     @abstractmethod
     def create_spans(self, spans: List) -> None:
-        """Create multiple spans in the database as a batch.
+        """Create multiple spans in the database as a batch. The spans may belong to different traces.
 
         Args:
             spans: List of Span objects to store.
@@ -1002,6 +1056,16 @@ class BaseDb(ABC):
         """Atomically claim a due schedule for execution."""
         raise NotImplementedError
 
+    def claim_due_schedules(
+        self, worker_id: str, limit: int = 10, lock_grace_seconds: int = 300
+    ) -> List[Dict[str, Any]]:
+        """Atomically claim up to `limit` due schedules for execution, earliest due first."""
+        raise NotImplementedError
+
+    def get_next_schedule_run_at(self) -> Optional[int]:
+        """Get the earliest next_run_at of the enabled, unclaimed schedules."""
+        raise NotImplementedError
+
     def release_schedule(self, schedule_id: str, next_run_at: Optional[int] = None) -> bool:
         """Release a claimed schedule and optionally update next_run_at."""
         raise NotImplementedError
@@ -1164,6 +1228,7 @@ class AsyncBaseDb(ABC):
         session_type: SessionType,
         user_id: Optional[str] = None,
         deserialize: Optional[bool] = True,
+        last_n_runs: Optional[int] = None,
     ) -> Optional[Union[Session, Dict[str, Any]]]:
         raise NotImplementedError
 
@@ -1201,6 +1266,42 @@ class AsyncBaseDb(ABC):
     ) -> Optional[Union[Session, Dict[str, Any]]]:
         raise NotImplementedError
 
+    # --- Runs ---
+    async def get_run(self, run_id: str, session_id: str, session_type: SessionType) -> Optional[Dict[str, Any]]:
+        """Read a single run of a session, as a dictionary, without deserializing the session.
+
+        Args:
+            run_id (str): ID of the run to read.
+            session_id (str): ID of the session the run belongs to.
+            session_type (SessionType): Type of the session.
+
+        Returns:
+            Optional[Dict[str, Any]]: The serialized run, or None if not found.
+        """
+        session = await self.get_session(session_id=session_id, session_type=session_type, deserialize=False)
+        return find_session_run(get_stored_session_runs(session, session_type), run_id)
+
+    async def list_runs(
+        self,
+        session_id: str,
+        session_type: SessionType,
+        status: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Read the runs of a session, as dictionaries, without deserializing the session.
+
+        Args:
+            session_id (str): ID of the session to read the runs of.
+            session_type (SessionType): Type of the session.
+            status (Optional[str]): Only return the runs with this status, e.g. "RUNNING".
+            limit (Optional[int]): Maximum number of runs to return. The most recent runs are kept.
+
+        Returns:
+            List[Dict[str, Any]]: The serialized runs, in session order.
+        """
+        session = await self.get_session(session_id=session_id, session_type=session_type, deserialize=False)
+        return filter_session_runs(get_stored_session_runs(session, session_type), status=status, limit=limit)
+
     # --- Memory ---
     @abstractmethod
     async def clear_memories(self) -> None:
@@ -1377,6 +1478,17 @@ class AsyncBaseDb(ABC):
         """
         raise NotImplementedError
 
+    async def upsert_traces(self, traces: List) -> None:
+        """Create or update multiple trace records in the database.
+
+        Databases supporting it override this to write all traces at once.
+
+        Args:
+            traces: The Trace objects to store (one per trace_id).
+        """
+        for trace in traces:
+            await self.upsert_trace(trace)
+
     @abstractmethod
     async def get_trace(
         self,
@@ -1482,7 +1594,7 @@ class AsyncBaseDb(ABC):
 
     @abstractmethod
     async def create_spans(self, spans: List) -> None:
-        """Create multiple spans in the database as a batch.
+        """Create multiple spans in the database as a batch. The spans may belong to different traces.
 
         Args:
             spans: List of Span objects to store.
@@ -1700,6 +1812,16 @@ class AsyncBaseDb(ABC):
         """Atomically claim a due schedule for execution."""
         raise NotImplementedError
 
+    async def claim_due_schedules(
+        self, worker_id: str, limit: int = 10, lock_grace_seconds: int = 300
+    ) -> List[Dict[str, Any]]:
+        """Atomically claim up to `limit` due schedules for execution, earliest due first."""
+        raise NotImplementedError
+
+    async def get_next_schedule_run_at(self) -> Optional[int]:
+        """Get the earliest next_run_at of the enabled, unclaimed schedules."""
+        raise NotImplementedError
+
     async def release_schedule(self, schedule_id: str, next_run_at: Optional[int] = None) -> bool:
         """Release a claimed schedule and optionally update next_run_at."""
         raise NotImplementedError
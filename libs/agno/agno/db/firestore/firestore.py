@@ -25,7 +25,7 @@ from agno.db.schemas.culture import CulturalKnowledge
 from agno.db.schemas.evals import EvalFilterType, EvalRunRecord, EvalType
 from agno.db.schemas.knowledge import KnowledgeRow
 from agno.db.schemas.memory import UserMemory
-from agno.db.utils import deserialize_session_json_fields
+from agno.db.utils import apply_runs_window, deserialize_session_json_fields, set_previous_runs
 from agno.session import AgentSession, Session, TeamSession, WorkflowSession
 from agno.utils.log import log_debug, log_error, log_info
 from agno.utils.string import generate_id
@@ -310,6 +310,7 @@ class FirestoreDb(BaseDb):
         session_type: SessionType,
         user_id: Optional[str] = None,
         deserialize: Optional[bool] = True,
+        last_n_runs: Optional[int] = None,
     ) -> Optional[Union[Session, Dict[str, Any]]]:
         """Read a session from the database.
 
@@ -318,6 +319,7 @@ class FirestoreDb(BaseDb):
             session_type (SessionType): The type of session to get.
             user_id (Optional[str]): The ID of the user to get the session for.
             deserialize (Optional[bool]): Whether to serialize the session. Defaults to True.
+            last_n_runs (Optional[int]): Only load the runs holding the last N history runs. Defaults to all runs.
 
         Returns:
             Union[Session, Dict[str, Any], None]:
@@ -345,15 +347,17 @@ class FirestoreDb(BaseDb):
 
             session = deserialize_session_json_fields(result)
 
+            previous_runs = apply_runs_window(session, last_n_runs)
+
             if not deserialize:
                 return session
 
             if session_type == SessionType.AGENT:
-                return AgentSession.from_dict(session)
+                return set_previous_runs(AgentSession.from_dict(session), previous_runs)
             elif session_type == SessionType.TEAM:
-                return TeamSession.from_dict(session)
+                return set_previous_runs(TeamSession.from_dict(session), previous_runs)
             elif session_type == SessionType.WORKFLOW:
-                return WorkflowSession.from_dict(session)
+                return set_previous_runs(WorkflowSession.from_dict(session), previous_runs)
             else:
                 raise ValueError(f"Invalid session type: {session_type}")
 
@@ -20,6 +20,7 @@ from agno.db.schemas.culture import CulturalKnowledge
 from agno.db.schemas.evals import EvalFilterType, EvalRunRecord, EvalType
 from agno.db.schemas.knowledge import KnowledgeRow
 from agno.db.schemas.memory import UserMemory
+from agno.db.utils import apply_runs_window, set_previous_runs
 from agno.session import AgentSession, Session, TeamSession, WorkflowSession
 from agno.utils.log import log_debug, log_error, log_info, log_warning
 from agno.utils.string import generate_id
@@ -226,6 +227,7 @@ class GcsJsonDb(BaseDb):
         session_type: SessionType,
         user_id: Optional[str] = None,
         deserialize: Optional[bool] = True,
+        last_n_runs: Optional[int] = None,
     ) -> Optional[Union[AgentSession, TeamSession, WorkflowSession, Dict[str, Any]]]:
         """Read a session from the GCS JSON file.
 
@@ -234,6 +236,7 @@ class GcsJsonDb(BaseDb):
             session_type (SessionType): The type of the session to read.
             user_id (Optional[str]): The ID of the user to read the session for.
             deserialize (Optional[bool]): Whether to deserialize the session.
+            last_n_runs (Optional[int]): Only load the runs holding the last N history runs. Defaults to all runs.
 
         Returns:
             Union[Session, Dict[str, Any], None]:
@@ -251,15 +254,17 @@ class GcsJsonDb(BaseDb):
                     if user_id is not None and session_data.get("user_id") != user_id:
                         continue
 
+                    previous_runs = apply_runs_window(session_data, last_n_runs)
+
                     if not deserialize:
                         return session_data
 
                     if session_type == SessionType.AGENT:
-                        return AgentSession.from_dict(session_data)
+                        return set_previous_runs(AgentSession.from_dict(session_data), previous_runs)
                     elif session_type == SessionType.TEAM:
-                        return TeamSession.from_dict(session_data)
+                        return set_previous_runs(TeamSession.from_dict(session_data), previous_runs)
                     elif session_type == SessionType.WORKFLOW:
-                        return WorkflowSession.from_dict(session_data)
+                        return set_previous_runs(WorkflowSession.from_dict(session_data), previous_runs)
                     else:
                         raise ValueError(f"Invalid session type: {session_type}")
 
@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 from uuid import uuid4
 
 from agno.db.base import BaseDb, SessionType
+from agno.db.in_memory.table import InMemoryTable, freeze, thaw
 from agno.db.in_memory.utils import (
     apply_sorting,
     calculate_date_metrics,
@@ -17,6 +18,7 @@ from agno.db.schemas.culture import CulturalKnowledge
 from agno.db.schemas.evals import EvalFilterType, EvalRunRecord, EvalType
 from agno.db.schemas.knowledge import KnowledgeRow
 from agno.db.schemas.memory import UserMemory
+from agno.db.utils import apply_runs_window, set_previous_runs
 from agno.session import AgentSession, Session, TeamSession, WorkflowSession
 from agno.utils.log import log_debug, log_error, log_info, log_warning
 
@@ -25,18 +27,53 @@ if TYPE_CHECKING:
 
 
 class InMemoryDb(BaseDb):
-    def __init__(self):
-        """Interface for in-memory storage."""
+    def __init__(self, frozen_views: bool = False):
+        """Interface for in-memory storage.
+
+        Sessions and memories are stored in indexed tables, so lookups by id, user, component or session type don't
+        scan all records, and writes are serialized by a lock so threads can share the database.
+
+        Args:
+            frozen_views (bool): Return read-only views of the stored sessions and memories, instead of deep copies,
+                when they are not deserialized. Defaults to False.
+        """
         super().__init__()
 
-        # Initialize in-memory storage dictionaries
-        self._sessions: List[Dict[str, Any]] = []
-        self._memories: List[Dict[str, Any]] = []
+        self.frozen_views = frozen_views
+
+        # Initialize in-memory storage
+        self._session_table = InMemoryTable(
+            index_fields=("session_id", "session_type", "user_id", "agent_id", "team_id", "workflow_id"),
+            order_field="created_at",
+        )
+        self._memory_table = InMemoryTable(index_fields=("memory_id", "user_id", "agent_id", "team_id"))
         self._metrics: List[Dict[str, Any]] = []
         self._eval_runs: List[Dict[str, Any]] = []
         self._knowledge: List[Dict[str, Any]] = []
         self._cultural_knowledge: List[Dict[str, Any]] = []
 
+    @property
+    def _sessions(self) -> List[Dict[str, Any]]:
+        """The stored session records, in insertion order."""
+        return self._session_table.records()
+
+    @_sessions.setter
+    def _sessions(self, sessions: List[Dict[str, Any]]) -> None:
+        self._session_table.load(sessions)
+
+    @property
+    def _memories(self) -> List[Dict[str, Any]]:
+        """The stored memory records, in insertion order."""
+        return self._memory_table.records()
+
+    @_memories.setter
+    def _memories(self, memories: List[Dict[str, Any]]) -> None:
+        self._memory_table.load(memories)
+
+    def _copy_record(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        """Get a stored record to return without deserializing it: the frozen record itself or a mutable copy."""
+        return freeze(record) if self.frozen_views else thaw(record)
+
     def table_exists(self, table_name: str) -> bool:
         """In-memory implementation, always returns True."""
         return True
@@ -64,14 +101,14 @@ class InMemoryDb(BaseDb):
             Exception: If an error occurs during deletion.
         """
         try:
-            original_count = len(self._sessions)
-            self._sessions = [
-                s
-                for s in self._sessions
-                if not (s.get("session_id") == session_id and (user_id is None or s.get("user_id") == user_id))
-            ]
-
-            if len(self._sessions) < original_count:
+            with self._session_table.lock:
+                deleted_count = self._session_table.delete(
+                    row_id
+                    for row_id, s in self._session_table.find_rows(session_id=session_id)
+                    if user_id is None or s.get("user_id") == user_id
+                )
+
+            if deleted_count > 0:
                 log_debug(f"Successfully deleted session with session_id: {session_id}")
                 return True
             else:
@@ -93,11 +130,13 @@ class InMemoryDb(BaseDb):
             Exception: If an error occurs during deletion.
         """
         try:
-            self._sessions = [
-                s
-                for s in self._sessions
-                if not (s.get("session_id") in session_ids and (user_id is None or s.get("user_id") == user_id))
-            ]
+            with self._session_table.lock:
+                self._session_table.delete(
+                    row_id
+                    for session_id in set(session_ids)
+                    for row_id, s in self._session_table.find_rows(session_id=session_id)
+                    if user_id is None or s.get("user_id") == user_id
+                )
             log_debug(f"Successfully deleted sessions with ids: {session_ids}")
 
         except Exception as e:
@@ -110,6 +149,7 @@ class InMemoryDb(BaseDb):
         session_type: SessionType,
         user_id: Optional[str] = None,
         deserialize: Optional[bool] = True,
+        last_n_runs: Optional[int] = None,
     ) -> Optional[Union[AgentSession, TeamSession, WorkflowSession, Dict[str, Any]]]:
         """Read a session from in-memory storage.
 
@@ -118,6 +158,7 @@ class InMemoryDb(BaseDb):
             session_type (SessionType): The type of the session to read.
             user_id (Optional[str]): The ID of the user to read the session for.
             deserialize (Optional[bool]): Whether to deserialize the session.
+            last_n_runs (Optional[int]): Only load the runs holding the last N history runs. Defaults to all runs.
 
         Returns:
             Union[Session, Dict[str, Any], None]:
@@ -128,22 +169,24 @@ class InMemoryDb(BaseDb):
             Exception: If an error occurs while reading the session.
         """
         try:
-            for session_data in self._sessions:
-                if session_data.get("session_id") == session_id:
-                    if user_id is not None and session_data.get("user_id") != user_id:
-                        continue
+            for session_data in self._session_table.find(session_id=session_id):
+                if user_id is not None and session_data.get("user_id") != user_id:
+                    continue
 
-                    session_data_copy = deepcopy(session_data)
+                # Only the runs in the window are copied. The previous runs are stored back as-is, so stay frozen.
+                session_data_window = dict(session_data)
+                previous_runs = apply_runs_window(session_data_window, last_n_runs)
 
-                    if not deserialize:
-                        return session_data_copy
+                if not deserialize:
+                    return self._copy_record(session_data_window)
 
-                    if session_type == SessionType.AGENT:
-                        return AgentSession.from_dict(session_data_copy)
-                    elif session_type == SessionType.TEAM:
-                        return TeamSession.from_dict(session_data_copy)
-                    else:
-                        return WorkflowSession.from_dict(session_data_copy)
+                session_data_copy = thaw(session_data_window)
+                if session_type == SessionType.AGENT:
+                    return set_previous_runs(AgentSession.from_dict(session_data_copy), previous_runs)
+                elif session_type == SessionType.TEAM:
+                    return set_previous_runs(TeamSession.from_dict(session_data_copy), previous_runs)
+                else:
+                    return set_previous_runs(WorkflowSession.from_dict(session_data_copy), previous_runs)
 
             return None
 
@@ -192,31 +235,26 @@ class InMemoryDb(BaseDb):
             Exception: If an error occurs while reading the sessions.
         """
         try:
-            # Apply filters
-            filtered_sessions = []
-            for session_data in self._sessions:
-                if user_id is not None and session_data.get("user_id") != user_id:
-                    continue
-                if component_id is not None:
-                    if session_type == SessionType.AGENT and session_data.get("agent_id") != component_id:
-                        continue
-                    elif session_type == SessionType.TEAM and session_data.get("team_id") != component_id:
-                        continue
-                    elif session_type == SessionType.WORKFLOW and session_data.get("workflow_id") != component_id:
-                        continue
-                if start_timestamp is not None and session_data.get("created_at", 0) < start_timestamp:
-                    continue
-                if end_timestamp is not None and session_data.get("created_at", 0) > end_timestamp:
-                    continue
-                if session_name is not None:
-                    stored_name = session_data.get("session_data", {}).get("session_name", "")
-                    if session_name.lower() not in stored_name.lower():
-                        continue
-                session_type_value = session_type.value if isinstance(session_type, SessionType) else session_type
-                if session_data.get("session_type") != session_type_value:
-                    continue
-
-                filtered_sessions.append(deepcopy(session_data))
+            # Apply the indexed filters
+            session_type_value = session_type.value if isinstance(session_type, SessionType) else session_type
+            filters: Dict[str, Any] = {"session_type": session_type_value}
+            if user_id is not None:
+                filters["user_id"] = user_id
+            if component_id is not None:
+                if session_type == SessionType.AGENT:
+                    filters["agent_id"] = component_id
+                elif session_type == SessionType.TEAM:
+                    filters["team_id"] = component_id
+                elif session_type == SessionType.WORKFLOW:
+                    filters["workflow_id"] = component_id
+            filtered_sessions = self._session_table.find(start=start_timestamp, end=end_timestamp, **filters)
+
+            if session_name is not None:
+                filtered_sessions = [
+                    session_data
+                    for session_data in filtered_sessions
+                    if session_name.lower() in (session_data.get("session_data") or {}).get("session_name", "").lower()
+                ]
 
             total_count = len(filtered_sessions)
 
@@ -230,15 +268,16 @@ class InMemoryDb(BaseDb):
                     start_idx = (page - 1) * limit
                 filtered_sessions = filtered_sessions[start_idx : start_idx + limit]
 
+            # Only copy the sessions of the page
             if not deserialize:
-                return filtered_sessions, total_count
+                return [self._copy_record(session) for session in filtered_sessions], total_count
 
             if session_type == SessionType.AGENT:
-                return [AgentSession.from_dict(session) for session in filtered_sessions]  # type: ignore
+                return [AgentSession.from_dict(thaw(session)) for session in filtered_sessions]  # type: ignore
             elif session_type == SessionType.TEAM:
-                return [TeamSession.from_dict(session) for session in filtered_sessions]  # type: ignore
+                return [TeamSession.from_dict(thaw(session)) for session in filtered_sessions]  # type: ignore
             elif session_type == SessionType.WORKFLOW:
-                return [WorkflowSession.from_dict(session) for session in filtered_sessions]  # type: ignore
+                return [WorkflowSession.from_dict(thaw(session)) for session in filtered_sessions]  # type: ignore
             else:
                 raise ValueError(f"Invalid session type: {session_type}")
 
@@ -255,23 +294,26 @@ class InMemoryDb(BaseDb):
         deserialize: Optional[bool] = True,
     ) -> Optional[Union[Session, Dict[str, Any]]]:
         try:
-            for i, session in enumerate(self._sessions):
-                if session.get("session_id") == session_id and session.get("session_type") == session_type.value:
+            with self._session_table.lock:
+                for row_id, session in self._session_table.find_rows(
+                    session_id=session_id, session_type=session_type.value
+                ):
                     if user_id is not None and session.get("user_id") != user_id:
                         continue
                     # Update session name in session_data
-                    if "session_data" not in session:
-                        session["session_data"] = {}
-                    session["session_data"]["session_name"] = session_name
-
-                    self._sessions[i] = session
+                    renamed_session = dict(session)
+                    renamed_session["session_data"] = {
+                        **(session.get("session_data") or {}),
+                        "session_name": session_name,
+                    }
+                    stored_session = self._session_table.replace(row_id, renamed_session)
 
                     log_debug(f"Renamed session with id '{session_id}' to '{session_name}'")
 
-                    session_copy = deepcopy(session)
                     if not deserialize:
-                        return session_copy
+                        return self._copy_record(stored_session)
 
+                    session_copy = thaw(stored_session)
                     if session_type == SessionType.AGENT:
                         return AgentSession.from_dict(session_copy)
                     elif session_type == SessionType.TEAM:
@@ -299,29 +341,27 @@ class InMemoryDb(BaseDb):
             elif isinstance(session, WorkflowSession):
                 session_dict["session_type"] = SessionType.WORKFLOW.value
 
-            # Find existing session to update
-            session_updated = False
-            for i, existing_session in enumerate(self._sessions):
-                if existing_session.get("session_id") == session_dict.get("session_id") and self._matches_session_key(
-                    existing_session, session
+            with self._session_table.lock:
+                # Find existing session to update
+                for row_id, existing_session in self._session_table.find_rows(
+                    session_id=session_dict.get("session_id")
                 ):
-                    existing_uid = existing_session.get("user_id")
-                    if existing_uid is not None and existing_uid != session_dict.get("user_id"):
-                        return None
-                    session_dict["updated_at"] = int(time.time())
-                    self._sessions[i] = deepcopy(session_dict)
-                    session_updated = True
-                    break
-
-            if not session_updated:
-                session_dict["created_at"] = session_dict.get("created_at", int(time.time()))
-                session_dict["updated_at"] = session_dict.get("created_at")
-                self._sessions.append(deepcopy(session_dict))
+                    if self._matches_session_key(existing_session, session):
+                        existing_uid = existing_session.get("user_id")
+                        if existing_uid is not None and existing_uid != session_dict.get("user_id"):
+                            return None
+                        session_dict["updated_at"] = int(time.time())
+                        stored_session = self._session_table.replace(row_id, session_dict)
+                        break
+                else:
+                    session_dict["created_at"] = session_dict.get("created_at", int(time.time()))
+                    session_dict["updated_at"] = session_dict.get("created_at")
+                    stored_session = self._session_table.insert(session_dict)
 
-            session_dict_copy = deepcopy(session_dict)
             if not deserialize:
-                return session_dict_copy
+                return self._copy_record(stored_session)
 
+            session_dict_copy = thaw(stored_session)
             if session_dict_copy["session_type"] == SessionType.AGENT:
                 return AgentSession.from_dict(session_dict_copy)
             elif session_dict_copy["session_type"] == SessionType.TEAM:
@@ -389,17 +429,15 @@ class InMemoryDb(BaseDb):
             Exception: If an error occurs during deletion.
         """
         try:
-            original_count = len(self._memories)
+            with self._memory_table.lock:
+                # If user_id is provided, verify ownership before deleting
+                deleted_count = self._memory_table.delete(
+                    row_id
+                    for row_id, m in self._memory_table.find_rows(memory_id=memory_id)
+                    if user_id is None or m.get("user_id") == user_id
+                )
 
-            # If user_id is provided, verify ownership before deleting
-            if user_id is not None:
-                self._memories = [
-                    m for m in self._memories if not (m.get("memory_id") == memory_id and m.get("user_id") == user_id)
-                ]
-            else:
-                self._memories = [m for m in self._memories if m.get("memory_id") != memory_id]
-
-            if len(self._memories) < original_count:
+            if deleted_count > 0:
                 log_debug(f"Successfully deleted user memory id: {memory_id}")
             else:
                 log_debug(f"No memory found with id: {memory_id}")
@@ -419,13 +457,14 @@ class InMemoryDb(BaseDb):
             Exception: If an error occurs during deletion.
         """
         try:
-            # If user_id is provided, verify ownership before deleting
-            if user_id is not None:
-                self._memories = [
-                    m for m in self._memories if not (m.get("memory_id") in memory_ids and m.get("user_id") == user_id)
-                ]
-            else:
-                self._memories = [m for m in self._memories if m.get("memory_id") not in memory_ids]
+            with self._memory_table.lock:
+                # If user_id is provided, verify ownership before deleting
+                self._memory_table.delete(
+                    row_id
+                    for memory_id in set(memory_ids)
+                    for row_id, m in self._memory_table.find_rows(memory_id=memory_id)
+                    if user_id is None or m.get("user_id") == user_id
+                )
             log_debug(f"Successfully deleted {len(memory_ids)} user memories")
 
         except Exception as e:
@@ -443,7 +482,7 @@ class InMemoryDb(BaseDb):
         """
         try:
             topics = set()
-            for memory in self._memories:
+            for memory in self._memory_table.records():
                 memory_topics = memory.get("topics", [])
                 if isinstance(memory_topics, list):
                     topics.update(memory_topics)
@@ -470,16 +509,14 @@ class InMemoryDb(BaseDb):
             Exception: If an error occurs while reading the memory.
         """
         try:
-            for memory_data in self._memories:
-                if memory_data.get("memory_id") == memory_id:
-                    # Filter by user_id if provided
-                    if user_id is not None and memory_data.get("user_id") != user_id:
-                        continue
+            for memory_data in self._memory_table.find(memory_id=memory_id):
+                # Filter by user_id if provided
+                if user_id is not None and memory_data.get("user_id") != user_id:
+                    continue
 
-                    memory_data_copy = deepcopy(memory_data)
-                    if not deserialize:
-                        return memory_data_copy
-                    return UserMemory.from_dict(memory_data_copy)
+                if not deserialize:
+                    return self._copy_record(memory_data)
+                return UserMemory.from_dict(thaw(memory_data))
 
             return None
 
@@ -501,15 +538,17 @@ class InMemoryDb(BaseDb):
         deserialize: Optional[bool] = True,
     ) -> Union[List[UserMemory], Tuple[List[Dict[str, Any]], int]]:
         try:
-            # Apply filters
+            # Apply the indexed filters
+            filters: Dict[str, Any] = {}
+            if user_id is not None:
+                filters["user_id"] = user_id
+            if agent_id is not None:
+                filters["agent_id"] = agent_id
+            if team_id is not None:
+                filters["team_id"] = team_id
+
             filtered_memories = []
-            for memory_data in self._memories:
-                if user_id is not None and memory_data.get("user_id") != user_id:
-                    continue
-                if agent_id is not None and memory_data.get("agent_id") != agent_id:
-                    continue
-                if team_id is not None and memory_data.get("team_id") != team_id:
-                    continue
+            for memory_data in self._memory_table.find(**filters):
                 if topics is not None:
                     memory_topics = memory_data.get("topics", [])
                     if not any(topic in memory_topics for topic in topics):
@@ -519,7 +558,7 @@ class InMemoryDb(BaseDb):
                     if search_content.lower() not in memory_content.lower():
                         continue
 
-                filtered_memories.append(deepcopy(memory_data))
+                filtered_memories.append(memory_data)
 
             total_count = len(filtered_memories)
 
@@ -533,10 +572,11 @@ class InMemoryDb(BaseDb):
                     start_idx = (page - 1) * limit
                 filtered_memories = filtered_memories[start_idx : start_idx + limit]
 
+            # Only copy the memories of the page
             if not deserialize:
-                return filtered_memories, total_count
+                return [self._copy_record(memory) for memory in filtered_memories], total_count
 
-            return [UserMemory.from_dict(memory) for memory in filtered_memories]
+            return [UserMemory.from_dict(thaw(memory)) for memory in filtered_memories]
 
         except Exception as e:
             log_error(f"Exception reading from memory storage: {e}")
@@ -561,7 +601,8 @@ class InMemoryDb(BaseDb):
         try:
             user_stats = {}
 
-            for memory in self._memories:
+            memories = self._memory_table.find(user_id=user_id) if user_id is not None else self._memory_table.records()
+            for memory in memories:
                 memory_user_id = memory.get("user_id")
                 # filter by user_id if provided
                 if user_id is not None and memory_user_id != user_id:
@@ -606,21 +647,18 @@ class InMemoryDb(BaseDb):
             memory_dict = memory.to_dict() if hasattr(memory, "to_dict") else memory.__dict__
             memory_dict["updated_at"] = int(time.time())
 
-            # Find existing memory to update
-            memory_updated = False
-            for i, existing_memory in enumerate(self._memories):
-                if existing_memory.get("memory_id") == memory.memory_id:
-                    self._memories[i] = memory_dict
-                    memory_updated = True
-                    break
-
-            if not memory_updated:
-                self._memories.append(memory_dict)
+            with self._memory_table.lock:
+                # Find existing memory to update
+                existing_rows = self._memory_table.find_rows(memory_id=memory.memory_id)
+                if existing_rows:
+                    stored_memory = self._memory_table.replace(existing_rows[0][0], memory_dict)
+                else:
+                    stored_memory = self._memory_table.insert(memory_dict)
 
-            memory_dict_copy = deepcopy(memory_dict)
             if not deserialize:
-                return memory_dict_copy
+                return self._copy_record(stored_memory)
 
+            memory_dict_copy = thaw(stored_memory)
             return UserMemory.from_dict(memory_dict_copy)
 
         except Exception as e:
@@ -669,7 +707,7 @@ class InMemoryDb(BaseDb):
             Exception: If an error occurs during deletion.
         """
         try:
-            self._memories.clear()
+            self._memory_table.clear()
 
         except Exception as e:
             log_warning(f"Exception deleting all memories: {e}")
@@ -753,10 +791,9 @@ class InMemoryDb(BaseDb):
                 return datetime.strptime(latest_metric["date"], "%Y-%m-%d").date()
 
         # No metrics records. Return the date of the first recorded session.
-        if self._sessions:
-            # Sort by created_at
-            sorted_sessions = sorted(self._sessions, key=lambda x: x.get("created_at", 0))
-            first_session_date = sorted_sessions[0]["created_at"]
+        first_session = self._session_table.first()
+        if first_session is not None:
+            first_session_date = first_session["created_at"]
             return datetime.fromtimestamp(first_session_date, tz=timezone.utc).date()
 
         return None
@@ -767,18 +804,15 @@ class InMemoryDb(BaseDb):
         """Get all sessions for metrics calculation."""
         try:
             filtered_sessions = []
-            for session in self._sessions:
-                created_at = session.get("created_at", 0)
-                if start_timestamp is not None and created_at < start_timestamp:
-                    continue
-                if end_timestamp is not None and created_at >= end_timestamp:
+            for session in self._session_table.find(start=start_timestamp, end=end_timestamp):
+                if end_timestamp is not None and session.get("created_at", 0) >= end_timestamp:
                     continue
 
                 # Only include necessary fields for metrics
                 filtered_session = {
                     "user_id": session.get("user_id"),
-                    "session_data": deepcopy(session.get("session_data")),
-                    "runs": deepcopy(session.get("runs")),
+                    "session_data": thaw(session.get("session_data")),
+                    "runs": thaw(session.get("runs")),
                     "created_at": session.get("created_at"),
                     "session_type": session.get("session_type"),
                 }
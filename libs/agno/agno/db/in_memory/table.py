@@ -0,0 +1,214 @@
+import threading
+from bisect import bisect_left, bisect_right, insort
+from copy import deepcopy
+from math import inf
+from typing import Any, Dict, Iterable, List, NoReturn, Optional, Sequence, Tuple
+
+# Values shared as-is between frozen records and their copies
+_IMMUTABLE_TYPES = (str, int, float, bool, bytes, type(None))
+
+
+class FrozenDict(dict):
+    """A read-only dict, returned instead of a copy of a stored record. Copies of it are plain, mutable dicts."""
+
+    def _read_only(self, *args: Any, **kwargs: Any) -> NoReturn:
+        raise TypeError("Records returned by InMemoryDb are read-only, use copy.deepcopy() to get a mutable copy")
+
+    __setitem__ = __delitem__ = __ior__ = _read_only  # type: ignore
+    clear = pop = popitem = setdefault = update = _read_only  # type: ignore
+
+    def __copy__(self) -> Dict[Any, Any]:
+        return dict(self)
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> Dict[Any, Any]:
+        return thaw(self)
+
+    def __reduce__(self) -> Any:
+        return (dict, (dict(self),))
+
+
+class FrozenList(list):
+    """A read-only list, used for the lists of frozen records. Copies of it are plain, mutable lists."""
+
+    def _read_only(self, *args: Any, **kwargs: Any) -> NoReturn:
+        raise TypeError("Records returned by InMemoryDb are read-only, use copy.deepcopy() to get a mutable copy")
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only  # type: ignore
+    append = extend = insert = pop = remove = clear = sort = reverse = _read_only  # type: ignore
+
+    def __copy__(self) -> List[Any]:
+        return list(self)
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> List[Any]:
+        return thaw(self)
+
+    def __reduce__(self) -> Any:
+        return (list, (list(self),))
+
+
+def freeze(value: Any) -> Any:
+    """Get a read-only copy of a record. Frozen values are shared instead of copied."""
+    if isinstance(value, (FrozenDict, FrozenList)) or isinstance(value, _IMMUTABLE_TYPES):
+        return value
+    if isinstance(value, dict):
+        return FrozenDict((key, freeze(item)) for key, item in value.items())
+    if isinstance(value, list):
+        return FrozenList(freeze(item) for item in value)
+    if isinstance(value, tuple):
+        return tuple(freeze(item) for item in value)
+    return deepcopy(value)
+
+
+def thaw(value: Any) -> Any:
+    """Get a mutable deep copy of a record, frozen or not."""
+    if isinstance(value, _IMMUTABLE_TYPES):
+        return value
+    if isinstance(value, dict):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [thaw(item) for item in value]
+    if isinstance(value, tuple):
+        return tuple(thaw(item) for item in value)
+    return deepcopy(value)
+
+
+class InMemoryTable:
+    """An InMemoryDb table: frozen records in insertion order, with hash indexes and an optional ordered field.
+
+    Records are stored by row id. Hash indexes map the values of `index_fields` to the ids of the rows holding
+    them, and the rows are kept sorted by `order_field` to select value ranges. The lock must be held to read and
+    then write the table consistently, e.g. to update a record found by a query.
+    """
+
+    def __init__(self, index_fields: Sequence[str] = (), order_field: Optional[str] = None):
+        """
+        Args:
+            index_fields (Sequence[str]): Record fields to index. Their values must be hashable.
+            order_field (Optional[str]): Numeric record field to keep the rows sorted by.
+        """
+        self.index_fields = tuple(index_fields)
+        self.order_field = order_field
+        self.lock = threading.RLock()
+
+        self._rows: Dict[int, Dict[str, Any]] = {}
+        self._indexes: Dict[str, Dict[Any, Dict[int, None]]] = {field: {} for field in self.index_fields}
+        # (order_field value, row id) of all rows, sorted
+        self._order: List[Tuple[float, int]] = []
+        self._next_row_id = 0
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    # -- Reads --
+
+    def records(self) -> List[Dict[str, Any]]:
+        """Get all records, in insertion order."""
+        with self.lock:
+            return list(self._rows.values())
+
+    def find(self, start: Optional[float] = None, end: Optional[float] = None, **filters: Any) -> List[Dict[str, Any]]:
+        """Get the records matching all filters, in insertion order. See `find_rows`."""
+        return [record for _, record in self.find_rows(start=start, end=end, **filters)]
+
+    def find_rows(
+        self, start: Optional[float] = None, end: Optional[float] = None, **filters: Any
+    ) -> List[Tuple[int, Dict[str, Any]]]:
+        """Get the rows matching all filters, in insertion order.
+
+        Args:
+            start (Optional[float]): Minimum value of the order field, inclusive.
+            end (Optional[float]): Maximum value of the order field, inclusive.
+            **filters: Values of indexed fields.
+
+        Returns:
+            List[Tuple[int, Dict[str, Any]]]: The matching row ids and records.
+        """
+        with self.lock:
+            candidates: List[Dict[int, None]] = []
+            for field, value in filters.items():
+                row_ids = self._indexes[field].get(value)
+                if not row_ids:
+                    return []
+                candidates.append(row_ids)
+            if start is not None or end is not None:
+                low = 0 if start is None else bisect_left(self._order, (start, -inf))
+                high = len(self._order) if end is None else bisect_right(self._order, (end, inf))
+                candidates.append(dict.fromkeys(row_id for _, row_id in self._order[low:high]))
+            if not candidates:
+                return list(self._rows.items())
+
+            candidates.sort(key=len)
+            smallest, others = candidates[0], candidates[1:]
+            matches = sorted(row_id for row_id in smallest if all(row_id in other for other in others))
+            return [(row_id, self._rows[row_id]) for row_id in matches]
+
+    def first(self) -> Optional[Dict[str, Any]]:
+        """Get the record with the lowest order field value."""
+        with self.lock:
+            return self._rows[self._order[0][1]] if self._order else None
+
+    # -- Writes --
+
+    def insert(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        """Insert a record. Returns the stored, frozen record."""
+        frozen_record = freeze(record)
+        with self.lock:
+            row_id = self._next_row_id
+            self._next_row_id += 1
+            self._rows[row_id] = frozen_record
+            self._index(row_id, frozen_record)
+        return frozen_record
+
+    def replace(self, row_id: int, record: Dict[str, Any]) -> Dict[str, Any]:
+        """Replace the record of a row, keeping its position. Returns the stored, frozen record."""
+        frozen_record = freeze(record)
+        with self.lock:
+            self._unindex(row_id, self._rows[row_id])
+            self._rows[row_id] = frozen_record
+            self._index(row_id, frozen_record)
+        return frozen_record
+
+    def delete(self, row_ids: Iterable[int]) -> int:
+        """Delete rows. Returns the number of rows deleted."""
+        deleted = 0
+        with self.lock:
+            for row_id in row_ids:
+                record = self._rows.pop(row_id, None)
+                if record is not None:
+                    self._unindex(row_id, record)
+                    deleted += 1
+        return deleted
+
+    def load(self, records: Iterable[Dict[str, Any]]) -> None:
+        """Replace all records."""
+        with self.lock:
+            self.clear()
+            for record in records:
+                self.insert(record)
+
+    def clear(self) -> None:
+        """Delete all records."""
+        with self.lock:
+            self._rows = {}
+            self._indexes = {field: {} for field in self.index_fields}
+            self._order = []
+
+    def _index(self, row_id: int, record: Dict[str, Any]) -> None:
+        for field in self.index_fields:
+            self._indexes[field].setdefault(record.get(field), {})[row_id] = None
+        if self.order_field is not None:
+            insort(self._order, (self._order_value(record), row_id))
+
+    def _unindex(self, row_id: int, record: Dict[str, Any]) -> None:
+        for field in self.index_fields:
+            value = record.get(field)
+            row_ids = self._indexes[field][value]
+            del row_ids[row_id]
+            if not row_ids:
+                del self._indexes[field][value]
+        if self.order_field is not None:
+            del self._order[bisect_left(self._order, (self._order_value(record), row_id))]
+
+    def _order_value(self, record: Dict[str, Any]) -> float:
+        value = record.get(self.order_field)  # type: ignore
+        return value if isinstance(value, (int, float)) and not isinstance(value, bool) else 0
@@ -1,5 +1,5 @@
-import json
 import os
+import threading
 import time
 from datetime import date, datetime, timedelta, timezone
 from pathlib import Path
@@ -10,6 +10,7 @@ if TYPE_CHECKING:
     from agno.tracing.schemas import Span, Trace
 
 from agno.db.base import BaseDb, SessionType
+from agno.db.json.table import JsonTable
 from agno.db.json.utils import (
     apply_sorting,
     calculate_date_metrics,
@@ -22,6 +23,7 @@ from agno.db.schemas.culture import CulturalKnowledge
 from agno.db.schemas.evals import EvalFilterType, EvalRunRecord, EvalType
 from agno.db.schemas.knowledge import KnowledgeRow
 from agno.db.schemas.memory import UserMemory
+from agno.db.utils import apply_runs_window, set_previous_runs
 from agno.session import AgentSession, Session, TeamSession, WorkflowSession
 from agno.utils.log import log_debug, log_error, log_info, log_warning
 from agno.utils.string import generate_id
@@ -44,9 +46,12 @@ class JsonDb(BaseDb):
         """
         Interface for interacting with JSON files as database.
 
+        Each table is stored as an append-only JSONL log (<table>.jsonl) with an in-memory index by primary key,
+        compacted as it grows. Tables from a previous <table>.json file are imported on first use.
+
         Args:
             db_path (Optional[str]): Path to the directory where JSON files will be stored.
-            session_table (Optional[str]): Name of the JSON file to store sessions (without .json extension).
+            session_table (Optional[str]): Name of the JSON file to store sessions (without extension).
             culture_table (Optional[str]): Name of the JSON file to store cultural knowledge.
             memory_table (Optional[str]): Name of the JSON file to store memories.
             metrics_table (Optional[str]): Name of the JSON file to store metrics.
@@ -75,62 +80,74 @@ class JsonDb(BaseDb):
         # Create the directory where the JSON files will be stored, if it doesn't exist
         self.db_path = Path(db_path or os.path.join(os.getcwd(), "agno_json_db"))
 
+        # Tables by file name, loaded on first use
+        self._tables: Dict[str, JsonTable] = {}
+        self._tables_lock = threading.Lock()
+
     def table_exists(self, table_name: str) -> bool:
         """JSON implementation, always returns True."""
         return True
 
-    def _read_json_file(self, filename: str, create_table_if_not_found: Optional[bool] = True) -> List[Dict[str, Any]]:
-        """Read data from a JSON file, creating it if it doesn't exist.
+    def _get_primary_key(self, filename: str) -> str:
+        """Get the field identifying the records of a table."""
+        primary_keys = {
+            self.session_table_name: "session_id",
+            self.memory_table_name: "memory_id",
+            self.eval_table_name: "run_id",
+            self.trace_table_name: "trace_id",
+            self.span_table_name: "span_id",
+        }
+        return primary_keys.get(filename, "id")
+
+    def _get_table(self, filename: str) -> JsonTable:
+        """Get the table stored in the given file, loading it on first use.
 
         Args:
-            filename (str): The name of the JSON file to read.
+            filename (str): The name of the table file, without extension.
 
         Returns:
-            List[Dict[str, Any]]: The data from the JSON file.
-
-        Raises:
-            json.JSONDecodeError: If the JSON file is not valid.
+            JsonTable: The table.
         """
-        file_path = self.db_path / f"{filename}.json"
-
-        # Create directory if it doesn't exist
-        self.db_path.mkdir(parents=True, exist_ok=True)
+        with self._tables_lock:
+            table = self._tables.get(filename)
+            if table is None:
+                table = JsonTable(
+                    path=self.db_path / f"{filename}.jsonl",
+                    primary_key=self._get_primary_key(filename),
+                    legacy_path=self.db_path / f"{filename}.json",
+                )
+                self._tables[filename] = table
+            return table
 
-        try:
-            with open(file_path, "r") as f:
-                return json.load(f)
+    def _read_json_file(self, filename: str, create_table_if_not_found: Optional[bool] = True) -> List[Dict[str, Any]]:
+        """Read all records of a table, creating it if it doesn't exist.
 
-        except FileNotFoundError:
-            if create_table_if_not_found:
-                with open(file_path, "w") as f:
-                    json.dump([], f)
-            return []
+        Args:
+            filename (str): The name of the table file to read.
 
-        except json.JSONDecodeError as e:
-            log_error(f"Error reading the {file_path} JSON file")
-            raise e
+        Returns:
+            List[Dict[str, Any]]: The records of the table.
+        """
+        table = self._get_table(filename)
+        if create_table_if_not_found:
+            table.create()
+        return table.records()
 
     def _write_json_file(self, filename: str, data: List[Dict[str, Any]]) -> None:
-        """Write data to a JSON file.
+        """Replace all records of a table. Only the records that changed are written.
 
         Args:
-            filename (str): The name of the JSON file to write.
-            data (List[Dict[str, Any]]): The data to write to the JSON file.
+            filename (str): The name of the table file to write.
+            data (List[Dict[str, Any]]): The records of the table.
 
         Raises:
-            Exception: If an error occurs while writing to the JSON file.
+            Exception: If an error occurs while writing to the table.
         """
-        file_path = self.db_path / f"{filename}.json"
-
-        # Create directory if it doesn't exist
-        self.db_path.mkdir(parents=True, exist_ok=True)
-
         try:
-            with open(file_path, "w") as f:
-                json.dump(data, f, indent=2, default=str)
+            self._get_table(filename).replace(data)
 
         except Exception as e:
-            log_error(f"Error writing to the {file_path} JSON file: {e}")
+            log_error(f"Error writing to the {filename} table: {e}")
             raise e
 
     def get_latest_schema_version(self):
@@ -157,16 +174,11 @@ class JsonDb(BaseDb):
             Exception: If an error occurs during deletion.
         """
         try:
-            sessions = self._read_json_file(self.session_table_name)
-            original_count = len(sessions)
-            sessions = [
-                s
-                for s in sessions
-                if not (s.get("session_id") == session_id and (user_id is None or s.get("user_id") == user_id))
-            ]
-
-            if len(sessions) < original_count:
-                self._write_json_file(self.session_table_name, sessions)
+            table = self._get_table(self.session_table_name)
+            session = table.get(session_id)
+
+            if session is not None and (user_id is None or session.get("user_id") == user_id):
+                table.delete(session_id)
                 log_debug(f"Successfully deleted session with session_id: {session_id}")
                 return True
 
@@ -189,13 +201,14 @@ class JsonDb(BaseDb):
             Exception: If an error occurs during deletion.
         """
         try:
-            sessions = self._read_json_file(self.session_table_name)
-            sessions = [
-                s
-                for s in sessions
-                if not (s.get("session_id") in session_ids and (user_id is None or s.get("user_id") == user_id))
-            ]
-            self._write_json_file(self.session_table_name, sessions)
+            table = self._get_table(self.session_table_name)
+            if user_id is not None:
+                session_ids = [
+                    session_id
+                    for session_id in session_ids
+                    if (session := table.get(session_id)) is not None and session.get("user_id") == user_id
+                ]
+            table.delete_many(session_ids)
             log_debug(f"Successfully deleted sessions with ids: {session_ids}")
 
         except Exception as e:
@@ -208,6 +221,7 @@ class JsonDb(BaseDb):
         session_type: SessionType,
         user_id: Optional[str] = None,
         deserialize: Optional[bool] = True,
+        last_n_runs: Optional[int] = None,
     ) -> Optional[Union[AgentSession, TeamSession, WorkflowSession, Dict[str, Any]]]:
         """Read a session from the JSON file.
 
@@ -216,6 +230,7 @@ class JsonDb(BaseDb):
             session_type (SessionType): The type of the session to read.
             user_id (Optional[str]): The ID of the user to read the session for.
             deserialize (Optional[bool]): Whether to deserialize the session.
+            last_n_runs (Optional[int]): Only load the runs holding the last N history runs. Defaults to all runs.
 
         Returns:
             Union[Session, Dict[str, Any], None]:
@@ -226,26 +241,26 @@ class JsonDb(BaseDb):
             Exception: If an error occurs while reading the session.
         """
         try:
-            sessions = self._read_json_file(self.session_table_name)
+            session_data = self._get_table(self.session_table_name).get(session_id)
 
-            for session_data in sessions:
-                if session_data.get("session_id") == session_id:
-                    if user_id is not None and session_data.get("user_id") != user_id:
-                        continue
+            if session_data is None:
+                return None
+            if user_id is not None and session_data.get("user_id") != user_id:
+                return None
 
-                    if not deserialize:
-                        return session_data
+            previous_runs = apply_runs_window(session_data, last_n_runs)
 
-                    if session_type == SessionType.AGENT:
-                        return AgentSession.from_dict(session_data)
-                    elif session_type == SessionType.TEAM:
-                        return TeamSession.from_dict(session_data)
-                    elif session_type == SessionType.WORKFLOW:
-                        return WorkflowSession.from_dict(session_data)
-                    else:
-                        raise ValueError(f"Invalid session type: {session_type}")
+            if not deserialize:
+                return session_data
 
-            return None
+            if session_type == SessionType.AGENT:
+                return set_previous_runs(AgentSession.from_dict(session_data), previous_runs)
+            elif session_type == SessionType.TEAM:
+                return set_previous_runs(TeamSession.from_dict(session_data), previous_runs)
+            elif session_type == SessionType.WORKFLOW:
+                return set_previous_runs(WorkflowSession.from_dict(session_data), previous_runs)
+            else:
+                raise ValueError(f"Invalid session type: {session_type}")
 
         except Exception as e:
             log_error(f"Exception reading from session file: {e}")
@@ -356,35 +371,34 @@ class JsonDb(BaseDb):
     ) -> Optional[Union[Session, Dict[str, Any]]]:
         """Rename a session in the JSON file."""
         try:
-            sessions = self._read_json_file(self.session_table_name)
+            table = self._get_table(self.session_table_name)
+            session = table.get(session_id)
 
-            for i, session in enumerate(sessions):
-                if session.get("session_id") == session_id and session.get("session_type") == session_type.value:
-                    if user_id is not None and session.get("user_id") != user_id:
-                        continue
-                    # Update session name in session_data
-                    if "session_data" not in session:
-                        session["session_data"] = {}
-                    session["session_data"]["session_name"] = session_name
+            if session is None or session.get("session_type") != session_type.value:
+                return None
+            if user_id is not None and session.get("user_id") != user_id:
+                return None
 
-                    sessions[i] = session
-                    self._write_json_file(self.session_table_name, sessions)
+            # Update session name in session_data
+            if "session_data" not in session:
+                session["session_data"] = {}
+            session["session_data"]["session_name"] = session_name
 
-                    log_debug(f"Renamed session with id '{session_id}' to '{session_name}'")
+            table.put(session)
 
-                    if not deserialize:
-                        return session
+            log_debug(f"Renamed session with id '{session_id}' to '{session_name}'")
 
-                    if session_type == SessionType.AGENT:
-                        return AgentSession.from_dict(session)
-                    elif session_type == SessionType.TEAM:
-                        return TeamSession.from_dict(session)
-                    elif session_type == SessionType.WORKFLOW:
-                        return WorkflowSession.from_dict(session)
-                    else:
-                        raise ValueError(f"Invalid session type: {session_type}")
+            if not deserialize:
+                return session
 
-            return None
+            if session_type == SessionType.AGENT:
+                return AgentSession.from_dict(session)
+            elif session_type == SessionType.TEAM:
+                return TeamSession.from_dict(session)
+            elif session_type == SessionType.WORKFLOW:
+                return WorkflowSession.from_dict(session)
+            else:
+                raise ValueError(f"Invalid session type: {session_type}")
 
         except Exception as e:
             log_error(f"Exception renaming session: {e}")
@@ -395,7 +409,7 @@ class JsonDb(BaseDb):
     ) -> Optional[Union[Session, Dict[str, Any]]]:
         """Insert or update a session in the JSON file."""
         try:
-            sessions = self._read_json_file(self.session_table_name, create_table_if_not_found=True)
+            table = self._get_table(self.session_table_name)
             session_dict = session.to_dict()
 
             # Add session_type based on session instance type
@@ -407,27 +421,21 @@ class JsonDb(BaseDb):
                 session_dict["session_type"] = SessionType.WORKFLOW.value
 
             # Find existing session to update
-            session_updated = False
-            for i, existing_session in enumerate(sessions):
-                if existing_session.get("session_id") == session_dict.get("session_id") and self._matches_session_key(
-                    existing_session, session
-                ):
-                    existing_uid = existing_session.get("user_id")
-                    if existing_uid is not None and existing_uid != session_dict.get("user_id"):
-                        return None
-                    # Update existing session
-                    session_dict["updated_at"] = int(time.time())
-                    sessions[i] = session_dict
-                    session_updated = True
-                    break
-
-            if not session_updated:
+            existing_session = table.get(session.session_id)
+            if existing_session is not None:
+                # Never overwrite a session held by another user
+                existing_uid = existing_session.get("user_id")
+                if existing_uid is not None and existing_uid != session_dict.get("user_id"):
+                    return None
+            if existing_session is not None and self._matches_session_key(existing_session, session):
+                # Update existing session
+                session_dict["updated_at"] = int(time.time())
+            else:
                 # Add new session
                 session_dict["created_at"] = session_dict.get("created_at", int(time.time()))
                 session_dict["updated_at"] = session_dict.get("created_at")
-                sessions.append(session_dict)
 
-            self._write_json_file(self.session_table_name, sessions)
+            table.put(session_dict)
 
             if not deserialize:
                 return session_dict
@@ -494,25 +502,16 @@ class JsonDb(BaseDb):
             user_id (Optional[str]): The ID of the user (optional, for filtering).
         """
         try:
-            memories = self._read_json_file(self.memory_table_name)
-            original_count = len(memories)
+            table = self._get_table(self.memory_table_name)
 
             # If user_id is provided, verify the memory belongs to the user before deleting
             if user_id is not None:
-                memory_to_delete = None
-                for m in memories:
-                    if m.get("memory_id") == memory_id:
-                        memory_to_delete = m
-                        break
-
+                memory_to_delete = table.get(memory_id)
                 if memory_to_delete and memory_to_delete.get("user_id") != user_id:
                     log_debug(f"Memory {memory_id} does not belong to user {user_id}")
                     return
 
-            memories = [m for m in memories if m.get("memory_id") != memory_id]
-
-            if len(memories) < original_count:
-                self._write_json_file(self.memory_table_name, memories)
+            if table.delete(memory_id):
                 log_debug(f"Successfully deleted user memory id: {memory_id}")
             else:
                 log_debug(f"No memory found with id: {memory_id}")
@@ -529,18 +528,17 @@ class JsonDb(BaseDb):
             user_id (Optional[str]): The ID of the user (optional, for filtering).
         """
         try:
-            memories = self._read_json_file(self.memory_table_name)
+            table = self._get_table(self.memory_table_name)
 
             # If user_id is provided, filter memory_ids to only those belonging to the user
             if user_id is not None:
-                filtered_memory_ids: List[str] = []
-                for memory in memories:
-                    if memory.get("memory_id") in memory_ids and memory.get("user_id") == user_id:
-                        filtered_memory_ids.append(memory.get("memory_id"))  # type: ignore
-                memory_ids = filtered_memory_ids
+                memory_ids = [
+                    memory_id
+                    for memory_id in memory_ids
+                    if (memory := table.get(memory_id)) is not None and memory.get("user_id") == user_id
+                ]
 
-            memories = [m for m in memories if m.get("memory_id") not in memory_ids]
-            self._write_json_file(self.memory_table_name, memories)
+            table.delete_many(memory_ids)
 
             log_debug(f"Successfully deleted {len(memory_ids)} user memories")
 
@@ -585,19 +583,17 @@ class JsonDb(BaseDb):
             Optional[Union[UserMemory, Dict[str, Any]]]: The user memory data if found, None otherwise.
         """
         try:
-            memories = self._read_json_file(self.memory_table_name)
-
-            for memory_data in memories:
-                if memory_data.get("memory_id") == memory_id:
-                    # Filter by user_id if provided
-                    if user_id and memory_data.get("user_id") != user_id:
-                        return None
+            memory_data = self._get_table(self.memory_table_name).get(memory_id)
 
-                    if not deserialize:
-                        return memory_data
-                    return UserMemory.from_dict(memory_data)
+            if memory_data is None:
+                return None
+            # Filter by user_id if provided
+            if user_id and memory_data.get("user_id") != user_id:
+                return None
 
-            return None
+            if not deserialize:
+                return memory_data
+            return UserMemory.from_dict(memory_data)
 
         except Exception as e:
             log_error(f"Exception reading from memory file: {e}")
@@ -718,26 +714,13 @@ class JsonDb(BaseDb):
     ) -> Optional[Union[UserMemory, Dict[str, Any]]]:
         """Upsert a user memory in the JSON file."""
         try:
-            memories = self._read_json_file(self.memory_table_name, create_table_if_not_found=True)
-
             if memory.memory_id is None:
                 memory.memory_id = str(uuid4())
 
             memory_dict = memory.to_dict() if hasattr(memory, "to_dict") else memory.__dict__
             memory_dict["updated_at"] = int(time.time())
 
-            # Find existing memory to update
-            memory_updated = False
-            for i, existing_memory in enumerate(memories):
-                if existing_memory.get("memory_id") == memory.memory_id:
-                    memories[i] = memory_dict
-                    memory_updated = True
-                    break
-
-            if not memory_updated:
-                memories.append(memory_dict)
-
-            self._write_json_file(self.memory_table_name, memories)
+            self._get_table(self.memory_table_name).put(memory_dict)
 
             if not deserialize:
                 return memory_dict
@@ -790,8 +773,7 @@ class JsonDb(BaseDb):
             Exception: If an error occurs during deletion.
         """
         try:
-            # Simply write an empty list to the memory JSON file
-            self._write_json_file(self.memory_table_name, [])
+            self._get_table(self.memory_table_name).clear()
 
         except Exception as e:
             log_warning(f"Exception deleting all memories: {e}")
@@ -965,9 +947,7 @@ class JsonDb(BaseDb):
             Exception: If an error occurs during deletion.
         """
         try:
-            knowledge_items = self._read_json_file(self.knowledge_table_name)
-            knowledge_items = [item for item in knowledge_items if item.get("id") != id]
-            self._write_json_file(self.knowledge_table_name, knowledge_items)
+            self._get_table(self.knowledge_table_name).delete(id)
 
         except Exception as e:
             log_error(f"Error deleting knowledge content: {e}")
@@ -986,13 +966,9 @@ class JsonDb(BaseDb):
             Exception: If an error occurs during retrieval.
         """
         try:
-            knowledge_items = self._read_json_file(self.knowledge_table_name)
+            item = self._get_table(self.knowledge_table_name).get(id)
 
-            for item in knowledge_items:
-                if item.get("id") == id:
-                    return KnowledgeRow.model_validate(item)
-
-            return None
+            return KnowledgeRow.model_validate(item) if item is not None else None
 
         except Exception as e:
             log_error(f"Error getting knowledge content: {e}")
@@ -1059,21 +1035,7 @@ class JsonDb(BaseDb):
             Exception: If an error occurs during upsert.
         """
         try:
-            knowledge_items = self._read_json_file(self.knowledge_table_name, create_table_if_not_found=True)
-            knowledge_dict = knowledge_row.model_dump()
-
-            # Find existing item to update
-            item_updated = False
-            for i, existing_item in enumerate(knowledge_items):
-                if existing_item.get("id") == knowledge_row.id:
-                    knowledge_items[i] = knowledge_dict
-                    item_updated = True
-                    break
-
-            if not item_updated:
-                knowledge_items.append(knowledge_dict)
-
-            self._write_json_file(self.knowledge_table_name, knowledge_items)
+            self._get_table(self.knowledge_table_name).put(knowledge_row.model_dump())
 
             return knowledge_row
 
@@ -1086,15 +1048,12 @@ class JsonDb(BaseDb):
     def create_eval_run(self, eval_run: EvalRunRecord) -> Optional[EvalRunRecord]:
         """Create an EvalRunRecord in the JSON file."""
         try:
-            eval_runs = self._read_json_file(self.eval_table_name, create_table_if_not_found=True)
-
             current_time = int(time.time())
             eval_dict = eval_run.model_dump()
             eval_dict["created_at"] = current_time
             eval_dict["updated_at"] = current_time
 
-            eval_runs.append(eval_dict)
-            self._write_json_file(self.eval_table_name, eval_runs)
+            self._get_table(self.eval_table_name).put(eval_dict)
 
             log_debug(f"Created eval run with id '{eval_run.run_id}'")
 
@@ -1107,12 +1066,7 @@ class JsonDb(BaseDb):
     def delete_eval_run(self, eval_run_id: str) -> None:
         """Delete an eval run from the JSON file."""
         try:
-            eval_runs = self._read_json_file(self.eval_table_name)
-            original_count = len(eval_runs)
-            eval_runs = [run for run in eval_runs if run.get("run_id") != eval_run_id]
-
-            if len(eval_runs) < original_count:
-                self._write_json_file(self.eval_table_name, eval_runs)
+            if self._get_table(self.eval_table_name).delete(eval_run_id):
                 log_debug(f"Deleted eval run with ID: {eval_run_id}")
             else:
                 log_debug(f"No eval run found with ID: {eval_run_id}")
@@ -1124,13 +1078,8 @@ class JsonDb(BaseDb):
     def delete_eval_runs(self, eval_run_ids: List[str]) -> None:
         """Delete multiple eval runs from the JSON file."""
         try:
-            eval_runs = self._read_json_file(self.eval_table_name)
-            original_count = len(eval_runs)
-            eval_runs = [run for run in eval_runs if run.get("run_id") not in eval_run_ids]
-
-            deleted_count = original_count - len(eval_runs)
+            deleted_count = self._get_table(self.eval_table_name).delete_many(eval_run_ids)
             if deleted_count > 0:
-                self._write_json_file(self.eval_table_name, eval_runs)
                 log_debug(f"Deleted {deleted_count} eval runs")
             else:
                 log_debug(f"No eval runs found with IDs: {eval_run_ids}")
@@ -1144,15 +1093,13 @@ class JsonDb(BaseDb):
     ) -> Optional[Union[EvalRunRecord, Dict[str, Any]]]:
         """Get an eval run from the JSON file."""
         try:
-            eval_runs = self._read_json_file(self.eval_table_name)
-
-            for run_data in eval_runs:
-                if run_data.get("run_id") == eval_run_id:
-                    if not deserialize:
-                        return run_data
-                    return EvalRunRecord.model_validate(run_data)
+            run_data = self._get_table(self.eval_table_name).get(eval_run_id)
 
-            return None
+            if run_data is None:
+                return None
+            if not deserialize:
+                return run_data
+            return EvalRunRecord.model_validate(run_data)
 
         except Exception as e:
             log_error(f"Exception getting eval run {eval_run_id}: {e}")
@@ -1229,23 +1176,22 @@ class JsonDb(BaseDb):
     ) -> Optional[Union[EvalRunRecord, Dict[str, Any]]]:
         """Rename an eval run in the JSON file."""
         try:
-            eval_runs = self._read_json_file(self.eval_table_name)
+            table = self._get_table(self.eval_table_name)
+            run_data = table.get(eval_run_id)
 
-            for i, run_data in enumerate(eval_runs):
-                if run_data.get("run_id") == eval_run_id:
-                    run_data["name"] = name
-                    run_data["updated_at"] = int(time.time())
-                    eval_runs[i] = run_data
-                    self._write_json_file(self.eval_table_name, eval_runs)
+            if run_data is None:
+                return None
 
-                    log_debug(f"Renamed eval run with id '{eval_run_id}' to '{name}'")
+            run_data["name"] = name
+            run_data["updated_at"] = int(time.time())
+            table.put(run_data)
 
-                    if not deserialize:
-                        return run_data
+            log_debug(f"Renamed eval run with id '{eval_run_id}' to '{name}'")
 
-                    return EvalRunRecord.model_validate(run_data)
+            if not deserialize:
+                return run_data
 
-            return None
+            return EvalRunRecord.model_validate(run_data)
 
         except Exception as e:
             log_error(f"Error renaming eval run {eval_run_id}: {e}")
@@ -1256,7 +1202,7 @@ class JsonDb(BaseDb):
     def clear_cultural_knowledge(self) -> None:
         """Delete all cultural knowledge from JSON file."""
         try:
-            self._write_json_file(self.culture_table_name, [])
+            self._get_table(self.culture_table_name).clear()
         except Exception as e:
             log_error(f"Error clearing cultural knowledge: {e}")
             raise e
@@ -1264,9 +1210,7 @@ class JsonDb(BaseDb):
     def delete_cultural_knowledge(self, id: str) -> None:
         """Delete a cultural knowledge entry from JSON file."""
         try:
-            cultural_knowledge = self._read_json_file(self.culture_table_name)
-            cultural_knowledge = [ck for ck in cultural_knowledge if ck.get("id") != id]
-            self._write_json_file(self.culture_table_name, cultural_knowledge)
+            self._get_table(self.culture_table_name).delete(id)
         except Exception as e:
             log_error(f"Error deleting cultural knowledge: {e}")
             raise e
@@ -1276,13 +1220,12 @@ class JsonDb(BaseDb):
     ) -> Optional[Union[CulturalKnowledge, Dict[str, Any]]]:
         """Get a cultural knowledge entry from JSON file."""
         try:
-            cultural_knowledge = self._read_json_file(self.culture_table_name)
-            for ck in cultural_knowledge:
-                if ck.get("id") == id:
-                    if not deserialize:
-                        return ck
-                    return deserialize_cultural_knowledge_from_db(ck)
-            return None
+            ck = self._get_table(self.culture_table_name).get(id)
+            if ck is None:
+                return None
+            if not deserialize:
+                return ck
+            return deserialize_cultural_knowledge_from_db(ck)
         except Exception as e:
             log_error(f"Error getting cultural knowledge: {e}")
             raise e
@@ -1342,8 +1285,6 @@ class JsonDb(BaseDb):
             if not cultural_knowledge.id:
                 cultural_knowledge.id = str(uuid4())
 
-            all_cultural_knowledge = self._read_json_file(self.culture_table_name, create_table_if_not_found=True)
-
             # Serialize content, categories, and notes into a dict for DB storage
             content_dict = serialize_cultural_knowledge_for_db(cultural_knowledge)
 
@@ -1361,13 +1302,7 @@ class JsonDb(BaseDb):
                 "team_id": cultural_knowledge.team_id,
             }
 
-            # Remove existing entry
-            all_cultural_knowledge = [ck for ck in all_cultural_knowledge if ck.get("id") != cultural_knowledge.id]
-
-            # Add new entry
-            all_cultural_knowledge.append(ck_dict)
-
-            self._write_json_file(self.culture_table_name, all_cultural_knowledge)
+            self._get_table(self.culture_table_name).put(ck_dict)
 
             return self.get_cultural_knowledge(cultural_knowledge.id, deserialize=deserialize)
         except Exception as e:
@@ -1382,18 +1317,12 @@ class JsonDb(BaseDb):
             trace: The Trace object to store (one per trace_id).
         """
         try:
-            traces = self._read_json_file(self.trace_table_name, create_table_if_not_found=True)
+            table = self._get_table(self.trace_table_name)
 
             # Check if trace exists
-            existing_idx = None
-            for i, existing in enumerate(traces):
-                if existing.get("trace_id") == trace.trace_id:
-                    existing_idx = i
-                    break
-
-            if existing_idx is not None:
-                existing = traces[existing_idx]
+            existing = table.get(trace.trace_id)
 
+            if existing is not None:
                 # workflow (level 3) > team (level 2) > agent (level 1) > child/unknown (level 0)
                 def get_component_level(workflow_id, team_id, agent_id, name):
                     is_root_name = ".run" in name or ".arun" in name
@@ -1447,15 +1376,13 @@ class JsonDb(BaseDb):
                 if trace.workflow_id is not None:
                     existing["workflow_id"] = trace.workflow_id
 
-                traces[existing_idx] = existing
+                table.put(existing)
             else:
                 # Add new trace
                 trace_dict = trace.to_dict()
                 trace_dict.pop("total_spans", None)
                 trace_dict.pop("error_count", None)
-                traces.append(trace_dict)
-
-            self._write_json_file(self.trace_table_name, traces)
+                table.put(trace_dict)
 
         except Exception as e:
             log_error(f"Error creating trace: {e}")
@@ -1477,25 +1404,22 @@ class JsonDb(BaseDb):
         try:
             from agno.tracing.schemas import Trace
 
-            traces = self._read_json_file(self.trace_table_name, create_table_if_not_found=False)
-            if not traces:
-                return None
-
-            # Get spans for calculating total_spans and error_count
-            spans = self._read_json_file(self.span_table_name, create_table_if_not_found=False)
-
             # Filter traces
             filtered = []
-            for t in traces:
-                if trace_id and t.get("trace_id") == trace_id:
-                    filtered.append(t)
-                    break
-                elif run_id and t.get("run_id") == run_id:
-                    filtered.append(t)
+            if trace_id:
+                trace_by_id = self._get_table(self.trace_table_name).get(trace_id)
+                if trace_by_id is not None:
+                    filtered.append(trace_by_id)
+            if not filtered and run_id:
+                traces = self._read_json_file(self.trace_table_name, create_table_if_not_found=False)
+                filtered = [t for t in traces if t.get("run_id") == run_id]
 
             if not filtered:
                 return None
 
+            # Get spans for calculating total_spans and error_count
+            spans = self._read_json_file(self.span_table_name, create_table_if_not_found=False)
+
             # Sort by start_time desc and get first
             filtered.sort(key=lambda x: x.get("start_time", ""), reverse=True)
             trace_data = filtered[0]
@@ -1711,9 +1635,7 @@ class JsonDb(BaseDb):
             span: The Span object to store.
         """
         try:
-            spans = self._read_json_file(self.span_table_name, create_table_if_not_found=True)
-            spans.append(span.to_dict())
-            self._write_json_file(self.span_table_name, spans)
+            self._get_table(self.span_table_name).put(span.to_dict())
 
         except Exception as e:
             log_error(f"Error creating span: {e}")
@@ -1728,10 +1650,7 @@ class JsonDb(BaseDb):
             return
 
         try:
-            existing_spans = self._read_json_file(self.span_table_name, create_table_if_not_found=True)
-            for span in spans:
-                existing_spans.append(span.to_dict())
-            self._write_json_file(self.span_table_name, existing_spans)
+            self._get_table(self.span_table_name).put_many([span.to_dict() for span in spans])
 
         except Exception as e:
             log_error(f"Error creating spans batch: {e}")
@@ -1748,13 +1667,9 @@ class JsonDb(BaseDb):
         try:
             from agno.tracing.schemas import Span
 
-            spans = self._read_json_file(self.span_table_name, create_table_if_not_found=False)
-
-            for s in spans:
-                if s.get("span_id") == span_id:
-                    return Span.from_dict(s)
+            span = self._get_table(self.span_table_name).get(span_id)
 
-            return None
+            return Span.from_dict(span) if span is not None else None
 
         except Exception as e:
             log_error(f"Error getting span: {e}")
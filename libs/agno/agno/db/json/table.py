@@ -0,0 +1,288 @@
+import json
+import os
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+from uuid import uuid4
+
+from agno.utils.log import log_debug, log_info, log_warning
+
+try:
+    import fcntl
+except ImportError:  # Windows: only the threads of a process are synchronized
+    fcntl = None  # type: ignore
+
+# Key of the first line of a log, identifying it so readers notice when the log was compacted
+LOG_ID_KEY = "__log_id__"
+# Key of the lines deleting a record
+DELETED_KEY = "__deleted__"
+
+
+class JsonTable:
+    """A JsonDb table stored as an append-only JSONL log, with an in-memory index by primary key.
+
+    Each line of the log holds a record, replacing any previous record with the same key, or deletes a key. Reads
+    are served from the index, after applying the lines other processes appended since the last read. Writes only
+    append the records that changed, holding a lock file so several processes can share the table.
+
+    The log is compacted, keeping only the live records, when it holds more than `compaction_ratio` lines per
+    record and at least `min_compaction_lines` lines.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        primary_key: str,
+        legacy_path: Optional[Path] = None,
+        compaction_ratio: float = 2.0,
+        min_compaction_lines: int = 1000,
+    ):
+        """
+        Args:
+            path (Path): Path of the JSONL log.
+            primary_key (str): Record field used as key. Records without it are keyed by their content.
+            legacy_path (Optional[Path]): Path of a JSON file with a list of records, imported if the log doesn't exist.
+            compaction_ratio (float): Maximum number of log lines per record before compacting.
+            min_compaction_lines (int): Minimum number of log lines before compacting.
+        """
+        self.path = path
+        self.primary_key = primary_key
+        self.legacy_path = legacy_path
+        self.compaction_ratio = compaction_ratio
+        self.min_compaction_lines = min_compaction_lines
+        self.lock_path = path.with_name(f"{path.name}.lock")
+
+        # Serialized records by key, in insertion order
+        self._index: Dict[str, str] = {}
+        # Number of record and delete lines in the log
+        self._lines = 0
+        # The log read so far: its id, the position up to which it was read and its last seen stat
+        self._log_id: Optional[str] = None
+        self._offset = 0
+        self._stat: Optional[Tuple[int, int, int]] = None
+        self._loaded = False
+        self._lock = threading.RLock()
+
+    # -- Reads --
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get a copy of the record with the given key."""
+        with self._lock:
+            self._refresh()
+            line = self._index.get(key)
+        return json.loads(line) if line is not None else None
+
+    def records(self) -> List[Dict[str, Any]]:
+        """Get copies of all records, in insertion order."""
+        with self._lock:
+            self._refresh()
+            lines = list(self._index.values())
+        return [json.loads(line) for line in lines]
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._refresh()
+            return len(self._index)
+
+    # -- Writes --
+
+    def create(self) -> None:
+        """Create the log if it doesn't exist."""
+        with self._lock:
+            self._refresh()
+            if self._log_id is None:
+                with self._file_lock():
+                    self._refresh()
+                    if self._log_id is None:
+                        self._write_log({})
+
+    def put(self, record: Dict[str, Any]) -> None:
+        """Insert or replace a record."""
+        self.put_many([record])
+
+    def put_many(self, records: Sequence[Dict[str, Any]]) -> None:
+        """Insert or replace records."""
+        entries = self._serialize_records(records)
+        with self._lock, self._file_lock():
+            self._refresh()
+            self._append([(key, line) for key, line in entries.items() if self._index.get(key) != line])
+
+    def delete(self, key: str) -> bool:
+        """Delete the record with the given key. Returns True if it existed."""
+        return self.delete_many([key]) > 0
+
+    def delete_many(self, keys: Sequence[str]) -> int:
+        """Delete the records with the given keys. Returns the number of records deleted."""
+        with self._lock, self._file_lock():
+            self._refresh()
+            existing_keys = list(dict.fromkeys(key for key in keys if key in self._index))
+            self._append([(key, None) for key in existing_keys])
+        return len(existing_keys)
+
+    def replace(self, records: Sequence[Dict[str, Any]]) -> None:
+        """Replace all records, only appending the records that changed and deleting the missing ones."""
+        entries = self._serialize_records(records)
+        with self._lock, self._file_lock():
+            self._refresh()
+            deleted: List[Tuple[str, Optional[str]]] = [(key, None) for key in self._index if key not in entries]
+            changed: List[Tuple[str, Optional[str]]] = [
+                (key, line) for key, line in entries.items() if self._index.get(key) != line
+            ]
+            self._append(deleted + changed)
+
+    def clear(self) -> None:
+        """Delete all records."""
+        with self._lock, self._file_lock():
+            self._write_log({})
+
+    def compact(self) -> None:
+        """Rewrite the log with only the live records."""
+        with self._lock, self._file_lock():
+            self._refresh()
+            self._write_log(dict(self._index))
+
+    # -- Log handling --
+
+    def _serialize_records(self, records: Sequence[Dict[str, Any]]) -> Dict[str, str]:
+        """Serialize records by key. Records without a primary key are keyed by their content."""
+        entries: Dict[str, str] = {}
+        for record in records:
+            line = json.dumps(record, default=str)
+            key = record.get(self.primary_key)
+            entries[str(key) if key is not None else line] = line
+        return entries
+
+    def _apply(self, line: str) -> None:
+        """Apply a log line to the index."""
+        try:
+            data = json.loads(line)
+        except json.JSONDecodeError:
+            log_warning(f"Skipping invalid line in {self.path}")
+            return
+        if not isinstance(data, dict) or LOG_ID_KEY in data:
+            return
+        self._lines += 1
+        if DELETED_KEY in data:
+            self._index.pop(data[DELETED_KEY], None)
+            return
+        key = data.get(self.primary_key)
+        self._index[str(key) if key is not None else line] = line
+
+    def _reset(self) -> None:
+        self._index = {}
+        self._lines = 0
+        self._log_id = None
+        self._offset = 0
+        self._stat = None
+
+    def _refresh(self) -> None:
+        """Apply the lines appended to the log since the last read, reloading it if it was replaced."""
+        if not self._loaded:
+            self._loaded = True
+            if self.legacy_path is not None and self.legacy_path.exists() and not self.path.exists():
+                with self._file_lock():
+                    if not self.path.exists():
+                        self._import_legacy_file(self.legacy_path)
+
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            self._reset()
+            return
+
+        current_stat = (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+        if current_stat == self._stat:
+            return
+
+        with open(self.path, "rb") as f:
+            header = f.readline()
+            log_id = self._parse_log_id(header)
+            if log_id is None or log_id != self._log_id or stat.st_size < self._offset:
+                # The log is new or was compacted: read it from the start
+                self._reset()
+                self._log_id = log_id
+                self._offset = len(header) if header.endswith(b"\n") else 0
+            f.seek(self._offset)
+            data = f.read()
+
+        # Only apply complete lines: the last line may still be written, or cut by a crash
+        end = data.rfind(b"\n") + 1
+        for line in data[:end].decode().split("\n"):
+            if line.strip():
+                self._apply(line)
+        self._offset += end
+        self._stat = current_stat if self._offset == stat.st_size else None
+
+    def _parse_log_id(self, header: bytes) -> Optional[str]:
+        try:
+            data = json.loads(header)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            return None
+        return data.get(LOG_ID_KEY) if isinstance(data, dict) else None
+
+    def _append(self, entries: List[Tuple[str, Optional[str]]]) -> None:
+        """Append records, or deletes if the line is None, to the log. Must hold the file lock, after a refresh."""
+        if not entries:
+            return
+        if self._log_id is None:
+            self._write_log(dict(self._index))
+        lines = [line if line is not None else json.dumps({DELETED_KEY: key}) for key, line in entries]
+        payload = "".join(f"{line}\n" for line in lines).encode()
+        with open(self.path, "r+b") as f:
+            # Drop a line cut by a crash, so it doesn't corrupt the appended lines
+            f.truncate(self._offset)
+            f.seek(self._offset)
+            f.write(payload)
+        for key, line in entries:
+            self._lines += 1
+            if line is None:
+                self._index.pop(key, None)
+            else:
+                self._index[key] = line
+        self._offset += len(payload)
+        stat = os.stat(self.path)
+        self._stat = (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+
+        if self._lines >= self.min_compaction_lines and self._lines > self.compaction_ratio * len(self._index):
+            log_debug(f"Compacting {self.path}: {self._lines} lines for {len(self._index)} records")
+            self._write_log(dict(self._index))
+
+    def _write_log(self, entries: Dict[str, str]) -> None:
+        """Atomically replace the log with a new one holding the given serialized records. Must hold the file lock."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        log_id = uuid4().hex
+        tmp_path = self.path.with_name(f"{self.path.name}.{log_id}.tmp")
+        with open(tmp_path, "w") as f:
+            f.write(json.dumps({LOG_ID_KEY: log_id}) + "\n")
+            for line in entries.values():
+                f.write(f"{line}\n")
+        os.replace(tmp_path, self.path)
+
+        self._reset()
+        self._log_id = log_id
+        self._index = dict(entries)
+        self._lines = len(entries)
+        stat = os.stat(self.path)
+        self._offset = stat.st_size
+        self._stat = (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+
+    def _import_legacy_file(self, legacy_path: Path) -> None:
+        """Create the log from a JSON file holding a list of records."""
+        with open(legacy_path, "r") as f:
+            records = json.load(f)
+        self._write_log(self._serialize_records(records))
+        log_info(f"Imported {len(records)} records from {legacy_path} into {self.path}")
+
+    @contextmanager
+    def _file_lock(self) -> Iterator[None]:
+        """Hold the lock file of the table, excluding the writers of other processes."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.lock_path, "a") as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
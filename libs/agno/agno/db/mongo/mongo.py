@@ -14,6 +14,7 @@ if TYPE_CHECKING:
 
 from agno.db.base import BaseDb, SessionType
 from agno.db.mongo.utils import (
+    RUNS_WINDOW_STATES_PROJECTION,
     apply_pagination,
     apply_sorting,
     bulk_upsert_metrics,
@@ -22,19 +23,26 @@ from agno.db.mongo.utils import (
     deserialize_cultural_knowledge_from_db,
     fetch_all_sessions_data,
     get_dates_to_calculate_metrics_for,
+    get_runs_window_projection,
+    get_session_update_pipeline,
     serialize_cultural_knowledge_for_db,
 )
 from agno.db.schemas.culture import CulturalKnowledge
 from agno.db.schemas.evals import EvalFilterType, EvalRunRecord, EvalType
 from agno.db.schemas.knowledge import KnowledgeRow
 from agno.db.schemas.memory import UserMemory
-from agno.db.utils import deserialize_session_json_fields
+from agno.db.utils import (
+    apply_runs_window,
+    deserialize_session_json_fields,
+    get_unloaded_runs_count,
+    set_previous_runs,
+)
 from agno.session import AgentSession, Session, TeamSession, WorkflowSession
 from agno.utils.log import log_debug, log_error, log_info
 from agno.utils.string import generate_id
 
 try:
-    from pymongo import MongoClient, ReturnDocument
+    from pymongo import MongoClient, ReturnDocument, UpdateOne
     from pymongo.collection import Collection
     from pymongo.database import Database
     from pymongo.driver_info import DriverInfo
@@ -361,6 +369,7 @@ class MongoDb(BaseDb):
         session_type: SessionType,
         user_id: Optional[str] = None,
         deserialize: Optional[bool] = True,
+        last_n_runs: Optional[int] = None,
     ) -> Optional[Union[Session, Dict[str, Any]]]:
         """Read a session from the database.
 
@@ -369,6 +378,7 @@ class MongoDb(BaseDb):
             session_type (SessionType): The type of session to get.
             user_id (Optional[str]): The ID of the user to get the session for.
             deserialize (Optional[bool]): Whether to serialize the session. Defaults to True.
+            last_n_runs (Optional[int]): Only load the runs holding the last N history runs. Defaults to all runs.
 
         Returns:
             Union[Session, Dict[str, Any], None]:
@@ -387,20 +397,31 @@ class MongoDb(BaseDb):
             if user_id is not None:
                 query["user_id"] = user_id
 
-            result = collection.find_one(query)
+            runs_offset, projection = 0, None
+            if last_n_runs:
+                # Read the status fields of the runs first, to then read only the runs in the window
+                runs_states = collection.find_one(query, RUNS_WINDOW_STATES_PROJECTION)
+                if runs_states is None:
+                    return None
+                runs_offset, projection = get_runs_window_projection(runs_states, last_n_runs)
+
+            result = collection.find_one(query, projection)
             if result is None:
                 return None
 
             session = deserialize_session_json_fields(result)
+            # Runs stored as a JSON string can only be windowed after reading them
+            previous_runs = apply_runs_window(session, last_n_runs) if not runs_offset else []
+
             if not deserialize:
                 return session
 
             if session_type == SessionType.AGENT:
-                return AgentSession.from_dict(session)
+                return set_previous_runs(AgentSession.from_dict(session), previous_runs, runs_offset)
             elif session_type == SessionType.TEAM:
-                return TeamSession.from_dict(session)
+                return set_previous_runs(TeamSession.from_dict(session), previous_runs, runs_offset)
             elif session_type == SessionType.WORKFLOW:
-                return WorkflowSession.from_dict(session)
+                return set_previous_runs(WorkflowSession.from_dict(session), previous_runs, runs_offset)
             else:
                 raise ValueError(f"Invalid session type: {session_type}")
 
@@ -408,6 +429,82 @@ class MongoDb(BaseDb):
             log_error(f"Exception reading session: {e}")
             raise e
 
+    def get_run(self, run_id: str, session_id: str, session_type: SessionType) -> Optional[Dict[str, Any]]:
+        """Read a single run of a session, projecting only the requested run out of the session document.
+
+        Args:
+            run_id (str): ID of the run to read.
+            session_id (str): ID of the session the run belongs to.
+            session_type (SessionType): Type of the session.
+
+        Returns:
+            Optional[Dict[str, Any]]: The serialized run, or None if not found.
+
+        Raises:
+            Exception: If there is an error reading the run.
+        """
+        try:
+            collection = self._get_collection(table_type="sessions")
+            if collection is None:
+                return None
+
+            result = collection.find_one(
+                {"session_id": session_id, "session_type": session_type.value},
+                {"_id": 0, "runs": {"$elemMatch": {"run_id": run_id}}},
+            )
+            runs = result.get("runs") if result else None
+            return runs[0] if runs else None
+
+        except Exception as e:
+            log_error(f"Exception reading run: {e}")
+            raise e
+
+    def list_runs(
+        self,
+        session_id: str,
+        session_type: SessionType,
+        status: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Read the runs of a session, filtering and limiting them in the database.
+
+        Args:
+            session_id (str): ID of the session to read the runs of.
+            session_type (SessionType): Type of the session.
+            status (Optional[str]): Only return the runs with this status, e.g. "RUNNING".
+            limit (Optional[int]): Maximum number of runs to return. The most recent runs are kept.
+
+        Returns:
+            List[Dict[str, Any]]: The serialized runs, in session order.
+
+        Raises:
+            Exception: If there is an error reading the runs.
+        """
+        try:
+            collection = self._get_collection(table_type="sessions")
+            if collection is None or (limit is not None and limit <= 0):
+                return []
+
+            runs: Any = {"$ifNull": ["$runs", []]}
+            if status is not None:
+                runs = {"$filter": {"input": runs, "as": "run", "cond": {"$eq": ["$$run.status", status]}}}
+            if limit is not None:
+                runs = {"$slice": [runs, -limit]}
+
+            results = list(
+                collection.aggregate(
+                    [
+                        {"$match": {"session_id": session_id, "session_type": session_type.value}},
+                        {"$project": {"_id": 0, "runs": runs}},
+                    ]
+                )
+            )
+            return results[0].get("runs") or [] if results else []
+
+        except Exception as e:
+            log_error(f"Exception reading runs: {e}")
+            raise e
+
     def get_sessions(
         self,
         session_type: Optional[SessionType] = None,
@@ -587,6 +684,22 @@ class MongoDb(BaseDb):
             log_error(f"Exception renaming session: {e}")
             raise e
 
+    def _replace_session_record(
+        self, collection: Collection, upsert_filter: Dict[str, Any], record: Dict[str, Any], session: Session
+    ) -> Optional[Dict[str, Any]]:
+        """Replace the stored session document, keeping the stored runs preceding a run window read in the database."""
+        runs_offset = get_unloaded_runs_count(session)
+        if runs_offset:
+            return collection.find_one_and_update(
+                filter=upsert_filter,
+                update=get_session_update_pipeline(record, runs_offset),
+                upsert=True,
+                return_document=ReturnDocument.AFTER,
+            )
+        return collection.find_one_and_replace(
+            filter=upsert_filter, replacement=record, upsert=True, return_document=ReturnDocument.AFTER
+        )
+
     def upsert_session(
         self, session: Session, deserialize: Optional[bool] = True
     ) -> Optional[Union[Session, Dict[str, Any]]]:
@@ -637,12 +750,7 @@ class MongoDb(BaseDb):
                 }
 
                 try:
-                    result = collection.find_one_and_replace(
-                        filter=upsert_filter,
-                        replacement=record,
-                        upsert=True,
-                        return_document=ReturnDocument.AFTER,
-                    )
+                    result = self._replace_session_record(collection, upsert_filter, record, session)
                 except DuplicateKeyError:
                     return None
                 if not result:
@@ -671,12 +779,7 @@ class MongoDb(BaseDb):
                 }
 
                 try:
-                    result = collection.find_one_and_replace(
-                        filter=upsert_filter,
-                        replacement=record,
-                        upsert=True,
-                        return_document=ReturnDocument.AFTER,
-                    )
+                    result = self._replace_session_record(collection, upsert_filter, record, session)
                 except DuplicateKeyError:
                     return None
                 if not result:
@@ -706,12 +809,7 @@ class MongoDb(BaseDb):
                 }
 
                 try:
-                    result = collection.find_one_and_replace(
-                        filter=upsert_filter,
-                        replacement=record,
-                        upsert=True,
-                        return_document=ReturnDocument.AFTER,
-                    )
+                    result = self._replace_session_record(collection, upsert_filter, record, session)
                 except DuplicateKeyError:
                     return None
                 if not result:
@@ -819,9 +917,19 @@ class MongoDb(BaseDb):
                 else:
                     continue
 
-                operations.append(
-                    ReplaceOne(filter={"session_id": record["session_id"]}, replacement=record, upsert=True)
-                )
+                runs_offset = get_unloaded_runs_count(session)
+                if runs_offset:
+                    operations.append(
+                        UpdateOne(
+                            filter={"session_id": record["session_id"]},
+                            update=get_session_update_pipeline(record, runs_offset),
+                            upsert=True,
+                        )
+                    )
+                else:
+                    operations.append(
+                        ReplaceOne(filter={"session_id": record["session_id"]}, replacement=record, upsert=True)
+                    )
 
             if operations:
                 # Execute bulk write
@@ -2132,156 +2240,171 @@ class MongoDb(BaseDb):
     def upsert_trace(self, trace: "Trace") -> None:
         """Create or update a single trace record in the database.
 
-        Uses MongoDB's update_one with upsert=True and aggregation pipeline
+        Args:
+            trace: The Trace object to store (one per trace_id).
+        """
+        self.upsert_traces([trace])
+
+    def upsert_traces(self, traces: List["Trace"]) -> None:
+        """Create or update trace records in the database, with a single bulk write.
+
+        Uses an upserting UpdateOne with an aggregation pipeline for each trace,
         to handle concurrent inserts atomically and avoid race conditions.
 
         Args:
-            trace: The Trace object to store (one per trace_id).
+            traces: The Trace objects to store (one per trace_id).
         """
+        if not traces:
+            return
+
         try:
             collection = self._get_collection(table_type="traces", create_collection_if_not_found=True)
             if collection is None:
                 return
 
-            trace_dict = trace.to_dict()
-            trace_dict.pop("total_spans", None)
-            trace_dict.pop("error_count", None)
-
-            # Calculate the component level for the new trace
-            new_level = self._get_component_level(trace.workflow_id, trace.team_id, trace.agent_id, trace.name)
-
-            # Use MongoDB aggregation pipeline update for atomic upsert
-            # This allows conditional logic within a single atomic operation
-            pipeline: List[Dict[str, Any]] = [
-                {
-                    "$set": {
-                        # Always update these fields
-                        "status": trace.status,
-                        "created_at": {"$ifNull": ["$created_at", trace_dict.get("created_at")]},
-                        # Use $min for start_time (keep earliest)
-                        "start_time": {
-                            "$cond": {
-                                "if": {"$eq": [{"$type": "$start_time"}, "missing"]},
-                                "then": trace_dict.get("start_time"),
-                                "else": {"$min": ["$start_time", trace_dict.get("start_time")]},
-                            }
-                        },
-                        # Use $max for end_time (keep latest)
-                        "end_time": {
-                            "$cond": {
-                                "if": {"$eq": [{"$type": "$end_time"}, "missing"]},
-                                "then": trace_dict.get("end_time"),
-                                "else": {"$max": ["$end_time", trace_dict.get("end_time")]},
-                            }
-                        },
-                        # Preserve existing non-null context values using $ifNull
-                        "run_id": {"$ifNull": [trace.run_id, "$run_id"]},
-                        "session_id": {"$ifNull": [trace.session_id, "$session_id"]},
-                        "user_id": {"$ifNull": [trace.user_id, "$user_id"]},
-                        "agent_id": {"$ifNull": [trace.agent_id, "$agent_id"]},
-                        "team_id": {"$ifNull": [trace.team_id, "$team_id"]},
-                        "workflow_id": {"$ifNull": [trace.workflow_id, "$workflow_id"]},
-                    }
-                },
-                {
-                    "$set": {
-                        # Calculate duration_ms from the (potentially updated) start_time and end_time
-                        # MongoDB stores dates as strings in ISO format, so we need to parse them
-                        "duration_ms": {
-                            "$cond": {
-                                "if": {
-                                    "$and": [
-                                        {"$ne": [{"$type": "$start_time"}, "missing"]},
-                                        {"$ne": [{"$type": "$end_time"}, "missing"]},
-                                    ]
-                                },
-                                "then": {
-                                    "$subtract": [
-                                        {"$toLong": {"$toDate": "$end_time"}},
-                                        {"$toLong": {"$toDate": "$start_time"}},
-                                    ]
-                                },
-                                "else": trace_dict.get("duration_ms", 0),
-                            }
-                        },
-                        # Update name based on component level priority
-                        # Only update if new trace is from a higher-level component
-                        "name": {
-                            "$cond": {
-                                "if": {"$eq": [{"$type": "$name"}, "missing"]},
-                                "then": trace.name,
-                                "else": {
-                                    "$cond": {
-                                        "if": {
-                                            "$gt": [
-                                                new_level,
-                                                {
-                                                    "$switch": {
-                                                        "branches": [
-                                                            # Check if existing name is a root span
-                                                            {
-                                                                "case": {
-                                                                    "$not": {
-                                                                        "$or": [
-                                                                            {
-                                                                                "$regexMatch": {
-                                                                                    "input": {"$ifNull": ["$name", ""]},
-                                                                                    "regex": "\\.run",
-                                                                                }
-                                                                            },
-                                                                            {
-                                                                                "$regexMatch": {
-                                                                                    "input": {"$ifNull": ["$name", ""]},
-                                                                                    "regex": "\\.arun",
-                                                                                }
-                                                                            },
-                                                                        ]
-                                                                    }
-                                                                },
-                                                                "then": 0,
-                                                            },
-                                                            # Workflow root (level 3)
-                                                            {
-                                                                "case": {"$ne": ["$workflow_id", None]},
-                                                                "then": 3,
-                                                            },
-                                                            # Team root (level 2)
-                                                            {
-                                                                "case": {"$ne": ["$team_id", None]},
-                                                                "then": 2,
-                                                            },
-                                                            # Agent root (level 1)
-                                                            {
-                                                                "case": {"$ne": ["$agent_id", None]},
-                                                                "then": 1,
-                                                            },
-                                                        ],
-                                                        "default": 0,
-                                                    }
-                                                },
-                                            ]
-                                        },
-                                        "then": trace.name,
-                                        "else": "$name",
-                                    }
-                                },
-                            }
-                        },
-                    }
-                },
+            # Perform atomic upserts using aggregation pipelines
+            operations = [
+                UpdateOne({"trace_id": trace.trace_id}, self._get_trace_upsert_pipeline(trace), upsert=True)
+                for trace in traces
             ]
-
-            # Perform atomic upsert using aggregation pipeline
-            collection.update_one(
-                {"trace_id": trace.trace_id},
-                pipeline,
-                upsert=True,
-            )
+            collection.bulk_write(operations, ordered=False)
 
         except Exception as e:
-            log_error(f"Error creating trace: {e}")
+            log_error(f"Error creating traces: {e}")
             # Don't raise - tracing should not break the main application flow
 
+    def _get_trace_upsert_pipeline(self, trace: "Trace") -> List[Dict[str, Any]]:
+        """Build the aggregation pipeline merging a trace into its stored record."""
+        trace_dict = trace.to_dict()
+        trace_dict.pop("total_spans", None)
+        trace_dict.pop("error_count", None)
+
+        # Calculate the component level for the new trace
+        new_level = self._get_component_level(trace.workflow_id, trace.team_id, trace.agent_id, trace.name)
+
+        # Use MongoDB aggregation pipeline update for atomic upsert
+        # This allows conditional logic within a single atomic operation
+        pipeline: List[Dict[str, Any]] = [
+            {
+                "$set": {
+                    # Always update these fields
+                    "status": trace.status,
+                    "created_at": {"$ifNull": ["$created_at", trace_dict.get("created_at")]},
+                    # Use $min for start_time (keep earliest)
+                    "start_time": {
+                        "$cond": {
+                            "if": {"$eq": [{"$type": "$start_time"}, "missing"]},
+                            "then": trace_dict.get("start_time"),
+                            "else": {"$min": ["$start_time", trace_dict.get("start_time")]},
+                        }
+                    },
+                    # Use $max for end_time (keep latest)
+                    "end_time": {
+                        "$cond": {
+                            "if": {"$eq": [{"$type": "$end_time"}, "missing"]},
+                            "then": trace_dict.get("end_time"),
+                            "else": {"$max": ["$end_time", trace_dict.get("end_time")]},
+                        }
+                    },
+                    # Preserve existing non-null context values using $ifNull
+                    "run_id": {"$ifNull": [trace.run_id, "$run_id"]},
+                    "session_id": {"$ifNull": [trace.session_id, "$session_id"]},
+                    "user_id": {"$ifNull": [trace.user_id, "$user_id"]},
+                    "agent_id": {"$ifNull": [trace.agent_id, "$agent_id"]},
+                    "team_id": {"$ifNull": [trace.team_id, "$team_id"]},
+                    "workflow_id": {"$ifNull": [trace.workflow_id, "$workflow_id"]},
+                }
+            },
+            {
+                "$set": {
+                    # Calculate duration_ms from the (potentially updated) start_time and end_time
+                    # MongoDB stores dates as strings in ISO format, so we need to parse them
+                    "duration_ms": {
+                        "$cond": {
+                            "if": {
+                                "$and": [
+                                    {"$ne": [{"$type": "$start_time"}, "missing"]},
+                                    {"$ne": [{"$type": "$end_time"}, "missing"]},
+                                ]
+                            },
+                            "then": {
+                                "$subtract": [
+                                    {"$toLong": {"$toDate": "$end_time"}},
+                                    {"$toLong": {"$toDate": "$start_time"}},
+                                ]
+                            },
+                            "else": trace_dict.get("duration_ms", 0),
+                        }
+                    },
+                    # Update name based on component level priority
+                    # Only update if new trace is from a higher-level component
+                    "name": {
+                        "$cond": {
+                            "if": {"$eq": [{"$type": "$name"}, "missing"]},
+                            "then": trace.name,
+                            "else": {
+                                "$cond": {
+                                    "if": {
+                                        "$gt": [
+                                            new_level,
+                                            {
+                                                "$switch": {
+                                                    "branches": [
+                                                        # Check if existing name is a root span
+                                                        {
+                                                            "case": {
+                                                                "$not": {
+                                                                    "$or": [
+                                                                        {
+                                                                            "$regexMatch": {
+                                                                                "input": {"$ifNull": ["$name", ""]},
+                                                                                "regex": "\\.run",
+                                                                            }
+                                                                        },
+                                                                        {
+                                                                            "$regexMatch": {
+                                                                                "input": {"$ifNull": ["$name", ""]},
+                                                                                "regex": "\\.arun",
+                                                                            }
+                                                                        },
+                                                                    ]
+                                                                }
+                                                            },
+                                                            "then": 0,
+                                                        },
+                                                        # Workflow root (level 3)
+                                                        {
+                                                            "case": {"$ne": ["$workflow_id", None]},
+                                                            "then": 3,
+                                                        },
+                                                        # Team root (level 2)
+                                                        {
+                                                            "case": {"$ne": ["$team_id", None]},
+                                                            "then": 2,
+                                                        },
+                                                        # Agent root (level 1)
+                                                        {
+                                                            "case": {"$ne": ["$agent_id", None]},
+                                                            "then": 1,
+                                                        },
+                                                    ],
+                                                    "default": 0,
+                                                }
+                                            },
+                                        ]
+                                    },
+                                    "then": trace.name,
+                                    "else": "$name",
+                                }
+                            },
+                        }
+                    },
+                }
+            },
+        ]
+
+        return pipeline
+
     def get_trace(
         self,
         trace_id: Optional[str] = None,
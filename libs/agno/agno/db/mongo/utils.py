@@ -3,11 +3,12 @@
 import json
 import time
 from datetime import date, datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from uuid import uuid4
 
 from agno.db.mongo.schemas import get_collection_indexes
 from agno.db.schemas.culture import CulturalKnowledge
+from agno.db.utils import get_runs_window_start
 from agno.utils.log import log_error, log_warning
 
 try:
@@ -74,6 +75,48 @@ def apply_pagination(
 
 
 # -- Metrics util methods --
+# Projection of the session document to the fields of its runs used to find the run window
+RUNS_WINDOW_STATES_PROJECTION = {"runs.status": 1, "runs.parent_run_id": 1}
+
+
+def get_runs_window_projection(
+    runs_states: Optional[Dict[str, Any]], last_n_runs: int
+) -> Tuple[int, Optional[Dict[str, Any]]]:
+    """Get the start of the run window and the projection reading only the runs in it.
+
+    Args:
+        runs_states (Optional[Dict[str, Any]]): The session document, projected with RUNS_WINDOW_STATES_PROJECTION.
+        last_n_runs (int): The number of history runs to read.
+
+    Returns:
+        Tuple[int, Optional[Dict[str, Any]]]: The number of runs preceding the window, and the projection of the
+            session document. The projection is None when all runs are in the window.
+    """
+    stored_runs = (runs_states or {}).get("runs")
+    if not isinstance(stored_runs, list):
+        return 0, None
+    runs_offset = get_runs_window_start(stored_runs, last_n_runs)
+    if runs_offset == 0:
+        return 0, None
+    return runs_offset, {"runs": {"$slice": [runs_offset, len(stored_runs)]}}
+
+
+def get_session_update_pipeline(record: Dict[str, Any], runs_offset: int) -> List[Dict[str, Any]]:
+    """Build the update pipeline storing a session read with its run window.
+
+    The first `runs_offset` stored runs were not loaded, so they are kept from the stored document and the runs of
+    the record are stored after them. Record values are set as literals, so they are never read as expressions.
+    """
+    fields: Dict[str, Any] = {key: {"$literal": value} for key, value in record.items() if key != "runs"}
+    fields["runs"] = {
+        "$concatArrays": [
+            {"$slice": [{"$ifNull": ["$runs", []]}, runs_offset]},
+            {"$literal": record.get("runs") or []},
+        ]
+    }
+    return [{"$set": fields}]
+
+
 def calculate_date_metrics(date_to_process: date, sessions_data: dict) -> dict:
     """Calculate metrics for the given single date."""
     metrics = {
@@ -19,12 +19,16 @@ from agno.db.mysql.utils import (
     deserialize_cultural_knowledge_from_db,
     fetch_all_sessions_data,
     get_dates_to_calculate_metrics_for,
+    get_runs_states_query,
+    get_session_runs_update,
+    select_session_with_runs_window,
     serialize_cultural_knowledge_for_db,
 )
 from agno.db.schemas.culture import CulturalKnowledge
 from agno.db.schemas.evals import EvalFilterType, EvalRunRecord, EvalType
 from agno.db.schemas.knowledge import KnowledgeRow
 from agno.db.schemas.memory import UserMemory
+from agno.db.utils import get_runs_window_start, get_unloaded_runs_count, set_previous_runs
 from agno.session import AgentSession, Session, TeamSession, WorkflowSession
 from agno.utils.log import log_debug, log_error, log_info, log_warning
 from agno.utils.string import generate_id
@@ -500,6 +504,7 @@ class AsyncMySQLDb(AsyncBaseDb):
         session_type: SessionType,
         user_id: Optional[str] = None,
         deserialize: Optional[bool] = True,
+        last_n_runs: Optional[int] = None,
     ) -> Optional[Union[Session, Dict[str, Any]]]:
         """
         Read a session from the database.
@@ -509,6 +514,7 @@ class AsyncMySQLDb(AsyncBaseDb):
             user_id (Optional[str]): User ID to filter by. Defaults to None.
             session_type (Optional[SessionType]): Type of session to read. Defaults to None.
             deserialize (Optional[bool]): Whether to serialize the session. Defaults to True.
+            last_n_runs (Optional[int]): Only load the runs holding the last N history runs. Defaults to all runs.
 
         Returns:
             Union[Session, Dict[str, Any], None]:
@@ -522,7 +528,13 @@ class AsyncMySQLDb(AsyncBaseDb):
             table = await self._get_table(table_type="sessions")
 
             async with self.async_session_factory() as sess:
-                stmt = select(table).where(table.c.session_id == session_id)
+                runs_offset = 0
+                if last_n_runs:
+                    # Read the status fields of the runs first, to then read only the runs in the window
+                    runs_states = (await sess.execute(get_runs_states_query(table, session_id, user_id))).fetchall()
+                    runs_offset = get_runs_window_start([dict(row._mapping) for row in runs_states], last_n_runs)
+
+                stmt = select_session_with_runs_window(table, runs_offset).where(table.c.session_id == session_id)
 
                 if user_id is not None:
                     stmt = stmt.where(table.c.user_id == user_id)
@@ -537,11 +549,11 @@ class AsyncMySQLDb(AsyncBaseDb):
                 return session
 
             if session_type == SessionType.AGENT:
-                return AgentSession.from_dict(session)
+                return set_previous_runs(AgentSession.from_dict(session), runs_offset=runs_offset)
             elif session_type == SessionType.TEAM:
-                return TeamSession.from_dict(session)
+                return set_previous_runs(TeamSession.from_dict(session), runs_offset=runs_offset)
             elif session_type == SessionType.WORKFLOW:
-                return WorkflowSession.from_dict(session)
+                return set_previous_runs(WorkflowSession.from_dict(session), runs_offset=runs_offset)
             else:
                 raise ValueError(f"Invalid session type: {session_type}")
 
@@ -777,7 +789,7 @@ class AsyncMySQLDb(AsyncBaseDb):
                         session_data=session_dict.get("session_data"),
                         summary=session_dict.get("summary"),
                         metadata=session_dict.get("metadata"),
-                        runs=session_dict.get("runs"),
+                        runs=get_session_runs_update(table, session, session_dict.get("runs")),
                         updated_at=int(time.time()),
                     )
                     await sess.execute(stmt)
@@ -830,7 +842,7 @@ class AsyncMySQLDb(AsyncBaseDb):
                         session_data=session_dict.get("session_data"),
                         summary=session_dict.get("summary"),
                         metadata=session_dict.get("metadata"),
-                        runs=session_dict.get("runs"),
+                        runs=get_session_runs_update(table, session, session_dict.get("runs")),
                         updated_at=int(time.time()),
                     )
                     await sess.execute(stmt)
@@ -883,7 +895,7 @@ class AsyncMySQLDb(AsyncBaseDb):
                         session_data=session_dict.get("session_data"),
                         summary=session_dict.get("summary"),
                         metadata=session_dict.get("metadata"),
-                        runs=session_dict.get("runs"),
+                        runs=get_session_runs_update(table, session, session_dict.get("runs")),
                         updated_at=int(time.time()),
                     )
                     await sess.execute(stmt)
@@ -932,6 +944,16 @@ class AsyncMySQLDb(AsyncBaseDb):
         try:
             table = await self._get_table(table_type="sessions")
 
+            # Sessions read with their run window in the database are upserted one by one, to keep their earlier runs
+            windowed_results = [
+                result
+                for session in sessions
+                if session is not None and get_unloaded_runs_count(session)
+                for result in [await self.upsert_session(session, deserialize=deserialize)]
+                if result is not None
+            ]
+            sessions = [session for session in sessions if session is not None and not get_unloaded_runs_count(session)]
+
             # Group sessions by type for batch processing
             agent_sessions = []
             team_sessions = []
@@ -945,7 +967,7 @@ class AsyncMySQLDb(AsyncBaseDb):
                 elif isinstance(session, WorkflowSession):
                     workflow_sessions.append(session)
 
-            results: List[Union[Session, Dict[str, Any]]] = []
+            results: List[Union[Session, Dict[str, Any]]] = list(windowed_results)
 
             # Process each session type in bulk
             async with self.async_session_factory() as sess, sess.begin():
@@ -2524,12 +2546,23 @@ class AsyncMySQLDb(AsyncBaseDb):
     async def upsert_trace(self, trace: "Trace") -> None:
         """Create or update a single trace record in the database.
 
+        Args:
+            trace: The Trace object to store (one per trace_id).
+        """
+        await self.upsert_traces([trace])
+
+    async def upsert_traces(self, traces: List["Trace"]) -> None:
+        """Create or update trace records in the database, with a single statement.
+
         Uses INSERT ... ON DUPLICATE KEY UPDATE (upsert) to handle concurrent inserts
         atomically and avoid race conditions.
 
         Args:
-            trace: The Trace object to store (one per trace_id).
+            traces: The Trace objects to store (one per trace_id).
         """
+        if not traces:
+            return
+
         from sqlalchemy import case
 
         try:
@@ -2537,15 +2570,18 @@ class AsyncMySQLDb(AsyncBaseDb):
             if table is None:
                 return
 
-            trace_dict = trace.to_dict()
-            trace_dict.pop("total_spans", None)
-            trace_dict.pop("error_count", None)
+            trace_dicts = []
+            for trace in traces:
+                trace_dict = trace.to_dict()
+                trace_dict.pop("total_spans", None)
+                trace_dict.pop("error_count", None)
+                trace_dicts.append(trace_dict)
 
             async with self.async_session_factory() as sess, sess.begin():
                 # Use upsert to handle concurrent inserts atomically
                 # On conflict, update fields while preserving existing non-null context values
                 # and keeping the earliest start_time
-                insert_stmt = mysql.insert(table).values(trace_dict)
+                insert_stmt = mysql.insert(table)
 
                 # Build component level expressions for comparing trace priority
                 new_level = self._get_trace_component_level_expr(
@@ -2591,10 +2627,10 @@ class AsyncMySQLDb(AsyncBaseDb):
                     team_id=func.coalesce(insert_stmt.inserted.team_id, table.c.team_id),
                     workflow_id=func.coalesce(insert_stmt.inserted.workflow_id, table.c.workflow_id),
                 )
-                await sess.execute(upsert_stmt)
+                await sess.execute(upsert_stmt, trace_dicts)
 
         except Exception as e:
-            log_error(f"Error creating trace: {e}")
+            log_error(f"Error creating traces: {e}")
             # Don't raise - tracing should not break the main application flow
 
     async def get_trace(
@@ -2887,9 +2923,7 @@ class AsyncMySQLDb(AsyncBaseDb):
                 return
 
             async with self.async_session_factory() as sess, sess.begin():
-                for span in spans:
-                    stmt = mysql.insert(table).values(span.to_dict())
-                    await sess.execute(stmt)
+                await sess.execute(mysql.insert(table), [span.to_dict() for span in spans])
 
         except Exception as e:
             log_error(f"Error creating spans batch: {e}")
@@ -17,14 +17,18 @@ from agno.db.mysql.utils import (
     deserialize_cultural_knowledge_from_db,
     fetch_all_sessions_data,
     get_dates_to_calculate_metrics_for,
+    get_runs_states_query,
+    get_session_runs_update,
     is_table_available,
     is_valid_table,
+    select_session_with_runs_window,
     serialize_cultural_knowledge_for_db,
 )
 from agno.db.schemas.culture import CulturalKnowledge
 from agno.db.schemas.evals import EvalFilterType, EvalRunRecord, EvalType
 from agno.db.schemas.knowledge import KnowledgeRow
 from agno.db.schemas.memory import UserMemory
+from agno.db.utils import get_runs_window_start, get_unloaded_runs_count, set_previous_runs
 from agno.session import AgentSession, Session, TeamSession, WorkflowSession
 from agno.utils.log import log_debug, log_error, log_info, log_warning
 from agno.utils.string import generate_id
@@ -493,6 +497,7 @@ class MySQLDb(BaseDb):
         session_type: SessionType,
         user_id: Optional[str] = None,
         deserialize: Optional[bool] = True,
+        last_n_runs: Optional[int] = None,
     ) -> Optional[Union[Session, Dict[str, Any]]]:
         """
         Read a session from the database.
@@ -502,6 +507,7 @@ class MySQLDb(BaseDb):
             session_type (SessionType): Type of session to get.
             user_id (Optional[str]): User ID to filter by. Defaults to None.
             deserialize (Optional[bool]): Whether to serialize the session. Defaults to True.
+            last_n_runs (Optional[int]): Only load the runs holding the last N history runs. Defaults to all runs.
 
         Returns:
             Union[Session, Dict[str, Any], None]:
@@ -517,7 +523,13 @@ class MySQLDb(BaseDb):
                 return None
 
             with self.Session() as sess:
-                stmt = select(table).where(table.c.session_id == session_id)
+                runs_offset = 0
+                if last_n_runs:
+                    # Read the status fields of the runs first, to then read only the runs in the window
+                    runs_states = sess.execute(get_runs_states_query(table, session_id, user_id)).fetchall()
+                    runs_offset = get_runs_window_start([dict(row._mapping) for row in runs_states], last_n_runs)
+
+                stmt = select_session_with_runs_window(table, runs_offset).where(table.c.session_id == session_id)
 
                 if user_id is not None:
                     stmt = stmt.where(table.c.user_id == user_id)
@@ -531,11 +543,11 @@ class MySQLDb(BaseDb):
                 return session
 
             if session_type == SessionType.AGENT:
-                return AgentSession.from_dict(session)
+                return set_previous_runs(AgentSession.from_dict(session), runs_offset=runs_offset)
             elif session_type == SessionType.TEAM:
-                return TeamSession.from_dict(session)
+                return set_previous_runs(TeamSession.from_dict(session), runs_offset=runs_offset)
             elif session_type == SessionType.WORKFLOW:
-                return WorkflowSession.from_dict(session)
+                return set_previous_runs(WorkflowSession.from_dict(session), runs_offset=runs_offset)
             else:
                 raise ValueError(f"Invalid session type: {session_type}")
 
@@ -774,7 +786,7 @@ class MySQLDb(BaseDb):
                         session_data=session_dict.get("session_data"),
                         summary=session_dict.get("summary"),
                         metadata=session_dict.get("metadata"),
-                        runs=session_dict.get("runs"),
+                        runs=get_session_runs_update(table, session, session_dict.get("runs")),
                         updated_at=int(time.time()),
                     )
                     sess.execute(stmt)
@@ -822,7 +834,7 @@ class MySQLDb(BaseDb):
                         session_data=session_dict.get("session_data"),
                         summary=session_dict.get("summary"),
                         metadata=session_dict.get("metadata"),
-                        runs=session_dict.get("runs"),
+                        runs=get_session_runs_update(table, session, session_dict.get("runs")),
                         updated_at=int(time.time()),
                     )
                     sess.execute(stmt)
@@ -870,7 +882,7 @@ class MySQLDb(BaseDb):
                         session_data=session_dict.get("session_data"),
                         summary=session_dict.get("summary"),
                         metadata=session_dict.get("metadata"),
-                        runs=session_dict.get("runs"),
+                        runs=get_session_runs_update(table, session, session_dict.get("runs")),
                         updated_at=int(time.time()),
                     )
                     sess.execute(stmt)
@@ -922,6 +934,16 @@ class MySQLDb(BaseDb):
                     if result is not None
                 ]
 
+            # Sessions read with their run window in the database are upserted one by one, to keep their earlier runs
+            windowed_results = [
+                result
+                for session in sessions
+                if session is not None and get_unloaded_runs_count(session)
+                for result in [self.upsert_session(session, deserialize=deserialize)]
+                if result is not None
+            ]
+            sessions = [session for session in sessions if session is not None and not get_unloaded_runs_count(session)]
+
             # Group sessions by type for batch processing
             agent_sessions = []
             team_sessions = []
@@ -935,7 +957,7 @@ class MySQLDb(BaseDb):
                 elif isinstance(session, WorkflowSession):
                     workflow_sessions.append(session)
 
-            results: List[Union[Session, Dict[str, Any]]] = []
+            results: List[Union[Session, Dict[str, Any]]] = list(windowed_results)
 
             # Process each session type in bulk
             with self.Session() as sess, sess.begin():
@@ -2546,12 +2568,23 @@ class MySQLDb(BaseDb):
     def upsert_trace(self, trace: "Trace") -> None:
         """Create or update a single trace record in the database.
 
+        Args:
+            trace: The Trace object to store (one per trace_id).
+        """
+        self.upsert_traces([trace])
+
+    def upsert_traces(self, traces: List["Trace"]) -> None:
+        """Create or update trace records in the database, with a single statement.
+
         Uses INSERT ... ON DUPLICATE KEY UPDATE (upsert) to handle concurrent inserts
         atomically and avoid race conditions.
 
         Args:
-            trace: The Trace object to store (one per trace_id).
+            traces: The Trace objects to store (one per trace_id).
         """
+        if not traces:
+            return
+
         from sqlalchemy import case
 
         try:
@@ -2559,15 +2592,18 @@ class MySQLDb(BaseDb):
             if table is None:
                 return
 
-            trace_dict = trace.to_dict()
-            trace_dict.pop("total_spans", None)
-            trace_dict.pop("error_count", None)
+            trace_dicts = []
+            for trace in traces:
+                trace_dict = trace.to_dict()
+                trace_dict.pop("total_spans", None)
+                trace_dict.pop("error_count", None)
+                trace_dicts.append(trace_dict)
 
             with self.Session() as sess, sess.begin():
                 # Use upsert to handle concurrent inserts atomically
                 # On conflict, update fields while preserving existing non-null context values
                 # and keeping the earliest start_time
-                insert_stmt = mysql.insert(table).values(trace_dict)
+                insert_stmt = mysql.insert(table)
 
                 # Build component level expressions for comparing trace priority
                 new_level = self._get_trace_component_level_expr(
@@ -2613,10 +2649,10 @@ class MySQLDb(BaseDb):
                     team_id=func.coalesce(insert_stmt.inserted.team_id, table.c.team_id),
                     workflow_id=func.coalesce(insert_stmt.inserted.workflow_id, table.c.workflow_id),
                 )
-                sess.execute(upsert_stmt)
+                sess.execute(upsert_stmt, trace_dicts)
 
         except Exception as e:
-            log_error(f"Error creating trace: {e}")
+            log_error(f"Error creating traces: {e}")
             # Don't raise - tracing should not break the main application flow
 
     def get_trace(
@@ -2904,9 +2940,7 @@ class MySQLDb(BaseDb):
                 return
 
             with self.Session() as sess, sess.begin():
-                for span in spans:
-                    stmt = mysql.insert(table).values(span.to_dict())
-                    sess.execute(stmt)
+                sess.execute(mysql.insert(table), [span.to_dict() for span in spans])
 
         except Exception as e:
             log_error(f"Error creating spans batch: {e}")
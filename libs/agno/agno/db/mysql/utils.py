@@ -2,20 +2,24 @@
 
 import time
 from datetime import date, datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 from uuid import uuid4
 
 from agno.db.mysql.schemas import get_table_schema_definition
 from agno.db.schemas.culture import CulturalKnowledge
+from agno.db.utils import get_unloaded_runs_count
 from agno.utils.log import log_debug, log_error, log_warning
 
+if TYPE_CHECKING:
+    from agno.session import Session as AgnoSession
+
 try:
-    from sqlalchemy import Engine, Table, func
+    from sqlalchemy import JSON, Engine, Table, func, literal
     from sqlalchemy.dialects import mysql
     from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
     from sqlalchemy.inspection import inspect
     from sqlalchemy.orm import Session
-    from sqlalchemy.sql.expression import text
+    from sqlalchemy.sql.expression import Select, TextClause, select, text
 except ImportError:
     raise ImportError("`sqlalchemy` not installed. Please install it using `pip install sqlalchemy`")
 
@@ -130,6 +134,41 @@ def is_valid_table(db_engine: Engine, table_name: str, table_type: str, db_schem
 
 
 # -- Metrics util methods --
+def get_runs_states_query(table: Table, session_id: str, user_id: Optional[str] = None) -> TextClause:
+    """Build the query reading the status and parent run ID of each stored run of a session, in session order.
+
+    Only these fields are read from the runs, to find the start of the run window without reading the runs.
+    """
+    user_filter = " AND s.user_id = :user_id" if user_id is not None else ""
+    return text(
+        f"SELECT jt.status, jt.parent_run_id FROM `{table.schema}`.`{table.name}` AS s, "
+        "JSON_TABLE(s.runs, '$[*]' COLUMNS (run_position FOR ORDINALITY, "
+        "status VARCHAR(64) PATH '$.status', parent_run_id VARCHAR(255) PATH '$.parent_run_id')) AS jt "
+        f"WHERE s.session_id = :session_id{user_filter} ORDER BY jt.run_position"
+    ).bindparams(session_id=session_id, **({"user_id": user_id} if user_id is not None else {}))
+
+
+def select_session_with_runs_window(table: Table, runs_offset: int) -> Select:
+    """Select the session columns, reading only the stored runs from position `runs_offset` on."""
+    if not runs_offset:
+        return select(table)
+    runs_window = func.json_extract(table.c.runs, f"$[{runs_offset} to last]", type_=JSON).label("runs")
+    return select(*[column for column in table.c if column.name != "runs"], runs_window)
+
+
+def get_session_runs_update(table: Table, session: "AgnoSession", runs: Optional[List[Dict[str, Any]]]) -> Any:
+    """Get the value updating the stored runs of a session on upsert.
+
+    When the session was read with its run window in the database, the stored runs preceding the window were not
+    loaded. They are kept, and the runs of the session are stored after them.
+    """
+    runs_offset = get_unloaded_runs_count(session)
+    if not runs_offset:
+        return runs
+    previous_runs = func.json_extract(table.c.runs, f"$[0 to {runs_offset - 1}]")
+    return func.json_merge_preserve(func.coalesce(previous_runs, func.json_array()), literal(runs or [], JSON))
+
+
 def bulk_upsert_metrics(session: Session, table: Table, metrics_records: list[dict]) -> list[dict]:
     """Bulk upsert metrics into the database.
 
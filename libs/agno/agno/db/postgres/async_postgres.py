@@ -25,7 +25,7 @@ from agno.db.schemas.culture import CulturalKnowledge
 from agno.db.schemas.evals import EvalFilterType, EvalRunRecord, EvalType
 from agno.db.schemas.knowledge import KnowledgeRow
 from agno.db.schemas.memory import UserMemory
-from agno.db.utils import json_serializer
+from agno.db.utils import apply_runs_window, json_serializer, set_previous_runs
 from agno.session import AgentSession, Session, TeamSession, WorkflowSession
 from agno.utils.log import log_debug, log_error, log_info, log_warning
 from agno.utils.string import sanitize_postgres_string, sanitize_postgres_strings
@@ -567,6 +567,7 @@ class AsyncPostgresDb(AsyncBaseDb):
         session_type: SessionType,
         user_id: Optional[str] = None,
         deserialize: Optional[bool] = True,
+        last_n_runs: Optional[int] = None,
     ) -> Optional[Union[Session, Dict[str, Any]]]:
         """
         Read a session from the database.
@@ -576,6 +577,7 @@ class AsyncPostgresDb(AsyncBaseDb):
             user_id (Optional[str]): User ID to filter by. Defaults to None.
             session_type (Optional[SessionType]): Type of session to read. Defaults to None.
             deserialize (Optional[bool]): Whether to serialize the session. Defaults to True.
+            last_n_runs (Optional[int]): Only load the runs holding the last N history runs. Defaults to all runs.
 
         Returns:
             Union[Session, Dict[str, Any], None]:
@@ -605,15 +607,17 @@ class AsyncPostgresDb(AsyncBaseDb):
 
                 session = dict(row._mapping)
 
+            previous_runs = apply_runs_window(session, last_n_runs)
+
             if not deserialize:
                 return session
 
             if session_type == SessionType.AGENT:
-                return AgentSession.from_dict(session)
+                return set_previous_runs(AgentSession.from_dict(session), previous_runs)
             elif session_type == SessionType.TEAM:
-                return TeamSession.from_dict(session)
+                return set_previous_runs(TeamSession.from_dict(session), previous_runs)
             elif session_type == SessionType.WORKFLOW:
-                return WorkflowSession.from_dict(session)
+                return set_previous_runs(WorkflowSession.from_dict(session), previous_runs)
             else:
                 raise ValueError(f"Invalid session type: {session_type}")
 
@@ -2337,31 +2341,45 @@ class AsyncPostgresDb(AsyncBaseDb):
     async def upsert_trace(self, trace: "Trace") -> None:
         """Create or update a single trace record in the database.
 
+        Args:
+            trace: The Trace object to store (one per trace_id).
+        """
+        await self.upsert_traces([trace])
+
+    async def upsert_traces(self, traces: List["Trace"]) -> None:
+        """Create or update trace records in the database, with a single statement.
+
         Uses INSERT ... ON CONFLICT DO UPDATE (upsert) to handle concurrent inserts
         atomically and avoid race conditions.
 
         Args:
-            trace: The Trace object to store (one per trace_id).
+            traces: The Trace objects to store (one per trace_id).
         """
+        if not traces:
+            return
+
         try:
             table = await self._get_table(table_type="traces", create_table_if_not_found=True)
 
-            trace_dict = trace.to_dict()
-            trace_dict.pop("total_spans", None)
-            trace_dict.pop("error_count", None)
-            # Sanitize string fields and nested JSON structures
-            if trace_dict.get("name"):
-                trace_dict["name"] = sanitize_postgres_string(trace_dict["name"])
-            if trace_dict.get("status"):
-                trace_dict["status"] = sanitize_postgres_string(trace_dict["status"])
-            # Sanitize any nested dict/JSON fields
-            trace_dict = cast(Dict[str, Any], sanitize_postgres_strings(trace_dict))
+            trace_dicts = []
+            for trace in traces:
+                trace_dict = trace.to_dict()
+                trace_dict.pop("total_spans", None)
+                trace_dict.pop("error_count", None)
+                # Sanitize string fields and nested JSON structures
+                if trace_dict.get("name"):
+                    trace_dict["name"] = sanitize_postgres_string(trace_dict["name"])
+                if trace_dict.get("status"):
+                    trace_dict["status"] = sanitize_postgres_string(trace_dict["status"])
+                # Sanitize any nested dict/JSON fields
+                trace_dict = cast(Dict[str, Any], sanitize_postgres_strings(trace_dict))
+                trace_dicts.append(trace_dict)
 
             async with self.async_session_factory() as sess, sess.begin():
                 # Use upsert to handle concurrent inserts atomically
                 # On conflict, update fields while preserving existing non-null context values
                 # and keeping the earliest start_time
-                insert_stmt = postgresql.insert(table).values(trace_dict)
+                insert_stmt = postgresql.insert(table)
 
                 # Build component level expressions for comparing trace priority
                 new_level = self._get_trace_component_level_expr(
@@ -2413,10 +2431,10 @@ class AsyncPostgresDb(AsyncBaseDb):
                         "workflow_id": func.coalesce(insert_stmt.excluded.workflow_id, table.c.workflow_id),
                     },
                 )
-                await sess.execute(upsert_stmt)
+                await sess.execute(upsert_stmt, trace_dicts)
 
         except Exception as e:
-            log_error(f"Error creating trace: {e}")
+            log_error(f"Error creating traces: {e}")
             # Don't raise - tracing should not break the main application flow
 
     async def get_trace(
@@ -2700,18 +2718,20 @@ class AsyncPostgresDb(AsyncBaseDb):
         try:
             table = await self._get_table(table_type="spans", create_table_if_not_found=True)
 
+            span_dicts = []
+            for span in spans:
+                span_dict = span.to_dict()
+                # Sanitize string fields and nested JSON structures
+                if span_dict.get("name"):
+                    span_dict["name"] = sanitize_postgres_string(span_dict["name"])
+                if span_dict.get("status_code"):
+                    span_dict["status_code"] = sanitize_postgres_string(span_dict["status_code"])
+                # Sanitize any nested dict/JSON fields
+                span_dict = cast(Dict[str, Any], sanitize_postgres_strings(span_dict))
+                span_dicts.append(span_dict)
+
             async with self.async_session_factory() as sess, sess.begin():
-                for span in spans:
-                    span_dict = span.to_dict()
-                    # Sanitize string fields and nested JSON structures
-                    if span_dict.get("name"):
-                        span_dict["name"] = sanitize_postgres_string(span_dict["name"])
-                    if span_dict.get("status_code"):
-                        span_dict["status_code"] = sanitize_postgres_string(span_dict["status_code"])
-                    # Sanitize any nested dict/JSON fields
-                    span_dict = sanitize_postgres_strings(span_dict)
-                    stmt = postgresql.insert(table).values(span_dict)
-                    await sess.execute(stmt)
+                await sess.execute(postgresql.insert(table), span_dicts)
 
         except Exception as e:
             log_error(f"Error creating spans batch: {e}")
@@ -3256,6 +3276,62 @@ class AsyncPostgresDb(AsyncBaseDb):
             log_debug(f"Error claiming schedule: {e}")
             return None
 
+    async def claim_due_schedules(
+        self, worker_id: str, limit: int = 10, lock_grace_seconds: int = 300
+    ) -> List[Dict[str, Any]]:
+        try:
+            table = await self._get_table(table_type="schedules")
+            if table is None or limit <= 0:
+                return []
+            now = int(time.time())
+            stale_lock_threshold = now - lock_grace_seconds
+
+            async with self.async_session_factory() as sess:
+                async with sess.begin():
+                    # One UPDATE...RETURNING, skipping the rows other workers are claiming
+                    subq = (
+                        select(table.c.id)
+                        .where(
+                            table.c.enabled == True,  # noqa: E712
+                            table.c.next_run_at <= now,
+                            or_(
+                                table.c.locked_by.is_(None),
+                                table.c.locked_at <= stale_lock_threshold,
+                            ),
+                        )
+                        .order_by(table.c.next_run_at.asc())
+                        .limit(limit)
+                        .with_for_update(skip_locked=True)
+                    )
+                    stmt = (
+                        update(table)
+                        .where(table.c.id.in_(subq))
+                        .values(locked_by=worker_id, locked_at=now)
+                        .returning(*table.c)
+                    )
+                    result = await sess.execute(stmt)
+                    schedules = [dict(row._mapping) for row in result.fetchall()]
+                    return sorted(schedules, key=lambda schedule: schedule["next_run_at"] or 0)
+        except Exception as e:
+            log_debug(f"Error claiming schedules: {e}")
+            return []
+
+    async def get_next_schedule_run_at(self) -> Optional[int]:
+        try:
+            table = await self._get_table(table_type="schedules")
+            if table is None:
+                return None
+            async with self.async_session_factory() as sess:
+                stmt = select(func.min(table.c.next_run_at)).where(
+                    table.c.enabled == True,  # noqa: E712
+                    table.c.locked_by.is_(None),
+                )
+                result = await sess.execute(stmt)
+                return result.scalar()
+        except Exception as e:
+            log_debug(f"Error getting next schedule run: {e}")
+            return None
+
     async def release_schedule(self, schedule_id: str, next_run_at: Optional[int] = None) -> bool:
         try:
             table = await self._get_table(table_type="schedules")
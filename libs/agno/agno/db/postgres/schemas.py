@@ -26,6 +26,25 @@ SESSION_TABLE_SCHEMA = {
     "updated_at": {"type": BigInteger, "nullable": True},
 }
 
+RUN_TABLE_SCHEMA = {
+    "session_id": {"type": String, "primary_key": True, "nullable": False},
+    "run_id": {"type": String, "primary_key": True, "nullable": False, "index": True},
+    "session_type": {"type": String, "nullable": False},
+    "agent_id": {"type": String, "nullable": True},
+    "team_id": {"type": String, "nullable": True},
+    "workflow_id": {"type": String, "nullable": True},
+    "user_id": {"type": String, "nullable": True},
+    "parent_run_id": {"type": String, "nullable": True},
+    "status": {"type": String, "nullable": True, "index": True},
+    "position": {"type": BigInteger, "nullable": False},
+    "run_data": {"type": JSONB, "nullable": False},
+    "created_at": {"type": BigInteger, "nullable": False, "index": True},
+    "updated_at": {"type": BigInteger, "nullable": True},
+    "__composite_indexes__": [
+        {"name": "session_id_position", "columns": ["session_id", "position"]},
+    ],
+}
+
 MEMORY_TABLE_SCHEMA = {
     "memory_id": {"type": String, "primary_key": True, "nullable": False},
     "memory": {"type": JSONB, "nullable": False},
@@ -330,6 +349,7 @@ def get_table_schema_definition(
 
     schemas = {
         "sessions": SESSION_TABLE_SCHEMA,
+        "runs": RUN_TABLE_SCHEMA,
         "evals": EVAL_TABLE_SCHEMA,
         "metrics": METRICS_TABLE_SCHEMA,
         "memories": MEMORY_TABLE_SCHEMA,
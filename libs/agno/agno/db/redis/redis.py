@@ -27,6 +27,7 @@ from agno.db.schemas.culture import CulturalKnowledge
 from agno.db.schemas.evals import EvalFilterType, EvalRunRecord, EvalType
 from agno.db.schemas.knowledge import KnowledgeRow
 from agno.db.schemas.memory import UserMemory
+from agno.db.utils import apply_runs_window, set_previous_runs
 from agno.session import AgentSession, Session, TeamSession, WorkflowSession
 from agno.utils.log import log_debug, log_error, log_info
 from agno.utils.string import generate_id
@@ -345,6 +346,7 @@ class RedisDb(BaseDb):
         session_type: SessionType,
         user_id: Optional[str] = None,
         deserialize: Optional[bool] = True,
+        last_n_runs: Optional[int] = None,
     ) -> Optional[Union[Session, Dict[str, Any]]]:
         """Read a session from Redis.
 
@@ -368,15 +370,17 @@ class RedisDb(BaseDb):
             if user_id is not None and session.get("user_id") != user_id:
                 return None
 
+            previous_runs = apply_runs_window(session, last_n_runs)
+
             if not deserialize:
                 return session
 
             if session_type == SessionType.AGENT.value:
-                return AgentSession.from_dict(session)
+                return set_previous_runs(AgentSession.from_dict(session), previous_runs)
             elif session_type == SessionType.TEAM.value:
-                return TeamSession.from_dict(session)
+                return set_previous_runs(TeamSession.from_dict(session), previous_runs)
             elif session_type == SessionType.WORKFLOW.value:
-                return WorkflowSession.from_dict(session)
+                return set_previous_runs(WorkflowSession.from_dict(session), previous_runs)
             else:
                 raise ValueError(f"Invalid session type: {session_type}")
 
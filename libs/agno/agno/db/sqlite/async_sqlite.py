@@ -27,7 +27,12 @@ from agno.db.sqlite.utils import (
     get_dates_to_calculate_metrics_for,
     serialize_cultural_knowledge_for_db,
 )
-from agno.db.utils import deserialize_session_json_fields, serialize_session_json_fields
+from agno.db.utils import (
+    apply_runs_window,
+    deserialize_session_json_fields,
+    serialize_session_json_fields,
+    set_previous_runs,
+)
 from agno.session import AgentSession, Session, TeamSession, WorkflowSession
 from agno.utils.log import log_debug, log_error, log_info, log_warning
 from agno.utils.string import generate_id
@@ -546,6 +551,7 @@ class AsyncSqliteDb(AsyncBaseDb):
         session_type: SessionType,
         user_id: Optional[str] = None,
         deserialize: Optional[bool] = True,
+        last_n_runs: Optional[int] = None,
     ) -> Optional[Union[Session, Dict[str, Any]]]:
         """
         Read a session from the database.
@@ -555,6 +561,7 @@ class AsyncSqliteDb(AsyncBaseDb):
             session_type (SessionType): Type of session to get.
             user_id (Optional[str]): User ID to filter by. Defaults to None.
             deserialize (Optional[bool]): Whether to serialize the session. Defaults to True.
+            last_n_runs (Optional[int]): Only load the runs holding the last N history runs. Defaults to all runs.
 
         Returns:
             Optional[Union[Session, Dict[str, Any]]]:
@@ -582,15 +589,17 @@ class AsyncSqliteDb(AsyncBaseDb):
                     return None
 
                 session_raw = deserialize_session_json_fields(dict(row._mapping))
+                previous_runs = apply_runs_window(session_raw, last_n_runs)
+
                 if not session_raw or not deserialize:
                     return session_raw
 
             if session_type == SessionType.AGENT:
-                return AgentSession.from_dict(session_raw)
+                return set_previous_runs(AgentSession.from_dict(session_raw), previous_runs)
             elif session_type == SessionType.TEAM:
-                return TeamSession.from_dict(session_raw)
+                return set_previous_runs(TeamSession.from_dict(session_raw), previous_runs)
             elif session_type == SessionType.WORKFLOW:
-                return WorkflowSession.from_dict(session_raw)
+                return set_previous_runs(WorkflowSession.from_dict(session_raw), previous_runs)
             else:
                 raise ValueError(f"Invalid session type: {session_type}")
 
@@ -2559,12 +2568,23 @@ class AsyncSqliteDb(AsyncBaseDb):
     async def upsert_trace(self, trace: "Trace") -> None:
         """Create or update a single trace record in the database.
 
+        Args:
+            trace: The Trace object to store (one per trace_id).
+        """
+        await self.upsert_traces([trace])
+
+    async def upsert_traces(self, traces: List["Trace"]) -> None:
+        """Create or update trace records in the database, with a single statement.
+
         Uses INSERT ... ON CONFLICT DO UPDATE (upsert) to handle concurrent inserts
         atomically and avoid race conditions.
 
         Args:
-            trace: The Trace object to store (one per trace_id).
+            traces: The Trace objects to store (one per trace_id).
         """
+        if not traces:
+            return
+
         from sqlalchemy import case
 
         try:
@@ -2572,15 +2592,18 @@ class AsyncSqliteDb(AsyncBaseDb):
             if table is None:
                 return
 
-            trace_dict = trace.to_dict()
-            trace_dict.pop("total_spans", None)
-            trace_dict.pop("error_count", None)
+            trace_dicts = []
+            for trace in traces:
+                trace_dict = trace.to_dict()
+                trace_dict.pop("total_spans", None)
+                trace_dict.pop("error_count", None)
+                trace_dicts.append(trace_dict)
 
             async with self.async_session_factory() as sess, sess.begin():
                 # Use upsert to handle concurrent inserts atomically
                 # On conflict, update fields while preserving existing non-null context values
                 # and keeping the earliest start_time
-                insert_stmt = sqlite.insert(table).values(trace_dict)
+                insert_stmt = sqlite.insert(table)
 
                 # Build component level expressions for comparing trace priority
                 new_level = self._get_trace_component_level_expr(
@@ -2629,10 +2652,10 @@ class AsyncSqliteDb(AsyncBaseDb):
                         "workflow_id": func.coalesce(insert_stmt.excluded.workflow_id, table.c.workflow_id),
                     },
                 )
-                await sess.execute(upsert_stmt)
+                await sess.execute(upsert_stmt, trace_dicts)
 
         except Exception as e:
-            log_error(f"Error creating trace: {e}")
+            log_error(f"Error creating traces: {e}")
             # Don't raise - tracing should not break the main application flow
 
     async def get_trace(
@@ -2919,9 +2942,7 @@ class AsyncSqliteDb(AsyncBaseDb):
                 return
 
             async with self.async_session_factory() as sess, sess.begin():
-                for span in spans:
-                    stmt = sqlite.insert(table).values(span.to_dict())
-                    await sess.execute(stmt)
+                await sess.execute(sqlite.insert(table), [span.to_dict() for span in spans])
 
         except Exception as e:
             log_error(f"Error creating spans batch: {e}")
@@ -3488,6 +3509,60 @@ class AsyncSqliteDb(AsyncBaseDb):
             log_debug(f"Error claiming schedule: {e}")
             return None
 
+    async def claim_due_schedules(
+        self, worker_id: str, limit: int = 10, lock_grace_seconds: int = 300
+    ) -> List[Dict[str, Any]]:
+        try:
+            table = await self._get_table(table_type="schedules")
+            if table is None or limit <= 0:
+                return []
+            now = int(time.time())
+            stale_lock_threshold = now - lock_grace_seconds
+            claimable = or_(table.c.locked_by.is_(None), table.c.locked_at <= stale_lock_threshold)
+            async with self.async_session_factory() as sess:
+                async with sess.begin():
+                    stmt = (
+                        select(table.c.id)
+                        .where(table.c.enabled == True, table.c.next_run_at <= now, claimable)  # noqa: E712
+                        .order_by(table.c.next_run_at.asc())
+                        .limit(limit)
+                    )
+                    result = await sess.execute(stmt)
+                    schedule_ids = [row[0] for row in result.fetchall()]
+                    if not schedule_ids:
+                        return []
+                    # Claim them in one statement. Schedules claimed by another worker in the meantime are skipped.
+                    await sess.execute(
+                        table.update()
+                        .where(table.c.id.in_(schedule_ids), claimable)
+                        .values(locked_by=worker_id, locked_at=now)
+                    )
+                    result = await sess.execute(
+                        select(table)
+                        .where(table.c.id.in_(schedule_ids), table.c.locked_by == worker_id, table.c.locked_at == now)
+                        .order_by(table.c.next_run_at.asc())
+                    )
+                    return [dict(row._mapping) for row in result.fetchall()]
+        except Exception as e:
+            log_debug(f"Error claiming schedules: {e}")
+            return []
+
+    async def get_next_schedule_run_at(self) -> Optional[int]:
+        try:
+            table = await self._get_table(table_type="schedules")
+            if table is None:
+                return None
+            async with self.async_session_factory() as sess:
+                stmt = select(func.min(table.c.next_run_at)).where(
+                    table.c.enabled == True,  # noqa: E712
+                    table.c.locked_by.is_(None),
+                )
+                result = await sess.execute(stmt)
+                return result.scalar()
+        except Exception as e:
+            log_debug(f"Error getting next schedule run: {e}")
+            return None
+
     async def release_schedule(self, schedule_id: str, next_run_at: Optional[int] = None) -> bool:
         try:
             table = await self._get_table(table_type="schedules")
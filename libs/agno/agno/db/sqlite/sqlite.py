@@ -1,3 +1,4 @@
+import json
 import time
 from datetime import date, datetime, timedelta, timezone
 from pathlib import Path
@@ -25,13 +26,23 @@ from agno.db.sqlite.utils import (
     is_valid_table,
     serialize_cultural_knowledge_for_db,
 )
-from agno.db.utils import deserialize_session_json_fields, serialize_session_json_fields
+from agno.db.utils import (
+    HISTORY_SKIPPED_RUN_STATUSES,
+    PAUSED_RUN_STATUS,
+    CustomJSONEncoder,
+    apply_runs_window,
+    deserialize_session_json_fields,
+    get_unsaved_run_rows,
+    merge_session_runs,
+    serialize_session_json_fields,
+    set_previous_runs,
+)
 from agno.session import AgentSession, Session, TeamSession, WorkflowSession
 from agno.utils.log import log_debug, log_error, log_info, log_warning
 from agno.utils.string import generate_id
 
 try:
-    from sqlalchemy import Column, MetaData, String, Table, func, or_, select, text
+    from sqlalchemy import Column, MetaData, String, Table, and_, func, literal, or_, select, text, true, union_all
     from sqlalchemy.dialects import sqlite
     from sqlalchemy.engine import Engine, create_engine
     from sqlalchemy.orm import scoped_session, sessionmaker
@@ -62,6 +73,7 @@ class SqliteDb(BaseDb):
         schedules_table: Optional[str] = None,
         schedule_runs_table: Optional[str] = None,
         approvals_table: Optional[str] = None,
+        runs_table: Optional[str] = None,
         id: Optional[str] = None,
     ):
         """
@@ -92,6 +104,8 @@ class SqliteDb(BaseDb):
             learnings_table (Optional[str]): Name of the table to store learning records.
             schedules_table (Optional[str]): Name of the table to store cron schedules.
             schedule_runs_table (Optional[str]): Name of the table to store schedule run history.
+            runs_table (Optional[str]): Name of the table to store session runs as individual rows.
+                When set, saving a session only writes its new or updated runs, instead of rewriting all of them.
             id (Optional[str]): ID of the database.
 
         Raises:
@@ -119,6 +133,7 @@ class SqliteDb(BaseDb):
             schedules_table=schedules_table,
             schedule_runs_table=schedule_runs_table,
             approvals_table=approvals_table,
+            runs_table=runs_table,
         )
 
         _engine: Optional[Engine] = db_engine
@@ -152,6 +167,7 @@ class SqliteDb(BaseDb):
             {
                 "db_file": self.db_file,
                 "db_url": self.db_url,
+                "runs_table": self.runs_table_name,
                 "type": "sqlite",
             }
         )
@@ -178,6 +194,7 @@ class SqliteDb(BaseDb):
             schedules_table=data.get("schedules_table"),
             schedule_runs_table=data.get("schedule_runs_table"),
             approvals_table=data.get("approvals_table"),
+            runs_table=data.get("runs_table"),
             id=data.get("id"),
         )
 
@@ -220,6 +237,8 @@ class SqliteDb(BaseDb):
             (self.schedule_runs_table_name, "schedule_runs"),
             (self.approvals_table_name, "approvals"),
         ]
+        if self.runs_table_name is not None:
+            tables_to_create.append((self.runs_table_name, "runs"))
 
         for table_name, table_type in tables_to_create:
             self._get_or_create_table(table_name=table_name, table_type=table_type, create_table_if_not_found=True)
@@ -439,6 +458,16 @@ class SqliteDb(BaseDb):
             )
             return self.session_table
 
+        elif table_type == "runs":
+            if self.runs_table_name is None:
+                return None
+            self.runs_table = self._get_or_create_table(
+                table_name=self.runs_table_name,
+                table_type="runs",
+                create_table_if_not_found=create_table_if_not_found,
+            )
+            return self.runs_table
+
         elif table_type == "memories":
             self.memory_table = self._get_or_create_table(
                 table_name=self.memory_table_name,
@@ -665,6 +694,8 @@ class SqliteDb(BaseDb):
             if table is None:
                 return False
 
+            runs_table = self._get_table(table_type="runs")
+
             with self.Session() as sess, sess.begin():
                 delete_stmt = table.delete().where(table.c.session_id == session_id)
                 if user_id is not None:
@@ -674,6 +705,8 @@ class SqliteDb(BaseDb):
                     log_debug(f"No session found to delete with session_id: {session_id}")
                     return False
                 else:
+                    if runs_table is not None:
+                        sess.execute(runs_table.delete().where(runs_table.c.session_id == session_id))
                     log_debug(f"Successfully deleted session with session_id: {session_id}")
                     return True
 
@@ -697,7 +730,16 @@ class SqliteDb(BaseDb):
             if table is None:
                 return
 
+            runs_table = self._get_table(table_type="runs")
+
             with self.Session() as sess, sess.begin():
+                if runs_table is not None:
+                    # Only delete the runs of the sessions that will be deleted
+                    deleted_ids_stmt = select(table.c.session_id).where(table.c.session_id.in_(session_ids))
+                    if user_id is not None:
+                        deleted_ids_stmt = deleted_ids_stmt.where(table.c.user_id == user_id)
+                    sess.execute(runs_table.delete().where(runs_table.c.session_id.in_(deleted_ids_stmt)))
+
                 delete_stmt = table.delete().where(table.c.session_id.in_(session_ids))
                 if user_id is not None:
                     delete_stmt = delete_stmt.where(table.c.user_id == user_id)
@@ -715,6 +757,7 @@ class SqliteDb(BaseDb):
         session_type: SessionType,
         user_id: Optional[str] = None,
         deserialize: Optional[bool] = True,
+        last_n_runs: Optional[int] = None,
     ) -> Optional[Union[Session, Dict[str, Any]]]:
         """
         Read a session from the database.
@@ -724,6 +767,7 @@ class SqliteDb(BaseDb):
             session_type (SessionType): Type of session to get.
             user_id (Optional[str]): User ID to filter by. Defaults to None.
             deserialize (Optional[bool]): Whether to serialize the session. Defaults to True.
+            last_n_runs (Optional[int]): Only load the runs holding the last N history runs. Defaults to all runs.
 
         Returns:
             Optional[Union[Session, Dict[str, Any]]]:
@@ -750,22 +794,202 @@ class SqliteDb(BaseDb):
                     return None
 
                 session_raw = deserialize_session_json_fields(dict(result._mapping))
-                if not session_raw or not deserialize:
-                    return session_raw
 
+            unsaved_run_ids: List[str] = []
+            previous_runs: List[Dict[str, Any]] = []
+            runs_offset = 0
+            if session_raw and self.runs_table_name is not None and not session_raw.get("runs"):
+                # Read the runs in the window from the runs table
+                runs_offset = self._get_runs_window_start(session_id, last_n_runs) if last_n_runs else 0
+                session_runs = self._get_session_runs(session_ids=[session_id], start_position=runs_offset)
+                session_raw["runs"] = session_runs.get(session_id) or None
+            elif session_raw and self.runs_table_name is not None:
+                # Runs still embedded in the session row are all loaded, to be moved to the runs table
+                stored_runs = self._get_session_runs(session_ids=[session_id]).get(session_id, [])
+                unsaved_run_ids = merge_session_runs(session_raw, stored_runs)
+            elif session_raw:
+                previous_runs = apply_runs_window(session_raw, last_n_runs)
+
+            if not session_raw or not deserialize:
+                return session_raw
+
+            deserialized_session: Optional[Session]
             if session_type == SessionType.AGENT:
-                return AgentSession.from_dict(session_raw)
+                deserialized_session = AgentSession.from_dict(session_raw)
             elif session_type == SessionType.TEAM:
-                return TeamSession.from_dict(session_raw)
+                deserialized_session = TeamSession.from_dict(session_raw)
             elif session_type == SessionType.WORKFLOW:
-                return WorkflowSession.from_dict(session_raw)
+                deserialized_session = WorkflowSession.from_dict(session_raw)
             else:
                 raise ValueError(f"Invalid session type: {session_type}")
 
+            # Runs still embedded in the session row are moved to the runs table on the next upsert
+            if deserialized_session is not None:
+                deserialized_session.unsaved_run_ids.update(unsaved_run_ids)
+                deserialized_session.runs_offset = runs_offset
+            return set_previous_runs(deserialized_session, previous_runs)
+
         except Exception as e:
             log_debug(f"Exception reading from sessions table: {e}")
             raise e
 
+    def get_run(self, run_id: str, session_id: str, session_type: SessionType) -> Optional[Dict[str, Any]]:
+        """
+        Read a single run of a session, without reading the rest of the session.
+
+        The run is looked up by its primary key in the runs table, if configured. Runs stored in the session row are
+        extracted with SQLite's JSON functions, so only the requested run is read.
+
+        Args:
+            run_id (str): ID of the run to read.
+            session_id (str): ID of the session the run belongs to.
+            session_type (SessionType): Type of the session.
+
+        Returns:
+            Optional[Dict[str, Any]]: The serialized run, or None if not found.
+
+        Raises:
+            Exception: If an error occurs during retrieval.
+        """
+        try:
+            runs_table = self._get_table(table_type="runs")
+            if runs_table is not None:
+                with self.Session() as sess:
+                    stmt = select(runs_table.c.run_data).where(
+                        runs_table.c.session_id == session_id,
+                        runs_table.c.run_id == run_id,
+                        runs_table.c.session_type == session_type.value,
+                    )
+                    run_data = sess.execute(stmt).scalar()
+                if run_data is not None:
+                    return json.loads(run_data) if isinstance(run_data, str) else run_data
+
+            runs = self._get_embedded_runs(session_id=session_id, session_type=session_type, run_id=run_id)
+            return runs[0] if runs else None
+
+        except Exception as e:
+            log_debug(f"Exception reading run {run_id}: {e}")
+            raise e
+
+    def list_runs(
+        self,
+        session_id: str,
+        session_type: SessionType,
+        status: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Read the runs of a session, without reading the rest of the session.
+
+        Runs are filtered and limited by the database, with SQLite's JSON functions on the runs stored in the session
+        row. If a runs table is configured, its runs are merged with any runs still stored in the session row.
+
+        Args:
+            session_id (str): ID of the session to read the runs of.
+            session_type (SessionType): Type of the session.
+            status (Optional[str]): Only return the runs with this status, e.g. "RUNNING".
+            limit (Optional[int]): Maximum number of runs to return. The most recent runs are kept.
+
+        Returns:
+            List[Dict[str, Any]]: The serialized runs, in session order.
+
+        Raises:
+            Exception: If an error occurs during retrieval.
+        """
+        try:
+            runs_table = self._get_table(table_type="runs")
+            if runs_table is None:
+                return self._get_embedded_runs(
+                    session_id=session_id, session_type=session_type, status=status, limit=limit
+                )
+
+            table = self._get_table(table_type="sessions")
+            if table is None:
+                return []
+
+            # Runs still embedded in the session row keep their position, with the runs table version taking
+            # precedence, and the other runs of the runs table follow them, as when reading the session.
+            # The runs and run_data columns hold JSON serialized as a JSON string.
+            embedded_runs = func.json_each(func.json_extract(table.c.runs, "$")).table_valued("key", "value")
+            embedded_run_id = func.json_extract(embedded_runs.c.value, "$.run_id")
+            session_filter = and_(table.c.session_id == session_id, table.c.session_type == session_type.value)
+            runs_filter = and_(runs_table.c.session_id == session_id, runs_table.c.session_type == session_type.value)
+
+            embedded_runs_stmt = (
+                select(
+                    func.coalesce(func.json_extract(runs_table.c.run_data, "$"), embedded_runs.c.value).label("run"),
+                    func.coalesce(runs_table.c.status, func.json_extract(embedded_runs.c.value, "$.status")).label(
+                        "status"
+                    ),
+                    literal(0).label("source"),
+                    embedded_runs.c.key.label("position"),
+                )
+                .select_from(
+                    table.join(embedded_runs, true()).outerjoin(
+                        runs_table, and_(runs_filter, runs_table.c.run_id == embedded_run_id)
+                    )
+                )
+                .where(session_filter)
+            )
+            embedded_run_ids = (
+                select(embedded_run_id)
+                .select_from(table.join(embedded_runs, true()))
+                .where(session_filter, embedded_run_id.is_not(None))
+            )
+            table_runs_stmt = select(
+                func.json_extract(runs_table.c.run_data, "$"),
+                runs_table.c.status,
+                literal(1),
+                runs_table.c.position,
+            ).where(runs_filter, runs_table.c.run_id.not_in(embedded_run_ids))
+
+            runs = union_all(embedded_runs_stmt, table_runs_stmt).subquery()
+            stmt = select(runs.c.run).order_by(runs.c.source.desc(), runs.c.position.desc())
+            if status is not None:
+                stmt = stmt.where(runs.c.status == status)
+            if limit is not None:
+                stmt = stmt.limit(limit)
+
+            with self.Session() as sess:
+                records = sess.execute(stmt).scalars().all()
+            return [json.loads(run) for run in reversed(records)]
+
+        except Exception as e:
+            log_debug(f"Exception reading runs of session {session_id}: {e}")
+            raise e
+
+    def _get_embedded_runs(
+        self,
+        session_id: str,
+        session_type: SessionType,
+        run_id: Optional[str] = None,
+        status: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Read the matching runs stored in a session row, in session order, keeping the last `limit` runs."""
+        table = self._get_table(table_type="sessions")
+        if table is None:
+            return []
+
+        # The runs column holds the runs array serialized as a JSON string
+        runs = func.json_each(func.json_extract(table.c.runs, "$")).table_valued("key", "value")
+        stmt = (
+            select(runs.c.value)
+            .select_from(table.join(runs, true()))
+            .where(table.c.session_id == session_id, table.c.session_type == session_type.value)
+            .order_by(runs.c.key.desc())
+        )
+        if run_id is not None:
+            stmt = stmt.where(func.json_extract(runs.c.value, "$.run_id") == run_id)
+        if status is not None:
+            stmt = stmt.where(func.json_extract(runs.c.value, "$.status") == status)
+        if limit is not None:
+            stmt = stmt.limit(limit)
+
+        with self.Session() as sess:
+            records = sess.execute(stmt).scalars().all()
+        return [json.loads(run) for run in reversed(records)]
+
     def get_sessions(
         self,
         session_type: Optional[SessionType] = None,
@@ -849,20 +1073,29 @@ class SqliteDb(BaseDb):
                     return [] if deserialize else ([], 0)
 
                 sessions_raw = [deserialize_session_json_fields(dict(record._mapping)) for record in records]
-                if not deserialize:
-                    return sessions_raw, total_count
-                if not sessions_raw:
-                    return []
 
+            # Runs stored in the runs table are read for all sessions at once
+            unsaved_run_ids = self._merge_runs_table_runs(sessions_raw)
+            if not deserialize:
+                return sessions_raw, total_count
+            if not sessions_raw:
+                return []
+
+            deserialized_sessions: List[Session]
             if session_type == SessionType.AGENT:
-                return [AgentSession.from_dict(record) for record in sessions_raw]  # type: ignore
+                deserialized_sessions = [AgentSession.from_dict(record) for record in sessions_raw]  # type: ignore
             elif session_type == SessionType.TEAM:
-                return [TeamSession.from_dict(record) for record in sessions_raw]  # type: ignore
+                deserialized_sessions = [TeamSession.from_dict(record) for record in sessions_raw]  # type: ignore
             elif session_type == SessionType.WORKFLOW:
-                return [WorkflowSession.from_dict(record) for record in sessions_raw]  # type: ignore
+                deserialized_sessions = [WorkflowSession.from_dict(record) for record in sessions_raw]  # type: ignore
             else:
                 raise ValueError(f"Invalid session type: {session_type}")
 
+            # Runs still embedded in the session rows are moved to the runs table on the next upsert
+            for deserialized_session in deserialized_sessions:
+                deserialized_session.unsaved_run_ids.update(unsaved_run_ids.get(deserialized_session.session_id, []))
+            return deserialized_sessions
+
         except Exception as e:
             log_debug(f"Exception reading from sessions table: {e}")
             raise e
@@ -936,7 +1169,9 @@ class SqliteDb(BaseDb):
             if table is None:
                 return None
 
-            serialized_session = serialize_session_json_fields(session.to_dict())
+            # With a runs table, the session row is stored without its runs and only unsaved runs are written
+            runs_table = self._get_table(table_type="runs", create_table_if_not_found=True)
+            serialized_session = serialize_session_json_fields(session.to_dict(include_runs=runs_table is None))
 
             if isinstance(session, AgentSession):
                 with self.Session() as sess, sess.begin():
@@ -971,10 +1206,13 @@ class SqliteDb(BaseDb):
                     result = sess.execute(stmt)
                     row = result.fetchone()
 
+                    if row is not None and runs_table is not None:
+                        self._upsert_session_runs(sess, runs_table, session, SessionType.AGENT)
+
                     session_raw = deserialize_session_json_fields(dict(row._mapping)) if row else None
                     if session_raw is None or not deserialize:
-                        return session_raw
-                    return AgentSession.from_dict(session_raw)
+                        return self._with_session_runs(session_raw, session, runs_table)
+                    return self._with_session_runs(AgentSession.from_dict(session_raw), session, runs_table)
 
             elif isinstance(session, TeamSession):
                 with self.Session() as sess, sess.begin():
@@ -1010,10 +1248,13 @@ class SqliteDb(BaseDb):
                     result = sess.execute(stmt)
                     row = result.fetchone()
 
+                    if row is not None and runs_table is not None:
+                        self._upsert_session_runs(sess, runs_table, session, SessionType.TEAM)
+
                     session_raw = deserialize_session_json_fields(dict(row._mapping)) if row else None
                     if session_raw is None or not deserialize:
-                        return session_raw
-                    return TeamSession.from_dict(session_raw)
+                        return self._with_session_runs(session_raw, session, runs_table)
+                    return self._with_session_runs(TeamSession.from_dict(session_raw), session, runs_table)
 
             else:
                 with self.Session() as sess, sess.begin():
@@ -1048,15 +1289,154 @@ class SqliteDb(BaseDb):
                     result = sess.execute(stmt)
                     row = result.fetchone()
 
+                    if row is not None and runs_table is not None:
+                        self._upsert_session_runs(sess, runs_table, session, SessionType.WORKFLOW)
+
                     session_raw = deserialize_session_json_fields(dict(row._mapping)) if row else None
                     if session_raw is None or not deserialize:
-                        return session_raw
-                    return WorkflowSession.from_dict(session_raw)
+                        return self._with_session_runs(session_raw, session, runs_table)
+                    return self._with_session_runs(WorkflowSession.from_dict(session_raw), session, runs_table)
 
         except Exception as e:
             log_warning(f"Exception upserting into table: {e}")
             raise e
 
+    def _get_runs_window_start(self, session_id: str, last_n_runs: int) -> int:
+        """Get the position of the first run of the window holding the last `last_n_runs` history runs.
+
+        Args:
+            session_id (str): ID of the session.
+            last_n_runs (int): The number of history runs in the window.
+
+        Returns:
+            int: The position of the first run in the window, or 0 if the session holds fewer history runs.
+        """
+        runs_table = self._get_table(table_type="runs")
+        if runs_table is None:
+            return 0
+
+        with self.Session() as sess:
+            stmt = (
+                select(runs_table.c.position)
+                .where(runs_table.c.session_id == session_id)
+                .where(runs_table.c.parent_run_id.is_(None))
+                .where(
+                    or_(
+                        runs_table.c.status.is_(None),
+                        runs_table.c.status.notin_(HISTORY_SKIPPED_RUN_STATUSES),
+                    )
+                )
+                .order_by(runs_table.c.position.desc())
+                .offset(last_n_runs - 1)
+                .limit(1)
+            )
+            window_start = sess.execute(stmt).scalar() or 0
+            if window_start == 0:
+                return 0
+
+            # Extend the window to any earlier paused run, so it can still be continued
+            paused_stmt = (
+                select(func.min(runs_table.c.position))
+                .where(runs_table.c.session_id == session_id)
+                .where(runs_table.c.status == PAUSED_RUN_STATUS)
+            )
+            paused_position = sess.execute(paused_stmt).scalar()
+            if paused_position is not None:
+                return min(window_start, paused_position)
+            return window_start
+
+    def _merge_runs_table_runs(self, sessions_raw: List[Dict[str, Any]]) -> Dict[str, List[str]]:
+        """Merge the runs stored in the runs table into the given session dictionaries, in place.
+
+        Args:
+            sessions_raw (List[Dict[str, Any]]): The session dictionaries, with their embedded runs deserialized.
+
+        Returns:
+            Dict[str, List[str]]: IDs of the runs still embedded in each session row and not yet in the runs table.
+        """
+        if self.runs_table_name is None or not sessions_raw:
+            return {}
+        runs_by_session = self._get_session_runs(session_ids=[session["session_id"] for session in sessions_raw])
+        return {
+            session["session_id"]: merge_session_runs(session, runs_by_session.get(session["session_id"], []))
+            for session in sessions_raw
+        }
+
+    def _get_session_runs(self, session_ids: List[str], start_position: int = 0) -> Dict[str, List[Dict[str, Any]]]:
+        """Read the runs of the given sessions from the runs table, in session order.
+
+        Args:
+            session_ids (List[str]): IDs of the sessions to read the runs for.
+            start_position (int): Position of the first run to read in each session. Defaults to 0.
+
+        Returns:
+            Dict[str, List[Dict[str, Any]]]: The serialized runs, grouped by session ID.
+        """
+        runs_table = self._get_table(table_type="runs")
+        if runs_table is None or not session_ids:
+            return {}
+
+        with self.Session() as sess:
+            stmt = (
+                select(runs_table.c.session_id, runs_table.c.run_data)
+                .where(runs_table.c.session_id.in_(session_ids))
+                .order_by(runs_table.c.session_id, runs_table.c.position)
+            )
+            if start_position > 0:
+                stmt = stmt.where(runs_table.c.position >= start_position)
+            records = sess.execute(stmt).fetchall()
+
+        runs_by_session: Dict[str, List[Dict[str, Any]]] = {}
+        for record in records:
+            run_data = json.loads(record.run_data) if isinstance(record.run_data, str) else record.run_data
+            runs_by_session.setdefault(record.session_id, []).append(run_data)
+        return runs_by_session
+
+    def _upsert_session_runs(self, sess: Any, runs_table: Table, session: Session, session_type: SessionType) -> None:
+        """Write the runs added or updated since the session was last stored to the runs table.
+
+        Args:
+            sess: The open database session to write with.
+            runs_table (Table): The runs table.
+            session (Session): The session holding the runs.
+            session_type (SessionType): The type of the session.
+        """
+        rows = get_unsaved_run_rows(session, session_type=session_type.value)
+        if not rows:
+            return
+
+        current_time = int(time.time())
+        for row in rows:
+            row["run_data"] = json.dumps(row["run_data"], cls=CustomJSONEncoder)
+            row["updated_at"] = current_time
+
+        stmt = sqlite.insert(runs_table)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["session_id", "run_id"],
+            set_=dict(
+                status=stmt.excluded.status,
+                position=stmt.excluded.position,
+                run_data=stmt.excluded.run_data,
+                updated_at=stmt.excluded.updated_at,
+            ),
+        )
+        sess.execute(stmt, rows)
+        session.unsaved_run_ids.clear()
+        log_debug(f"Stored {len(rows)} runs for session {session.session_id}")
+
+    def _with_session_runs(
+        self, stored_session: Optional[Union[Session, Dict[str, Any]]], session: Session, runs_table: Optional[Table]
+    ) -> Optional[Union[Session, Dict[str, Any]]]:
+        """Attach the in-memory runs to a session row that was stored without them."""
+        if stored_session is None or runs_table is None:
+            return stored_session
+        if isinstance(stored_session, dict):
+            stored_session["runs"] = [run.to_dict() for run in session.runs] if session.runs else None
+        else:
+            stored_session.runs = session.runs  # type: ignore
+            stored_session.runs_offset = session.runs_offset
+        return stored_session
+
     def upsert_sessions(
         self,
         sessions: List[Session],
@@ -1792,6 +2172,7 @@ class SqliteDb(BaseDb):
                 return []
 
             stmt = select(
+                table.c.session_id,
                 table.c.user_id,
                 table.c.session_data,
                 table.c.runs,
@@ -1806,7 +2187,21 @@ class SqliteDb(BaseDb):
 
             with self.Session() as sess:
                 result = sess.execute(stmt).fetchall()
-                return [record._mapping for record in result]
+                sessions = [record._mapping for record in result]
+
+            if self.runs_table_name is None:
+                return sessions
+
+            # Add the runs stored in the runs table to each session
+            sessions_with_runs = []
+            runs_by_session = self._get_session_runs(session_ids=[session["session_id"] for session in sessions])
+            for session in sessions:
+                session_dict = dict(session)
+                if isinstance(session_dict.get("runs"), str):
+                    session_dict["runs"] = json.loads(session_dict["runs"])
+                merge_session_runs(session_dict, runs_by_session.get(session_dict["session_id"], []))
+                sessions_with_runs.append(session_dict)
+            return sessions_with_runs
 
         except Exception as e:
             log_error(f"Error reading from sessions table: {e}")
@@ -2442,12 +2837,23 @@ class SqliteDb(BaseDb):
     def upsert_trace(self, trace: "Trace") -> None:
         """Create or update a single trace record in the database.
 
+        Args:
+            trace: The Trace object to store (one per trace_id).
+        """
+        self.upsert_traces([trace])
+
+    def upsert_traces(self, traces: List["Trace"]) -> None:
+        """Create or update trace records in the database, with a single statement.
+
         Uses INSERT ... ON CONFLICT DO UPDATE (upsert) to handle concurrent inserts
         atomically and avoid race conditions.
 
         Args:
-            trace: The Trace object to store (one per trace_id).
+            traces: The Trace objects to store (one per trace_id).
         """
+        if not traces:
+            return
+
         from sqlalchemy import case
 
         try:
@@ -2455,15 +2861,18 @@ class SqliteDb(BaseDb):
             if table is None:
                 return
 
-            trace_dict = trace.to_dict()
-            trace_dict.pop("total_spans", None)
-            trace_dict.pop("error_count", None)
+            trace_dicts = []
+            for trace in traces:
+                trace_dict = trace.to_dict()
+                trace_dict.pop("total_spans", None)
+                trace_dict.pop("error_count", None)
+                trace_dicts.append(trace_dict)
 
             with self.Session() as sess, sess.begin():
                 # Use upsert to handle concurrent inserts atomically
                 # On conflict, update fields while preserving existing non-null context values
                 # and keeping the earliest start_time
-                insert_stmt = sqlite.insert(table).values(trace_dict)
+                insert_stmt = sqlite.insert(table)
 
                 # Build component level expressions for comparing trace priority
                 new_level = self._get_trace_component_level_expr(
@@ -2512,10 +2921,10 @@ class SqliteDb(BaseDb):
                         "workflow_id": func.coalesce(insert_stmt.excluded.workflow_id, table.c.workflow_id),
                     },
                 )
-                sess.execute(upsert_stmt)
+                sess.execute(upsert_stmt, trace_dicts)
 
         except Exception as e:
-            log_error(f"Error creating trace: {e}")
+            log_error(f"Error creating traces: {e}")
             # Don't raise - tracing should not break the main application flow
 
     def get_trace(
@@ -2808,9 +3217,7 @@ class SqliteDb(BaseDb):
                 return
 
             with self.Session() as sess, sess.begin():
-                for span in spans:
-                    stmt = sqlite.insert(table).values(span.to_dict())
-                    sess.execute(stmt)
+                sess.execute(sqlite.insert(table), [span.to_dict() for span in spans])
 
         except Exception as e:
             log_error(f"Error creating spans batch: {e}")
@@ -4538,6 +4945,58 @@ class SqliteDb(BaseDb):
             log_debug(f"Error claiming schedule: {e}")
             return None
 
+    def claim_due_schedules(
+        self, worker_id: str, limit: int = 10, lock_grace_seconds: int = 300
+    ) -> List[Dict[str, Any]]:
+        try:
+            table = self._get_table(table_type="schedules")
+            if table is None or limit <= 0:
+                return []
+            now = int(time.time())
+            stale_lock_threshold = now - lock_grace_seconds
+            claimable = or_(table.c.locked_by.is_(None), table.c.locked_at <= stale_lock_threshold)
+            with self.Session() as sess, sess.begin():
+                # Find the due, enabled schedules that are either unlocked or have a stale lock
+                stmt = (
+                    select(table.c.id)
+                    .where(table.c.enabled == True, table.c.next_run_at <= now, claimable)  # noqa: E712
+                    .order_by(table.c.next_run_at.asc())
+                    .limit(limit)
+                )
+                schedule_ids = [row[0] for row in sess.execute(stmt).fetchall()]
+                if not schedule_ids:
+                    return []
+                # Claim them in one statement. Schedules claimed by another worker in the meantime are skipped.
+                sess.execute(
+                    table.update()
+                    .where(table.c.id.in_(schedule_ids), claimable)
+                    .values(locked_by=worker_id, locked_at=now)
+                )
+                claimed = sess.execute(
+                    select(table)
+                    .where(table.c.id.in_(schedule_ids), table.c.locked_by == worker_id, table.c.locked_at == now)
+                    .order_by(table.c.next_run_at.asc())
+                ).fetchall()
+                return [dict(row._mapping) for row in claimed]
+        except Exception as e:
+            log_debug(f"Error claiming schedules: {e}")
+            return []
+
+    def get_next_schedule_run_at(self) -> Optional[int]:
+        try:
+            table = self._get_table(table_type="schedules")
+            if table is None:
+                return None
+            with self.Session() as sess:
+                stmt = select(func.min(table.c.next_run_at)).where(
+                    table.c.enabled == True,  # noqa: E712
+                    table.c.locked_by.is_(None),
+                )
+                return sess.execute(stmt).scalar()
+        except Exception as e:
+            log_debug(f"Error getting next schedule run: {e}")
+            return None
+
     def release_schedule(self, schedule_id: str, next_run_at: Optional[int] = None) -> bool:
         try:
             table = self._get_table(table_type="schedules")
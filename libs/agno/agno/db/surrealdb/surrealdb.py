@@ -43,6 +43,7 @@ from agno.db.surrealdb.models import (
 )
 from agno.db.surrealdb.queries import COUNT_QUERY, WhereClause, order_limit_start
 from agno.db.surrealdb.utils import build_client
+from agno.db.utils import apply_runs_window, set_previous_runs
 from agno.session import Session
 from agno.utils.log import log_debug, log_error, log_info
 from agno.utils.string import generate_id
@@ -275,6 +276,7 @@ class SurrealDb(BaseDb):
         session_type: SessionType,
         user_id: Optional[str] = None,
         deserialize: Optional[bool] = True,
+        last_n_runs: Optional[int] = None,
     ) -> Optional[Union[Session, Dict[str, Any]]]:
         r"""
         Read a session from the database.
@@ -284,6 +286,7 @@ class SurrealDb(BaseDb):
             session_type (SessionType): Type of session to get.
             user_id (Optional[str]): User ID to filter by. Defaults to None.
             deserialize (Optional[bool]): Whether to serialize the session. Defaults to True.
+            last_n_runs (Optional[int]): Only load the runs holding the last N history runs. Defaults to all runs.
 
         Returns:
             Optional[Union[Session, Dict[str, Any]]]:
@@ -318,10 +321,11 @@ class SurrealDb(BaseDb):
         elif session_type == SessionType.WORKFLOW and raw.get("workflow") is None:
             return None
 
+        previous_runs = apply_runs_window(raw, last_n_runs)
         if not deserialize:
             return raw
 
-        return deserialize_session(session_type, raw)
+        return set_previous_runs(deserialize_session(session_type, raw), previous_runs)
 
     def get_sessions(
         self,
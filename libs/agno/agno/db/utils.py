@@ -2,7 +2,8 @@
 
 import json
 from datetime import date, datetime
-from typing import TYPE_CHECKING, Any, Dict, Optional, Union
+from enum import Enum
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 from uuid import UUID
 
 from agno.models.message import Message
@@ -11,6 +12,7 @@ from agno.utils.log import log_error, log_warning
 
 if TYPE_CHECKING:
     from agno.db.base import BaseDb
+    from agno.session import Session
 
 
 def get_sort_value(record: Dict[str, Any], sort_by: str) -> Any:
@@ -100,6 +102,210 @@ def serialize_session_json_fields(session: dict) -> dict:
     return session
 
 
+def get_unsaved_run_rows(session: "Session", session_type: str) -> List[Dict[str, Any]]:
+    """Build the runs table rows for the runs added or updated since the session was last stored.
+
+    Args:
+        session (Session): The session holding the runs.
+        session_type (str): The type of the session the runs belong to.
+
+    Returns:
+        List[Dict[str, Any]]: One row per unsaved run, with the serialized run under "run_data".
+    """
+    if not session.runs or not session.unsaved_run_ids:
+        return []
+
+    rows = []
+    for position, run in enumerate(session.runs, start=session.runs_offset):
+        if run.run_id not in session.unsaved_run_ids:
+            continue
+        status = getattr(run, "status", None)
+        if isinstance(status, Enum):
+            status = status.value
+        rows.append(
+            {
+                "session_id": session.session_id,
+                "run_id": run.run_id,
+                "session_type": session_type,
+                "agent_id": getattr(run, "agent_id", None),
+                "team_id": getattr(run, "team_id", None),
+                "workflow_id": getattr(run, "workflow_id", None),
+                "user_id": getattr(run, "user_id", None) or session.user_id,
+                "parent_run_id": getattr(run, "parent_run_id", None),
+                "status": status,
+                "position": position,
+                "run_data": run.to_dict(),
+                "created_at": getattr(run, "created_at", None) or session.created_at,
+            }
+        )
+    return rows
+
+
+def merge_session_runs(session: Dict[str, Any], stored_runs: List[Dict[str, Any]]) -> List[str]:
+    """Merge the runs read from a runs table into the given session dictionary, in place.
+
+    Runs still embedded in the session row (stored before the runs table was configured) keep their position,
+    with the runs table version taking precedence.
+
+    Args:
+        session (Dict[str, Any]): The session dictionary, with its embedded runs already deserialized.
+        stored_runs (List[Dict[str, Any]]): The runs read from the runs table, in session order.
+
+    Returns:
+        List[str]: IDs of the embedded runs not yet present in the runs table.
+    """
+    embedded_runs = session.get("runs") or []
+    stored_by_id = {run.get("run_id"): run for run in stored_runs}
+
+    merged_runs: List[Dict[str, Any]] = []
+    missing_run_ids: List[str] = []
+    for run in embedded_runs:
+        stored_run = stored_by_id.pop(run.get("run_id"), None)
+        if stored_run is None:
+            missing_run_ids.append(run.get("run_id"))
+        merged_runs.append(stored_run or run)
+    merged_runs.extend(run for run in stored_runs if run.get("run_id") in stored_by_id)
+
+    session["runs"] = merged_runs or None
+    return missing_run_ids
+
+
+# Statuses of the runs never added to the history, matching the defaults of AgentSession.get_messages()
+HISTORY_SKIPPED_RUN_STATUSES = ["PAUSED", "CANCELLED", "ERROR"]
+
+# Status of the runs that can still be continued, which are always loaded with the session
+PAUSED_RUN_STATUS = "PAUSED"
+
+
+def get_runs_window_start(runs: List[Dict[str, Any]], last_n_runs: int) -> int:
+    """Get the index of the first run of the window holding the last `last_n_runs` history runs.
+
+    History runs are the top-level runs that were not paused, cancelled or errored. All runs after the start of the
+    window are part of it, so the window is always a suffix of the session runs. The window also starts early enough
+    to hold every paused run.
+
+    Args:
+        runs (List[Dict[str, Any]]): The serialized session runs, in session order.
+        last_n_runs (int): The number of history runs to keep.
+
+    Returns:
+        int: The index of the first run in the window, or 0 if the session holds fewer history runs.
+    """
+    history_runs_count = 0
+    for index in range(len(runs) - 1, -1, -1):
+        run = runs[index]
+        if run.get("parent_run_id") is None and run.get("status") not in HISTORY_SKIPPED_RUN_STATUSES:
+            history_runs_count += 1
+            if history_runs_count == last_n_runs:
+                break
+    else:
+        return 0
+
+    # Extend the window to any earlier paused run, so it can still be continued
+    for paused_index in range(index):
+        if runs[paused_index].get("status") == PAUSED_RUN_STATUS:
+            return paused_index
+    return index
+
+
+def apply_runs_window(session: Dict[str, Any], last_n_runs: Optional[int]) -> List[Dict[str, Any]]:
+    """Keep only the runs of the given window in the session dictionary, in place.
+
+    Args:
+        session (Dict[str, Any]): The session dictionary, with its runs already deserialized from JSON.
+        last_n_runs (Optional[int]): The number of history runs to keep. All runs are kept if not set.
+
+    Returns:
+        List[Dict[str, Any]]: The serialized runs preceding the window.
+    """
+    runs = session.get("runs")
+    if not last_n_runs or not isinstance(runs, list):
+        return []
+
+    window_start = get_runs_window_start(runs, last_n_runs)
+    if window_start == 0:
+        return []
+
+    session["runs"] = runs[window_start:]
+    return runs[:window_start]
+
+
+def get_run_status_value(run: Dict[str, Any]) -> Optional[str]:
+    """Get the status of a serialized run as a plain string."""
+    status = run.get("status")
+    if isinstance(status, Enum):
+        return status.value
+    return status
+
+
+def get_stored_session_runs(session: Any, session_type: Any) -> Optional[List[Dict[str, Any]]]:
+    """Get the runs of a session dictionary, with its runs already deserialized from JSON.
+
+    Returns None if the session is missing or has another session type.
+    """
+    if not isinstance(session, dict):
+        return None
+    stored_type = session.get("session_type")
+    expected_type = getattr(session_type, "value", session_type)
+    if stored_type is not None and getattr(stored_type, "value", stored_type) != expected_type:
+        return None
+    runs = session.get("runs")
+    return runs if isinstance(runs, list) else None
+
+
+def find_session_run(runs: Optional[List[Dict[str, Any]]], run_id: str) -> Optional[Dict[str, Any]]:
+    """Find a run by its ID in the serialized runs of a session."""
+    for run in runs or []:
+        if isinstance(run, dict) and run.get("run_id") == run_id:
+            return run
+    return None
+
+
+def filter_session_runs(
+    runs: Optional[List[Dict[str, Any]]], status: Optional[str] = None, limit: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """Get the runs with the given status, keeping the last `limit` runs in session order.
+
+    Args:
+        runs (Optional[List[Dict[str, Any]]]): The serialized runs of a session, in session order.
+        status (Optional[str]): Only keep the runs with this status. All runs are kept if not set.
+        limit (Optional[int]): Maximum number of runs to return. The most recent runs are kept.
+
+    Returns:
+        List[Dict[str, Any]]: The matching runs, in session order.
+    """
+    matching_runs = [
+        run for run in runs or [] if isinstance(run, dict) and (status is None or get_run_status_value(run) == status)
+    ]
+    if limit is not None:
+        matching_runs = matching_runs[-limit:] if limit > 0 else []
+    return matching_runs
+
+
+def set_previous_runs(
+    session: Optional["Session"], previous_runs: Optional[List[Dict[str, Any]]] = None, runs_offset: int = 0
+) -> Optional["Session"]:
+    """Attach the runs preceding the loaded run window to the session, so they are stored back as-is.
+
+    When the window was read in the database, the earlier runs are not loaded. Only their count is set as
+    `runs_offset`, and the database keeps them when the session is stored.
+    """
+    if session is not None and previous_runs:
+        session.previous_runs = previous_runs
+        session.runs_offset = len(previous_runs)
+    elif session is not None and runs_offset:
+        session.runs_offset = runs_offset
+    return session
+
+
+def get_unloaded_runs_count(session: "Session") -> int:
+    """Get the number of stored runs preceding the run window that were not loaded with the session.
+
+    Databases reading the run window in the database keep these runs when the session is stored.
+    """
+    return session.runs_offset if session.previous_runs is None else 0
+
+
 def deserialize_session_json_fields(session: dict) -> dict:
     """Deserialize JSON fields in the given Session dictionary.
 
@@ -1,9 +1,14 @@
 from agno.knowledge.filesystem import FileSystemKnowledge
+from agno.knowledge.ingestion import IngestionPipeline, IngestionStats
 from agno.knowledge.knowledge import Knowledge
 from agno.knowledge.protocol import KnowledgeProtocol
+from agno.knowledge.search_cache import SearchCache
 
 __all__ = [
     "FileSystemKnowledge",
+    "IngestionPipeline",
+    "IngestionStats",
     "Knowledge",
     "KnowledgeProtocol",
+    "SearchCache",
 ]
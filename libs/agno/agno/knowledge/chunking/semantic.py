@@ -1,3 +1,4 @@
+import threading
 from typing import Any, Dict, List, Literal, Optional, Union
 
 try:
@@ -24,15 +25,52 @@ def _get_chonkie_embedder_wrapper(embedder: Embedder):
     """Create a wrapper that adapts Agno Embedder to chonkie's BaseEmbeddings interface."""
 
     class _ChonkieEmbedderWrapper(BaseEmbeddings):
-        """Wrapper to make Agno Embedders compatible with chonkie."""
+        """Wrapper to make Agno Embedders compatible with chonkie.
+
+        Sentences are embedded in batches, and their embeddings are cached until `clear_cache` is called, so texts
+        repeated within a document are embedded once. Each thread has its own cache, so documents chunked
+        concurrently do not share or clear each other's embeddings.
+        """
 
         def __init__(self, agno_embedder: Embedder):
             super().__init__()
             self._embedder = agno_embedder
+            self._local = threading.local()
+
+        @property
+        def _cache(self) -> Dict[str, np.ndarray]:
+            cache = getattr(self._local, "cache", None)
+            if cache is None:
+                cache = self._local.cache = {}
+            return cache
 
         def embed(self, text: str):
-            embedding = self._embedder.get_embedding(text)  # type: ignore[attr-defined]
-            return np.array(embedding, dtype=np.float32)
+            cache = self._cache
+            embedding = cache.get(text)
+            if embedding is None:
+                embedding = np.array(self._embedder.get_embedding(text), dtype=np.float32)  # type: ignore[attr-defined]
+                if embedding.size:
+                    cache[text] = embedding
+            return embedding
+
+        def embed_batch(self, texts: List[str]) -> List[np.ndarray]:
+            cache = self._cache
+            missing_texts = list(dict.fromkeys(text for text in texts if text not in cache))
+            if missing_texts:
+                try:
+                    embeddings = self._embedder.get_embeddings_batch(missing_texts)
+                except NotImplementedError:
+                    # Embedders implementing only get_embedding
+                    embeddings = [self._embedder.get_embedding(text) for text in missing_texts]
+                log_debug(f"Embedded {len(missing_texts)} of {len(texts)} sentences")
+                for text, embedding in zip(missing_texts, embeddings):
+                    if embedding:
+                        cache[text] = np.array(embedding, dtype=np.float32)
+            return [cache[text] if text in cache else self.embed(text) for text in texts]
+
+        def clear_cache(self) -> None:
+            """Clear the cache of the current thread."""
+            self._local.cache = {}
 
         def get_tokenizer(self):
             """Return a simple token counter function."""
@@ -102,6 +140,7 @@ class SemanticChunking(ChunkingStrategy):
         self.filter_tolerance = filter_tolerance
         self.chunker_params = chunker_params
         self.chunker: Optional[SemanticChunker] = None
+        self._embedder_wrapper: Optional[BaseEmbeddings] = None
 
     def _initialize_chunker(self):
         """Lazily initialize the chunker with chonkie dependency."""
@@ -119,6 +158,7 @@ class SemanticChunking(ChunkingStrategy):
             embedding_model = self.embedder
         elif isinstance(self.embedder, Embedder):
             embedding_model = _get_chonkie_embedder_wrapper(self.embedder)
+            self._embedder_wrapper = embedding_model
         else:
             raise ValueError("Invalid embedder type. Must be a string, BaseEmbeddings, or Embedder instance.")
 
@@ -153,7 +193,12 @@ class SemanticChunking(ChunkingStrategy):
         if self.chunker is None:
             raise RuntimeError("Chunker failed to initialize")
 
-        chunks = self.chunker.chunk(self.clean_text(document.content))
+        try:
+            chunks = self.chunker.chunk(self.clean_text(document.content))
+        finally:
+            # Sentence embeddings are only cached within a document
+            if self._embedder_wrapper is not None:
+                self._embedder_wrapper.clear_cache()  # type: ignore[attr-defined]
 
         # Convert chunks to Documents
         chunked_documents: List[Document] = []
@@ -1,3 +1,4 @@
+import asyncio
 from dataclasses import dataclass
 from typing import Dict, List, Optional, Tuple
 
@@ -9,6 +10,9 @@ class Embedder:
     dimensions: Optional[int] = 1536
     enable_batch: bool = False
     batch_size: int = 100  # Number of texts to process in each API call
+    batch_concurrency: int = 1  # Number of batches embedded concurrently
+    batch_retries: int = 0  # Number of times a failed batch is retried
+    batch_retry_delay: float = 1.0  # Delay in seconds before the first retry, doubled after each retry
 
     def get_embedding(self, text: str) -> List[float]:
         raise NotImplementedError
@@ -21,3 +25,28 @@ class Embedder:
 
     async def async_get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
         raise NotImplementedError
+
+    def get_embeddings_batch(self, texts: List[str]) -> List[List[float]]:
+        """Get embeddings for multiple texts, in as few requests as the embedder supports."""
+        return self.get_embeddings_batch_and_usage(texts)[0]
+
+    def get_embeddings_batch_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        """Get embeddings and usage for multiple texts. Embedders supporting batch requests override this."""
+        results = [self.get_embedding_and_usage(text) for text in texts]
+        return [embedding for embedding, _ in results], [usage for _, usage in results]
+
+    async def async_get_embeddings_batch_and_usage(
+        self, texts: List[str]
+    ) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        """Get embeddings and usage for multiple texts. Embedders supporting batch requests override this.
+
+        Texts are embedded one by one, at most `batch_concurrency` at a time.
+        """
+        semaphore = asyncio.Semaphore(max(self.batch_concurrency, 1))
+
+        async def embed(text: str) -> Tuple[List[float], Optional[Dict]]:
+            async with semaphore:
+                return await self.async_get_embedding_and_usage(text)
+
+        results = await asyncio.gather(*[embed(text) for text in texts])
+        return [embedding for embedding, _ in results], [usage for _, usage in results]
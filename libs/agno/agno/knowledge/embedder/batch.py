@@ -0,0 +1,162 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence
+
+from agno.knowledge.document import Document
+from agno.knowledge.embedder.base import Embedder
+from agno.utils.log import log_debug, log_error, log_warning
+
+# Phrases of the errors raised by rate limited embedders. Falling back to individual embeddings would make it worse.
+RATE_LIMIT_PHRASES = ["rate limit", "too many requests", "429", "trial key", "api calls / minute"]
+
+
+def is_rate_limit_error(error: Exception) -> bool:
+    error_str = str(error).lower()
+    return any(phrase in error_str for phrase in RATE_LIMIT_PHRASES)
+
+
+def embed_documents(embedder: Embedder, documents: List[Document]) -> List[Optional[Dict[str, Any]]]:
+    """Embed documents, with one embedder call per batch of `embedder.batch_size` documents if batching is enabled.
+
+    Up to `embedder.batch_concurrency` batches are embedded concurrently, and a failed batch is retried
+    `embedder.batch_retries` times. If it keeps failing, its documents are embedded one by one, unless the embedder is
+    rate limited. Objects that are not `Embedder` instances, without batch settings, embed documents one by one.
+    An error embedding a single document is raised.
+
+    Args:
+        embedder (Embedder): The embedder to use.
+        documents (List[Document]): The documents to embed, in place.
+
+    Returns:
+        List[Optional[Dict[str, Any]]]: The usage of each batch. Empty if batching is disabled.
+
+    Raises:
+        Exception: If a document fails to be embedded, or the embedder is rate limited.
+    """
+    if not _is_batch_enabled(embedder):
+        for document in documents:
+            _embed_document(embedder, document)
+        return []
+
+    batches = _split_batches(embedder, documents)
+    if embedder.batch_concurrency > 1 and len(batches) > 1:
+        with ThreadPoolExecutor(max_workers=min(embedder.batch_concurrency, len(batches))) as executor:
+            return list(executor.map(lambda batch: _embed_batch(embedder, batch), batches))
+    return [_embed_batch(embedder, batch) for batch in batches]
+
+
+async def async_embed_documents(embedder: Embedder, documents: List[Document]) -> List[Optional[Dict[str, Any]]]:
+    """Embed documents asynchronously, with one embedder call per batch of documents if batching is enabled.
+
+    See `embed_documents`.
+    """
+    if not _is_batch_enabled(embedder):
+        await _async_embed_documents_individually(embedder, documents)
+        return []
+
+    semaphore = asyncio.Semaphore(max(embedder.batch_concurrency, 1))
+
+    async def embed_batch(batch: List[Document]) -> Optional[Dict[str, Any]]:
+        async with semaphore:
+            return await _async_embed_batch(embedder, batch)
+
+    return list(await asyncio.gather(*[embed_batch(batch) for batch in _split_batches(embedder, documents)]))
+
+
+def _is_batch_enabled(embedder: Embedder) -> bool:
+    return isinstance(embedder, Embedder) and embedder.enable_batch
+
+
+def _split_batches(embedder: Embedder, documents: List[Document]) -> List[List[Document]]:
+    batch_size = max(embedder.batch_size, 1)
+    return [documents[i : i + batch_size] for i in range(0, len(documents), batch_size)]
+
+
+def _embed_document(embedder: Embedder, document: Document) -> None:
+    try:
+        document.embed(embedder=embedder)
+    except Exception as e:
+        # Documents are not stored without their embedding
+        log_error(f"Error embedding document '{document.name}': {e}")
+        raise
+
+
+async def _async_embed_documents_individually(embedder: Embedder, documents: List[Document]) -> None:
+    results = await asyncio.gather(
+        *[document.async_embed(embedder=embedder) for document in documents], return_exceptions=True
+    )
+    errors = []
+    for document, result in zip(documents, results):
+        if isinstance(result, Exception):
+            log_error(f"Error embedding document '{document.name}': {result}")
+            errors.append(result)
+    if errors:
+        # Documents are not stored without their embedding
+        raise errors[0]
+
+
+def _embed_batch(embedder: Embedder, batch: List[Document]) -> Optional[Dict[str, Any]]:
+    for attempt in range(embedder.batch_retries + 1):
+        try:
+            embeddings, usages = embedder.get_embeddings_batch_and_usage([document.content for document in batch])
+            return _assign_batch_embeddings(batch, embeddings, usages)
+        except Exception as e:
+            if not _should_retry(embedder, attempt, e):
+                break
+            time.sleep(embedder.batch_retry_delay * 2**attempt)
+
+    for document in batch:
+        _embed_document(embedder, document)
+    return None
+
+
+async def _async_embed_batch(embedder: Embedder, batch: List[Document]) -> Optional[Dict[str, Any]]:
+    for attempt in range(embedder.batch_retries + 1):
+        try:
+            embeddings, usages = await embedder.async_get_embeddings_batch_and_usage(
+                [document.content for document in batch]
+            )
+            return _assign_batch_embeddings(batch, embeddings, usages)
+        except Exception as e:
+            if not _should_retry(embedder, attempt, e):
+                break
+            await asyncio.sleep(embedder.batch_retry_delay * 2**attempt)
+
+    await _async_embed_documents_individually(embedder, batch)
+    return None
+
+
+def _should_retry(embedder: Embedder, attempt: int, error: Exception) -> bool:
+    """Check if a failed batch is retried. Raises rate limit errors once the retries are exhausted."""
+    if attempt < embedder.batch_retries:
+        log_warning(f"Batch embedding failed, retrying ({attempt + 1}/{embedder.batch_retries}): {error}")
+        return True
+    if is_rate_limit_error(error):
+        log_error(f"Rate limit detected during batch embedding. {error}")
+        raise error
+    log_warning(f"Batch embedding failed, falling back to individual embeddings: {error}")
+    return False
+
+
+def _assign_batch_embeddings(
+    batch: List[Document], embeddings: List[List[float]], usages: Sequence[Optional[Dict[str, Any]]]
+) -> Optional[Dict[str, Any]]:
+    """Assign the embeddings of a batch to its documents. Returns the usage of the batch."""
+    for i, document in enumerate(batch):
+        if i < len(embeddings):
+            document.embedding = embeddings[i]
+            document.usage = usages[i] if i < len(usages) else None
+
+    # Embedders report the usage of a request for each of its texts
+    distinct_usages = list({id(usage): usage for usage in usages if usage}.values())
+    if len(distinct_usages) <= 1:
+        usage = distinct_usages[0] if distinct_usages else None
+    else:
+        usage = {}
+        for request_usage in distinct_usages:
+            for key, value in request_usage.items():
+                if isinstance(value, (int, float)) and not isinstance(value, bool):
+                    usage[key] = usage.get(key, 0) + value
+    log_debug(f"Embedded batch of {len(batch)} documents, usage: {usage}")
+    return usage
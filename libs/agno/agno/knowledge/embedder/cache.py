@@ -0,0 +1,308 @@
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from array import array
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from hashlib import sha256
+from pathlib import Path
+from time import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from agno.knowledge.embedder.base import Embedder
+from agno.utils.log import log_debug, log_warning
+
+
+class EmbeddingCache(ABC):
+    """Base class for the backends storing cached embeddings, keyed by `CachedEmbedder.get_cache_key`.
+
+    Hits and misses are counted on `hits` and `misses`.
+    """
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self._metrics_lock = threading.Lock()
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of the lookups that were hits."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def get_many(self, keys: Sequence[str]) -> Dict[str, List[float]]:
+        """Get the cached embeddings of the keys found in the cache."""
+        try:
+            embeddings = self._get_many(keys)
+        except Exception as e:
+            log_warning(f"Error reading from embedding cache: {e}")
+            embeddings = {}
+
+        hits = sum(1 for key in keys if key in embeddings)
+        with self._metrics_lock:
+            self.hits += hits
+            self.misses += len(keys) - hits
+        return embeddings
+
+    def set_many(self, embeddings: Dict[str, List[float]]) -> None:
+        """Store embeddings in the cache, evicting older entries if the cache is full."""
+        try:
+            self._set_many(embeddings)
+        except Exception as e:
+            log_warning(f"Error writing to embedding cache: {e}")
+
+    def reset_metrics(self) -> None:
+        with self._metrics_lock:
+            self.hits = 0
+            self.misses = 0
+
+    @abstractmethod
+    def _get_many(self, keys: Sequence[str]) -> Dict[str, List[float]]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def _set_many(self, embeddings: Dict[str, List[float]]) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Delete all entries from the cache."""
+        raise NotImplementedError
+
+
+class InMemoryEmbeddingCache(EmbeddingCache):
+    """Keeps cached embeddings in memory, evicting the least recently used entries first."""
+
+    def __init__(self, max_entries: Optional[int] = 100000):
+        """
+        Args:
+            max_entries (Optional[int]): Maximum number of embeddings to keep. Defaults to 100000.
+        """
+        super().__init__()
+        self.max_entries = max_entries
+        # Embeddings are kept as tuples so callers can't modify the cached data
+        self._entries: "OrderedDict[str, Tuple[float, ...]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _get_many(self, keys: Sequence[str]) -> Dict[str, List[float]]:
+        embeddings = {}
+        with self._lock:
+            for key in keys:
+                embedding = self._entries.get(key)
+                if embedding is not None:
+                    self._entries.move_to_end(key)
+                    embeddings[key] = list(embedding)
+        return embeddings
+
+    def _set_many(self, embeddings: Dict[str, List[float]]) -> None:
+        with self._lock:
+            for key, embedding in embeddings.items():
+                self._entries[key] = tuple(embedding)
+                self._entries.move_to_end(key)
+            while self.max_entries is not None and len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SqliteEmbeddingCache(EmbeddingCache):
+    """Stores cached embeddings as float32 blobs in a single SQLite file, evicting the least recently used first.
+
+    The file can be shared by several processes.
+    """
+
+    # Number of keys looked up per query, below the SQLite limit of query parameters
+    lookup_batch_size = 500
+
+    def __init__(
+        self,
+        db_file: Optional[str] = None,
+        max_entries: Optional[int] = 1000000,
+        table_name: str = "agno_embedding_cache",
+    ):
+        """
+        Args:
+            db_file (Optional[str]): Path to the SQLite file. Defaults to ~/.agno/cache/embeddings.db.
+            max_entries (Optional[int]): Maximum number of embeddings to keep. Defaults to 1000000.
+            table_name (str): Name of the cache table.
+        """
+        super().__init__()
+        self.db_file = Path(db_file) if db_file else Path.home() / ".agno" / "cache" / "embeddings.db"
+        self.max_entries = max_entries
+        self.table_name = table_name
+
+        self.db_file.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(str(self.db_file), check_same_thread=False, timeout=30)
+        with self._lock, self._connection:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {self.table_name} ("
+                "key TEXT PRIMARY KEY, embedding BLOB NOT NULL, accessed_at REAL NOT NULL)"
+            )
+            self._connection.execute(
+                f"CREATE INDEX IF NOT EXISTS idx_{self.table_name}_accessed_at ON {self.table_name} (accessed_at)"
+            )
+
+    def _get_many(self, keys: Sequence[str]) -> Dict[str, List[float]]:
+        embeddings = {}
+        unique_keys = list(dict.fromkeys(keys))
+        with self._lock, self._connection:
+            for i in range(0, len(unique_keys), self.lookup_batch_size):
+                batch_keys = unique_keys[i : i + self.lookup_batch_size]
+                placeholders = ", ".join("?" * len(batch_keys))
+                rows = self._connection.execute(
+                    f"SELECT key, embedding FROM {self.table_name} WHERE key IN ({placeholders})", batch_keys
+                ).fetchall()
+                for key, blob in rows:
+                    embeddings[key] = array("f", blob).tolist()
+            if embeddings:
+                now = time()
+                self._connection.executemany(
+                    f"UPDATE {self.table_name} SET accessed_at = ? WHERE key = ?",
+                    [(now, key) for key in embeddings],
+                )
+        return {key: embeddings[key] for key in keys if key in embeddings}
+
+    def _set_many(self, embeddings: Dict[str, List[float]]) -> None:
+        now = time()
+        with self._lock, self._connection:
+            self._connection.executemany(
+                f"INSERT INTO {self.table_name} (key, embedding, accessed_at) VALUES (?, ?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET embedding = excluded.embedding, accessed_at = excluded.accessed_at",
+                [(key, array("f", embedding).tobytes(), now) for key, embedding in embeddings.items()],
+            )
+            if self.max_entries is not None:
+                self._connection.execute(
+                    f"DELETE FROM {self.table_name} WHERE key IN ("
+                    f"SELECT key FROM {self.table_name} ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                    (self.max_entries,),
+                )
+
+    def clear(self) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(f"DELETE FROM {self.table_name}")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute(f"SELECT COUNT(*) FROM {self.table_name}").fetchone()[0]
+
+    def close(self) -> None:
+        """Close the connection to the SQLite file."""
+        with self._lock:
+            self._connection.close()
+
+
+@dataclass
+class CachedEmbedder(Embedder):
+    """Wraps an embedder to reuse the embeddings of texts it has already embedded.
+
+    Embeddings are keyed by the class, model id and dimensions of the wrapped embedder and the hash of the text,
+    so a cache can be shared by several embedders. Cached embeddings have no usage. The dimensions and batch
+    settings of the wrapped embedder are used.
+    """
+
+    embedder: Embedder = field(default_factory=Embedder)
+    cache: EmbeddingCache = field(default_factory=InMemoryEmbeddingCache)
+
+    def __post_init__(self):
+        self.dimensions = self.embedder.dimensions
+        self.enable_batch = self.embedder.enable_batch
+        self.batch_size = self.embedder.batch_size
+        self.batch_concurrency = self.embedder.batch_concurrency
+        self.batch_retries = self.embedder.batch_retries
+        self.batch_retry_delay = self.embedder.batch_retry_delay
+
+    def get_cache_key(self, text: str) -> str:
+        embedder_class = type(self.embedder)
+        model_id = getattr(self.embedder, "id", None)
+        embedder_key = (
+            f"{embedder_class.__module__}.{embedder_class.__qualname__}:{model_id}:{self.embedder.dimensions}"
+        )
+        return sha256(f"{embedder_key}\n{text}".encode()).hexdigest()
+
+    def get_embedding(self, text: str) -> List[float]:
+        return self.get_embedding_and_usage(text)[0]
+
+    def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        key = self.get_cache_key(text)
+        cached = self.cache.get_many([key])
+        if key in cached:
+            return cached[key], None
+
+        embedding, usage = self.embedder.get_embedding_and_usage(text)
+        self._store({key: embedding})
+        return embedding, usage
+
+    async def async_get_embedding(self, text: str) -> List[float]:
+        return (await self.async_get_embedding_and_usage(text))[0]
+
+    async def async_get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        key = self.get_cache_key(text)
+        cached = self.cache.get_many([key])
+        if key in cached:
+            return cached[key], None
+
+        embedding, usage = await self.embedder.async_get_embedding_and_usage(text)
+        self._store({key: embedding})
+        return embedding, usage
+
+    def get_embeddings_batch_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        keys, cached, missing_texts = self._lookup(texts)
+        if missing_texts:
+            embeddings, usages = self.embedder.get_embeddings_batch_and_usage(missing_texts)
+            return self._merge(texts, keys, cached, missing_texts, embeddings, usages)
+        return [cached[key] for key in keys], [None] * len(texts)
+
+    async def async_get_embeddings_batch_and_usage(
+        self, texts: List[str]
+    ) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        keys, cached, missing_texts = self._lookup(texts)
+        if missing_texts:
+            embeddings, usages = await self.embedder.async_get_embeddings_batch_and_usage(missing_texts)
+            return self._merge(texts, keys, cached, missing_texts, embeddings, usages)
+        return [cached[key] for key in keys], [None] * len(texts)
+
+    def _lookup(self, texts: List[str]) -> Tuple[List[str], Dict[str, List[float]], List[str]]:
+        """Get the cache keys of the texts, their cached embeddings and the distinct texts to embed."""
+        keys = [self.get_cache_key(text) for text in texts]
+        cached = self.cache.get_many(keys)
+        missing_texts = list(dict.fromkeys(text for text, key in zip(texts, keys) if key not in cached))
+        log_debug(f"Embedding cache: {len(texts) - len(missing_texts)} of {len(texts)} texts cached")
+        return keys, cached, missing_texts
+
+    def _merge(
+        self,
+        texts: List[str],
+        keys: List[str],
+        cached: Dict[str, List[float]],
+        missing_texts: List[str],
+        embeddings: List[List[float]],
+        usages: List[Optional[Dict]],
+    ) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        """Store the new embeddings and return the embeddings and usages of all texts, in order."""
+        new_embeddings = {text: embedding for text, embedding in zip(missing_texts, embeddings)}
+        new_usages = {text: usage for text, usage in zip(missing_texts, usages)}
+        self._store({self.get_cache_key(text): embedding for text, embedding in new_embeddings.items()})
+
+        all_embeddings = []
+        all_usages: List[Optional[Dict]] = []
+        for text, key in zip(texts, keys):
+            if key in cached:
+                all_embeddings.append(cached[key])
+                all_usages.append(None)
+            else:
+                all_embeddings.append(new_embeddings.get(text, []))
+                all_usages.append(new_usages.get(text))
+        return all_embeddings, all_usages
+
+    def _store(self, embeddings: Dict[str, List[float]]) -> None:
+        # Failed embeddings are returned empty and must not be cached
+        embeddings = {key: embedding for key, embedding in embeddings.items() if embedding}
+        if embeddings:
+            self.cache.set_many(embeddings)
@@ -114,6 +114,41 @@ class CohereEmbedder(Embedder):
         )
         await asyncio.sleep(delay)
 
+    def _batch_with_retry(
+        self, texts: List[str], max_retries: int = 3
+    ) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        """Execute batch embedding with exponential backoff for rate limiting."""
+        for attempt in range(max_retries + 1):
+            try:
+                request_params = self._get_batch_request_params()
+                response: Union[EmbeddingsFloatsEmbedResponse, EmbeddingsByTypeEmbedResponse] = self.client.embed(
+                    texts=texts, **request_params
+                )
+
+                # Extract embeddings from response
+                if isinstance(response, EmbeddingsFloatsEmbedResponse):
+                    batch_embeddings = response.embeddings
+                elif isinstance(response, EmbeddingsByTypeEmbedResponse):
+                    batch_embeddings = response.embeddings.float_ if response.embeddings.float_ else []
+                else:
+                    log_warning("No embeddings found in response")
+                    batch_embeddings = []
+
+                # Extract usage information
+                usage = response.meta.billed_units if response.meta else None
+                usage_dict = usage.model_dump() if usage else None
+                return batch_embeddings, [usage_dict] * len(batch_embeddings)
+
+            except Exception as e:
+                if self._is_rate_limit_error(e) and self.exponential_backoff and attempt < max_retries:
+                    self._exponential_backoff_sleep(attempt)
+                    continue
+                raise e
+
+        # This should never be reached, but just in case
+        log_error("Could not create embeddings. End of retry loop reached.")
+        return [], []
+
     async def _async_batch_with_retry(
         self, texts: List[str], max_retries: int = 3
     ) -> Tuple[List[List[float]], List[Optional[Dict]]]:
@@ -250,6 +285,46 @@ class CohereEmbedder(Embedder):
             return embedding, usage.model_dump()
         return embedding, None
 
+    def get_embeddings_batch_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        """
+        Get embeddings and usage for multiple texts in batches.
+
+        Args:
+            texts: List of text strings to embed
+
+        Returns:
+            Tuple of (List of embedding vectors, List of usage dictionaries)
+        """
+        all_embeddings: List[List[float]] = []
+        all_usage: List[Optional[Dict]] = []
+        log_info(f"Getting embeddings and usage for {len(texts)} texts in batches of {self.batch_size}")
+
+        for i in range(0, len(texts), self.batch_size):
+            batch_texts = texts[i : i + self.batch_size]
+
+            try:
+                batch_embeddings, batch_usage = self._batch_with_retry(batch_texts)
+                all_embeddings.extend(batch_embeddings)
+                all_usage.extend(batch_usage)
+            except Exception as e:
+                log_warning(f"Batch embedding failed: {e}")
+                # Falling back to individual calls would hit the rate limit even harder
+                if self._is_rate_limit_error(e):
+                    raise e
+
+                log_debug("Non-rate-limit error, falling back to individual calls")
+                for text in batch_texts:
+                    try:
+                        embedding, usage = self.get_embedding_and_usage(text)
+                        all_embeddings.append(embedding)
+                        all_usage.append(usage)
+                    except Exception as e2:
+                        log_warning(f"Error in individual embedding fallback: {e2}")
+                        all_embeddings.append([])
+                        all_usage.append(None)
+
+        return all_embeddings, all_usage
+
     async def async_get_embeddings_batch_and_usage(
         self, texts: List[str]
     ) -> Tuple[List[List[float]], List[Optional[Dict]]]:
@@ -51,6 +51,15 @@ class FastEmbedEmbedder(Embedder):
 
         return embedding, usage
 
+    def get_embeddings_batch_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        """Get embeddings for multiple texts, encoded by the model in batches of `batch_size`."""
+        embeddings = [
+            embedding.tolist() if isinstance(embedding, np.ndarray) else list(embedding)
+            for embedding in self.client.embed(texts, batch_size=self.batch_size)
+        ]
+        # Currently, FastEmbed does not provide usage information
+        return embeddings, [None] * len(embeddings)
+
     async def async_get_embedding(self, text: str) -> List[float]:
         """Async version using thread executor for CPU-bound operations."""
         import asyncio
@@ -66,3 +75,12 @@ class FastEmbedEmbedder(Embedder):
         loop = asyncio.get_event_loop()
         # Run the CPU-bound operation in a thread executor
         return await loop.run_in_executor(None, self.get_embedding_and_usage, text)
+
+    async def async_get_embeddings_batch_and_usage(
+        self, texts: List[str]
+    ) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        """Async version using thread executor for CPU-bound operations."""
+        import asyncio
+
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, self.get_embeddings_batch_and_usage, texts)
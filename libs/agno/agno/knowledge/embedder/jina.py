@@ -43,12 +43,15 @@ class JinaEmbedder(Embedder):
         return headers
 
     def _response(self, text: str) -> Dict[str, Any]:
+        return self._batch_response([text])  # Jina API expects a list
+
+    def _batch_response(self, texts: List[str]) -> Dict[str, Any]:
         data = {
             "model": self.id,
             "late_chunking": self.late_chunking,
             "dimensions": self.dimensions,
             "embedding_type": self.embedding_type,
-            "input": [text],  # Jina API expects a list
+            "input": texts,
         }
         if self.user is not None:
             data["user"] = self.user
@@ -77,6 +80,41 @@ class JinaEmbedder(Embedder):
             logger.warning(f"Failed to get embedding and usage: {e}")
             return [], None
 
+    def get_embeddings_batch_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        """
+        Get embeddings and usage for multiple texts in batches.
+
+        Args:
+            texts: List of text strings to embed
+
+        Returns:
+            Tuple of (List of embedding vectors, List of usage dictionaries)
+        """
+        all_embeddings = []
+        all_usage = []
+        logger.info(f"Getting embeddings and usage for {len(texts)} texts in batches of {self.batch_size}")
+
+        for i in range(0, len(texts), self.batch_size):
+            batch_texts = texts[i : i + self.batch_size]
+
+            try:
+                result = self._batch_response(batch_texts)
+                batch_embeddings = [data["embedding"] for data in result["data"]]
+                all_embeddings.extend(batch_embeddings)
+
+                # For each embedding in the batch, add the same usage information
+                usage_dict = result.get("usage")
+                all_usage.extend([usage_dict] * len(batch_embeddings))
+            except Exception as e:
+                logger.warning(f"Error in batch embedding: {e}")
+                # Fallback to individual calls for this batch
+                for text in batch_texts:
+                    embedding, usage = self.get_embedding_and_usage(text)
+                    all_embeddings.append(embedding)
+                    all_usage.append(usage)
+
+        return all_embeddings, all_usage
+
     async def _async_response(self, text: str) -> Dict[str, Any]:
         """Async version of _response using aiohttp."""
         data = {
@@ -47,6 +47,15 @@ class SentenceTransformerEmbedder(Embedder):
     def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
         return self.get_embedding(text=text), None
 
+    def get_embeddings_batch_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        """Get embeddings for multiple texts, encoded by the model in batches of `batch_size`."""
+        if self.sentence_transformer_client is None:
+            raise RuntimeError("SentenceTransformer model not initialized")
+        embeddings = self.sentence_transformer_client.encode(
+            texts, prompt=self.prompt, normalize_embeddings=self.normalize_embeddings, batch_size=self.batch_size
+        )
+        return [embedding.tolist() for embedding in embeddings], [None] * len(texts)
+
     async def async_get_embedding(self, text: Union[str, List[str]]) -> List[float]:
         """Async version using thread executor for CPU-bound operations."""
         import asyncio
@@ -61,3 +70,12 @@ class SentenceTransformerEmbedder(Embedder):
 
         loop = asyncio.get_event_loop()
         return await loop.run_in_executor(None, self.get_embedding_and_usage, text)
+
+    async def async_get_embeddings_batch_and_usage(
+        self, texts: List[str]
+    ) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        """Async version using thread executor for CPU-bound operations."""
+        import asyncio
+
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, self.get_embeddings_batch_and_usage, texts)
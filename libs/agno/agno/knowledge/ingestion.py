@@ -0,0 +1,218 @@
+import asyncio
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Union
+
+from agno.knowledge.content import Content, ContentStatus
+from agno.knowledge.document import Document
+from agno.utils.log import log_debug, log_error
+
+if TYPE_CHECKING:
+    from agno.knowledge.knowledge import Knowledge
+
+# The ingestion run of the current read worker. Documents read while it is set are handed to its write stage.
+_active_run: ContextVar[Optional["_IngestionRun"]] = ContextVar("agno_ingestion_run", default=None)
+
+_WriteItem = Optional[Tuple[Content, List[Document], bool]]
+
+
+@dataclass
+class IngestionStats:
+    """Progress and throughput of an ingestion run."""
+
+    # Insert arguments processed by the read stage
+    contents_read: int = 0
+    # Contents written to the vector database, by final status
+    contents_completed: int = 0
+    contents_failed: int = 0
+    documents_written: int = 0
+    # Time the read stage waited for room in the queue, i.e. how long the write stage held it back
+    read_blocked_seconds: float = 0.0
+    # Time the write stage waited for documents to write
+    write_idle_seconds: float = 0.0
+    elapsed_seconds: float = 0.0
+
+    @property
+    def documents_per_second(self) -> float:
+        return self.documents_written / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+
+@dataclass
+class IngestionPipeline:
+    """Staged ingestion for `Knowledge.insert_many` and `Knowledge.ainsert_many`.
+
+    Contents are read, and chunked by their reader, by `read_workers` workers. Their documents are handed to
+    `write_workers` workers, which embed and write them to the vector database, through a queue of at most
+    `queue_size` contents. Readers wait while the queue is full, so reading never runs far ahead of the embedder.
+
+    `on_progress` is called with the stats of the run each time a content is written, and once more at the end.
+    """
+
+    read_workers: int = 4
+    write_workers: int = 2
+    queue_size: int = 16
+    on_progress: Optional[Callable[[IngestionStats], None]] = None
+
+    def run(self, knowledge: "Knowledge", arguments: List[Dict[str, Any]]) -> IngestionStats:
+        """Insert contents, given as the keyword arguments of `Knowledge.insert`, through the pipeline."""
+        ingestion_run = _IngestionRun(self, queue.Queue(maxsize=max(self.queue_size, 1)))
+        writers = [
+            threading.Thread(target=ingestion_run.write_loop, args=(knowledge,), daemon=True)
+            for _ in range(max(self.write_workers, 1))
+        ]
+        for writer in writers:
+            writer.start()
+
+        def read(argument: Dict[str, Any]) -> None:
+            token = _active_run.set(ingestion_run)
+            try:
+                knowledge.insert(**argument)
+            except Exception as e:
+                log_error(f"Error reading content {_describe(argument)}: {e}")
+            finally:
+                _active_run.reset(token)
+                ingestion_run.record_read()
+
+        try:
+            with ThreadPoolExecutor(max_workers=max(self.read_workers, 1)) as executor:
+                list(executor.map(read, arguments))
+        finally:
+            for _ in writers:
+                ingestion_run.queue.put(None)
+            for writer in writers:
+                writer.join()
+        return ingestion_run.finish()
+
+    async def arun(self, knowledge: "Knowledge", arguments: List[Dict[str, Any]]) -> IngestionStats:
+        """Insert contents, given as the keyword arguments of `Knowledge.ainsert`, through the pipeline."""
+        ingestion_run = _IngestionRun(self, asyncio.Queue(maxsize=max(self.queue_size, 1)))
+        writers = [asyncio.create_task(ingestion_run.awrite_loop(knowledge)) for _ in range(max(self.write_workers, 1))]
+        semaphore = asyncio.Semaphore(max(self.read_workers, 1))
+
+        async def read(argument: Dict[str, Any]) -> None:
+            # Each task runs in a copy of the context, so the run does not leak into the caller
+            async with semaphore:
+                _active_run.set(ingestion_run)
+                try:
+                    await knowledge.ainsert(**argument)
+                except Exception as e:
+                    log_error(f"Error reading content {_describe(argument)}: {e}")
+                finally:
+                    ingestion_run.record_read()
+
+        try:
+            await asyncio.gather(*[read(argument) for argument in arguments])
+        finally:
+            for _ in writers:
+                await ingestion_run.queue.put(None)
+            await asyncio.gather(*writers)
+        return ingestion_run.finish()
+
+
+def get_active_ingestion_run() -> Optional["_IngestionRun"]:
+    return _active_run.get()
+
+
+class _IngestionRun:
+    """The state of one pipeline run, shared by its read and write workers."""
+
+    def __init__(self, pipeline: IngestionPipeline, write_queue: Union[queue.Queue, asyncio.Queue]):
+        self.pipeline = pipeline
+        # A queue.Queue for sync runs and an asyncio.Queue for async runs
+        self.queue: Any = write_queue
+        self.stats = IngestionStats()
+        self._started_at = time.perf_counter()
+        self._lock = threading.Lock()
+
+    def put(self, content: Content, documents: List[Document], upsert: bool) -> None:
+        started_at = time.perf_counter()
+        self.queue.put((content, documents, upsert))
+        self._add_blocked_time(time.perf_counter() - started_at)
+
+    async def aput(self, content: Content, documents: List[Document], upsert: bool) -> None:
+        started_at = time.perf_counter()
+        await self.queue.put((content, documents, upsert))
+        self._add_blocked_time(time.perf_counter() - started_at)
+
+    def write_loop(self, knowledge: "Knowledge") -> None:
+        while True:
+            started_at = time.perf_counter()
+            item: _WriteItem = self.queue.get()
+            self._add_idle_time(time.perf_counter() - started_at)
+            if item is None:
+                return
+            content, documents, upsert = item
+            content.status_message = f"Inserted {len(documents)} documents"
+            try:
+                knowledge._insert_vector_db(content, documents, upsert)
+            except Exception as e:
+                log_error(f"Error writing content {content.name}: {e}")
+                content.status = ContentStatus.FAILED
+            self._record_write(content, documents)
+
+    async def awrite_loop(self, knowledge: "Knowledge") -> None:
+        while True:
+            started_at = time.perf_counter()
+            item: _WriteItem = await self.queue.get()
+            self._add_idle_time(time.perf_counter() - started_at)
+            if item is None:
+                return
+            content, documents, upsert = item
+            content.status_message = f"Inserted {len(documents)} documents"
+            try:
+                await knowledge._ainsert_vector_db(content, documents, upsert)
+            except Exception as e:
+                log_error(f"Error writing content {content.name}: {e}")
+                content.status = ContentStatus.FAILED
+            self._record_write(content, documents)
+
+    def record_read(self) -> None:
+        with self._lock:
+            self.stats.contents_read += 1
+
+    def finish(self) -> IngestionStats:
+        with self._lock:
+            self.stats.elapsed_seconds = time.perf_counter() - self._started_at
+        log_debug(
+            f"Ingested {self.stats.contents_completed} contents ({self.stats.documents_written} documents) in "
+            f"{self.stats.elapsed_seconds:.2f}s, {self.stats.contents_failed} failed"
+        )
+        self._report_progress()
+        return self.stats
+
+    def _record_write(self, content: Content, documents: List[Document]) -> None:
+        with self._lock:
+            if content.status == ContentStatus.COMPLETED:
+                self.stats.contents_completed += 1
+                self.stats.documents_written += len(documents)
+            else:
+                self.stats.contents_failed += 1
+            self.stats.elapsed_seconds = time.perf_counter() - self._started_at
+        self._report_progress()
+
+    def _report_progress(self) -> None:
+        if self.pipeline.on_progress is None:
+            return
+        try:
+            self.pipeline.on_progress(self.stats)
+        except Exception as e:
+            log_error(f"Error in ingestion progress callback: {e}")
+
+    def _add_blocked_time(self, seconds: float) -> None:
+        with self._lock:
+            self.stats.read_blocked_seconds += seconds
+
+    def _add_idle_time(self, seconds: float) -> None:
+        with self._lock:
+            self.stats.write_idle_seconds += seconds
+
+
+def _describe(argument: Dict[str, Any]) -> str:
+    for key in ("name", "path", "url"):
+        if argument.get(key):
+            return str(argument[key])
+    return ""
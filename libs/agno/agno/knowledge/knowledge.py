@@ -1,7 +1,9 @@
 import asyncio
 import hashlib
 import io
+import json
 import time
+from collections import Counter
 from dataclasses import dataclass
 from enum import Enum
 from io import BytesIO
@@ -16,12 +18,14 @@ from agno.db.schemas.knowledge import KnowledgeRow
 from agno.filters import EQ, FilterExpr
 from agno.knowledge.content import Content, ContentAuth, ContentStatus, FileData
 from agno.knowledge.document import Document
+from agno.knowledge.ingestion import IngestionPipeline, get_active_ingestion_run
 from agno.knowledge.reader import Reader, ReaderFactory
 from agno.knowledge.remote_content.base import BaseStorageConfig
 from agno.knowledge.remote_content.remote_content import (
     RemoteContent,
 )
 from agno.knowledge.remote_knowledge import RemoteKnowledge
+from agno.knowledge.search_cache import SearchCache
 from agno.knowledge.utils import merge_user_metadata, set_agno_metadata, strip_agno_metadata
 from agno.utils.http import async_fetch_with_retry
 from agno.utils.log import log_debug, log_error, log_info, log_warning
@@ -53,6 +57,8 @@ class Knowledge(RemoteKnowledge):
     # Requires re-indexing existing data to add linked_to metadata.
     # Default is False for backwards compatibility with existing data.
     isolate_vector_search: bool = False
+    # Caches search results. Cleared when content is inserted, updated or removed through this Knowledge.
+    search_cache: Optional[SearchCache] = None
 
     def __post_init__(self):
         from agno.vectordb import VectorDb
@@ -241,115 +247,23 @@ class Knowledge(RemoteKnowledge):
         upsert: bool = True,
         skip_if_exists: bool = False,
         remote_content: Optional[RemoteContent] = None,
+        pipeline: Optional[IngestionPipeline] = None,
     ) -> None: ...
 
     async def ainsert_many(self, *args, **kwargs) -> None:
-        if args and isinstance(args[0], list):
-            arguments = args[0]
-            upsert = kwargs.get("upsert", True)
-            skip_if_exists = kwargs.get("skip_if_exists", False)
-            for argument in arguments:
-                await self.ainsert(
-                    name=argument.get("name"),
-                    description=argument.get("description"),
-                    path=argument.get("path"),
-                    url=argument.get("url"),
-                    metadata=argument.get("metadata"),
-                    topics=argument.get("topics"),
-                    text_content=argument.get("text_content"),
-                    reader=argument.get("reader"),
-                    include=argument.get("include"),
-                    exclude=argument.get("exclude"),
-                    upsert=argument.get("upsert", upsert),
-                    skip_if_exists=argument.get("skip_if_exists", skip_if_exists),
-                    remote_content=argument.get("remote_content", None),
-                    auth=argument.get("auth"),
-                )
-
-        elif kwargs:
-            name = kwargs.get("name", [])
-            metadata = kwargs.get("metadata", {})
-            description = kwargs.get("description", [])
-            topics = kwargs.get("topics", [])
-            reader = kwargs.get("reader", None)
-            paths = kwargs.get("paths", [])
-            urls = kwargs.get("urls", [])
-            text_contents = kwargs.get("text_contents", [])
-            include = kwargs.get("include")
-            exclude = kwargs.get("exclude")
-            upsert = kwargs.get("upsert", True)
-            skip_if_exists = kwargs.get("skip_if_exists", False)
-            remote_content = kwargs.get("remote_content", None)
-            auth = kwargs.get("auth")
-            for path in paths:
-                await self.ainsert(
-                    name=name,
-                    description=description,
-                    path=path,
-                    metadata=metadata,
-                    include=include,
-                    exclude=exclude,
-                    upsert=upsert,
-                    skip_if_exists=skip_if_exists,
-                    reader=reader,
-                    auth=auth,
-                )
-            for url in urls:
-                await self.ainsert(
-                    name=name,
-                    description=description,
-                    url=url,
-                    metadata=metadata,
-                    include=include,
-                    exclude=exclude,
-                    upsert=upsert,
-                    skip_if_exists=skip_if_exists,
-                    reader=reader,
-                    auth=auth,
-                )
-            for i, text_content in enumerate(text_contents):
-                content_name = f"{name}_{i}" if name else f"text_content_{i}"
-                log_debug(f"Adding text content: {content_name}")
-                await self.ainsert(
-                    name=content_name,
-                    description=description,
-                    text_content=text_content,
-                    metadata=metadata,
-                    include=include,
-                    exclude=exclude,
-                    upsert=upsert,
-                    skip_if_exists=skip_if_exists,
-                    reader=reader,
-                    auth=auth,
-                )
-            if topics:
-                await self.ainsert(
-                    name=name,
-                    description=description,
-                    topics=topics,
-                    metadata=metadata,
-                    include=include,
-                    exclude=exclude,
-                    upsert=upsert,
-                    skip_if_exists=skip_if_exists,
-                    reader=reader,
-                    auth=auth,
-                )
+        """
+        Asynchronously insert multiple content items into the knowledge base.
 
-            if remote_content:
-                await self.ainsert(
-                    name=name,
-                    metadata=metadata,
-                    description=description,
-                    remote_content=remote_content,
-                    upsert=upsert,
-                    skip_if_exists=skip_if_exists,
-                    reader=reader,
-                    auth=auth,
-                )
+        See `insert_many`. With a `pipeline`, contents are read and written concurrently through its stages.
+        """
+        pipeline: Optional[IngestionPipeline] = kwargs.pop("pipeline", None)
+        arguments = self._get_insert_many_arguments(args, kwargs)
+        if pipeline is not None:
+            await pipeline.arun(self, self._expand_path_arguments(arguments))
+            return
 
-        else:
-            raise ValueError("Invalid usage of insert_many.")
+        for argument in arguments:
+            await self.ainsert(**argument)
 
     @overload
     def insert_many(self, contents: List[ContentDict]) -> None: ...
@@ -369,6 +283,7 @@ class Knowledge(RemoteKnowledge):
         upsert: bool = True,
         skip_if_exists: bool = False,
         remote_content: Optional[RemoteContent] = None,
+        pipeline: Optional[IngestionPipeline] = None,
     ) -> None: ...
 
     def insert_many(self, *args, **kwargs) -> None:
@@ -392,113 +307,17 @@ class Knowledge(RemoteKnowledge):
             upsert: Whether to update existing content if it already exists (only used when skip_if_exists=False)
             skip_if_exists: Whether to skip inserting content if it already exists (default: True)
             remote_content: Optional remote content (S3, GCS, etc.) to insert
+            pipeline: Optional ingestion pipeline. When set, contents are read and written to the vector database
+                concurrently, with directories expanded into one content per file
         """
-        if args and isinstance(args[0], list):
-            arguments = args[0]
-            upsert = kwargs.get("upsert", True)
-            skip_if_exists = kwargs.get("skip_if_exists", False)
-            for argument in arguments:
-                self.insert(
-                    name=argument.get("name"),
-                    description=argument.get("description"),
-                    path=argument.get("path"),
-                    url=argument.get("url"),
-                    metadata=argument.get("metadata"),
-                    topics=argument.get("topics"),
-                    text_content=argument.get("text_content"),
-                    reader=argument.get("reader"),
-                    include=argument.get("include"),
-                    exclude=argument.get("exclude"),
-                    upsert=argument.get("upsert", upsert),
-                    skip_if_exists=argument.get("skip_if_exists", skip_if_exists),
-                    remote_content=argument.get("remote_content", None),
-                    auth=argument.get("auth"),
-                )
-
-        elif kwargs:
-            name = kwargs.get("name", [])
-            metadata = kwargs.get("metadata", {})
-            description = kwargs.get("description", [])
-            topics = kwargs.get("topics", [])
-            reader = kwargs.get("reader", None)
-            paths = kwargs.get("paths", [])
-            urls = kwargs.get("urls", [])
-            text_contents = kwargs.get("text_contents", [])
-            include = kwargs.get("include")
-            exclude = kwargs.get("exclude")
-            upsert = kwargs.get("upsert", True)
-            skip_if_exists = kwargs.get("skip_if_exists", False)
-            remote_content = kwargs.get("remote_content", None)
-            auth = kwargs.get("auth")
-            for path in paths:
-                self.insert(
-                    name=name,
-                    description=description,
-                    path=path,
-                    metadata=metadata,
-                    include=include,
-                    exclude=exclude,
-                    upsert=upsert,
-                    skip_if_exists=skip_if_exists,
-                    reader=reader,
-                    auth=auth,
-                )
-            for url in urls:
-                self.insert(
-                    name=name,
-                    description=description,
-                    url=url,
-                    metadata=metadata,
-                    include=include,
-                    exclude=exclude,
-                    upsert=upsert,
-                    skip_if_exists=skip_if_exists,
-                    reader=reader,
-                    auth=auth,
-                )
-            for i, text_content in enumerate(text_contents):
-                content_name = f"{name}_{i}" if name else f"text_content_{i}"
-                log_debug(f"Adding text content: {content_name}")
-                self.insert(
-                    name=content_name,
-                    description=description,
-                    text_content=text_content,
-                    metadata=metadata,
-                    include=include,
-                    exclude=exclude,
-                    upsert=upsert,
-                    skip_if_exists=skip_if_exists,
-                    reader=reader,
-                    auth=auth,
-                )
-            if topics:
-                self.insert(
-                    name=name,
-                    description=description,
-                    topics=topics,
-                    metadata=metadata,
-                    include=include,
-                    exclude=exclude,
-                    upsert=upsert,
-                    skip_if_exists=skip_if_exists,
-                    reader=reader,
-                    auth=auth,
-                )
-
-            if remote_content:
-                self.insert(
-                    name=name,
-                    metadata=metadata,
-                    description=description,
-                    remote_content=remote_content,
-                    upsert=upsert,
-                    skip_if_exists=skip_if_exists,
-                    reader=reader,
-                    auth=auth,
-                )
+        pipeline: Optional[IngestionPipeline] = kwargs.pop("pipeline", None)
+        arguments = self._get_insert_many_arguments(args, kwargs)
+        if pipeline is not None:
+            pipeline.run(self, self._expand_path_arguments(arguments))
+            return
 
-        else:
-            raise ValueError("Invalid usage of insert_many.")
+        for argument in arguments:
+            self.insert(**argument)
 
     # ==========================================
     # PUBLIC API - SEARCH METHODS
@@ -539,8 +358,21 @@ class Knowledge(RemoteKnowledge):
                     search_filters = [EQ("linked_to", self.name), *search_filters]
 
             _max_results = max_results or self.max_results
+            if self.search_cache is not None:
+                cache_key = self.search_cache.get_cache_key(
+                    query, search_filters, search_type or getattr(self.vector_db, "search_type", None), _max_results
+                )
+                cache_generation = self.search_cache.generation
+                cached_documents = self.search_cache.get(cache_key)
+                if cached_documents is not None:
+                    log_debug(f"Found {len(cached_documents)} cached documents for query: {query}")
+                    return cached_documents
+
             log_debug(f"Getting {_max_results} relevant documents for query: {query}")
-            return self.vector_db.search(query=query, limit=_max_results, filters=search_filters)
+            documents = self.vector_db.search(query=query, limit=_max_results, filters=search_filters)
+            if self.search_cache is not None:
+                self.search_cache.set(cache_key, documents, cache_generation)
+            return documents
         except Exception as e:
             log_error(f"Error searching for documents: {e}")
             return []
@@ -579,12 +411,25 @@ class Knowledge(RemoteKnowledge):
                     search_filters = [EQ("linked_to", self.name), *search_filters]
 
             _max_results = max_results or self.max_results
+            if self.search_cache is not None:
+                cache_key = self.search_cache.get_cache_key(
+                    query, search_filters, search_type or getattr(self.vector_db, "search_type", None), _max_results
+                )
+                cache_generation = self.search_cache.generation
+                cached_documents = self.search_cache.get(cache_key)
+                if cached_documents is not None:
+                    log_debug(f"Found {len(cached_documents)} cached documents for query: {query}")
+                    return cached_documents
+
             log_debug(f"Getting {_max_results} relevant documents for query: {query}")
             try:
-                return await self.vector_db.async_search(query=query, limit=_max_results, filters=search_filters)
+                documents = await self.vector_db.async_search(query=query, limit=_max_results, filters=search_filters)
             except NotImplementedError:
                 log_info("Vector db does not support async search")
-                return self.vector_db.search(query=query, limit=_max_results, filters=search_filters)
+                documents = self.vector_db.search(query=query, limit=_max_results, filters=search_filters)
+            if self.search_cache is not None:
+                self.search_cache.set(cache_key, documents, cache_generation)
+            return documents
         except Exception as e:
             log_error(f"Error searching for documents: {e}")
             return []
@@ -710,6 +555,9 @@ class Knowledge(RemoteKnowledge):
             else:
                 self.vector_db.delete_by_content_id(content_id)
 
+        # Cleared after deleting, so searches running meanwhile cannot cache the removed documents again
+        self._clear_search_cache()
+
         if self.contents_db is not None:
             self.contents_db.delete_knowledge_content(content_id)
 
@@ -725,6 +573,9 @@ class Knowledge(RemoteKnowledge):
             else:
                 self.vector_db.delete_by_content_id(content_id)
 
+        # Cleared after deleting, so searches running meanwhile cannot cache the removed documents again
+        self._clear_search_cache()
+
         if self.contents_db is not None:
             if isinstance(self.contents_db, AsyncBaseDb):
                 await self.contents_db.delete_knowledge_content(content_id)
@@ -750,7 +601,9 @@ class Knowledge(RemoteKnowledge):
         if self.vector_db is None:
             log_warning("No vector DB provided")
             return False
-        return self.vector_db.delete_by_id(id)
+        deleted = self.vector_db.delete_by_id(id)
+        self._clear_search_cache()
+        return deleted
 
     def remove_vectors_by_name(self, name: str) -> bool:
         from agno.vectordb import VectorDb
@@ -759,7 +612,9 @@ class Knowledge(RemoteKnowledge):
         if self.vector_db is None:
             log_warning("No vector DB provided")
             return False
-        return self.vector_db.delete_by_name(name)
+        deleted = self.vector_db.delete_by_name(name)
+        self._clear_search_cache()
+        return deleted
 
     def remove_vectors_by_metadata(self, metadata: Dict[str, Any]) -> bool:
         from agno.vectordb import VectorDb
@@ -768,7 +623,9 @@ class Knowledge(RemoteKnowledge):
         if self.vector_db is None:
             log_warning("No vector DB provided")
             return False
-        return self.vector_db.delete_by_metadata(metadata)
+        deleted = self.vector_db.delete_by_metadata(metadata)
+        self._clear_search_cache()
+        return deleted
 
     # ==========================================
     # PUBLIC API - FILTER METHODS
@@ -1085,6 +942,119 @@ class Knowledge(RemoteKnowledge):
     # PRIVATE - CONTENT LOADING METHODS
     # ==========================================
 
+    def _get_insert_many_arguments(self, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Get the keyword arguments of the insert call of each content passed to insert_many."""
+        if args and isinstance(args[0], list):
+            upsert = kwargs.get("upsert", True)
+            skip_if_exists = kwargs.get("skip_if_exists", False)
+            return [
+                dict(
+                    name=argument.get("name"),
+                    description=argument.get("description"),
+                    path=argument.get("path"),
+                    url=argument.get("url"),
+                    metadata=argument.get("metadata"),
+                    topics=argument.get("topics"),
+                    text_content=argument.get("text_content"),
+                    reader=argument.get("reader"),
+                    include=argument.get("include"),
+                    exclude=argument.get("exclude"),
+                    upsert=argument.get("upsert", upsert),
+                    skip_if_exists=argument.get("skip_if_exists", skip_if_exists),
+                    remote_content=argument.get("remote_content", None),
+                    auth=argument.get("auth"),
+                )
+                for argument in args[0]
+            ]
+
+        if not kwargs:
+            raise ValueError("Invalid usage of insert_many.")
+
+        name = kwargs.get("name", [])
+        metadata = kwargs.get("metadata", {})
+        description = kwargs.get("description", [])
+        topics = kwargs.get("topics", [])
+        remote_content = kwargs.get("remote_content", None)
+        reader = kwargs.get("reader", None)
+        include = kwargs.get("include")
+        exclude = kwargs.get("exclude")
+        upsert = kwargs.get("upsert", True)
+        skip_if_exists = kwargs.get("skip_if_exists", False)
+        auth = kwargs.get("auth")
+        common = dict(upsert=upsert, skip_if_exists=skip_if_exists, reader=reader, auth=auth)
+
+        arguments: List[Dict[str, Any]] = []
+        for path in kwargs.get("paths", []):
+            arguments.append(
+                dict(
+                    name=name,
+                    description=description,
+                    path=path,
+                    metadata=metadata,
+                    include=include,
+                    exclude=exclude,
+                    **common,
+                )
+            )
+        for url in kwargs.get("urls", []):
+            arguments.append(
+                dict(
+                    name=name,
+                    description=description,
+                    url=url,
+                    metadata=metadata,
+                    include=include,
+                    exclude=exclude,
+                    **common,
+                )
+            )
+        for i, text_content in enumerate(kwargs.get("text_contents", [])):
+            content_name = f"{name}_{i}" if name else f"text_content_{i}"
+            log_debug(f"Adding text content: {content_name}")
+            arguments.append(
+                dict(
+                    name=content_name,
+                    description=description,
+                    text_content=text_content,
+                    metadata=metadata,
+                    include=include,
+                    exclude=exclude,
+                    **common,
+                )
+            )
+        if topics:
+            arguments.append(
+                dict(
+                    name=name,
+                    description=description,
+                    topics=topics,
+                    metadata=metadata,
+                    include=include,
+                    exclude=exclude,
+                    **common,
+                )
+            )
+        if remote_content:
+            arguments.append(
+                dict(name=name, metadata=metadata, description=description, remote_content=remote_content, **common)
+            )
+        return arguments
+
+    def _expand_path_arguments(self, arguments: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Replace the insert arguments of directories with the arguments of each file they contain."""
+        expanded: List[Dict[str, Any]] = []
+        for argument in arguments:
+            path = argument.get("path")
+            if not path or not Path(path).is_dir():
+                expanded.append(argument)
+                continue
+            for file_path in Path(path).iterdir():
+                if not self._should_include_file(str(file_path), argument.get("include"), argument.get("exclude")):
+                    log_debug(f"Skipping file {file_path} due to include/exclude filters")
+                    continue
+                expanded.extend(self._expand_path_arguments([{**argument, "path": str(file_path)}]))
+        return expanded
+
     def _load_content(
         self,
         content: Content,
@@ -2360,6 +2330,14 @@ class Knowledge(RemoteKnowledge):
     # --- Vector DB Insert Helpers ---
 
     async def _ahandle_vector_db_insert(self, content: Content, read_documents, upsert):
+        ingestion_run = get_active_ingestion_run()
+        if ingestion_run is not None:
+            # Inside an ingestion pipeline, the documents are written by its write stage
+            await ingestion_run.aput(content, read_documents, upsert)
+            return
+        await self._ainsert_vector_db(content, read_documents, upsert)
+
+    async def _ainsert_vector_db(self, content: Content, read_documents, upsert):
         from agno.vectordb import VectorDb
 
         self.vector_db = cast(VectorDb, self.vector_db)
@@ -2373,7 +2351,19 @@ class Knowledge(RemoteKnowledge):
 
         if self.vector_db.upsert_available() and upsert:
             try:
-                await self.vector_db.async_upsert(content.content_hash, read_documents, content.metadata)  # type: ignore[arg-type]
+                chunk_changes = self._get_chunk_changes(content, read_documents)
+                if chunk_changes is None:
+                    await self.vector_db.async_upsert(content.content_hash, read_documents, content.metadata)  # type: ignore[arg-type]
+                else:
+                    changed_documents, removed_ids = chunk_changes
+                    for removed_id in removed_ids:
+                        self.vector_db.delete_by_id(removed_id)
+                    if changed_documents:
+                        await self.vector_db.async_insert(
+                            content.content_hash,  # type: ignore[arg-type]
+                            documents=changed_documents,
+                            filters=content.metadata,  # type: ignore[arg-type]
+                        )
             except Exception as e:
                 log_error(f"Error upserting document: {e}")
                 content.status = ContentStatus.FAILED
@@ -2399,6 +2389,14 @@ class Knowledge(RemoteKnowledge):
 
     def _handle_vector_db_insert(self, content: Content, read_documents, upsert):
         """Synchronously handle vector database insertion."""
+        ingestion_run = get_active_ingestion_run()
+        if ingestion_run is not None:
+            # Inside an ingestion pipeline, the documents are written by its write stage
+            ingestion_run.put(content, read_documents, upsert)
+            return
+        self._insert_vector_db(content, read_documents, upsert)
+
+    def _insert_vector_db(self, content: Content, read_documents, upsert):
         from agno.vectordb import VectorDb
 
         self.vector_db = cast(VectorDb, self.vector_db)
@@ -2412,7 +2410,19 @@ class Knowledge(RemoteKnowledge):
 
         if self.vector_db.upsert_available() and upsert:
             try:
-                self.vector_db.upsert(content.content_hash, read_documents, content.metadata)  # type: ignore[arg-type]
+                chunk_changes = self._get_chunk_changes(content, read_documents)
+                if chunk_changes is None:
+                    self.vector_db.upsert(content.content_hash, read_documents, content.metadata)  # type: ignore[arg-type]
+                else:
+                    changed_documents, removed_ids = chunk_changes
+                    for removed_id in removed_ids:
+                        self.vector_db.delete_by_id(removed_id)
+                    if changed_documents:
+                        self.vector_db.insert(
+                            content.content_hash,  # type: ignore[arg-type]
+                            documents=changed_documents,
+                            filters=content.metadata,  # type: ignore[arg-type]
+                        )
             except Exception as e:
                 log_error(f"Error upserting document: {e}")
                 content.status = ContentStatus.FAILED
@@ -2436,11 +2446,82 @@ class Knowledge(RemoteKnowledge):
         content.status = ContentStatus.COMPLETED
         self._update_content(content)
 
+    def _set_chunk_hashes(self, documents: List[Document]) -> None:
+        """Store the hash of each document in its metadata, so later inserts can tell which chunks changed."""
+        from agno.vectordb.base import CHUNK_HASH_KEY
+
+        for document in documents:
+            meta_data = {key: value for key, value in (document.meta_data or {}).items() if key != CHUNK_HASH_KEY}
+            hash_input = json.dumps([document.name, document.content, meta_data], sort_keys=True, default=str)
+            # Copy the metadata, chunks of the same document can share it
+            document.meta_data = {**meta_data, CHUNK_HASH_KEY: hashlib.sha256(hash_input.encode()).hexdigest()}
+
+    def _get_chunk_changes(
+        self, content: Content, documents: List[Document]
+    ) -> Optional[Tuple[List[Document], List[str]]]:
+        """
+        Compare documents with the chunks already stored for their content.
+
+        If the vector db reports chunk hashes, the hash of each document is stored in its metadata first.
+
+        Args:
+            content: The content the documents were read from
+            documents: The documents to write
+
+        Returns:
+            The new or changed documents and the ids of the stored chunks that are gone, or None if the content has
+            to be rewritten in full: the vector db does not report chunk hashes, the content is not stored yet, or some
+            stored chunks were written without a hash.
+        """
+        from agno.vectordb.base import CHUNK_HASH_KEY
+
+        stored_hashes = self.vector_db.get_chunk_hashes(content.content_hash)  # type: ignore[union-attr]
+        if not isinstance(stored_hashes, dict):
+            return None
+        self._set_chunk_hashes(documents)
+        if not stored_hashes:
+            return None
+        if any(chunk_hash is None for chunk_hash in stored_hashes.values()):
+            return None
+
+        # Compare as multisets, the same chunk can appear more than once in a document
+        unmatched_stored = Counter(stored_hashes.values())
+        changed_documents = []
+        for document in documents:
+            chunk_hash = document.meta_data[CHUNK_HASH_KEY]
+            if unmatched_stored[chunk_hash] > 0:
+                unmatched_stored[chunk_hash] -= 1
+                continue
+            if document.id:
+                # Keep the ids of new chunks apart from the ids of the chunks that are kept
+                document.id = f"{document.id}_{chunk_hash[:16]}"
+            changed_documents.append(document)
+
+        unmatched_new = Counter(document.meta_data[CHUNK_HASH_KEY] for document in documents)
+        removed_ids = []
+        for record_id, chunk_hash in stored_hashes.items():
+            if unmatched_new[chunk_hash] > 0:
+                unmatched_new[chunk_hash] -= 1
+            else:
+                removed_ids.append(record_id)
+
+        log_debug(
+            f"Content {content.content_hash}: {len(documents) - len(changed_documents)} chunks unchanged, "
+            f"{len(changed_documents)} to write, {len(removed_ids)} to delete"
+        )
+        return changed_documents, removed_ids
+
     # --- Content Update ---
 
+    def _clear_search_cache(self) -> None:
+        if self.search_cache is not None:
+            self.search_cache.clear()
+
     def _update_content(self, content: Content) -> Optional[Dict[str, Any]]:
         from agno.vectordb import VectorDb
 
+        # Content was written or changed, searches can find other documents now
+        self._clear_search_cache()
         self.vector_db = cast(VectorDb, self.vector_db)
         if self.contents_db:
             if isinstance(self.contents_db, AsyncBaseDb):
@@ -2491,6 +2572,8 @@ class Knowledge(RemoteKnowledge):
             return None
 
     async def _aupdate_content(self, content: Content) -> Optional[Dict[str, Any]]:
+        # Content was written or changed, searches can find other documents now
+        self._clear_search_cache()
         if self.contents_db:
             if not content.id:
                 log_warning("Content id is required to update Knowledge content")
@@ -1,7 +1,9 @@
 import asyncio
 import re
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
 from pathlib import Path
-from typing import IO, Any, List, Optional, Tuple, Union
+from typing import IO, Any, Iterator, List, Optional, Tuple, Union
 from uuid import uuid4
 
 from agno.knowledge.chunking.document import DocumentChunking
@@ -94,6 +96,27 @@ async def _async_ocr_reader(page: Any) -> str:
     return images_text
 
 
+# The PDF read by a worker process of the page-sharded reading mode, opened once per process
+_worker_pdf_reader: Optional[DocumentReader] = None
+
+
+def _init_page_range_worker(pdf_source: Union[str, bytes], password: Optional[str]) -> None:
+    """Open the PDF in a worker process. The source is a file path or the content of the file."""
+    global _worker_pdf_reader
+    _worker_pdf_reader = DocumentReader(BytesIO(pdf_source) if isinstance(pdf_source, bytes) else pdf_source)
+    if _worker_pdf_reader.is_encrypted and password is not None:
+        _worker_pdf_reader.decrypt(password)
+
+
+def _read_page_range(start: int, end: int, read_images: bool) -> List[Tuple[str, str]]:
+    """Extract the text, and the text of the images if `read_images`, of the pages in [start, end) in a worker."""
+    if _worker_pdf_reader is None:
+        raise RuntimeError("PDF page range worker not initialized")
+    return [
+        (page.extract_text(), _ocr_reader(page) if read_images else "") for page in _worker_pdf_reader.pages[start:end]
+    ]
+
+
 def _clean_page_numbers(
     page_content_list: List[str],
     extra_content: List[str] = [],
@@ -151,30 +174,43 @@ def _clean_page_numbers(
 
     # Check if at least ..% of the pages have correct sequential numbering
     if best_match and best_correct_count / len(page_numbers) >= PAGE_NUMBERING_CORRECTNESS_RATIO_FOR_REMOVAL:
-        # Remove the page numbers from the content
-        for i, expected_number in enumerate(best_match):
-            page_content_list[i] = re.sub(
-                rf"^\s*{expected_number}\s*|\s*{expected_number}\s*$", "", page_content_list[i]
-            )
-
-            page_start = (
-                page_start_numbering_format.format(page_nr=expected_number) + "\n"
-                if page_start_numbering_format
-                else ""
-            )
-            page_end = (
-                "\n" + page_end_numbering_format.format(page_nr=expected_number) if page_end_numbering_format else ""
-            )
-            extra_info = "\n" + extra_content[i] if extra_content else ""
-
-            # Add formatted page numbering if configured.
-            page_content_list[i] = page_start + page_content_list[i] + extra_info + page_end
+        page_content_list = _replace_page_numbers(
+            page_content_list,
+            best_match,
+            extra_content=extra_content,
+            page_start_numbering_format=page_start_numbering_format,
+            page_end_numbering_format=page_end_numbering_format,
+        )
     else:
         best_shift = None
 
     return page_content_list, best_shift
 
 
+def _replace_page_numbers(
+    page_content_list: List[str],
+    page_numbers: List[int],
+    extra_content: List[str] = [],
+    page_start_numbering_format: str = PAGE_START_NUMBERING_FORMAT_DEFAULT,
+    page_end_numbering_format: str = PAGE_END_NUMBERING_FORMAT_DEFAULT,
+) -> List[str]:
+    """Remove the given page numbers from the start or end of the page contents, and add the formatted page numbers."""
+    page_content_list = list(page_content_list)
+    for i, expected_number in enumerate(page_numbers):
+        # Remove the page numbers from the content
+        page_content_list[i] = re.sub(rf"^\s*{expected_number}\s*|\s*{expected_number}\s*$", "", page_content_list[i])
+
+        page_start = (
+            page_start_numbering_format.format(page_nr=expected_number) + "\n" if page_start_numbering_format else ""
+        )
+        page_end = "\n" + page_end_numbering_format.format(page_nr=expected_number) if page_end_numbering_format else ""
+        extra_info = "\n" + extra_content[i] if extra_content else ""
+
+        # Add formatted page numbering if configured.
+        page_content_list[i] = page_start + page_content_list[i] + extra_info + page_end
+    return page_content_list
+
+
 def _identify_best_page_sequence(page_numbers, range_shifts):
     best_match = None
     best_shift: Optional[int] = None
@@ -207,8 +243,17 @@ class BasePDFReader(Reader):
         password: Optional[str] = None,
         sanitize_content: bool = True,
         chunking_strategy: Optional[ChunkingStrategy] = DocumentChunking(chunk_size=5000),
+        max_workers: Optional[int] = None,
+        pages_per_shard: int = 10,
         **kwargs,
     ):
+        """
+        Args:
+            max_workers (Optional[int]): Number of processes reading ranges of pages in parallel. If not set, pages are
+                read in the calling process.
+            pages_per_shard (int): Number of pages read at a time by a process, and of the ranges of pages
+                streamed by `iter_read`.
+        """
         if page_start_numbering_format is None:
             page_start_numbering_format = PAGE_START_NUMBERING_FORMAT_DEFAULT
         if page_end_numbering_format is None:
@@ -219,6 +264,8 @@ class BasePDFReader(Reader):
         self.page_end_numbering_format = page_end_numbering_format
         self.password = password
         self.sanitize_content = sanitize_content
+        self.max_workers = max_workers
+        self.pages_per_shard = pages_per_shard
 
         super().__init__(chunking_strategy=chunking_strategy, **kwargs)
 
@@ -273,11 +320,66 @@ class BasePDFReader(Reader):
             log_error(f'Error decrypting PDF file "{doc_name}": {e}')
             return False
 
-    def _create_documents(self, pdf_content: List[str], doc_name: str, use_uuid_for_id: bool, page_number_shift):
+    def _read_page_ranges(
+        self,
+        doc_reader: DocumentReader,
+        read_images: bool = False,
+        pdf_source: Optional[Union[str, Path, IO[Any]]] = None,
+        password: Optional[str] = None,
+    ) -> Iterator[Tuple[int, List[Tuple[str, str]]]]:
+        """Extract the text and image text of the pages, yielding the index of the first page of each range of
+        `pages_per_shard` pages with the contents of its pages, in page order.
+
+        With `max_workers` and a `pdf_source`, the ranges are read by a pool of processes.
+        """
+        page_count = len(doc_reader.pages)
+        shard_size = max(self.pages_per_shard, 1)
+        starts = range(0, page_count, shard_size)
+
+        if not self.max_workers or self.max_workers <= 1 or pdf_source is None or page_count <= shard_size:
+            for start in starts:
+                yield (
+                    start,
+                    [
+                        (page.extract_text(), _ocr_reader(page) if read_images else "")
+                        for page in doc_reader.pages[start : start + shard_size]
+                    ],
+                )
+            return
+
+        # Workers open the file themselves, page objects can't be sent to other processes
+        if isinstance(pdf_source, (str, Path)):
+            worker_source: Union[str, bytes] = str(pdf_source)
+        else:
+            pdf_source.seek(0)
+            worker_source = pdf_source.read()
+        worker_password = self.password if password is None else password
+
+        log_debug(f"Reading {page_count} pages with {self.max_workers} processes")
+        executor = ProcessPoolExecutor(
+            max_workers=min(self.max_workers, len(starts)),
+            initializer=_init_page_range_worker,
+            initargs=(worker_source, worker_password),
+        )
+        try:
+            futures = [executor.submit(_read_page_range, start, start + shard_size, read_images) for start in starts]
+            for start, future in zip(starts, futures):
+                yield start, future.result()
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _create_documents(
+        self,
+        pdf_content: List[str],
+        doc_name: str,
+        use_uuid_for_id: bool,
+        page_number_shift,
+        first_page_index: int = 0,
+    ):
         if self.split_on_pages:
             shift = page_number_shift if page_number_shift is not None else 1
             documents: List[Document] = []
-            for page_number, page_content in enumerate(pdf_content, start=shift):
+            for page_number, page_content in enumerate(pdf_content, start=shift + first_page_index):
                 documents.append(
                     Document(
                         name=doc_name,
@@ -306,13 +408,16 @@ class BasePDFReader(Reader):
         doc_name,
         read_images=False,
         use_uuid_for_id=False,
+        pdf_source: Optional[Union[str, Path, IO[Any]]] = None,
+        password: Optional[str] = None,
     ):
         pdf_content = []
         pdf_images_text = []
-        for page in doc_reader.pages:
-            pdf_content.append(page.extract_text())
-            if read_images:
-                pdf_images_text.append(_ocr_reader(page))
+        for _, pages in self._read_page_ranges(doc_reader, read_images, pdf_source, password):
+            for page_text, page_images_text in pages:
+                pdf_content.append(page_text)
+                if read_images:
+                    pdf_images_text.append(page_images_text)
 
         # Sanitize before page number cleaning so that _clean_page_numbers can insert
         # its markers without the sanitizer later collapsing their newline delimiters.
@@ -327,13 +432,73 @@ class BasePDFReader(Reader):
         )
         return self._create_documents(pdf_content, doc_name, use_uuid_for_id, shift)
 
+    def _iter_pdf_documents(
+        self,
+        pdf: Union[str, Path, IO[Any]],
+        doc_name: str,
+        read_images: bool = False,
+        password: Optional[str] = None,
+    ) -> Iterator[List[Document]]:
+        """Yield the documents of each range of `pages_per_shard` pages as soon as the range is read.
+
+        The page numbering detected on the first range is applied to the following ranges.
+        """
+        try:
+            doc_reader = DocumentReader(pdf)
+        except PdfStreamError as e:
+            log_error(f"Error reading PDF: {e}")
+            return
+        if not self._decrypt_pdf(doc_reader, doc_name, password):
+            return
+
+        shift: Optional[int] = None
+        for start, pages in self._read_page_ranges(doc_reader, read_images, pdf, password):
+            page_texts = [page_text for page_text, _ in pages]
+            if self.sanitize_content:
+                page_texts = [_sanitize_pdf_text(page) for page in page_texts]
+            extra_content = [page_images_text for _, page_images_text in pages] if read_images else []
+
+            if start == 0:
+                page_texts, shift = _clean_page_numbers(
+                    page_content_list=page_texts,
+                    extra_content=extra_content,
+                    page_start_numbering_format=self.page_start_numbering_format,
+                    page_end_numbering_format=self.page_end_numbering_format,
+                )
+            elif shift is not None:
+                page_texts = _replace_page_numbers(
+                    page_texts,
+                    [start + i + shift for i in range(len(page_texts))],
+                    extra_content=extra_content,
+                    page_start_numbering_format=self.page_start_numbering_format,
+                    page_end_numbering_format=self.page_end_numbering_format,
+                )
+            elif extra_content:
+                page_texts = [f"\n{page_text}\n{extra_content[i]}" for i, page_text in enumerate(page_texts)]
+
+            yield self._create_documents(page_texts, doc_name, True, shift, first_page_index=start)
+
     async def _async_pdf_reader_to_documents(
         self,
         doc_reader: DocumentReader,
         doc_name: str,
         read_images=False,
         use_uuid_for_id=False,
+        pdf_source: Optional[Union[str, Path, IO[Any]]] = None,
+        password: Optional[str] = None,
     ):
+        if self.max_workers and self.max_workers > 1 and pdf_source is not None:
+            # The pool of processes is driven from a thread, to not block the event loop
+            return await asyncio.to_thread(
+                self._pdf_reader_to_documents,
+                doc_reader,
+                doc_name,
+                read_images=read_images,
+                use_uuid_for_id=use_uuid_for_id,
+                pdf_source=pdf_source,
+                password=password,
+            )
+
         async def _read_pdf_page(page, read_images) -> Tuple[str, str]:
             # We tried "asyncio.to_thread(page.extract_text)", but it maintains state internally, which leads to issues.
             page_text = page.extract_text()
@@ -393,7 +558,9 @@ class PDFReader(BasePDFReader):
             return []
 
         # Read and chunk
-        return self._pdf_reader_to_documents(pdf_reader, doc_name, use_uuid_for_id=True)
+        return self._pdf_reader_to_documents(
+            pdf_reader, doc_name, use_uuid_for_id=True, pdf_source=pdf, password=password
+        )
 
     async def async_read(
         self,
@@ -418,7 +585,23 @@ class PDFReader(BasePDFReader):
             return []
 
         # Read and chunk.
-        return await self._async_pdf_reader_to_documents(pdf_reader, doc_name, use_uuid_for_id=True)
+        return await self._async_pdf_reader_to_documents(
+            pdf_reader, doc_name, use_uuid_for_id=True, pdf_source=pdf, password=password
+        )
+
+    def iter_read(
+        self,
+        pdf: Optional[Union[str, Path, IO[Any]]] = None,
+        name: Optional[str] = None,
+        password: Optional[str] = None,
+    ) -> Iterator[List[Document]]:
+        """Read a PDF, yielding the documents of each range of `pages_per_shard` pages as soon as it is read."""
+        if pdf is None:
+            log_error("No pdf provided")
+            return iter([])
+        doc_name = self._get_doc_name(pdf, name)
+        log_debug(f"Reading: {doc_name}")
+        return self._iter_pdf_documents(pdf, doc_name, password=password)
 
 
 class PDFImageReader(BasePDFReader):
@@ -443,7 +626,9 @@ class PDFImageReader(BasePDFReader):
             return []
 
         # Read and chunk.
-        return self._pdf_reader_to_documents(pdf_reader, doc_name, read_images=True, use_uuid_for_id=True)
+        return self._pdf_reader_to_documents(
+            pdf_reader, doc_name, read_images=True, use_uuid_for_id=True, pdf_source=pdf, password=password
+        )
 
     async def async_read(
         self, pdf: Union[str, Path, IO[Any]], name: Optional[str] = None, password: Optional[str] = None
@@ -465,4 +650,19 @@ class PDFImageReader(BasePDFReader):
             return []
 
         # Read and chunk.
-        return await self._async_pdf_reader_to_documents(pdf_reader, doc_name, read_images=True, use_uuid_for_id=True)
+        return await self._async_pdf_reader_to_documents(
+            pdf_reader, doc_name, read_images=True, use_uuid_for_id=True, pdf_source=pdf, password=password
+        )
+
+    def iter_read(
+        self, pdf: Union[str, Path, IO[Any]], name: Optional[str] = None, password: Optional[str] = None
+    ) -> Iterator[List[Document]]:
+        """Read a PDF with its images, yielding the documents of each range of `pages_per_shard` pages as soon as
+        it is read.
+        """
+        if not pdf:
+            raise ValueError("No pdf provided")
+
+        doc_name = self._get_doc_name(pdf, name)
+        log_debug(f"Reading: {doc_name}")
+        return self._iter_pdf_documents(pdf, doc_name, read_images=True, password=password)
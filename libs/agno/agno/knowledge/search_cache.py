@@ -0,0 +1,92 @@
+import json
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import replace
+from hashlib import sha256
+from time import time
+from typing import Any, List, Optional, Tuple
+
+from agno.knowledge.document import Document
+
+
+class SearchCache:
+    """Caches the results of `Knowledge.search` and `Knowledge.asearch`, evicting the least recently used first.
+
+    A cached search skips both the query embedding and the vector database. Results are keyed by the normalized
+    query, filters, search type and limit, and the whole cache is invalidated when content is inserted, updated or
+    removed through the `Knowledge`. Hits and misses are counted on `hits` and `misses`.
+    """
+
+    def __init__(self, max_entries: Optional[int] = 1000, ttl: Optional[int] = 300):
+        """
+        Args:
+            max_entries (Optional[int]): Maximum number of search results to keep. Defaults to 1000.
+            ttl (Optional[int]): Number of seconds results stay valid. Defaults to 300, None keeps them until evicted.
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        # Incremented when the cache is cleared, so a search started before does not store stale results
+        self.generation = 0
+        # Results with the time they were stored, in least recently used order
+        self._results: "OrderedDict[str, Tuple[Tuple[Document, ...], float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of the lookups that were hits."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def get_cache_key(self, query: str, filters: Any, search_type: Optional[str], limit: int) -> str:
+        """Get the key of a search. Queries differing only in case or whitespace share a key."""
+        normalized_query = re.sub(r"\s+", " ", query).strip().lower()
+        if isinstance(filters, list):
+            filters = [f.to_dict() if hasattr(f, "to_dict") else f for f in filters]
+        key_data = json.dumps([normalized_query, filters, search_type, limit], sort_keys=True, default=str)
+        return sha256(key_data.encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[List[Document]]:
+        """Get copies of the cached documents of a search, or None if the search is not cached."""
+        with self._lock:
+            cached = self._results.get(key)
+            if cached is not None and self.ttl is not None and time() - cached[1] > self.ttl:
+                del self._results[key]
+                cached = None
+            if cached is None:
+                self.misses += 1
+                return None
+            self._results.move_to_end(key)
+            self.hits += 1
+        return [_copy_document(document) for document in cached[0]]
+
+    def set(self, key: str, documents: List[Document], generation: int) -> None:
+        """Store the documents of a search that started at the given generation of the cache."""
+        with self._lock:
+            if generation != self.generation:
+                return
+            self._results.pop(key, None)
+            self._results[key] = (tuple(_copy_document(document) for document in documents), time())
+            while self.max_entries is not None and len(self._results) > self.max_entries:
+                self._results.popitem(last=False)
+
+    def clear(self) -> None:
+        """Delete all cached results. Searches running at the time do not store theirs."""
+        with self._lock:
+            self.generation += 1
+            self._results.clear()
+
+    def reset_metrics(self) -> None:
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+
+def _copy_document(document: Document) -> Document:
+    # Callers can modify returned documents, e.g. when reranking, without changing the cached ones
+    return replace(document, meta_data=dict(document.meta_data) if document.meta_data else {})
@@ -1,3 +1,4 @@
+from agno.memory.index import InMemoryMemoryIndex, MemoryIndex, VectorDbMemoryIndex
 from agno.memory.manager import MemoryManager, UserMemory
 from agno.memory.strategies import (
     MemoryOptimizationStrategy,
@@ -9,6 +10,9 @@ from agno.memory.strategies import (
 __all__ = [
     "MemoryManager",
     "UserMemory",
+    "MemoryIndex",
+    "InMemoryMemoryIndex",
+    "VectorDbMemoryIndex",
     "MemoryOptimizationStrategy",
     "MemoryOptimizationStrategyType",
     "MemoryOptimizationStrategyFactory",
@@ -0,0 +1,344 @@
+import heapq
+import math
+import threading
+from abc import ABC, abstractmethod
+from array import array
+from hashlib import md5
+from operator import mul
+from typing import Dict, List, Optional, Tuple
+
+from agno.db.schemas import UserMemory
+from agno.knowledge.document import Document
+from agno.knowledge.embedder.base import Embedder
+from agno.knowledge.embedder.batch import async_embed_documents, embed_documents
+from agno.utils.log import log_debug, log_warning
+from agno.vectordb.base import VectorDb
+
+
+class MemoryIndex(ABC):
+    """Base class for the indexes used to find the user memories related to a query, without reading all of them.
+
+    Memories are indexed per user. The hash of the indexed text of each memory is kept, so `refresh` only indexes the
+    memories added or changed since.
+    """
+
+    def __init__(self):
+        # user id -> memory id -> hash of the indexed text
+        self._hashes: Dict[str, Dict[str, str]] = {}
+        self._lock = threading.RLock()
+
+    @staticmethod
+    def get_memory_text(memory: UserMemory) -> str:
+        """Get the text of a memory to index."""
+        text = memory.memory
+        if memory.topics:
+            text += f"\nTopics: {', '.join(memory.topics)}"
+        return text
+
+    def get_memory_hash(self, memory: UserMemory) -> str:
+        return md5(f"{memory.user_id}:{memory.memory_id}:{self.get_memory_text(memory)}".encode()).hexdigest()
+
+    def upsert(self, memories: List[UserMemory]) -> None:
+        """Index memories, replacing the indexed version of memories already in the index."""
+        memories = [memory for memory in memories if memory.memory_id and memory.user_id and memory.memory]
+        if memories:
+            self._record(self._upsert(memories))
+
+    async def aupsert(self, memories: List[UserMemory]) -> None:
+        """Index memories asynchronously, replacing the indexed version of memories already in the index."""
+        memories = [memory for memory in memories if memory.memory_id and memory.user_id and memory.memory]
+        if memories:
+            self._record(await self._aupsert(memories))
+
+    def delete(self, user_id: str, memory_ids: List[str]) -> None:
+        """Remove memories of a user from the index."""
+        if not memory_ids:
+            return
+        self._delete(user_id, memory_ids)
+        with self._lock:
+            hashes = self._hashes.get(user_id, {})
+            for memory_id in memory_ids:
+                hashes.pop(memory_id, None)
+
+    def clear(self, user_id: Optional[str] = None) -> None:
+        """Remove the memories of a user from the index, or all memories if no user is given."""
+        self._clear(user_id)
+        with self._lock:
+            if user_id is None:
+                self._hashes.clear()
+            else:
+                self._hashes.pop(user_id, None)
+
+    def refresh(self, user_id: str, memories: List[UserMemory]) -> None:
+        """Bring the index of a user up to date with their memories, indexing new or changed memories and removing
+        the memories that no longer exist.
+        """
+        stale_ids, changed_memories = self._diff(user_id, memories)
+        self.delete(user_id, stale_ids)
+        self.upsert(changed_memories)
+
+    async def arefresh(self, user_id: str, memories: List[UserMemory]) -> None:
+        """Bring the index of a user up to date with their memories asynchronously. See `refresh`."""
+        stale_ids, changed_memories = self._diff(user_id, memories)
+        self.delete(user_id, stale_ids)
+        await self.aupsert(changed_memories)
+
+    def search(self, user_id: str, query: str, limit: int = 10) -> List[str]:
+        """Get the ids of the memories of a user most similar to the query, most similar first."""
+        return [memory_id for memory_id, _ in self._search(user_id, query, limit)]
+
+    async def asearch(self, user_id: str, query: str, limit: int = 10) -> List[str]:
+        """Get the ids of the memories of a user most similar to the query asynchronously, most similar first."""
+        return [memory_id for memory_id, _ in await self._asearch(user_id, query, limit)]
+
+    def _diff(self, user_id: str, memories: List[UserMemory]) -> Tuple[List[str], List[UserMemory]]:
+        """Get the ids of the indexed memories missing from `memories`, and the memories not indexed yet."""
+        current_hashes = {
+            memory.memory_id: self.get_memory_hash(memory) for memory in memories if memory.memory_id is not None
+        }
+        with self._lock:
+            indexed_hashes = dict(self._hashes.get(user_id, {}))
+        stale_ids = [memory_id for memory_id in indexed_hashes if memory_id not in current_hashes]
+        changed_memories = []
+        for memory in memories:
+            if memory.memory_id is None or indexed_hashes.get(memory.memory_id) == current_hashes[memory.memory_id]:
+                continue
+            if self._is_indexed(memory, current_hashes[memory.memory_id]):
+                self._record([memory])
+            else:
+                changed_memories.append(memory)
+        return stale_ids, changed_memories
+
+    def _record(self, memories: List[UserMemory]) -> None:
+        with self._lock:
+            for memory in memories:
+                self._hashes.setdefault(memory.user_id, {})[memory.memory_id] = self.get_memory_hash(memory)  # type: ignore
+
+    def _is_indexed(self, memory: UserMemory, memory_hash: str) -> bool:
+        """Check if the current version of a memory was indexed before, e.g. by another process."""
+        return False
+
+    @abstractmethod
+    def _upsert(self, memories: List[UserMemory]) -> List[UserMemory]:
+        """Index memories and return the memories indexed successfully."""
+        raise NotImplementedError
+
+    async def _aupsert(self, memories: List[UserMemory]) -> List[UserMemory]:
+        return self._upsert(memories)
+
+    @abstractmethod
+    def _delete(self, user_id: str, memory_ids: List[str]) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def _clear(self, user_id: Optional[str] = None) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def _search(self, user_id: str, query: str, limit: int) -> List[Tuple[str, float]]:
+        raise NotImplementedError
+
+    async def _asearch(self, user_id: str, query: str, limit: int) -> List[Tuple[str, float]]:
+        return self._search(user_id, query, limit)
+
+
+class InMemoryMemoryIndex(MemoryIndex):
+    """Keeps the normalized embeddings of the memories of each user in memory, in one float32 array per user."""
+
+    def __init__(self, embedder: Optional[Embedder] = None):
+        """
+        Args:
+            embedder (Optional[Embedder]): The embedder of the memories and queries. Defaults to OpenAIEmbedder.
+        """
+        super().__init__()
+        if embedder is None:
+            from agno.knowledge.embedder.openai import OpenAIEmbedder
+
+            embedder = OpenAIEmbedder()
+            log_debug("Embedder not provided, using OpenAIEmbedder as default.")
+        self.embedder: Embedder = embedder
+
+        self._dimensions: Optional[int] = None
+        # user id -> memory ids, in the order of the rows of the user's vectors
+        self._memory_ids: Dict[str, List[str]] = {}
+        self._rows: Dict[str, Dict[str, int]] = {}
+        self._vectors: Dict[str, array] = {}
+
+    def __len__(self) -> int:
+        return sum(len(memory_ids) for memory_ids in self._memory_ids.values())
+
+    def _upsert(self, memories: List[UserMemory]) -> List[UserMemory]:
+        documents = [Document(content=self.get_memory_text(memory)) for memory in memories]
+        embed_documents(self.embedder, documents)
+        return self._store(memories, documents)
+
+    async def _aupsert(self, memories: List[UserMemory]) -> List[UserMemory]:
+        documents = [Document(content=self.get_memory_text(memory)) for memory in memories]
+        await async_embed_documents(self.embedder, documents)
+        return self._store(memories, documents)
+
+    def _store(self, memories: List[UserMemory], documents: List[Document]) -> List[UserMemory]:
+        indexed = []
+        with self._lock:
+            for memory, document in zip(memories, documents):
+                vector = self._normalize(document.embedding)
+                if vector is None:
+                    log_warning(f"Could not embed memory {memory.memory_id}, it will be indexed on the next search")
+                    continue
+                user_id, memory_id = memory.user_id, memory.memory_id
+                memory_ids = self._memory_ids.setdefault(user_id, [])  # type: ignore
+                rows = self._rows.setdefault(user_id, {})  # type: ignore
+                vectors = self._vectors.setdefault(user_id, array("f"))  # type: ignore
+                row = rows.get(memory_id)  # type: ignore
+                if row is None:
+                    rows[memory_id] = len(memory_ids)  # type: ignore
+                    memory_ids.append(memory_id)  # type: ignore
+                    vectors.extend(vector)
+                else:
+                    vectors[row * len(vector) : (row + 1) * len(vector)] = vector
+                indexed.append(memory)
+        return indexed
+
+    def _normalize(self, embedding: Optional[List[float]]) -> Optional[array]:
+        if not embedding:
+            return None
+        if self._dimensions is None:
+            self._dimensions = len(embedding)
+        elif len(embedding) != self._dimensions:
+            log_warning(f"Expected an embedding of {self._dimensions} dimensions, got {len(embedding)}")
+            return None
+        norm = math.sqrt(sum(value * value for value in embedding)) or 1.0
+        return array("f", (value / norm for value in embedding))
+
+    def _delete(self, user_id: str, memory_ids: List[str]) -> None:
+        with self._lock:
+            rows = self._rows.get(user_id)
+            if not rows or self._dimensions is None:
+                return
+            user_memory_ids = self._memory_ids[user_id]
+            vectors = self._vectors[user_id]
+            size = self._dimensions
+            for memory_id in memory_ids:
+                row = rows.pop(memory_id, None)
+                if row is None:
+                    continue
+                # Move the last row into the deleted one, to keep the vectors contiguous
+                last_row = len(user_memory_ids) - 1
+                if row != last_row:
+                    vectors[row * size : (row + 1) * size] = vectors[last_row * size :]
+                    user_memory_ids[row] = user_memory_ids[last_row]
+                    rows[user_memory_ids[row]] = row
+                user_memory_ids.pop()
+                del vectors[last_row * size :]
+
+    def _clear(self, user_id: Optional[str] = None) -> None:
+        with self._lock:
+            if user_id is None:
+                self._memory_ids.clear()
+                self._rows.clear()
+                self._vectors.clear()
+            else:
+                self._memory_ids.pop(user_id, None)
+                self._rows.pop(user_id, None)
+                self._vectors.pop(user_id, None)
+
+    def _search(self, user_id: str, query: str, limit: int) -> List[Tuple[str, float]]:
+        if not self._memory_ids.get(user_id):
+            return []
+        return self._rank(user_id, self.embedder.get_embedding(query), limit)
+
+    async def _asearch(self, user_id: str, query: str, limit: int) -> List[Tuple[str, float]]:
+        if not self._memory_ids.get(user_id):
+            return []
+        return self._rank(user_id, await self.embedder.async_get_embedding(query), limit)
+
+    def _rank(self, user_id: str, query_embedding: List[float], limit: int) -> List[Tuple[str, float]]:
+        query_vector = self._normalize(query_embedding)
+        if query_vector is None:
+            return []
+        with self._lock:
+            memory_ids = list(self._memory_ids.get(user_id, []))
+            vectors = self._vectors.get(user_id, array("f"))
+            size = len(query_vector)
+            scores = (
+                (memory_id, sum(map(mul, query_vector, vectors[row * size : (row + 1) * size])))
+                for row, memory_id in enumerate(memory_ids)
+            )
+            return heapq.nlargest(limit, scores, key=lambda item: item[1])
+
+
+class VectorDbMemoryIndex(MemoryIndex):
+    """Indexes memories in a vector database, as documents with the user and memory ids in their metadata.
+
+    The vector database must support metadata filters. Memories indexed by other processes are detected with the
+    content hash of their documents.
+    """
+
+    def __init__(self, vector_db: VectorDb):
+        """
+        Args:
+            vector_db (VectorDb): The vector database to index the memories in.
+        """
+        super().__init__()
+        self.vector_db = vector_db
+
+    def _get_document(self, memory: UserMemory) -> Document:
+        return Document(
+            id=memory.memory_id,
+            name=memory.memory_id,
+            content=self.get_memory_text(memory),
+            meta_data={"user_id": memory.user_id, "memory_id": memory.memory_id},
+        )
+
+    def _is_indexed(self, memory: UserMemory, memory_hash: str) -> bool:
+        return self.vector_db.content_hash_exists(memory_hash)
+
+    def _upsert(self, memories: List[UserMemory]) -> List[UserMemory]:
+        indexed = []
+        for memory in memories:
+            try:
+                self.vector_db.delete_by_metadata({"memory_id": memory.memory_id})
+                self.vector_db.insert(content_hash=self.get_memory_hash(memory), documents=[self._get_document(memory)])
+                indexed.append(memory)
+            except Exception as e:
+                log_warning(f"Error indexing memory {memory.memory_id}: {e}")
+        return indexed
+
+    async def _aupsert(self, memories: List[UserMemory]) -> List[UserMemory]:
+        indexed = []
+        for memory in memories:
+            try:
+                self.vector_db.delete_by_metadata({"memory_id": memory.memory_id})
+                await self.vector_db.async_insert(
+                    content_hash=self.get_memory_hash(memory), documents=[self._get_document(memory)]
+                )
+                indexed.append(memory)
+            except Exception as e:
+                log_warning(f"Error indexing memory {memory.memory_id}: {e}")
+        return indexed
+
+    def _delete(self, user_id: str, memory_ids: List[str]) -> None:
+        for memory_id in memory_ids:
+            self.vector_db.delete_by_metadata({"memory_id": memory_id})
+
+    def _clear(self, user_id: Optional[str] = None) -> None:
+        if user_id is None:
+            self.vector_db.delete()
+        else:
+            self.vector_db.delete_by_metadata({"user_id": user_id})
+
+    def _search(self, user_id: str, query: str, limit: int) -> List[Tuple[str, float]]:
+        documents = self.vector_db.search(query=query, limit=limit, filters={"user_id": user_id})
+        return self._get_results(documents)
+
+    async def _asearch(self, user_id: str, query: str, limit: int) -> List[Tuple[str, float]]:
+        documents = await self.vector_db.async_search(query=query, limit=limit, filters={"user_id": user_id})
+        return self._get_results(documents)
+
+    def _get_results(self, documents: List[Document]) -> List[Tuple[str, float]]:
+        results = []
+        for document in documents:
+            memory_id = (document.meta_data or {}).get("memory_id")
+            if memory_id is not None:
+                results.append((memory_id, document.meta_data.get("similarity_score", 0.0)))
+        return results
@@ -8,6 +8,7 @@ from pydantic import BaseModel, Field
 
 from agno.db.base import AsyncBaseDb, BaseDb
 from agno.db.schemas import UserMemory
+from agno.memory.index import MemoryIndex
 from agno.memory.strategies import MemoryOptimizationStrategy
 from agno.memory.strategies.types import (
     MemoryOptimizationStrategyFactory,
@@ -68,6 +69,11 @@ class MemoryManager:
     # The database to store memories
     db: Optional[Union[BaseDb, AsyncBaseDb]] = None
 
+    # Index of the memories, to search them by similarity instead of passing all of them to the model
+    memory_index: Optional[MemoryIndex] = None
+    # Number of the most similar memories passed to the model in agentic search, if memory_index is set
+    memory_search_candidates: int = 20
+
     debug_mode: bool = False
 
     def __init__(
@@ -81,6 +87,8 @@ class MemoryManager:
         update_memories: bool = True,
         add_memories: bool = True,
         clear_memories: bool = False,
+        memory_index: Optional[MemoryIndex] = None,
+        memory_search_candidates: int = 20,
         debug_mode: bool = False,
     ):
         self.model = model  # type: ignore[assignment]
@@ -92,6 +100,8 @@ class MemoryManager:
         self.update_memories = update_memories
         self.add_memories = add_memories
         self.clear_memories = clear_memories
+        self.memory_index = memory_index
+        self.memory_search_candidates = memory_search_candidates
         self.debug_mode = debug_mode
 
         if self.model is not None:
@@ -273,6 +283,7 @@ class MemoryManager:
         """Clears the memory."""
         if self.db:
             self.db.clear_memories()
+            self._clear_memory_index()
 
     def delete_user_memory(
         self,
@@ -326,6 +337,7 @@ class MemoryManager:
         if memory_ids:
             # Delete all memories in a single batch operation
             self.db.delete_user_memories(memory_ids=memory_ids, user_id=user_id)
+            self._clear_memory_index(user_id=user_id)
             log_debug(f"Cleared {len(memory_ids)} memories for user {user_id}")
 
     async def aclear_user_memories(self, user_id: Optional[str] = None) -> None:
@@ -359,6 +371,7 @@ class MemoryManager:
                 await self.db.delete_user_memories(memory_ids=memory_ids, user_id=user_id)
             else:
                 self.db.delete_user_memories(memory_ids=memory_ids, user_id=user_id)
+            self._clear_memory_index(user_id=user_id)
             log_debug(f"Cleared {len(memory_ids)} memories for user {user_id}")
 
     # -*- Agent Functions
@@ -557,6 +570,7 @@ class MemoryManager:
             if not self.db:
                 raise ValueError("Memory db not initialized")
             self.db.upsert_user_memory(memory=memory)
+            self._index_memories([memory])
             return "Memory added successfully"
         except Exception as e:
             log_warning(f"Error storing memory in db: {e}")
@@ -572,28 +586,81 @@ class MemoryManager:
                 user_id = "default"
 
             self.db.delete_user_memory(memory_id=memory_id, user_id=user_id)
+            self._remove_from_memory_index(user_id=user_id, memory_ids=[memory_id])
             return "Memory deleted successfully"
         except Exception as e:
             log_warning(f"Error deleting memory in db: {e}")
             return f"Error deleting memory: {e}"
 
+    # -*- Memory Index Functions
+    def _index_memories(self, memories: List[UserMemory]) -> None:
+        """Add memories to the memory index, if set. Memories failing to be indexed are indexed on the next search."""
+        if self.memory_index is None:
+            return
+        try:
+            self.memory_index.upsert(memories)
+        except Exception as e:
+            log_warning(f"Error indexing memories: {e}")
+
+    async def _aindex_memories(self, memories: List[UserMemory]) -> None:
+        """Add memories to the memory index asynchronously, if set."""
+        if self.memory_index is None:
+            return
+        try:
+            await self.memory_index.aupsert(memories)
+        except Exception as e:
+            log_warning(f"Error indexing memories: {e}")
+
+    def _remove_from_memory_index(self, user_id: str, memory_ids: List[str]) -> None:
+        """Remove memories from the memory index, if set."""
+        if self.memory_index is None:
+            return
+        try:
+            self.memory_index.delete(user_id=user_id, memory_ids=memory_ids)
+        except Exception as e:
+            log_warning(f"Error removing memories from index: {e}")
+
+    def _clear_memory_index(self, user_id: Optional[str] = None) -> None:
+        """Remove the memories of a user, or all memories, from the memory index, if set."""
+        if self.memory_index is None:
+            return
+        try:
+            self.memory_index.clear(user_id=user_id)
+        except Exception as e:
+            log_warning(f"Error clearing memory index: {e}")
+
+    def _get_similar_memories(
+        self, user_id: str, query: str, user_memories: List[UserMemory], limit: int
+    ) -> List[UserMemory]:
+        """Get the memories of a user most similar to the query from the memory index, most similar first."""
+        if self.memory_index is None:
+            raise ValueError("A memory_index is required to search memories by similarity")
+
+        # Memories written without the manager, e.g. by another process, are indexed here
+        self.memory_index.refresh(user_id=user_id, memories=user_memories)
+        memories_by_id = {memory.memory_id: memory for memory in user_memories}
+        memory_ids = self.memory_index.search(user_id=user_id, query=query, limit=limit)
+        return [memories_by_id[memory_id] for memory_id in memory_ids if memory_id in memories_by_id]
+
     # -*- Utility Functions
     def search_user_memories(
         self,
         query: Optional[str] = None,
         limit: Optional[int] = None,
-        retrieval_method: Optional[Literal["last_n", "first_n", "agentic"]] = None,
+        retrieval_method: Optional[Literal["last_n", "first_n", "agentic", "semantic"]] = None,
         user_id: Optional[str] = None,
     ) -> List[UserMemory]:
         """Search through user memories using the specified retrieval method.
 
         Args:
-            query: The search query for agentic search. Required if retrieval_method is "agentic".
+            query: The search query. Required if retrieval_method is "agentic" or "semantic".
             limit: Maximum number of memories to return. Defaults to self.retrieval_limit if not specified. Optional.
             retrieval_method: The method to use for retrieving memories. Defaults to self.retrieval if not specified.
                 - "last_n": Return the most recent memories
                 - "first_n": Return the oldest memories
-                - "agentic": Return memories most similar to the query, but using an agentic approach
+                - "agentic": Return memories most similar to the query, but using an agentic approach.
+                  If memory_index is set, only the memory_search_candidates most similar memories are passed to the model.
+                - "semantic": Return memories most similar to the query, using memory_index
             user_id: The user to search for. Optional.
 
         Returns:
@@ -624,6 +691,17 @@ class MemoryManager:
 
             return self._search_user_memories_agentic(user_id=user_id, query=query, limit=limit)
 
+        elif retrieval_method == "semantic":
+            if not query:
+                raise ValueError("Query is required for semantic search")
+
+            return self._get_similar_memories(
+                user_id=user_id,
+                query=query,
+                user_memories=memories.get(user_id, []),
+                limit=limit or self.memory_search_candidates,
+            )
+
         elif retrieval_method == "first_n":
             return self._get_first_n_memories(user_id=user_id, limit=limit)
 
@@ -663,6 +741,11 @@ class MemoryManager:
 
         # Get all memories as a list
         user_memories: List[UserMemory] = memories[user_id]
+        if self.memory_index is not None:
+            # Only the memories most similar to the query are passed to the model
+            user_memories = self._get_similar_memories(
+                user_id=user_id, query=query, user_memories=user_memories, limit=self.memory_search_candidates
+            )
         system_message_str = "Your task is to search through user memories and return the IDs of the memories that are related to the query.\n"
         system_message_str += "\n<user_memories>\n"
         for memory in user_memories:
@@ -848,6 +931,7 @@ class MemoryManager:
                     opt_mem.memory_id = str(uuid4())
 
                 self.db.upsert_user_memory(memory=opt_mem)
+            self._index_memories(optimized_memories)
 
         optimized_tokens = strategy_instance.count_tokens(optimized_memories)
         log_debug(f"Optimization complete. New token count: {optimized_tokens}")
@@ -921,6 +1005,7 @@ class MemoryManager:
                     await self.db.upsert_user_memory(memory=opt_mem)
                 elif isinstance(self.db, BaseDb):
                     self.db.upsert_user_memory(memory=opt_mem)
+            await self._aindex_memories(optimized_memories)
 
         optimized_tokens = strategy_instance.count_tokens(optimized_memories)
         log_debug(f"Memory optimization complete. New token count: {optimized_tokens}")
@@ -1321,17 +1406,17 @@ class MemoryManager:
 
             try:
                 memory_id = str(uuid4())
-                db.upsert_user_memory(
-                    UserMemory(
-                        memory_id=memory_id,
-                        user_id=user_id,
-                        agent_id=agent_id,
-                        team_id=team_id,
-                        memory=memory,
-                        topics=topics,
-                        input=input_string,
-                    )
+                user_memory = UserMemory(
+                    memory_id=memory_id,
+                    user_id=user_id,
+                    agent_id=agent_id,
+                    team_id=team_id,
+                    memory=memory,
+                    topics=topics,
+                    input=input_string,
                 )
+                db.upsert_user_memory(user_memory)
+                self._index_memories([user_memory])
                 log_debug(f"Memory added: {memory_id}")
                 return "Memory added successfully"
             except Exception as e:
@@ -1353,15 +1438,15 @@ class MemoryManager:
                 return "Can't update memory with empty string. Use the delete memory function if available."
 
             try:
-                db.upsert_user_memory(
-                    UserMemory(
-                        memory_id=memory_id,
-                        memory=memory,
-                        topics=topics,
-                        user_id=user_id,
-                        input=input_string,
-                    )
+                user_memory = UserMemory(
+                    memory_id=memory_id,
+                    memory=memory,
+                    topics=topics,
+                    user_id=user_id,
+                    input=input_string,
                 )
+                db.upsert_user_memory(user_memory)
+                self._index_memories([user_memory])
                 log_debug("Memory updated")
                 return "Memory updated successfully"
             except Exception as e:
@@ -1377,6 +1462,7 @@ class MemoryManager:
             """
             try:
                 db.delete_user_memory(memory_id=memory_id, user_id=user_id)
+                self._remove_from_memory_index(user_id=user_id, memory_ids=[memory_id])
                 log_debug("Memory deleted")
                 return "Memory deleted successfully"
             except Exception as e:
@@ -1390,6 +1476,7 @@ class MemoryManager:
                 str: A message indicating if the memory was cleared successfully or not.
             """
             db.clear_memories()
+            self._clear_memory_index()
             log_debug("Memory cleared")
             return "Memory cleared successfully"
 
@@ -1430,30 +1517,20 @@ class MemoryManager:
 
             try:
                 memory_id = str(uuid4())
+                user_memory = UserMemory(
+                    memory_id=memory_id,
+                    user_id=user_id,
+                    agent_id=agent_id,
+                    team_id=team_id,
+                    memory=memory,
+                    topics=topics,
+                    input=input_string,
+                )
                 if isinstance(db, AsyncBaseDb):
-                    await db.upsert_user_memory(
-                        UserMemory(
-                            memory_id=memory_id,
-                            user_id=user_id,
-                            agent_id=agent_id,
-                            team_id=team_id,
-                            memory=memory,
-                            topics=topics,
-                            input=input_string,
-                        )
-                    )
+                    await db.upsert_user_memory(user_memory)
                 else:
-                    db.upsert_user_memory(
-                        UserMemory(
-                            memory_id=memory_id,
-                            user_id=user_id,
-                            agent_id=agent_id,
-                            team_id=team_id,
-                            memory=memory,
-                            topics=topics,
-                            input=input_string,
-                        )
-                    )
+                    db.upsert_user_memory(user_memory)
+                await self._aindex_memories([user_memory])
                 log_debug(f"Memory added: {memory_id}")
                 return "Memory added successfully"
             except Exception as e:
@@ -1511,6 +1588,7 @@ class MemoryManager:
                     await db.delete_user_memory(memory_id=memory_id)
                 else:
                     db.delete_user_memory(memory_id=memory_id)
+                self._remove_from_memory_index(user_id=user_id, memory_ids=[memory_id])
                 log_debug("Memory deleted")
                 return "Memory deleted successfully"
             except Exception as e:
@@ -1527,6 +1605,7 @@ class MemoryManager:
                 await db.clear_memories()
             else:
                 db.clear_memories()
+            self._clear_memory_index()
             log_debug("Memory cleared")
             return "Memory cleared successfully"
 
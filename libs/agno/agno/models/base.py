@@ -2,6 +2,8 @@ import asyncio
 import collections.abc
 import json
 from abc import ABC, abstractmethod
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextvars import copy_context
 from dataclasses import dataclass, field
 from hashlib import md5
 from pathlib import Path
@@ -25,6 +27,7 @@ from typing import (
 
 if TYPE_CHECKING:
     from agno.compression.manager import CompressionManager
+    from agno.models.cache import ModelCache
 from uuid import uuid4
 
 from pydantic import BaseModel
@@ -157,6 +160,9 @@ class Model(ABC):
     cache_response: bool = False
     cache_ttl: Optional[int] = None
     cache_dir: Optional[str] = None
+    # Backend for the cached responses, shared by copies of the model.
+    # Defaults to a FileModelCache using cache_dir and cache_ttl.
+    cache: Optional["ModelCache"] = None
 
     # Retry configuration for model provider errors
     # Number of retries to attempt when a ModelProviderError occurs
@@ -463,66 +469,58 @@ class Model(ABC):
         cache_str = json.dumps(cache_data, sort_keys=True)
         return md5(cache_str.encode()).hexdigest()
 
-    def _get_model_cache_file_path(self, cache_key: str) -> Path:
-        """Get the file path for a cache key."""
-        if self.cache_dir:
-            cache_dir = Path(self.cache_dir)
-        else:
-            cache_dir = Path.home() / ".agno" / "cache" / "model_responses"
+    def _get_model_cache(self) -> "ModelCache":
+        """Get the backend for the cached responses, defaulting to the file cache for cache_dir and cache_ttl."""
+        if self.cache is not None:
+            return self.cache
 
-        cache_dir.mkdir(parents=True, exist_ok=True)
-        return cache_dir / f"{cache_key}.json"
+        from agno.models.cache import get_file_model_cache
 
-    def _get_cached_model_response(self, cache_key: str) -> Optional[Dict[str, Any]]:
-        """Retrieve a cached response if it exists and is not expired."""
-        cache_file = self._get_model_cache_file_path(cache_key)
-
-        if not cache_file.exists():
-            return None
-
-        try:
-            with open(cache_file, "r") as f:
-                cached_data = json.load(f)
+        return get_file_model_cache(cache_dir=self.cache_dir, ttl=self.cache_ttl)
 
-            # Check TTL if set (None means no expiration)
-            if self.cache_ttl is not None:
-                if time() - cached_data["timestamp"] > self.cache_ttl:
-                    return None
-
-            return cached_data
-        except Exception:
-            return None
+    def _get_model_cache_file_path(self, cache_key: str) -> Path:
+        """Get the file path for a cache key."""
+        from agno.models.cache import FileModelCache
+
+        return FileModelCache(cache_dir=self.cache_dir).get_file_path(cache_key)
+
+    def _get_cached_model_response(
+        self, cache_key: str, run_response: Optional[Union[RunOutput, TeamRunOutput]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Retrieve a cached response if it exists and is not expired, counting the lookup on the run metrics."""
+        cached_data = self._get_model_cache().get(cache_key)
+        if run_response is not None:
+            if run_response.metrics is None:
+                run_response.metrics = Metrics()
+            if cached_data:
+                run_response.metrics.model_cache_hits += 1
+            else:
+                run_response.metrics.model_cache_misses += 1
+        return cached_data
 
     def _save_model_response_to_cache(self, cache_key: str, result: ModelResponse, is_streaming: bool = False) -> None:
         """Save a model response to cache."""
         try:
-            cache_file = self._get_model_cache_file_path(cache_key)
-
             cache_data = {
                 "timestamp": int(time()),
                 "is_streaming": is_streaming,
                 "result": result.to_dict(),
             }
-            with open(cache_file, "w") as f:
-                json.dump(cache_data, f)
         except Exception:
-            pass
+            return
+        self._get_model_cache().set(cache_key, cache_data)
 
     def _save_streaming_responses_to_cache(self, cache_key: str, responses: List[ModelResponse]) -> None:
         """Save streaming responses to cache."""
-        cache_file = self._get_model_cache_file_path(cache_key)
-
-        cache_data = {
-            "timestamp": int(time()),
-            "is_streaming": True,
-            "streaming_responses": [r.to_dict() for r in responses],
-        }
-
         try:
-            with open(cache_file, "w") as f:
-                json.dump(cache_data, f)
+            cache_data = {
+                "timestamp": int(time()),
+                "is_streaming": True,
+                "streaming_responses": [r.to_dict() for r in responses],
+            }
         except Exception:
-            pass
+            return
+        self._get_model_cache().set(cache_key, cache_data)
 
     def _model_response_from_cache(self, cached_data: Dict[str, Any]) -> ModelResponse:
         """Reconstruct a ModelResponse from cached data."""
@@ -615,6 +613,7 @@ class Model(ABC):
         tools: Optional[List[Union[Function, dict]]] = None,
         tool_choice: Optional[Union[str, Dict[str, Any]]] = None,
         tool_call_limit: Optional[int] = None,
+        tool_call_concurrency: Optional[int] = None,
         run_response: Optional[Union[RunOutput, TeamRunOutput]] = None,
         send_media_to_model: bool = True,
         compression_manager: Optional["CompressionManager"] = None,
@@ -628,6 +627,7 @@ class Model(ABC):
             tools: List of tools to use. This includes the original Function objects and dicts for built-in tools.
             tool_choice: Tool choice to use
             tool_call_limit: Tool call limit
+            tool_call_concurrency: Maximum number of tool calls to run in parallel
             run_response: Run response to use
             send_media_to_model: Whether to send media to the model
         """
@@ -637,7 +637,7 @@ class Model(ABC):
                 cache_key = self._get_model_cache_key(
                     messages, stream=False, response_format=response_format, tools=tools
                 )
-                cached_data = self._get_cached_model_response(cache_key)
+                cached_data = self._get_cached_model_response(cache_key, run_response=run_response)
 
                 if cached_data:
                     log_info("Cache hit for model response")
@@ -700,6 +700,7 @@ class Model(ABC):
                         function_call_results=function_call_results,
                         current_function_call_count=function_call_count,
                         function_call_limit=tool_call_limit,
+                        max_concurrency=tool_call_concurrency,
                     ):
                         if isinstance(function_call_response, ModelResponse):
                             # The session state is updated by the function call
@@ -850,7 +851,7 @@ class Model(ABC):
                 cache_key = self._get_model_cache_key(
                     messages, stream=False, response_format=response_format, tools=tools
                 )
-                cached_data = self._get_cached_model_response(cache_key)
+                cached_data = self._get_cached_model_response(cache_key, run_response=run_response)
 
                 if cached_data:
                     log_info("Cache hit for model response")
@@ -1268,6 +1269,7 @@ class Model(ABC):
         tools: Optional[List[Union[Function, dict]]] = None,
         tool_choice: Optional[Union[str, Dict[str, Any]]] = None,
         tool_call_limit: Optional[int] = None,
+        tool_call_concurrency: Optional[int] = None,
         stream_model_response: bool = True,
         run_response: Optional[Union[RunOutput, TeamRunOutput]] = None,
         send_media_to_model: bool = True,
@@ -1283,7 +1285,7 @@ class Model(ABC):
                 cache_key = self._get_model_cache_key(
                     messages, stream=True, response_format=response_format, tools=tools
                 )
-                cached_data = self._get_cached_model_response(cache_key)
+                cached_data = self._get_cached_model_response(cache_key, run_response=run_response)
 
                 if cached_data:
                     log_info("Cache hit for streaming model response")
@@ -1393,6 +1395,7 @@ class Model(ABC):
                         function_call_results=function_call_results,
                         current_function_call_count=function_call_count,
                         function_call_limit=tool_call_limit,
+                        max_concurrency=tool_call_concurrency,
                     ):
                         if self.cache_response and isinstance(function_call_response, ModelResponse):
                             streaming_responses.append(function_call_response)
@@ -1534,7 +1537,7 @@ class Model(ABC):
                 cache_key = self._get_model_cache_key(
                     messages, stream=True, response_format=response_format, tools=tools
                 )
-                cached_data = self._get_cached_model_response(cache_key)
+                cached_data = self._get_cached_model_response(cache_key, run_response=run_response)
 
                 if cached_data:
                     log_info("Cache hit for async streaming model response")
@@ -1960,6 +1963,7 @@ class Model(ABC):
         function_call: FunctionCall,
         function_call_results: List[Message],
         additional_input: Optional[List[Message]] = None,
+        function_execution_future: Optional["Future[FunctionExecutionResult]"] = None,
     ) -> Iterator[Union[ModelResponse, RunOutputEvent, TeamRunOutputEvent]]:
         # Start function call
         function_call_timer = Timer()
@@ -1981,7 +1985,11 @@ class Model(ABC):
         function_execution_result: FunctionExecutionResult = FunctionExecutionResult(status="failure")
         stop_after_tool_call_from_exception = False
         try:
-            function_execution_result = function_call.execute()
+            if function_execution_future is not None:
+                # The function call was already submitted to run in parallel with the other function calls
+                function_execution_result = function_execution_future.result()
+            else:
+                function_execution_result = function_call.execute()
         except AgentRunException as a_exc:
             # Update additional messages from function call
             _handle_agent_exception(a_exc, additional_input)
@@ -2114,6 +2122,36 @@ class Model(ABC):
         # Add function call to function call results
         function_call_results.append(function_call_result)
 
+    def _is_paused_function_call(self, function_call: FunctionCall) -> bool:
+        """Check if the function call pauses the run for user confirmation, user input or external execution (HITL)."""
+        function = function_call.function
+        if function.requires_confirmation or function.requires_user_input or function.external_execution:
+            return True
+        arguments = function_call.arguments or {}
+        if function.name == "get_user_input" and arguments.get("user_input_fields"):
+            return True
+        return function.name == "ask_user" and bool(arguments.get("questions"))
+
+    def _submit_function_calls(
+        self,
+        executor: ThreadPoolExecutor,
+        function_calls: List[FunctionCall],
+        current_function_call_count: int = 0,
+        function_call_limit: Optional[int] = None,
+    ) -> Dict[int, "Future[FunctionExecutionResult]"]:
+        """Submit the function calls that will be executed to the executor, keyed by the id of the function call."""
+        function_execution_futures: Dict[int, "Future[FunctionExecutionResult]"] = {}
+        for fc in function_calls:
+            if function_call_limit is not None:
+                current_function_call_count += 1
+                if current_function_call_count > function_call_limit:
+                    continue
+            if self._is_paused_function_call(fc):
+                continue
+            # Run each function call in a copy of the current context, like asyncio.to_thread
+            function_execution_futures[id(fc)] = executor.submit(copy_context().run, fc.execute)
+        return function_execution_futures
+
     def run_function_calls(
         self,
         function_calls: List[FunctionCall],
@@ -2121,11 +2159,43 @@ class Model(ABC):
         additional_input: Optional[List[Message]] = None,
         current_function_call_count: int = 0,
         function_call_limit: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
     ) -> Iterator[Union[ModelResponse, RunOutputEvent, TeamRunOutputEvent]]:
         # Additional messages from function calls that will be added to the function call results
         if additional_input is None:
             additional_input = []
 
+        # Run the function calls in parallel threads if enabled. Events and results are still processed in order below.
+        executor: Optional[ThreadPoolExecutor] = None
+        function_execution_futures: Dict[int, "Future[FunctionExecutionResult]"] = {}
+        if max_concurrency is not None and max_concurrency > 1 and len(function_calls) > 1:
+            executor = ThreadPoolExecutor(max_workers=min(max_concurrency, len(function_calls)))
+            function_execution_futures = self._submit_function_calls(
+                executor, function_calls, current_function_call_count, function_call_limit
+            )
+
+        try:
+            yield from self._run_function_calls(
+                function_calls=function_calls,
+                function_call_results=function_call_results,
+                additional_input=additional_input,
+                current_function_call_count=current_function_call_count,
+                function_call_limit=function_call_limit,
+                function_execution_futures=function_execution_futures,
+            )
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True)
+
+    def _run_function_calls(
+        self,
+        function_calls: List[FunctionCall],
+        function_call_results: List[Message],
+        additional_input: List[Message],
+        current_function_call_count: int,
+        function_call_limit: Optional[int],
+        function_execution_futures: Dict[int, "Future[FunctionExecutionResult]"],
+    ) -> Iterator[Union[ModelResponse, RunOutputEvent, TeamRunOutputEvent]]:
         for fc in function_calls:
             if function_call_limit is not None:
                 current_function_call_count += 1
@@ -2258,7 +2328,10 @@ class Model(ABC):
                 continue
 
             yield from self.run_function_call(
-                function_call=fc, function_call_results=function_call_results, additional_input=additional_input
+                function_call=fc,
+                function_call_results=function_call_results,
+                additional_input=additional_input,
+                function_execution_future=function_execution_futures.get(id(fc)),
             )
 
         # Add any additional messages at the end
@@ -2871,6 +2944,10 @@ class Model(ABC):
         for k, v in self.__dict__.items():
             if k in {"response_format", "_tools", "_functions"}:
                 continue
+            # Share the response cache between copies
+            if k == "cache":
+                setattr(new_model, k, v)
+                continue
             # Skip client objects
             if k in {"client", "async_client", "http_client", "mistral_client", "model_client"}:
                 setattr(new_model, k, None)
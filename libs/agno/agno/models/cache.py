@@ -0,0 +1,412 @@
+import json
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
+from time import time
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
+
+from agno.models.metrics import Metrics
+from agno.utils.log import log_debug, log_warning
+
+if TYPE_CHECKING:
+    from agno.db.base import BaseDb
+
+
+class ModelCache(ABC):
+    """Base class for the backends storing cached model responses.
+
+    Entries are the JSON-serializable dicts built by the Model, with a "timestamp" key used for the TTL.
+    Hits and misses are counted on `metrics`.
+    """
+
+    def __init__(self, ttl: Optional[int] = None):
+        """
+        Args:
+            ttl (Optional[int]): Seconds after which an entry expires. Entries never expire if not set.
+        """
+        self.ttl = ttl
+        self.metrics = Metrics()
+        self._metrics_lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get a cached entry if it exists and is not expired."""
+        try:
+            entry = self._get(key)
+        except Exception as e:
+            log_warning(f"Error reading from model cache: {e}")
+            entry = None
+
+        if entry is not None and self._is_expired(entry):
+            self.delete(key)
+            entry = None
+
+        with self._metrics_lock:
+            if entry is None:
+                self.metrics.model_cache_misses += 1
+            else:
+                self.metrics.model_cache_hits += 1
+        return entry
+
+    def set(self, key: str, entry: Dict[str, Any]) -> None:
+        """Store an entry in the cache, evicting older entries if the cache is full."""
+        entry.setdefault("timestamp", int(time()))
+        try:
+            self._set(key, entry)
+        except Exception as e:
+            log_warning(f"Error writing to model cache: {e}")
+
+    def delete(self, key: str) -> None:
+        """Delete an entry from the cache."""
+        try:
+            self._delete(key)
+        except Exception as e:
+            log_debug(f"Error deleting from model cache: {e}")
+
+    def _is_expired(self, entry: Dict[str, Any]) -> bool:
+        return self.ttl is not None and time() - entry.get("timestamp", 0) > self.ttl
+
+    @abstractmethod
+    def _get(self, key: str) -> Optional[Dict[str, Any]]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def _set(self, key: str, entry: Dict[str, Any]) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def _delete(self, key: str) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Delete all entries from the cache."""
+        raise NotImplementedError
+
+
+class FileModelCache(ModelCache):
+    """Stores each cached response in its own JSON file. This is the default backend of `Model.cache_response`."""
+
+    def __init__(self, cache_dir: Optional[str] = None, ttl: Optional[int] = None):
+        """
+        Args:
+            cache_dir (Optional[str]): Directory for the cache files. Defaults to ~/.agno/cache/model_responses.
+            ttl (Optional[int]): Seconds after which an entry expires. Entries never expire if not set.
+        """
+        super().__init__(ttl=ttl)
+        self.cache_dir = Path(cache_dir) if cache_dir else Path.home() / ".agno" / "cache" / "model_responses"
+
+    def get_file_path(self, key: str) -> Path:
+        """Get the file path for a cache key."""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        return self.cache_dir / f"{key}.json"
+
+    def _get(self, key: str) -> Optional[Dict[str, Any]]:
+        cache_file = self.get_file_path(key)
+        if not cache_file.exists():
+            return None
+        with open(cache_file, "r") as f:
+            return json.load(f)
+
+    def _set(self, key: str, entry: Dict[str, Any]) -> None:
+        with open(self.get_file_path(key), "w") as f:
+            json.dump(entry, f)
+
+    def _delete(self, key: str) -> None:
+        self.get_file_path(key).unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        if self.cache_dir.exists():
+            for cache_file in self.cache_dir.glob("*.json"):
+                cache_file.unlink(missing_ok=True)
+
+
+@lru_cache(maxsize=None)
+def get_file_model_cache(cache_dir: Optional[str] = None, ttl: Optional[int] = None) -> FileModelCache:
+    """Get the FileModelCache for the given settings, shared by all models using them."""
+    return FileModelCache(cache_dir=cache_dir, ttl=ttl)
+
+
+class InMemoryModelCache(ModelCache):
+    """Keeps cached responses in memory, evicting the least recently used entries first."""
+
+    def __init__(self, max_entries: Optional[int] = 1000, max_bytes: Optional[int] = None, ttl: Optional[int] = None):
+        """
+        Args:
+            max_entries (Optional[int]): Maximum number of entries to keep. Defaults to 1000.
+            max_bytes (Optional[int]): Maximum total size of the serialized entries to keep, in bytes.
+            ttl (Optional[int]): Seconds after which an entry expires. Entries never expire if not set.
+        """
+        super().__init__(ttl=ttl)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        # Serialized entries with their size, in least recently used order.
+        # Entries are kept serialized so callers can't modify the cached data.
+        self._entries: "OrderedDict[str, Tuple[str, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is None:
+                return None
+            self._entries.move_to_end(key)
+        return json.loads(cached[0])
+
+    def _set(self, key: str, entry: Dict[str, Any]) -> None:
+        serialized_entry = json.dumps(entry)
+        size = len(serialized_entry.encode())
+        if self.max_bytes is not None and size > self.max_bytes:
+            log_debug(f"Model response of {size} bytes is too large to cache")
+            return
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.total_bytes -= previous[1]
+            self._entries[key] = (serialized_entry, size)
+            self.total_bytes += size
+
+            while self._entries and (
+                (self.max_entries is not None and len(self._entries) > self.max_entries)
+                or (self.max_bytes is not None and self.total_bytes > self.max_bytes)
+            ):
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self.total_bytes -= evicted_size
+
+    def _delete(self, key: str) -> None:
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.total_bytes -= previous[1]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.total_bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SqliteModelCache(ModelCache):
+    """Stores cached responses in a single SQLite file, evicting the least recently used entries first.
+
+    The file can be shared by several processes.
+    """
+
+    def __init__(
+        self,
+        db_file: Optional[str] = None,
+        max_entries: Optional[int] = 10000,
+        max_bytes: Optional[int] = None,
+        ttl: Optional[int] = None,
+        table_name: str = "agno_model_cache",
+    ):
+        """
+        Args:
+            db_file (Optional[str]): Path to the SQLite file. Defaults to ~/.agno/cache/model_responses.db.
+            max_entries (Optional[int]): Maximum number of entries to keep. Defaults to 10000.
+            max_bytes (Optional[int]): Maximum total size of the serialized entries to keep, in bytes.
+            ttl (Optional[int]): Seconds after which an entry expires. Entries never expire if not set.
+            table_name (str): Name of the cache table.
+        """
+        super().__init__(ttl=ttl)
+        self.db_file = Path(db_file) if db_file else Path.home() / ".agno" / "cache" / "model_responses.db"
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.table_name = table_name
+
+        self.db_file.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(str(self.db_file), check_same_thread=False, timeout=30)
+        with self._lock, self._connection:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {self.table_name} ("
+                "key TEXT PRIMARY KEY, entry TEXT NOT NULL, size INTEGER NOT NULL, "
+                "created_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+            )
+            self._connection.execute(
+                f"CREATE INDEX IF NOT EXISTS idx_{self.table_name}_accessed_at ON {self.table_name} (accessed_at)"
+            )
+
+    def _get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock, self._connection:
+            row = self._connection.execute(f"SELECT entry FROM {self.table_name} WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            self._connection.execute(
+                f"UPDATE {self.table_name} SET accessed_at = ? WHERE key = ?",
+                (time(), key),
+            )
+        return json.loads(row[0])
+
+    def _set(self, key: str, entry: Dict[str, Any]) -> None:
+        serialized_entry = json.dumps(entry)
+        size = len(serialized_entry.encode())
+        if self.max_bytes is not None and size > self.max_bytes:
+            log_debug(f"Model response of {size} bytes is too large to cache")
+            return
+
+        now = time()
+        with self._lock, self._connection:
+            self._connection.execute(
+                f"INSERT INTO {self.table_name} (key, entry, size, created_at, accessed_at) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET entry = excluded.entry, size = excluded.size, "
+                "created_at = excluded.created_at, accessed_at = excluded.accessed_at",
+                (key, serialized_entry, size, entry["timestamp"], now),
+            )
+            self._evict()
+
+    def _evict(self) -> None:
+        """Delete the least recently used entries until the cache is within its bounds."""
+        if self.max_entries is not None:
+            self._connection.execute(
+                f"DELETE FROM {self.table_name} WHERE key IN ("
+                f"SELECT key FROM {self.table_name} ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+        if self.max_bytes is not None:
+            # Keep the most recently used entries whose running total size fits in max_bytes
+            self._connection.execute(
+                f"DELETE FROM {self.table_name} WHERE key IN ("
+                f"SELECT key FROM (SELECT key, SUM(size) OVER (ORDER BY accessed_at DESC, key) AS total_size "
+                f"FROM {self.table_name}) WHERE total_size > ?)",
+                (self.max_bytes,),
+            )
+
+    def _delete(self, key: str) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(f"DELETE FROM {self.table_name} WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(f"DELETE FROM {self.table_name}")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute(f"SELECT COUNT(*) FROM {self.table_name}").fetchone()[0]
+
+    def close(self) -> None:
+        """Close the connection to the SQLite file."""
+        with self._lock:
+            self._connection.close()
+
+
+class DbModelCache(ModelCache):
+    """Stores cached responses in a dedicated table of an agno SQL database, e.g. PostgresDb, MySQLDb or SqliteDb.
+
+    The least recently written entries are evicted first.
+    """
+
+    def __init__(
+        self,
+        db: "BaseDb",
+        max_entries: Optional[int] = None,
+        ttl: Optional[int] = None,
+        table_name: str = "agno_model_cache",
+    ):
+        """
+        Args:
+            db (BaseDb): The database to store the entries in. It must have a synchronous SQLAlchemy engine.
+            max_entries (Optional[int]): Maximum number of entries to keep. The least recently written entries
+                are deleted first.
+            ttl (Optional[int]): Seconds after which an entry expires. Entries never expire if not set.
+            table_name (str): Name of the cache table.
+        """
+        try:
+            from sqlalchemy import Column, Float, Index, MetaData, String, Table, Text
+            from sqlalchemy.engine import Engine
+            from sqlalchemy.orm import sessionmaker
+            from sqlalchemy.schema import CreateSchema
+        except ImportError:
+            raise ImportError("`sqlalchemy` not installed. Please install it using `pip install sqlalchemy`")
+
+        db_engine = getattr(db, "db_engine", None)
+        if not isinstance(db_engine, Engine):
+            raise ValueError(f"DbModelCache requires a database with a synchronous SQLAlchemy engine, got {type(db)}")
+
+        super().__init__(ttl=ttl)
+        self.db = db
+        self.max_entries = max_entries
+        self.table_name = table_name
+
+        db_schema = getattr(db, "db_schema", None)
+        self.table = Table(
+            table_name,
+            MetaData(schema=db_schema),
+            Column("key", String(128), primary_key=True),
+            Column("entry", Text, nullable=False),
+            # Sub-second write time, to order the entries for eviction
+            Column("cached_at", Float, nullable=False),
+            # Entry timestamp, to delete the expired entries
+            Column("created_at", Float, nullable=False),
+        )
+        Index(f"idx_{table_name}_cached_at", self.table.c.cached_at)
+        Index(f"idx_{table_name}_created_at", self.table.c.created_at)
+        self.Session = sessionmaker(bind=db_engine)
+
+        if db_schema is not None and db_engine.dialect.name != "sqlite" and getattr(db, "create_schema", True):
+            with db_engine.begin() as connection:
+                connection.execute(CreateSchema(db_schema, if_not_exists=True))
+        self.table.create(db_engine, checkfirst=True)
+
+    def _get(self, key: str) -> Optional[Dict[str, Any]]:
+        from sqlalchemy import select
+
+        with self.Session() as sess:
+            entry = sess.execute(select(self.table.c.entry).where(self.table.c.key == key)).scalar_one_or_none()
+        if entry is None:
+            return None
+        return json.loads(entry)
+
+    def _set(self, key: str, entry: Dict[str, Any]) -> None:
+        from sqlalchemy import delete, insert
+
+        with self.Session() as sess, sess.begin():
+            sess.execute(delete(self.table).where(self.table.c.key == key))
+            sess.execute(
+                insert(self.table).values(
+                    key=key, entry=json.dumps(entry), cached_at=time(), created_at=entry["timestamp"]
+                )
+            )
+            self._evict(sess)
+
+    def _evict(self, sess: Any) -> None:
+        """Delete the expired entries and the least recently written entries beyond max_entries.
+
+        Both deletes are range deletes on an indexed column, so their cost does not grow with the cache size.
+        """
+        from sqlalchemy import delete, select
+
+        if self.ttl is not None:
+            sess.execute(delete(self.table).where(self.table.c.created_at < time() - self.ttl))
+        if self.max_entries is not None:
+            # Write time of the newest entry beyond max_entries
+            cutoff = sess.execute(
+                select(self.table.c.cached_at).order_by(self.table.c.cached_at.desc()).offset(self.max_entries).limit(1)
+            ).scalar_one_or_none()
+            if cutoff is not None:
+                sess.execute(delete(self.table).where(self.table.c.cached_at <= cutoff))
+
+    def _delete(self, key: str) -> None:
+        from sqlalchemy import delete
+
+        with self.Session() as sess, sess.begin():
+            sess.execute(delete(self.table).where(self.table.c.key == key))
+
+    def clear(self) -> None:
+        from sqlalchemy import delete
+
+        with self.Session() as sess, sess.begin():
+            sess.execute(delete(self.table))
+
+    def __len__(self) -> int:
+        from sqlalchemy import func, select
+
+        with self.Session() as sess:
+            return sess.execute(select(func.count()).select_from(self.table)).scalar_one()
@@ -29,6 +29,10 @@ class Metrics:
     # Tokens employed in reasoning
     reasoning_tokens: int = 0
 
+    # Model response cache lookups
+    model_cache_hits: int = 0
+    model_cache_misses: int = 0
+
     # Time metrics
     # Internal timer utility for tracking execution time
     timer: Optional[Timer] = None
@@ -68,6 +72,8 @@ class Metrics:
             cache_read_tokens=self.cache_read_tokens + other.cache_read_tokens,
             cache_write_tokens=self.cache_write_tokens + other.cache_write_tokens,
             reasoning_tokens=self.reasoning_tokens + other.reasoning_tokens,
+            model_cache_hits=self.model_cache_hits + other.model_cache_hits,
+            model_cache_misses=self.model_cache_misses + other.model_cache_misses,
         )
 
         if self.cost is not None and other.cost is not None:
@@ -35,7 +35,9 @@ from agno.os.config import (
     TracesConfig,
     TracesDomainConfig,
 )
+from agno.os.event_log import EventLog
 from agno.os.interfaces.base import BaseInterface
+from agno.os.managers import event_buffer
 from agno.os.router import get_base_router, get_websocket_router
 from agno.os.routers.agents import get_agent_router
 from agno.os.routers.approvals import get_approval_router
@@ -119,6 +121,7 @@ async def scheduler_lifespan(app: FastAPI, agent_os: "AgentOS"):
     executor = ScheduleExecutor(
         base_url=base_url,
         internal_service_token=internal_token,
+        agent_os=agent_os if agent_os._scheduler_in_process else None,
     )
     poller = SchedulePoller(
         db=agent_os.db,
@@ -190,7 +193,9 @@ class AgentOS:
         scheduler: bool = False,
         scheduler_poll_interval: int = 15,
         scheduler_base_url: Optional[str] = None,
+        scheduler_in_process: bool = True,
         internal_service_token: Optional[str] = None,
+        event_log: Optional[EventLog] = None,
     ):
         """Initialize AgentOS.
 
@@ -221,9 +226,13 @@ class AgentOS:
             telemetry: Whether to enable telemetry
             registry: Optional registry to use for the AgentOS
             scheduler: Whether to enable the cron scheduler
-            scheduler_poll_interval: Seconds between scheduler poll cycles (default: 15)
+            scheduler_poll_interval: Maximum seconds between scheduler poll cycles (default: 15)
             scheduler_base_url: Base URL for scheduler HTTP calls (default: http://127.0.0.1:7777)
+            scheduler_in_process: If True, the scheduler runs the agents, teams and workflows of this AgentOS directly
+                instead of calling their endpoints over HTTP. Remote components are still called over HTTP
             internal_service_token: Token for scheduler-to-OS auth (auto-generated if not provided)
+            event_log: Backend storing the events of streaming runs for reconnection. Use a SqliteEventLog or
+                RedisEventLog to let clients resume runs on any worker (default: in memory, per process)
 
         """
         if not agents and not workflows and not teams and not knowledge and not db:
@@ -283,12 +292,16 @@ class AgentOS:
         self._scheduler_enabled = scheduler
         self._scheduler_poll_interval = scheduler_poll_interval
         self._scheduler_base_url = scheduler_base_url
+        self._scheduler_in_process = scheduler_in_process
         if self._scheduler_enabled and not internal_service_token:
             import secrets
 
             internal_service_token = secrets.token_urlsafe(32)
         self._internal_service_token = internal_service_token
 
+        if event_log is not None:
+            event_buffer.event_log = event_log
+
         # List of all MCP tools used inside the AgentOS
         self.mcp_tools: List[Any] = []
         self._mcp_app: Optional[Any] = None
@@ -0,0 +1,500 @@
+"""
+Event logs for the AgentOS events buffer.
+
+An event log stores the events of streaming runs under a per-run sequence number, starting at 0, so clients can
+resume a run from the last event they received. The available backends are:
+- InMemoryEventLog: events are only visible to the current process. This is the default.
+- SqliteEventLog: events are shared by the processes of one host, e.g. the workers of a gunicorn server.
+- RedisEventLog: events are shared by any number of AgentOS nodes, through Redis or a Redis-compatible server.
+"""
+
+import asyncio
+import json
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from pathlib import Path
+from time import time
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, TypeVar, Union
+
+from agno.run.agent import RunOutputEvent
+from agno.run.base import RunStatus
+from agno.run.team import TeamRunOutputEvent
+from agno.run.workflow import WorkflowRunOutputEvent, workflow_run_output_event_from_dict
+from agno.utils.log import log_debug
+from agno.utils.serialize import json_dumps_bytes
+
+if TYPE_CHECKING:
+    from redis import Redis
+
+BufferedEvent = Union[WorkflowRunOutputEvent, RunOutputEvent, TeamRunOutputEvent]
+
+T = TypeVar("T")
+
+FINISHED_RUN_STATUSES = (RunStatus.completed, RunStatus.error, RunStatus.cancelled)
+
+
+def _serialize_event(event: BufferedEvent) -> str:
+    return json_dumps_bytes(event.to_dict()).decode("utf-8")
+
+
+def _deserialize_event(serialized_event: str) -> BufferedEvent:
+    # Restores agent and team events too, from their event type
+    return workflow_run_output_event_from_dict(json.loads(serialized_event))  # type: ignore
+
+
+class EventLog(ABC):
+    """Base class for the backends storing the events of streaming runs.
+
+    Followers waiting in `wait()` are woken up when an event is appended or the status of the run changes in this
+    process. Backends shared by several processes also notify, or are polled by, the followers of other processes.
+
+    The async methods run the methods of backends doing blocking I/O in a thread, so a slow write does not stall
+    the other streams of the event loop.
+    """
+
+    # Whether the methods do blocking I/O, and are run in a thread by the async methods
+    blocking: bool = True
+
+    def __init__(self):
+        # Followers waiting for new events, by run id
+        self._waiters: Dict[str, List[Tuple[asyncio.AbstractEventLoop, asyncio.Event]]] = {}
+        self._waiters_lock = threading.Lock()
+
+    @abstractmethod
+    def append(self, run_id: str, event: BufferedEvent, max_events: Optional[int] = None) -> int:
+        """Append an event to a run and return its sequence number.
+
+        Args:
+            run_id: The run ID (agent/team/workflow)
+            event: The event to append
+            max_events: Maximum number of events to keep for the run. The oldest events are dropped first.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def read(self, run_id: str, after: Optional[int] = None) -> List[Tuple[int, BufferedEvent]]:
+        """Get the events of a run with a sequence number greater than `after`, or all events if None."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def count(self, run_id: str) -> int:
+        """Get the number of events appended to a run, which is also the sequence number of its next event."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def set_status(self, run_id: str, status: RunStatus) -> None:
+        """Set the status of a run. Runs with no events are ignored."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_status(self, run_id: str) -> Optional[RunStatus]:
+        """Get the status of a run, or None if the run is not in the log."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete(self, run_id: str) -> None:
+        """Delete the events and status of a run."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_finished_runs(self, finished_before: float) -> List[str]:
+        """Get the ids of the runs that finished before the given timestamp."""
+        raise NotImplementedError
+
+    async def _run(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Call a method of the log, in a thread if it does blocking I/O."""
+        if not self.blocking:
+            return fn(*args, **kwargs)
+        return await asyncio.to_thread(fn, *args, **kwargs)
+
+    async def aappend(self, run_id: str, event: BufferedEvent, max_events: Optional[int] = None) -> int:
+        """Async version of `append`."""
+        return await self._run(self.append, run_id, event, max_events=max_events)
+
+    async def aread(self, run_id: str, after: Optional[int] = None) -> List[Tuple[int, BufferedEvent]]:
+        """Async version of `read`."""
+        return await self._run(self.read, run_id, after=after)
+
+    async def acount(self, run_id: str) -> int:
+        """Async version of `count`."""
+        return await self._run(self.count, run_id)
+
+    async def aset_status(self, run_id: str, status: RunStatus) -> None:
+        """Async version of `set_status`."""
+        await self._run(self.set_status, run_id, status)
+
+    async def aget_status(self, run_id: str) -> Optional[RunStatus]:
+        """Async version of `get_status`."""
+        return await self._run(self.get_status, run_id)
+
+    async def adelete(self, run_id: str) -> None:
+        """Async version of `delete`."""
+        await self._run(self.delete, run_id)
+
+    async def aget_finished_runs(self, finished_before: float) -> List[str]:
+        """Async version of `get_finished_runs`."""
+        return await self._run(self.get_finished_runs, finished_before)
+
+    async def wait(self, run_id: str, after: int, timeout: float) -> None:
+        """Wait until a run has an event after the given sequence number or is finished, for at most `timeout` seconds."""
+        notification = asyncio.Event()
+        waiter = (asyncio.get_running_loop(), notification)
+        with self._waiters_lock:
+            self._waiters.setdefault(run_id, []).append(waiter)
+        try:
+            # Checked once registered, so an event appended in between is not missed
+            if await self._run(self._has_news, run_id, after):
+                return
+            try:
+                await asyncio.wait_for(notification.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                pass
+        finally:
+            with self._waiters_lock:
+                waiters = self._waiters.get(run_id, [])
+                if waiter in waiters:
+                    waiters.remove(waiter)
+                if not waiters:
+                    self._waiters.pop(run_id, None)
+
+    def _has_news(self, run_id: str, after: int) -> bool:
+        return self.count(run_id) - 1 > after or self.get_status(run_id) in FINISHED_RUN_STATUSES
+
+    def _notify(self, run_id: str) -> None:
+        """Wake up the followers of a run in this process. Safe to call from any thread."""
+        with self._waiters_lock:
+            waiters = list(self._waiters.get(run_id, []))
+        for loop, notification in waiters:
+            try:
+                loop.call_soon_threadsafe(notification.set)
+            except RuntimeError:
+                # The loop of the follower is closed
+                pass
+
+
+class InMemoryEventLog(EventLog):
+    """Keeps the events of each run in memory, in the current process."""
+
+    blocking = False
+
+    def __init__(self):
+        super().__init__()
+        self.events: Dict[str, List[Tuple[int, BufferedEvent]]] = {}
+        self.run_metadata: Dict[str, Dict[str, Any]] = {}  # {run_id: {status, next_sequence, last_updated, etc}}
+        self._lock = threading.Lock()
+
+    def append(self, run_id: str, event: BufferedEvent, max_events: Optional[int] = None) -> int:
+        current_time = time()
+        with self._lock:
+            if run_id not in self.events:
+                self.events[run_id] = []
+                self.run_metadata[run_id] = {
+                    "status": RunStatus.running,
+                    "created_at": current_time,
+                    "last_updated": current_time,
+                    "next_sequence": 0,
+                }
+            metadata = self.run_metadata[run_id]
+            sequence = metadata["next_sequence"]
+            metadata["next_sequence"] = sequence + 1
+            metadata["last_updated"] = current_time
+            self.events[run_id].append((sequence, event))
+
+            # Keep buffer size under control - trim oldest events if exceeded
+            if max_events is not None and len(self.events[run_id]) > max_events:
+                self.events[run_id] = self.events[run_id][-max_events:]
+                log_debug(f"Trimmed event buffer for run {run_id} to {max_events} events")
+
+        self._notify(run_id)
+        return sequence
+
+    def read(self, run_id: str, after: Optional[int] = None) -> List[Tuple[int, BufferedEvent]]:
+        with self._lock:
+            events = list(self.events.get(run_id, []))
+        if after is None:
+            return events
+        return [(sequence, event) for sequence, event in events if sequence > after]
+
+    def count(self, run_id: str) -> int:
+        metadata = self.run_metadata.get(run_id)
+        return metadata["next_sequence"] if metadata else 0
+
+    def set_status(self, run_id: str, status: RunStatus) -> None:
+        with self._lock:
+            if run_id not in self.run_metadata:
+                return
+            self.run_metadata[run_id]["status"] = status
+            if status in FINISHED_RUN_STATUSES:
+                self.run_metadata[run_id]["completed_at"] = time()
+        self._notify(run_id)
+
+    def get_status(self, run_id: str) -> Optional[RunStatus]:
+        metadata = self.run_metadata.get(run_id)
+        return metadata["status"] if metadata else None
+
+    def delete(self, run_id: str) -> None:
+        with self._lock:
+            self.events.pop(run_id, None)
+            self.run_metadata.pop(run_id, None)
+
+    def get_finished_runs(self, finished_before: float) -> List[str]:
+        with self._lock:
+            return [
+                run_id
+                for run_id, metadata in self.run_metadata.items()
+                if metadata["status"] in FINISHED_RUN_STATUSES
+                and metadata.get("completed_at", metadata["last_updated"]) < finished_before
+            ]
+
+
+class SqliteEventLog(EventLog):
+    """Stores the events of each run in a SQLite file, shared by the processes of one host.
+
+    Followers in other processes are not notified, they check the file every `poll_interval` seconds instead.
+    """
+
+    def __init__(
+        self,
+        db_file: Optional[str] = None,
+        poll_interval: float = 0.5,
+        table_name: str = "agno_run_events",
+    ):
+        """
+        Args:
+            db_file (Optional[str]): Path to the SQLite file. Defaults to ~/.agno/run_events.db.
+            poll_interval (float): Seconds between checks for events appended by other processes.
+            table_name (str): Name of the events table. The statuses of the runs are stored in `<table_name>_runs`.
+        """
+        super().__init__()
+        self.db_file = Path(db_file) if db_file else Path.home() / ".agno" / "run_events.db"
+        self.poll_interval = poll_interval
+        self.table_name = table_name
+        self.runs_table_name = f"{table_name}_runs"
+
+        self.db_file.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(str(self.db_file), check_same_thread=False, timeout=30)
+        with self._lock, self._connection:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {self.table_name} ("
+                "run_id TEXT NOT NULL, sequence INTEGER NOT NULL, event TEXT NOT NULL, "
+                "PRIMARY KEY (run_id, sequence))"
+            )
+            self._connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {self.runs_table_name} ("
+                "run_id TEXT PRIMARY KEY, status TEXT NOT NULL, next_sequence INTEGER NOT NULL, "
+                "created_at REAL NOT NULL, last_updated REAL NOT NULL, completed_at REAL)"
+            )
+
+    def append(self, run_id: str, event: BufferedEvent, max_events: Optional[int] = None) -> int:
+        serialized_event = _serialize_event(event)
+        current_time = time()
+        with self._lock, self._connection:
+            # Claims the next sequence number of the run, also against other processes
+            self._connection.execute(
+                f"INSERT INTO {self.runs_table_name} (run_id, status, next_sequence, created_at, last_updated) "
+                "VALUES (?, ?, 1, ?, ?) ON CONFLICT(run_id) DO UPDATE SET "
+                "next_sequence = next_sequence + 1, last_updated = excluded.last_updated",
+                (run_id, RunStatus.running.value, current_time, current_time),
+            )
+            row = self._connection.execute(
+                f"SELECT next_sequence FROM {self.runs_table_name} WHERE run_id = ?", (run_id,)
+            ).fetchone()
+            sequence = row[0] - 1
+            self._connection.execute(
+                f"INSERT INTO {self.table_name} (run_id, sequence, event) VALUES (?, ?, ?)",
+                (run_id, sequence, serialized_event),
+            )
+            if max_events is not None and sequence >= max_events:
+                self._connection.execute(
+                    f"DELETE FROM {self.table_name} WHERE run_id = ? AND sequence <= ?",
+                    (run_id, sequence - max_events),
+                )
+
+        self._notify(run_id)
+        return sequence
+
+    def read(self, run_id: str, after: Optional[int] = None) -> List[Tuple[int, BufferedEvent]]:
+        with self._lock:
+            rows = self._connection.execute(
+                f"SELECT sequence, event FROM {self.table_name} WHERE run_id = ? AND sequence > ? ORDER BY sequence",
+                (run_id, -1 if after is None else after),
+            ).fetchall()
+        return [(sequence, _deserialize_event(event)) for sequence, event in rows]
+
+    def count(self, run_id: str) -> int:
+        with self._lock:
+            row = self._connection.execute(
+                f"SELECT next_sequence FROM {self.runs_table_name} WHERE run_id = ?", (run_id,)
+            ).fetchone()
+        return row[0] if row else 0
+
+    def set_status(self, run_id: str, status: RunStatus) -> None:
+        completed_at = time() if status in FINISHED_RUN_STATUSES else None
+        with self._lock, self._connection:
+            self._connection.execute(
+                f"UPDATE {self.runs_table_name} SET status = ?, completed_at = ? WHERE run_id = ?",
+                (status.value, completed_at, run_id),
+            )
+        self._notify(run_id)
+
+    def get_status(self, run_id: str) -> Optional[RunStatus]:
+        with self._lock:
+            row = self._connection.execute(
+                f"SELECT status FROM {self.runs_table_name} WHERE run_id = ?", (run_id,)
+            ).fetchone()
+        return RunStatus(row[0]) if row else None
+
+    def delete(self, run_id: str) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(f"DELETE FROM {self.table_name} WHERE run_id = ?", (run_id,))
+            self._connection.execute(f"DELETE FROM {self.runs_table_name} WHERE run_id = ?", (run_id,))
+
+    def get_finished_runs(self, finished_before: float) -> List[str]:
+        statuses = [status.value for status in FINISHED_RUN_STATUSES]
+        with self._lock:
+            rows = self._connection.execute(
+                f"SELECT run_id FROM {self.runs_table_name} WHERE status IN (?, ?, ?) "
+                "AND COALESCE(completed_at, last_updated) < ?",
+                (*statuses, finished_before),
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    async def wait(self, run_id: str, after: int, timeout: float) -> None:
+        # Appends of this process notify the followers, appends of other processes are found by polling
+        await super().wait(run_id, after, min(timeout, self.poll_interval))
+
+    def close(self) -> None:
+        """Close the connection to the SQLite file."""
+        with self._lock:
+            self._connection.close()
+
+
+class RedisEventLog(EventLog):
+    """Stores the events of each run in Redis, shared by any number of processes and hosts.
+
+    Appends are published on a per-run channel, so followers on every node are notified without polling.
+    """
+
+    def __init__(
+        self,
+        redis_client: Optional["Redis"] = None,
+        db_url: Optional[str] = None,
+        key_prefix: str = "agno:run_events",
+        expire: Optional[int] = 86400,
+    ):
+        """
+        Args:
+            redis_client (Optional[Redis]): Redis client to use.
+            db_url (Optional[str]): Redis URL, used to create a client if `redis_client` is not provided.
+            key_prefix (str): Prefix of the keys and channels used by the log.
+            expire (Optional[int]): Seconds after their last event the keys of a run expire. Defaults to a day.
+        """
+        super().__init__()
+        if redis_client is None:
+            try:
+                from redis import Redis
+            except ImportError:
+                raise ImportError("`redis` not installed. Please install it using `pip install redis`")
+
+            if db_url is None:
+                raise ValueError("One of redis_client or db_url must be provided")
+            redis_client = Redis.from_url(db_url)
+
+        self.redis_client = redis_client
+        self.key_prefix = key_prefix
+        self.expire = expire
+
+    def _events_key(self, run_id: str) -> str:
+        return f"{self.key_prefix}:{run_id}:events"
+
+    def _run_key(self, run_id: str) -> str:
+        return f"{self.key_prefix}:{run_id}:run"
+
+    def _channel(self, run_id: str) -> str:
+        return f"{self.key_prefix}:{run_id}:notify"
+
+    def _finished_key(self) -> str:
+        return f"{self.key_prefix}:finished"
+
+    def append(self, run_id: str, event: BufferedEvent, max_events: Optional[int] = None) -> int:
+        serialized_event = _serialize_event(event)
+        current_time = time()
+        run_key = self._run_key(run_id)
+        events_key = self._events_key(run_id)
+
+        sequence = int(self.redis_client.hincrby(run_key, "next_sequence", 1)) - 1
+        pipeline = self.redis_client.pipeline()
+        # The sequence number keeps members unique, and orders them as their score
+        pipeline.zadd(events_key, {json.dumps([sequence, serialized_event]): sequence})
+        pipeline.hsetnx(run_key, "status", RunStatus.running.value)
+        pipeline.hsetnx(run_key, "created_at", current_time)
+        pipeline.hset(run_key, "last_updated", current_time)
+        if max_events is not None and sequence >= max_events:
+            pipeline.zremrangebyscore(events_key, "-inf", sequence - max_events)
+        if self.expire is not None:
+            pipeline.expire(events_key, self.expire)
+            pipeline.expire(run_key, self.expire)
+        pipeline.publish(self._channel(run_id), sequence)
+        pipeline.execute()
+
+        self._notify(run_id)
+        return sequence
+
+    def read(self, run_id: str, after: Optional[int] = None) -> List[Tuple[int, BufferedEvent]]:
+        min_score = "-inf" if after is None else f"({after}"
+        members: List[Any] = self.redis_client.zrangebyscore(self._events_key(run_id), min_score, "+inf")  # type: ignore
+        events = []
+        for member in members:
+            sequence, serialized_event = json.loads(member)
+            events.append((sequence, _deserialize_event(serialized_event)))
+        return events
+
+    def count(self, run_id: str) -> int:
+        next_sequence = self.redis_client.hget(self._run_key(run_id), "next_sequence")
+        return int(next_sequence) if next_sequence is not None else 0
+
+    def set_status(self, run_id: str, status: RunStatus) -> None:
+        run_key = self._run_key(run_id)
+        if not self.redis_client.exists(run_key):
+            return
+        pipeline = self.redis_client.pipeline()
+        pipeline.hset(run_key, "status", status.value)
+        if status in FINISHED_RUN_STATUSES:
+            pipeline.zadd(self._finished_key(), {run_id: time()})
+        pipeline.publish(self._channel(run_id), status.value)
+        pipeline.execute()
+        self._notify(run_id)
+
+    def get_status(self, run_id: str) -> Optional[RunStatus]:
+        status = self.redis_client.hget(self._run_key(run_id), "status")
+        if status is None:
+            return None
+        return RunStatus(status.decode("utf-8") if isinstance(status, bytes) else status)
+
+    def delete(self, run_id: str) -> None:
+        pipeline = self.redis_client.pipeline()
+        pipeline.delete(self._events_key(run_id), self._run_key(run_id))
+        pipeline.zrem(self._finished_key(), run_id)
+        pipeline.execute()
+
+    def get_finished_runs(self, finished_before: float) -> List[str]:
+        run_ids: List[Any] = self.redis_client.zrangebyscore(self._finished_key(), "-inf", f"({finished_before}")  # type: ignore
+        return [run_id.decode("utf-8") if isinstance(run_id, bytes) else run_id for run_id in run_ids]
+
+    async def wait(self, run_id: str, after: int, timeout: float) -> None:
+        pubsub = self.redis_client.pubsub(ignore_subscribe_messages=True)
+        try:
+            await asyncio.to_thread(pubsub.subscribe, self._channel(run_id))
+            # Checked once subscribed, so an event appended in between is not missed
+            if await self._run(self._has_news, run_id, after):
+                return
+            deadline = time() + timeout
+            while time() < deadline:
+                message = await asyncio.to_thread(pubsub.get_message, timeout=max(min(deadline - time(), 1.0), 0.0))
+                if message is not None:
+                    return
+        finally:
+            await asyncio.to_thread(pubsub.close)
@@ -9,19 +9,21 @@ This module provides various manager classes for AgentOS:
 These managers are used by agents, teams, and workflows for background WebSocket execution.
 """
 
+import asyncio
 import json
 from dataclasses import dataclass
 from time import time
-from typing import Any, Dict, List, Optional, Union
+from typing import AsyncIterator, Dict, List, Optional, Set, Tuple, Union
 
 from starlette.websockets import WebSocket
 
+from agno.os.event_log import FINISHED_RUN_STATUSES, EventLog, InMemoryEventLog
 from agno.run.agent import RunOutputEvent
 from agno.run.base import RunStatus
 from agno.run.team import TeamRunOutputEvent
 from agno.run.workflow import WorkflowRunOutputEvent
 from agno.utils.log import log_debug, log_warning, logger
-from agno.utils.serialize import json_serializer
+from agno.utils.serialize import json_dumps_bytes
 
 
 @dataclass
@@ -78,7 +80,10 @@ class WebSocketHandler:
             if run_id and "run_id" not in data:
                 data["run_id"] = run_id
 
-            await self.websocket.send_text(self.format_sse_event(json.dumps(data, default=json_serializer)))
+            # The event type is read from the data, instead of parsing the serialized JSON again
+            event_type = data.get("event", "message")
+            json_data = json_dumps_bytes(data).decode("utf-8")
+            await self.websocket.send_text(f"event: {event_type}\ndata: {json_data}\n\n")
 
         except RuntimeError as e:
             if "websocket.close" in str(e).lower() or "already completed" in str(e).lower():
@@ -108,6 +113,8 @@ class WebSocketManager:
         self.active_connections = active_connections or {}
         # Track authentication state for each websocket
         self.authenticated_connections = {}
+        # Tasks forwarding the events of runs executing on other workers: {websocket: tasks}
+        self.forwarding_tasks: Dict[WebSocket, Set[asyncio.Task]] = {}  # type: ignore[type-arg]
 
     async def connect(self, websocket: WebSocket, requires_auth: bool = True):
         """Accept WebSocket connection"""
@@ -174,12 +181,28 @@ class WebSocketManager:
                 del self.authenticated_connections[websocket]
             logger.debug(f"WebSocket disconnected for run_id: {run_id}")
 
+    def add_forwarding_task(self, websocket: WebSocket, task: "asyncio.Task") -> None:  # type: ignore[type-arg]
+        """Keep a task forwarding events to a WebSocket, until it finishes or the WebSocket disconnects"""
+        tasks = self.forwarding_tasks.setdefault(websocket, set())
+        tasks.add(task)
+
+        def _discard(finished_task: "asyncio.Task") -> None:  # type: ignore[type-arg]
+            tasks.discard(finished_task)
+            if not tasks and self.forwarding_tasks.get(websocket) is tasks:
+                del self.forwarding_tasks[websocket]
+
+        task.add_done_callback(_discard)
+
     async def disconnect_websocket(self, websocket: WebSocket):
         """Remove WebSocket connection and clean up all associated state"""
         # Remove from authenticated connections
         if websocket in self.authenticated_connections:
             del self.authenticated_connections[websocket]
 
+        # Stop forwarding events to the connection
+        for task in list(self.forwarding_tasks.pop(websocket, ())):
+            task.cancel()
+
         # Remove from active connections
         runs_to_remove = [run_id for run_id, ws in self.active_connections.items() if ws == websocket]
         for run_id in runs_to_remove:
@@ -194,53 +217,49 @@ class WebSocketManager:
 
 class EventsBuffer:
     """
-    In-memory buffer for events to support WebSocket reconnection.
+    Buffer for events to support WebSocket reconnection.
 
     Stores recent events for active runs (agents, teams, workflows), allowing clients
     to catch up on missed events when reconnecting after disconnection or page refresh.
 
     Buffers all event types: RunOutputEvent (agents), TeamRunOutputEvent (teams),
     and WorkflowRunOutputEvent (workflows).
+
+    Events are stored in an EventLog, in memory by default. With a SqliteEventLog or RedisEventLog,
+    clients can resume a run on any AgentOS worker, not only the one executing it.
     """
 
-    def __init__(self, max_events_per_run: int = 1000, cleanup_interval: int = 3600):
+    def __init__(
+        self,
+        max_events_per_run: int = 1000,
+        cleanup_interval: int = 3600,
+        event_log: Optional[EventLog] = None,
+    ):
         """
         Initialize the event buffer.
 
         Args:
             max_events_per_run: Maximum number of events to store per run (prevents memory bloat)
             cleanup_interval: How long (in seconds) to keep completed runs in buffer
+            event_log: Backend storing the events. Defaults to an InMemoryEventLog.
         """
-        # Store all event types (WorkflowRunOutputEvent, RunOutputEvent, TeamRunOutputEvent)
-        self.events: Dict[str, List[Union[WorkflowRunOutputEvent, RunOutputEvent, TeamRunOutputEvent]]] = {}
-        self.run_metadata: Dict[str, Dict[str, Any]] = {}  # {run_id: {status, last_updated, etc}}
+        self.event_log: EventLog = event_log or InMemoryEventLog()
         self.max_events_per_run = max_events_per_run
         self.cleanup_interval = cleanup_interval
+        # Runs whose events are added by this process
+        self.local_runs: Set[str] = set()
 
     def add_event(self, run_id: str, event: Union[WorkflowRunOutputEvent, RunOutputEvent, TeamRunOutputEvent]) -> int:
         """Add event to buffer for a specific run and return the event index (handles workflow, agent, and team events)"""
-        current_time = time()
+        self.local_runs.add(run_id)
+        return self.event_log.append(run_id, event, max_events=self.max_events_per_run)
 
-        if run_id not in self.events:
-            self.events[run_id] = []
-            self.run_metadata[run_id] = {
-                "status": RunStatus.running,
-                "created_at": current_time,
-                "last_updated": current_time,
-            }
-
-        self.events[run_id].append(event)
-        self.run_metadata[run_id]["last_updated"] = current_time
-
-        # Get the index of the event we just added (before potential trimming)
-        event_index = len(self.events[run_id]) - 1
-
-        # Keep buffer size under control - trim oldest events if exceeded
-        if len(self.events[run_id]) > self.max_events_per_run:
-            self.events[run_id] = self.events[run_id][-self.max_events_per_run :]
-            log_debug(f"Trimmed event buffer for run {run_id} to {self.max_events_per_run} events")
-
-        return event_index
+    async def aadd_event(
+        self, run_id: str, event: Union[WorkflowRunOutputEvent, RunOutputEvent, TeamRunOutputEvent]
+    ) -> int:
+        """Async version of add_event, which does not block the event loop on the event log I/O"""
+        self.local_runs.add(run_id)
+        return await self.event_log.aappend(run_id, event, max_events=self.max_events_per_run)
 
     def get_events(
         self, run_id: str, last_event_index: Optional[int] = None
@@ -255,53 +274,79 @@ class EventsBuffer:
         Returns:
             List of events since last_event_index, or all events if None
         """
-        events = self.events.get(run_id, [])
+        return [event for _, event in self.get_indexed_events(run_id, last_event_index)]
 
-        if last_event_index is None:
-            # Client has no events, send all
-            return events
+    def get_indexed_events(
+        self, run_id: str, last_event_index: Optional[int] = None
+    ) -> List[Tuple[int, Union[WorkflowRunOutputEvent, RunOutputEvent, TeamRunOutputEvent]]]:
+        """Get events since the last received event index, with their event index"""
+        return self.event_log.read(run_id, after=last_event_index)
 
-        # Client has events up to last_event_index, send new ones
-        # last_event_index is 0-based, so we want events starting from index + 1
-        if last_event_index >= len(events) - 1:
-            # Client is caught up
-            return []
+    async def aget_indexed_events(
+        self, run_id: str, last_event_index: Optional[int] = None
+    ) -> List[Tuple[int, Union[WorkflowRunOutputEvent, RunOutputEvent, TeamRunOutputEvent]]]:
+        """Async version of get_indexed_events"""
+        return await self.event_log.aread(run_id, after=last_event_index)
 
-        return events[last_event_index + 1 :]
+    async def follow_events(
+        self, run_id: str, last_event_index: Optional[int] = None, wait_timeout: float = 30
+    ) -> AsyncIterator[Tuple[int, Union[WorkflowRunOutputEvent, RunOutputEvent, TeamRunOutputEvent]]]:
+        """
+        Yield the events of a run after the last received event index, as they are added, until the run finishes.
+
+        Args:
+            run_id: The run ID (agent/team/workflow)
+            last_event_index: Index of last event received by client (0-based), or None to start from the first event
+            wait_timeout: Seconds to wait for a notification before checking the event log again
+
+        Yields:
+            Tuples of the event index and the event
+        """
+        last_index = -1 if last_event_index is None else last_event_index
+        while True:
+            # Read before checking for new events, so the events added before the run finished are not missed
+            status = await self.event_log.aget_status(run_id)
+            for event_index, event in await self.event_log.aread(run_id, after=last_index):
+                yield event_index, event
+                last_index = event_index
+            if status is None or status in FINISHED_RUN_STATUSES:
+                return
+            await self.event_log.wait(run_id, after=last_index, timeout=wait_timeout)
 
     def get_event_count(self, run_id: str) -> int:
         """Get the current number of events for a run"""
-        return len(self.events.get(run_id, []))
+        return self.event_log.count(run_id)
+
+    async def aget_event_count(self, run_id: str) -> int:
+        """Async version of get_event_count"""
+        return await self.event_log.acount(run_id)
 
     def set_run_completed(self, run_id: str, status: RunStatus) -> None:
         """Mark a run as completed/cancelled/error for future cleanup"""
-        if run_id in self.run_metadata:
-            self.run_metadata[run_id]["status"] = status
-            self.run_metadata[run_id]["completed_at"] = time()
-            log_debug(f"Marked run {run_id} as {status}")
+        self.event_log.set_status(run_id, status)
+        self.local_runs.discard(run_id)
+        log_debug(f"Marked run {run_id} as {status}")
 
         # Trigger cleanup of old completed runs
         self.cleanup_runs()
 
+    async def aset_run_completed(self, run_id: str, status: RunStatus) -> None:
+        """Async version of set_run_completed"""
+        await self.event_log.aset_status(run_id, status)
+        self.local_runs.discard(run_id)
+        log_debug(f"Marked run {run_id} as {status}")
+
+        # Trigger cleanup of old completed runs
+        await self.acleanup_runs()
+
     def cleanup_run(self, run_id: str) -> None:
         """Remove buffer for a completed run (called after retention period)"""
-        if run_id in self.events:
-            del self.events[run_id]
-        if run_id in self.run_metadata:
-            del self.run_metadata[run_id]
+        self.event_log.delete(run_id)
         log_debug(f"Cleaned up event buffer for run {run_id}")
 
     def cleanup_runs(self) -> None:
         """Clean up runs that have been completed for longer than cleanup_interval"""
-        current_time = time()
-        runs_to_cleanup = []
-
-        for run_id, metadata in self.run_metadata.items():
-            # Only cleanup completed runs
-            if metadata["status"] in [RunStatus.completed, RunStatus.error, RunStatus.cancelled]:
-                completed_at = metadata.get("completed_at", metadata["last_updated"])
-                if current_time - completed_at > self.cleanup_interval:
-                    runs_to_cleanup.append(run_id)
+        runs_to_cleanup = self.event_log.get_finished_runs(finished_before=time() - self.cleanup_interval)
 
         for run_id in runs_to_cleanup:
             self.cleanup_run(run_id)
@@ -309,10 +354,24 @@ class EventsBuffer:
         if runs_to_cleanup:
             log_debug(f"Cleaned up {len(runs_to_cleanup)} old run buffers")
 
+    async def acleanup_runs(self) -> None:
+        """Async version of cleanup_runs"""
+        runs_to_cleanup = await self.event_log.aget_finished_runs(finished_before=time() - self.cleanup_interval)
+
+        for run_id in runs_to_cleanup:
+            await self.event_log.adelete(run_id)
+            log_debug(f"Cleaned up event buffer for run {run_id}")
+
+        if runs_to_cleanup:
+            log_debug(f"Cleaned up {len(runs_to_cleanup)} old run buffers")
+
     def get_run_status(self, run_id: str) -> Optional[RunStatus]:
         """Get the status of a run from metadata"""
-        metadata = self.run_metadata.get(run_id)
-        return metadata["status"] if metadata else None
+        return self.event_log.get_status(run_id)
+
+    async def aget_run_status(self, run_id: str) -> Optional[RunStatus]:
+        """Async version of get_run_status"""
+        return await self.event_log.aget_status(run_id)
 
 
 # Global manager instances
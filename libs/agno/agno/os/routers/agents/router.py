@@ -17,7 +17,7 @@ from fastapi.responses import JSONResponse, StreamingResponse
 
 from agno.agent.agent import Agent
 from agno.agent.remote import RemoteAgent
-from agno.db.base import BaseDb
+from agno.db.base import BaseDb, SessionType
 from agno.exceptions import InputCheckError, OutputCheckError
 from agno.media import Audio, Image, Video
 from agno.media import File as FileMedia
@@ -35,6 +35,8 @@ from agno.os.utils import (
     format_sse_event,
     get_agent_by_id,
     get_request_kwargs,
+    get_stored_run,
+    list_stored_runs,
     process_audio,
     process_document,
     process_image,
@@ -731,17 +733,18 @@ def get_agent_router(
         run_id: str,
         session_id: str = Query(..., description="Session ID for the run"),
     ):
-        agent = get_agent_by_id(agent_id=agent_id, agents=os.agents, db=os.db, registry=os.registry, create_fresh=True)
+        # Only the agent's db is needed, so the agent is not copied
+        agent = get_agent_by_id(agent_id=agent_id, agents=os.agents, db=os.db, registry=os.registry)
         if agent is None:
             raise HTTPException(status_code=404, detail="Agent not found")
         if isinstance(agent, RemoteAgent):
             raise HTTPException(status_code=400, detail="Run polling is not supported for remote agents")
 
-        run_output = await agent.aget_run_output(run_id=run_id, session_id=session_id)
-        if run_output is None:
+        run = await get_stored_run(agent.db, run_id=run_id, session_id=session_id, session_type=SessionType.AGENT)
+        if run is None:
             raise HTTPException(status_code=404, detail="Run not found")
 
-        return run_output.to_dict()
+        return run
 
     @router.get(
         "/agents/{agent_id}/runs",
@@ -762,29 +765,22 @@ def get_agent_router(
         agent_id: str,
         session_id: str = Query(..., description="Session ID to list runs for"),
         status: Optional[str] = Query(None, description="Filter by run status (PENDING, RUNNING, COMPLETED, ERROR)"),
+        limit: Optional[int] = Query(
+            None, ge=1, description="Maximum number of runs to return. The most recent runs are kept."
+        ),
     ):
         from agno.os.schema import RunSchema
 
-        agent = get_agent_by_id(agent_id=agent_id, agents=os.agents, db=os.db, registry=os.registry, create_fresh=True)
+        agent = get_agent_by_id(agent_id=agent_id, agents=os.agents, db=os.db, registry=os.registry)
         if agent is None:
             raise HTTPException(status_code=404, detail="Agent not found")
         if isinstance(agent, RemoteAgent):
             raise HTTPException(status_code=400, detail="Run listing is not supported for remote agents")
 
-        # Load the session to get its runs
-        from agno.agent._storage import aread_or_create_session
-
-        session = await aread_or_create_session(agent, session_id=session_id)
-        runs = session.runs or []
-
-        # Convert to dicts and optionally filter by status
-        result = []
-        for run in runs:
-            run_dict = run.to_dict()
-            if status and run_dict.get("status") != status:
-                continue
-            result.append(RunSchema.from_dict(run_dict))
-
-        return result
+        # Runs are filtered by the database, without loading the session
+        runs = await list_stored_runs(
+            agent.db, session_id=session_id, session_type=SessionType.AGENT, status=status or None, limit=limit
+        )
+        return [RunSchema.from_dict(run) for run in runs]
 
     return router
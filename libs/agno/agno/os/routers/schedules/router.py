@@ -15,6 +15,7 @@ from agno.os.routers.schedules.schema import (
     ScheduleUpdate,
 )
 from agno.os.schema import PaginatedResponse, PaginationInfo
+from agno.scheduler.poller import notify_schedule_change
 from agno.utils.log import log_info
 
 # Valid DB method names that _db_call can invoke
@@ -65,10 +66,15 @@ def get_schedule_router(os_db: Any, settings: Any) -> APIRouter:
             raise HTTPException(status_code=503, detail="Scheduler not supported by the configured database")
         try:
             if asyncio.iscoroutinefunction(fn):
-                return await fn(*args, **kwargs)
-            return fn(*args, **kwargs)
+                result = await fn(*args, **kwargs)
+            else:
+                result = fn(*args, **kwargs)
         except NotImplementedError:
             raise HTTPException(status_code=503, detail="Scheduler not supported by the configured database")
+        # Wake the poller, so a new or rescheduled run is not picked up a poll interval late
+        if method_name in ("create_schedule", "update_schedule"):
+            notify_schedule_change(os_db)
+        return result
 
     # ------------------------------------------------------------------
     # Endpoints
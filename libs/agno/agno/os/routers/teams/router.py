@@ -14,7 +14,7 @@ from fastapi import (
 )
 from fastapi.responses import JSONResponse, StreamingResponse
 
-from agno.db.base import BaseDb
+from agno.db.base import BaseDb, SessionType
 from agno.exceptions import InputCheckError, OutputCheckError
 from agno.media import Audio, Image, Video
 from agno.media import File as FileMedia
@@ -31,7 +31,9 @@ from agno.os.settings import AgnoAPISettings
 from agno.os.utils import (
     format_sse_event,
     get_request_kwargs,
+    get_stored_run,
     get_team_by_id,
+    list_stored_runs,
     process_audio,
     process_document,
     process_image,
@@ -597,17 +599,18 @@ def get_team_router(
         run_id: str,
         session_id: str = Query(..., description="Session ID for the run"),
     ):
-        team = get_team_by_id(team_id=team_id, teams=os.teams, db=os.db, registry=registry, create_fresh=True)
+        # Only the team's db is needed, so the team is not copied
+        team = get_team_by_id(team_id=team_id, teams=os.teams, db=os.db, registry=registry)
         if team is None:
             raise HTTPException(status_code=404, detail="Team not found")
         if isinstance(team, RemoteTeam):
             raise HTTPException(status_code=400, detail="Run polling is not supported for remote teams")
 
-        run_output = await team.aget_run_output(run_id=run_id, session_id=session_id)
-        if run_output is None:
+        run = await get_stored_run(team.db, run_id=run_id, session_id=session_id, session_type=SessionType.TEAM)
+        if run is None:
             raise HTTPException(status_code=404, detail="Run not found")
 
-        return run_output.to_dict()
+        return run
 
     @router.get(
         "/teams/{team_id}/runs",
@@ -628,26 +631,22 @@ def get_team_router(
         team_id: str,
         session_id: str = Query(..., description="Session ID to list runs for"),
         status: Optional[str] = Query(None, description="Filter by run status (PENDING, RUNNING, COMPLETED, ERROR)"),
+        limit: Optional[int] = Query(
+            None, ge=1, description="Maximum number of runs to return. The most recent runs are kept."
+        ),
     ):
         from agno.os.schema import TeamRunSchema
-        from agno.team._storage import _aread_or_create_session
 
-        team = get_team_by_id(team_id=team_id, teams=os.teams, db=os.db, registry=registry, create_fresh=True)
+        team = get_team_by_id(team_id=team_id, teams=os.teams, db=os.db, registry=registry)
         if team is None:
             raise HTTPException(status_code=404, detail="Team not found")
         if isinstance(team, RemoteTeam):
             raise HTTPException(status_code=400, detail="Run listing is not supported for remote teams")
 
-        session = await _aread_or_create_session(team, session_id=session_id)
-        runs = session.runs or []
-
-        result = []
-        for run in runs:
-            run_dict = run.to_dict()
-            if status and run_dict.get("status") != status:
-                continue
-            result.append(TeamRunSchema.from_dict(run_dict))
-
-        return result
+        # Runs are filtered by the database, without loading the session
+        runs = await list_stored_runs(
+            team.db, session_id=session_id, session_type=SessionType.TEAM, status=status or None, limit=limit
+        )
+        return [TeamRunSchema.from_dict(run) for run in runs]
 
     return router
@@ -1,3 +1,4 @@
+import asyncio
 import json
 from typing import TYPE_CHECKING, Any, AsyncGenerator, Dict, List, Optional, Union
 from uuid import uuid4
@@ -15,7 +16,7 @@ from fastapi import (
 from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel
 
-from agno.db.base import BaseDb
+from agno.db.base import BaseDb, SessionType
 from agno.exceptions import InputCheckError, OutputCheckError
 from agno.os.auth import (
     get_auth_token_from_request,
@@ -37,6 +38,7 @@ from agno.os.settings import AgnoAPISettings
 from agno.os.utils import (
     format_sse_event,
     get_request_kwargs,
+    get_stored_run,
     get_workflow_by_id,
 )
 from agno.run.base import RunStatus
@@ -123,6 +125,25 @@ async def handle_workflow_via_websocket(websocket: WebSocket, message: dict, os:
         await websocket.send_text(json.dumps(error_payload))
 
 
+async def _send_buffered_event(websocket: WebSocket, run_id: str, event_index: int, buffered_event: Any) -> None:
+    # Convert event to dict and add event_index
+    event_dict = buffered_event.model_dump() if hasattr(buffered_event, "model_dump") else buffered_event.to_dict()
+    event_dict["event_index"] = event_index
+    if "run_id" not in event_dict:
+        event_dict["run_id"] = run_id
+
+    await websocket.send_text(json.dumps(event_dict))
+
+
+async def _forward_buffered_events(websocket: WebSocket, run_id: str, last_event_index: Optional[int]) -> None:
+    """Send the events a run executing on another worker adds to the event log, until the run finishes."""
+    try:
+        async for event_index, buffered_event in event_buffer.follow_events(run_id, last_event_index):
+            await _send_buffered_event(websocket, run_id, event_index, buffered_event)
+    except Exception as e:
+        log_debug(f"Stopped forwarding events of workflow run {run_id}: {e}")
+
+
 async def handle_workflow_subscription(websocket: WebSocket, message: dict, os: "AgentOS"):
     """
     Handle subscription/reconnection to an existing workflow run.
@@ -140,7 +161,7 @@ async def handle_workflow_subscription(websocket: WebSocket, message: dict, os:
             return
 
         # Check if run exists in event buffer
-        buffer_status = event_buffer.get_run_status(run_id)
+        buffer_status = await event_buffer.aget_run_status(run_id)
 
         if buffer_status is None:
             # Run not in buffer - check database
@@ -198,7 +219,7 @@ async def handle_workflow_subscription(websocket: WebSocket, message: dict, os:
         # Run is in buffer (still active or recently completed)
         if buffer_status in [RunStatus.completed, RunStatus.error, RunStatus.cancelled]:
             # Run finished - send all events from buffer
-            all_events = event_buffer.get_events(run_id, last_event_index=None)
+            all_events = await event_buffer.aget_indexed_events(run_id, last_event_index=None)
 
             await websocket.send_text(
                 json.dumps(
@@ -213,21 +234,13 @@ async def handle_workflow_subscription(websocket: WebSocket, message: dict, os:
             )
 
             # Send all events
-            for idx, buffered_event in enumerate(all_events):
-                # Convert event to dict and add event_index
-                event_dict = (
-                    buffered_event.model_dump() if hasattr(buffered_event, "model_dump") else buffered_event.to_dict()
-                )
-                event_dict["event_index"] = idx
-                if "run_id" not in event_dict:
-                    event_dict["run_id"] = run_id
-
-                await websocket.send_text(json.dumps(event_dict))
+            for event_index, buffered_event in all_events:
+                await _send_buffered_event(websocket, run_id, event_index, buffered_event)
             return
 
         # Run is still active - send missed events and subscribe to new ones
-        missed_events = event_buffer.get_events(run_id, last_event_index)
-        current_event_count = event_buffer.get_event_count(run_id)
+        missed_events = await event_buffer.aget_indexed_events(run_id, last_event_index)
+        current_event_count = await event_buffer.aget_event_count(run_id)
 
         if missed_events:
             # Send catch-up notification
@@ -245,20 +258,18 @@ async def handle_workflow_subscription(websocket: WebSocket, message: dict, os:
             )
 
             # Send missed events
-            start_index = (last_event_index + 1) if last_event_index is not None else 0
-            for idx, buffered_event in enumerate(missed_events):
-                # Convert event to dict and add event_index
-                event_dict = (
-                    buffered_event.model_dump() if hasattr(buffered_event, "model_dump") else buffered_event.to_dict()
-                )
-                event_dict["event_index"] = start_index + idx
-                if "run_id" not in event_dict:
-                    event_dict["run_id"] = run_id
+            for event_index, buffered_event in missed_events:
+                await _send_buffered_event(websocket, run_id, event_index, buffered_event)
+                last_event_index = event_index
 
-                await websocket.send_text(json.dumps(event_dict))
-
-        # Register websocket for future events
-        await websocket_manager.register_websocket(run_id, websocket)
+        if run_id in event_buffer.local_runs:
+            # Register websocket for future events
+            await websocket_manager.register_websocket(run_id, websocket)
+        else:
+            # The run executes on another worker: follow its events in the shared event log
+            forwarding_task = asyncio.create_task(_forward_buffered_events(websocket, run_id, last_event_index))
+            # Kept until the run finishes, and cancelled when the websocket disconnects
+            websocket_manager.add_forwarding_task(websocket, forwarding_task)
 
         # Send subscription confirmation
         await websocket.send_text(
@@ -777,18 +788,17 @@ def get_workflow_router(
         run_id: str,
         session_id: str = Query(..., description="Session ID for the run"),
     ):
-        workflow = get_workflow_by_id(
-            workflow_id=workflow_id, workflows=os.workflows, db=os.db, registry=os.registry, create_fresh=True
-        )
+        # Only the workflow's db is needed, so the workflow is not copied
+        workflow = get_workflow_by_id(workflow_id=workflow_id, workflows=os.workflows, db=os.db, registry=os.registry)
         if workflow is None:
             raise HTTPException(status_code=404, detail="Workflow not found")
         if isinstance(workflow, RemoteWorkflow):
             raise HTTPException(status_code=400, detail="Run polling is not supported for remote workflows")
 
-        run_output = await workflow.aget_run_output(run_id=run_id, session_id=session_id)
-        if run_output is None:
+        run = await get_stored_run(workflow.db, run_id=run_id, session_id=session_id, session_type=SessionType.WORKFLOW)
+        if run is None:
             raise HTTPException(status_code=404, detail="Run not found")
 
-        return run_output.to_dict()
+        return run
 
     return router
@@ -8,7 +8,7 @@ from pydantic import BaseModel, create_model
 from starlette.middleware.cors import CORSMiddleware
 
 from agno.agent import Agent, RemoteAgent
-from agno.db.base import AsyncBaseDb, BaseDb
+from agno.db.base import AsyncBaseDb, BaseDb, SessionType
 from agno.knowledge.knowledge import Knowledge
 from agno.media import Audio, Image, Video
 from agno.media import File as FileMedia
@@ -70,8 +70,21 @@ async def get_request_kwargs(request: Request, endpoint_func: Callable) -> Dict[
     form_data = await request.form()
     sig = inspect.signature(endpoint_func)
     known_fields = set(sig.parameters.keys())
-    kwargs: Dict[str, Any] = {key: value for key, value in form_data.items() if key not in known_fields}
+    return parse_run_kwargs({key: value for key, value in form_data.items() if key not in known_fields})
 
+
+def parse_run_kwargs(kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """Parse the extra form data fields of a run request into kwargs for the Agent/Team/Workflow run methods.
+
+    JSON parameters are deserialized, and "true", "false", "null" and "none" strings are converted.
+    See get_request_kwargs for the supported parameters.
+
+    Args:
+        kwargs: The extra form data fields, as strings. The dictionary is updated in place.
+
+    Returns:
+        A dictionary of kwargs to pass to Agent/Team run methods
+    """
     # Handle JSON parameters. They are passed as strings and need to be deserialized.
     if session_state := kwargs.get("session_state"):
         try:
@@ -268,6 +281,32 @@ async def get_db(
     return next(db for dbs in dbs.values() for db in dbs)
 
 
+async def get_stored_run(
+    db: Optional[Union[BaseDb, AsyncBaseDb]], run_id: str, session_id: str, session_type: SessionType
+) -> Optional[Dict[str, Any]]:
+    """Read a stored run as a dictionary, without loading the component or its session."""
+    if db is None:
+        return None
+    if isinstance(db, AsyncBaseDb):
+        return await db.get_run(run_id=run_id, session_id=session_id, session_type=session_type)
+    return db.get_run(run_id=run_id, session_id=session_id, session_type=session_type)
+
+
+async def list_stored_runs(
+    db: Optional[Union[BaseDb, AsyncBaseDb]],
+    session_id: str,
+    session_type: SessionType,
+    status: Optional[str] = None,
+    limit: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """Read the stored runs of a session as dictionaries, without loading the component or its session."""
+    if db is None:
+        return []
+    if isinstance(db, AsyncBaseDb):
+        return await db.list_runs(session_id=session_id, session_type=session_type, status=status, limit=limit)
+    return db.list_runs(session_id=session_id, session_type=session_type, status=status, limit=limit)
+
+
 def _generate_knowledge_id(name: str, db_id: str, table_name: str) -> str:
     """Generate a deterministic unique ID for a knowledge instance.
 
@@ -513,14 +552,14 @@ def get_agent_by_id(
 ) -> Optional[Union[Agent, RemoteAgent]]:
     """Get an agent by ID, optionally creating a fresh instance for request isolation.
 
-    When create_fresh=True, creates a new agent instance using deep_copy() to prevent
-    state contamination between concurrent requests. The new instance shares heavy
-    resources (db, model, MCP tools) but has isolated mutable state.
+    When create_fresh=True, creates a new agent instance using shallow_copy() to prevent
+    state contamination between concurrent requests. The new instance shares the agent
+    configuration (db, model, tools, knowledge) but has isolated mutable state.
 
     Args:
         agent_id: The agent ID to look up
         agents: List of agents to search
-        create_fresh: If True, creates a new instance using deep_copy()
+        create_fresh: If True, creates a new instance using shallow_copy()
 
     Returns:
         The agent instance (shared or fresh copy based on create_fresh)
@@ -533,11 +572,8 @@ def get_agent_by_id(
         for agent in agents:
             if agent.id == agent_id:
                 if create_fresh and isinstance(agent, Agent):
-                    fresh_agent = agent.deep_copy()
                     # Clear team/workflow context — this is a standalone agent copy
-                    fresh_agent.team_id = None
-                    fresh_agent.workflow_id = None
-                    return fresh_agent
+                    return agent.shallow_copy(update={"team_id": None, "workflow_id": None})
                 return agent
 
     # Try to get the agent from the database
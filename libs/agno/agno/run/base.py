@@ -1,4 +1,4 @@
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass
 from enum import Enum
 from typing import Any, Dict, List, Optional, Type, Union
 
@@ -10,6 +10,7 @@ from agno.models.message import Citations, Message, MessageReferences
 from agno.models.metrics import Metrics
 from agno.reasoning.step import ReasoningStep
 from agno.utils.log import log_error
+from agno.utils.serialize import dataclass_to_dict, json_dumps_bytes
 
 
 @dataclass
@@ -33,36 +34,36 @@ class RunContext:
     members: Optional[List[Any]] = None
 
 
+# Fields of run events converted by their own serializers in BaseRunOutputEvent.to_dict()
+_EVENT_SERIALIZED_FIELDS = frozenset(
+    {
+        "tools",
+        "tool",
+        "metadata",
+        "image",
+        "images",
+        "videos",
+        "audio",
+        "response_audio",
+        "citations",
+        "member_responses",
+        "reasoning_messages",
+        "reasoning_steps",
+        "references",
+        "additional_input",
+        "session_summary",
+        "metrics",
+        "run_input",
+        "requirements",
+        "memories",
+    }
+)
+
+
 @dataclass
 class BaseRunOutputEvent:
     def to_dict(self) -> Dict[str, Any]:
-        _dict = {
-            k: v
-            for k, v in asdict(self).items()
-            if v is not None
-            and k
-            not in [
-                "tools",
-                "tool",
-                "metadata",
-                "image",
-                "images",
-                "videos",
-                "audio",
-                "response_audio",
-                "citations",
-                "member_responses",
-                "reasoning_messages",
-                "reasoning_steps",
-                "references",
-                "additional_input",
-                "session_summary",
-                "metrics",
-                "run_input",
-                "requirements",
-                "memories",
-            ]
-        }
+        _dict = dataclass_to_dict(self, exclude=_EVENT_SERIALIZED_FIELDS)
 
         if hasattr(self, "metadata") and self.metadata is not None:
             _dict["metadata"] = self.metadata
@@ -168,10 +169,22 @@ class BaseRunOutputEvent:
             raise
 
         if indent is None:
+            if tuple(separators) == (",", ":"):
+                return json_dumps_bytes(_dict).decode("utf-8")
             return json.dumps(_dict, separators=separators, default=json_serializer, ensure_ascii=False)
         else:
             return json.dumps(_dict, indent=indent, separators=separators, default=json_serializer, ensure_ascii=False)
 
+    def to_json_bytes(self) -> bytes:
+        """Serialize the event to compact UTF-8 encoded JSON, using orjson when it is installed."""
+        try:
+            _dict = self.to_dict()
+        except Exception:
+            log_error("Failed to convert response event to json", exc_info=True)
+            raise
+
+        return json_dumps_bytes(_dict)
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]):
         tool = data.pop("tool", None)
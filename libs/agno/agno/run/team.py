@@ -1,4 +1,4 @@
-from dataclasses import asdict, dataclass, field
+from dataclasses import dataclass, field
 from enum import Enum
 from time import time
 from typing import Any, Dict, List, Optional, Sequence, Union
@@ -21,6 +21,7 @@ from agno.utils.media import (
     reconstruct_response_audio,
     reconstruct_videos,
 )
+from agno.utils.serialize import dataclass_to_dict
 
 
 @dataclass
@@ -577,6 +578,30 @@ def team_run_output_event_from_dict(data: dict) -> BaseTeamRunEvent:
     return event_class.from_dict(data)  # type: ignore
 
 
+# Fields of TeamRunOutput converted by their own serializers in TeamRunOutput.to_dict()
+_TEAM_RUN_OUTPUT_SERIALIZED_FIELDS = frozenset(
+    {
+        "messages",
+        "metrics",
+        "status",
+        "tools",
+        "metadata",
+        "images",
+        "videos",
+        "audio",
+        "files",
+        "response_audio",
+        "citations",
+        "events",
+        "additional_input",
+        "reasoning_steps",
+        "reasoning_messages",
+        "references",
+        "requirements",
+    }
+)
+
+
 @dataclass
 class TeamRunOutput:
     """Response returned by Team.run() functions"""
@@ -650,31 +675,7 @@ class TeamRunOutput:
         return self.status == RunStatus.cancelled
 
     def to_dict(self) -> Dict[str, Any]:
-        _dict = {
-            k: v
-            for k, v in asdict(self).items()
-            if v is not None
-            and k
-            not in [
-                "messages",
-                "metrics",
-                "status",
-                "tools",
-                "metadata",
-                "images",
-                "videos",
-                "audio",
-                "files",
-                "response_audio",
-                "citations",
-                "events",
-                "additional_input",
-                "reasoning_steps",
-                "reasoning_messages",
-                "references",
-                "requirements",
-            ]
-        }
+        _dict = dataclass_to_dict(self, exclude=_TEAM_RUN_OUTPUT_SERIALIZED_FIELDS)
         if self.events is not None:
             _dict["events"] = [e.to_dict() for e in self.events]
 
@@ -1,4 +1,4 @@
-from dataclasses import asdict, dataclass, field
+from dataclasses import dataclass, field
 from enum import Enum
 from time import time
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
@@ -16,6 +16,7 @@ from agno.utils.media import (
     reconstruct_response_audio,
     reconstruct_videos,
 )
+from agno.utils.serialize import dataclass_to_dict
 
 if TYPE_CHECKING:
     from agno.workflow.types import StepOutput, WorkflowMetrics
@@ -61,6 +62,10 @@ class WorkflowRunEvent(str, Enum):
     custom_event = "CustomEvent"
 
 
+# Fields of workflow events converted by their own serializers in BaseWorkflowRunOutputEvent.to_dict()
+_WORKFLOW_EVENT_SERIALIZED_FIELDS = frozenset({"step_results", "step_response", "iteration_results", "all_results"})
+
+
 @dataclass
 class BaseWorkflowRunOutputEvent(BaseRunOutputEvent):
     """Base class for all workflow run response events"""
@@ -77,7 +82,7 @@ class BaseWorkflowRunOutputEvent(BaseRunOutputEvent):
     parent_step_id: Optional[str] = None
 
     def to_dict(self) -> Dict[str, Any]:
-        _dict = {k: v for k, v in asdict(self).items() if v is not None}
+        _dict = dataclass_to_dict(self, exclude=_WORKFLOW_EVENT_SERIALIZED_FIELDS)
 
         if hasattr(self, "content") and self.content and isinstance(self.content, BaseModel):
             _dict["content"] = self.content.model_dump(exclude_none=True)
@@ -490,6 +495,24 @@ def workflow_run_output_event_from_dict(data: dict) -> BaseWorkflowRunOutputEven
     return event_class.from_dict(data)  # type: ignore
 
 
+# Fields of WorkflowRunOutput converted by their own serializers in WorkflowRunOutput.to_dict()
+_WORKFLOW_RUN_OUTPUT_SERIALIZED_FIELDS = frozenset(
+    {
+        "metadata",
+        "images",
+        "videos",
+        "audio",
+        "files",
+        "response_audio",
+        "step_results",
+        "step_executor_runs",
+        "events",
+        "metrics",
+        "workflow_agent_run",
+    }
+)
+
+
 @dataclass
 class WorkflowRunOutput:
     """Response returned by Workflow.run() functions - kept for backwards compatibility"""
@@ -539,25 +562,7 @@ class WorkflowRunOutput:
         return self.status == RunStatus.cancelled
 
     def to_dict(self) -> Dict[str, Any]:
-        _dict = {
-            k: v
-            for k, v in asdict(self).items()
-            if v is not None
-            and k
-            not in [
-                "metadata",
-                "images",
-                "videos",
-                "audio",
-                "files",
-                "response_audio",
-                "step_results",
-                "step_executor_runs",
-                "events",
-                "metrics",
-                "workflow_agent_run",
-            ]
-        }
+        _dict = dataclass_to_dict(self, exclude=_WORKFLOW_RUN_OUTPUT_SERIALIZED_FIELDS)
 
         if self.status is not None:
             _dict["status"] = self.status.value if isinstance(self.status, RunStatus) else self.status
@@ -1,15 +1,18 @@
-"""Schedule executor -- fires HTTP requests for due schedules."""
+"""Schedule executor -- runs due schedules in-process or fires HTTP requests for them."""
 
 import asyncio
 import json
 import re
 import time
-from typing import Any, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 from uuid import uuid4
 
 from agno.db.schemas.scheduler import Schedule
 from agno.utils.log import log_error, log_info, log_warning
 
+if TYPE_CHECKING:
+    from agno.os.app import AgentOS
+
 try:
     import httpx
 except ImportError:
@@ -24,6 +27,9 @@ _TERMINAL_STATUSES = {"COMPLETED", "CANCELLED", "ERROR", "PAUSED"}
 # Default polling interval in seconds for background run status checks
 _DEFAULT_POLL_INTERVAL = 30
 
+# Form fields of the run endpoints that are not passed to arun() as extra kwargs
+_RUN_FORM_FIELDS = {"message", "stream", "monitor", "session_id", "user_id", "files", "version", "background"}
+
 
 def _to_form_value(v: Any) -> str:
     """Convert a payload value to a JSON-safe form string."""
@@ -37,9 +43,13 @@ def _to_form_value(v: Any) -> str:
 class ScheduleExecutor:
     """Execute a schedule by calling its endpoint on the AgentOS server.
 
-    For run endpoints (``/agents/*/runs``, ``/teams/*/runs``, etc.) the executor
-    submits a background run (``background=true``), then polls the run status
-    endpoint until it reaches a terminal state (COMPLETED, ERROR, CANCELLED, PAUSED).
+    When ``agent_os`` is given, run endpoints (``/agents/*/runs``, ``/teams/*/runs``, etc.)
+    of the agents, teams and workflows registered on it are executed in-process: the
+    component's ``arun()`` is awaited directly, without going through HTTP.
+
+    Otherwise, and for remote components, the executor submits a background run
+    (``background=true``), then polls the run status endpoint until it reaches a
+    terminal state (COMPLETED, ERROR, CANCELLED, PAUSED).
 
     For all other endpoints a simple request/response cycle is used.
     """
@@ -50,6 +60,7 @@ class ScheduleExecutor:
         internal_service_token: str,
         timeout: int = 3600,
         poll_interval: int = _DEFAULT_POLL_INTERVAL,
+        agent_os: Optional["AgentOS"] = None,
     ) -> None:
         if httpx is None:
             raise ImportError("`httpx` not installed. Please install it using `pip install httpx`")
@@ -57,6 +68,7 @@ class ScheduleExecutor:
         self.internal_service_token = internal_service_token
         self.timeout = timeout
         self.poll_interval = poll_interval
+        self.agent_os = agent_os
         self._client: Optional[httpx.AsyncClient] = None
 
     async def _get_client(self) -> httpx.AsyncClient:
@@ -257,6 +269,11 @@ class ScheduleExecutor:
         match = _RUN_ENDPOINT_RE.match(endpoint)
         is_run_endpoint = match is not None and method == "POST"
 
+        if is_run_endpoint and match is not None and self.agent_os is not None:
+            component = self._get_local_component(match.group(1), match.group(2), payload.get("version"))
+            if component is not None:
+                return await self._run_in_process(component, payload, timeout_seconds)
+
         headers: Dict[str, str] = {
             "Authorization": f"Bearer {self.internal_service_token}",
         }
@@ -284,6 +301,124 @@ class ScheduleExecutor:
             headers["Content-Type"] = "application/json"
             return await self._simple_request(client, method, url, headers, payload if payload else None)
 
+    def _get_local_component(self, resource_type: str, resource_id: str, version: Any) -> Optional[Any]:
+        """Get a fresh copy of an agent, team or workflow registered on the AgentOS, or None if it is remote."""
+        from agno.agent.remote import RemoteAgent
+        from agno.os.utils import get_agent_by_id, get_team_by_id, get_workflow_by_id
+        from agno.team.remote import RemoteTeam
+        from agno.workflow.remote import RemoteWorkflow
+
+        agent_os = self.agent_os
+        if agent_os is None:
+            return None
+        try:
+            version_value = int(version) if version not in (None, "") else None
+        except (TypeError, ValueError):
+            version_value = None
+
+        component: Optional[Any] = None
+        if resource_type == "agents":
+            component = get_agent_by_id(
+                resource_id,
+                agent_os.agents,
+                agent_os.db,
+                agent_os.registry,
+                version=version_value,
+                create_fresh=True,
+            )
+        elif resource_type == "teams":
+            component = get_team_by_id(
+                resource_id,
+                agent_os.teams,
+                db=agent_os.db,
+                version=version_value,
+                registry=agent_os.registry,
+                create_fresh=True,
+            )
+        elif resource_type == "workflows":
+            component = get_workflow_by_id(
+                resource_id,
+                agent_os.workflows,
+                db=agent_os.db,
+                version=version_value,
+                registry=agent_os.registry,
+                create_fresh=True,
+            )
+
+        # Remote components are run through their own server, over HTTP
+        if component is None or isinstance(component, (RemoteAgent, RemoteTeam, RemoteWorkflow)):
+            return None
+        return component
+
+    async def _run_in_process(
+        self,
+        component: Any,
+        payload: Dict[str, Any],
+        timeout_seconds: int,
+    ) -> Dict[str, Any]:
+        """Run an agent, team or workflow in-process and wait for the run to finish."""
+        from agno.os.utils import parse_run_kwargs
+
+        message = payload.get("message")
+        session_id = payload.get("session_id") or str(uuid4())
+        user_id = payload.get("user_id")
+        run_id = str(uuid4())
+        if message is None:
+            return {
+                "status": "failed",
+                "status_code": None,
+                "error": "Missing message in schedule payload",
+                "run_id": None,
+                "session_id": None,
+                "input": None,
+                "output": None,
+                "requirements": None,
+            }
+
+        # Extra fields are parsed like the form fields of the run endpoints
+        kwargs = parse_run_kwargs(
+            {k: _to_form_value(v) for k, v in payload.items() if k not in _RUN_FORM_FIELDS and v is not None}
+        )
+
+        try:
+            run_output = await asyncio.wait_for(
+                component.arun(
+                    input=str(message),
+                    session_id=str(session_id),
+                    user_id=str(user_id) if user_id is not None else None,
+                    run_id=run_id,
+                    stream=False,
+                    **kwargs,
+                ),
+                timeout=timeout_seconds,
+            )
+        except asyncio.TimeoutError:
+            return {
+                "status": "failed",
+                "status_code": None,
+                "error": f"Run timed out after {timeout_seconds}s for run {run_id}",
+                "run_id": run_id,
+                "session_id": session_id,
+                "input": None,
+                "output": None,
+                "requirements": None,
+            }
+
+        data = run_output.to_dict()
+        result = self._terminal_run_result(data, run_id, session_id, None)
+        if result is None:
+            return {
+                "status": "failed",
+                "status_code": None,
+                "error": f"Run ended with status {data.get('status')}",
+                "run_id": run_id,
+                "session_id": session_id,
+                "input": None,
+                "output": None,
+                "requirements": None,
+            }
+        return result
+
     async def _simple_request(
         self,
         client: Any,
@@ -439,41 +574,54 @@ class ScheduleExecutor:
                 log_warning(f"Invalid JSON in poll response for run {run_id}")
                 continue
 
-            run_status = data.get("status")
-
-            if run_status in _TERMINAL_STATUSES:
-                if run_status == "COMPLETED":
-                    status = "success"
-                    error = None
-                elif run_status == "PAUSED":
-                    status = "paused"
-                    error = None
-                elif run_status == "CANCELLED":
-                    status = "failed"
-                    error = data.get("error") or "Run was cancelled"
-                else:
-                    status = "failed"
-                    error = data.get("error") or f"Run failed with status {run_status}"
-
-                # Extract input, output, and requirements from RunOutput
-                run_input = data.get("input") if isinstance(data.get("input"), dict) else None
-                run_output = self._extract_output(data)
-                run_requirements = self._extract_requirements(data) if run_status == "PAUSED" else None
-
-                return {
-                    "status": status,
-                    "status_code": resp.status_code,
-                    "error": error,
-                    "run_id": run_id,
-                    "session_id": session_id,
-                    "input": run_input,
-                    "output": run_output,
-                    "requirements": run_requirements,
-                }
+            result = self._terminal_run_result(data, run_id, session_id, resp.status_code)
+            if result is not None:
+                return result
 
             await asyncio.sleep(self.poll_interval)
 
     # ------------------------------------------------------------------
+    def _terminal_run_result(
+        self,
+        data: Dict[str, Any],
+        run_id: str,
+        session_id: str,
+        status_code: Optional[int],
+    ) -> Optional[Dict[str, Any]]:
+        """Build the result of a run from its RunOutput data, or None if the run is not finished."""
+        run_status = data.get("status")
+        if run_status not in _TERMINAL_STATUSES:
+            return None
+
+        if run_status == "COMPLETED":
+            status = "success"
+            error = None
+        elif run_status == "PAUSED":
+            status = "paused"
+            error = None
+        elif run_status == "CANCELLED":
+            status = "failed"
+            error = data.get("error") or "Run was cancelled"
+        else:
+            status = "failed"
+            error = data.get("error") or f"Run failed with status {run_status}"
+
+        # Extract input, output, and requirements from RunOutput
+        run_input = data.get("input") if isinstance(data.get("input"), dict) else None
+        run_output = self._extract_output(data)
+        run_requirements = self._extract_requirements(data) if run_status == "PAUSED" else None
+
+        return {
+            "status": status,
+            "status_code": status_code,
+            "error": error,
+            "run_id": run_id,
+            "session_id": session_id,
+            "input": run_input,
+            "output": run_output,
+            "requirements": run_requirements,
+        }
+
     @staticmethod
     def _extract_output(data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Build a structured output dict from RunOutput data."""
@@ -7,6 +7,7 @@ from typing import Any, Dict, List, Literal, Optional
 from uuid import uuid4
 
 from agno.db.schemas.scheduler import Schedule, ScheduleRun
+from agno.scheduler.poller import notify_schedule_change
 from agno.utils.log import log_debug, log_warning
 
 # Valid DB method names for the scheduler
@@ -59,11 +60,14 @@ class ScheduleManager:
                 # Running inside an async context — bridge via thread
                 if self._pool is None:
                     self._pool = concurrent.futures.ThreadPoolExecutor(max_workers=1)
-                return self._pool.submit(asyncio.run, fn(*args, **kwargs)).result()
+                result = self._pool.submit(asyncio.run, fn(*args, **kwargs)).result()
             except RuntimeError:
                 # No running loop — safe to use asyncio.run directly
-                return asyncio.run(fn(*args, **kwargs))
-        return fn(*args, **kwargs)
+                result = asyncio.run(fn(*args, **kwargs))
+        else:
+            result = fn(*args, **kwargs)
+        self._notify_poller(method_name)
+        return result
 
     async def _acall(self, method_name: SchedulerDbMethod, *args: Any, **kwargs: Any) -> Any:
         """Async call a DB method."""
@@ -71,8 +75,16 @@ class ScheduleManager:
         if fn is None:
             raise NotImplementedError(f"Database does not support {method_name}")
         if asyncio.iscoroutinefunction(fn):
-            return await fn(*args, **kwargs)
-        return fn(*args, **kwargs)
+            result = await fn(*args, **kwargs)
+        else:
+            result = fn(*args, **kwargs)
+        self._notify_poller(method_name)
+        return result
+
+    def _notify_poller(self, method_name: SchedulerDbMethod) -> None:
+        """Wake the pollers running in this process when a schedule is created or updated."""
+        if method_name in ("create_schedule", "update_schedule"):
+            notify_schedule_change(self.db)
 
     @staticmethod
     def _to_schedule(data: Any) -> Optional[Schedule]:
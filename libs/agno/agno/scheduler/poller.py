@@ -1,7 +1,9 @@
-"""Schedule poller -- periodically claims and executes due schedules."""
+"""Schedule poller -- claims and executes due schedules, waking up when the next one is due."""
 
 import asyncio
-from typing import Any, Dict, Optional, Set, Union
+import time
+import weakref
+from typing import Any, Dict, List, Optional, Set, Union
 from uuid import uuid4
 
 from agno.db.schemas.scheduler import Schedule
@@ -10,13 +12,31 @@ from agno.utils.log import log_error, log_info, log_warning
 # Default timeout (in seconds) when stopping the poller
 _DEFAULT_STOP_TIMEOUT = 30
 
+# Minimum wait (in seconds) before polling again when a due schedule could not be claimed
+_MIN_RETRY_WAIT = 1.0
+
+# Running pollers, so schedule changes made in this process wake them up
+_running_pollers: "weakref.WeakSet[SchedulePoller]" = weakref.WeakSet()
+
+
+def notify_schedule_change(db: Any) -> None:
+    """Wake the running pollers of a DB, so new or updated schedules are picked up without waiting for a poll."""
+    for poller in list(_running_pollers):
+        if poller.db is db:
+            poller.notify()
+
 
 class SchedulePoller:
-    """Periodically poll the DB for due schedules and execute them.
+    """Poll the DB for due schedules and execute them.
 
-    Each poll tick repeatedly calls ``db.claim_due_schedule()`` until no more
+    Each poll tick claims due schedules in batches with ``db.claim_due_schedules()``
+    (falling back to ``db.claim_due_schedule()`` one at a time) until no more
     schedules are due, spawning an ``asyncio.create_task`` for each claimed
     schedule so they run concurrently.
+
+    Between ticks the poller sleeps until the earliest ``next_run_at``, at most
+    ``poll_interval`` seconds. It wakes up early when ``notify()`` is called,
+    e.g. when a schedule is created or updated, and when an execution finishes.
     """
 
     def __init__(
@@ -37,18 +57,27 @@ class SchedulePoller:
         self._task: Optional[asyncio.Task] = None  # type: ignore[type-arg]
         self._running = False
         self._in_flight: Set[asyncio.Task] = set()  # type: ignore[type-arg]
+        # Created by start(), inside the event loop the poller runs on
+        self._wakeup: Optional[asyncio.Event] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # Set to False once the DB has shown it cannot claim schedules in batches
+        self._bulk_claim_supported = True
 
     async def start(self) -> None:
         """Start the polling loop as a background task."""
         if self._running:
             return
         self._running = True
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        _running_pollers.add(self)
         self._task = asyncio.create_task(self._poll_loop())
         log_info(f"Scheduler poller started (worker={self.worker_id}, interval={self.poll_interval}s)")
 
     async def stop(self) -> None:
         """Stop the polling loop gracefully and cancel in-flight tasks."""
         self._running = False
+        _running_pollers.discard(self)
         if self._task is not None:
             self._task.cancel()
             try:
@@ -73,46 +102,130 @@ class SchedulePoller:
             await self.executor.close()
         log_info("Scheduler poller stopped")
 
+    def notify(self) -> None:
+        """Wake the polling loop, so it claims due schedules and recomputes when to wake up next.
+
+        Safe to call from any thread.
+        """
+        loop, wakeup = self._loop, self._wakeup
+        if loop is None or wakeup is None or loop.is_closed():
+            return
+        try:
+            running_loop: Optional[asyncio.AbstractEventLoop] = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+        if running_loop is loop:
+            wakeup.set()
+        else:
+            loop.call_soon_threadsafe(wakeup.set)
+
     async def _poll_loop(self) -> None:
-        """Main loop: poll first, then sleep."""
+        """Main loop: poll first, then sleep until the next schedule is due or the poller is notified."""
+        if self._wakeup is None:
+            self._wakeup = asyncio.Event()
         while self._running:
             try:
-                await self._poll_once()
+                # Cleared before polling, so notifications received while polling are not lost
+                self._wakeup.clear()
+                caught_up = await self._poll_once()
                 if not self._running:
                     break
-                await asyncio.sleep(self.poll_interval)
+                timeout = await self._get_wait_seconds() if caught_up else self.poll_interval
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+                except asyncio.TimeoutError:
+                    pass
             except asyncio.CancelledError:
                 break
             except Exception as exc:
                 log_error(f"Scheduler poll error: {exc}")
                 await asyncio.sleep(self.poll_interval)
 
-    async def _poll_once(self) -> None:
-        """Claim all due schedules in a tight loop and fire them off."""
+    async def _get_wait_seconds(self) -> float:
+        """Get the number of seconds until the next schedule is due, at most ``poll_interval``."""
+        try:
+            fn = getattr(self.db, "get_next_schedule_run_at", None)
+            if fn is None:
+                return self.poll_interval
+            next_run_at = await fn() if asyncio.iscoroutinefunction(fn) else fn()
+        except NotImplementedError:
+            return self.poll_interval
+        except Exception as exc:
+            log_error(f"Error getting next schedule run: {exc}")
+            return self.poll_interval
+        if not isinstance(next_run_at, (int, float)):
+            return self.poll_interval
+        wait_seconds = next_run_at - time.time()
+        if wait_seconds <= 0:
+            # The schedule is due but was not claimed, e.g. it is locked by another worker
+            wait_seconds = _MIN_RETRY_WAIT
+        return min(float(self.poll_interval), wait_seconds)
+
+    async def _claim_due_schedules(self, limit: int) -> List[Any]:
+        """Claim up to ``limit`` due schedules, in one batch if the DB supports it."""
+        if self._bulk_claim_supported:
+            fn = getattr(self.db, "claim_due_schedules", None)
+            if fn is not None:
+                try:
+                    if asyncio.iscoroutinefunction(fn):
+                        claimed = await fn(self.worker_id, limit=limit)
+                    else:
+                        claimed = fn(self.worker_id, limit=limit)
+                except NotImplementedError:
+                    claimed = None
+                # DBs claiming in batches return a list of schedules
+                if isinstance(claimed, list):
+                    return claimed
+            self._bulk_claim_supported = False
+
+        schedules: List[Any] = []
+        while len(schedules) < limit:
+            if asyncio.iscoroutinefunction(getattr(self.db, "claim_due_schedule", None)):
+                schedule = await self.db.claim_due_schedule(self.worker_id)
+            else:
+                schedule = self.db.claim_due_schedule(self.worker_id)
+            if schedule is None:
+                break
+            schedules.append(schedule)
+        return schedules
+
+    async def _poll_once(self) -> bool:
+        """Claim all due schedules in batches and fire them off.
+
+        Returns:
+            True if all due schedules were claimed, False if claiming stopped early
+            because of the concurrency limit or an error.
+        """
         while self._running:
             # Enforce concurrency limit
             self._in_flight -= {t for t in self._in_flight if t.done()}
-            if len(self._in_flight) >= self.max_concurrent:
+            capacity = self.max_concurrent - len(self._in_flight)
+            if capacity <= 0:
                 log_warning(f"Max concurrent executions reached ({self.max_concurrent}), waiting")
-                break
+                return False
 
             try:
-                if asyncio.iscoroutinefunction(getattr(self.db, "claim_due_schedule", None)):
-                    schedule = await self.db.claim_due_schedule(self.worker_id)
-                else:
-                    schedule = self.db.claim_due_schedule(self.worker_id)
-
-                if schedule is None:
-                    break
+                schedules = await self._claim_due_schedules(capacity)
+            except Exception as exc:
+                log_error(f"Error claiming schedule: {exc}")
+                return False
 
+            for schedule in schedules:
                 sched = Schedule.from_dict(schedule) if isinstance(schedule, dict) else schedule
                 log_info(f"Claimed schedule: {sched.name or sched.id}")
                 task = asyncio.create_task(self._execute_safe(sched))
                 self._in_flight.add(task)
-                task.add_done_callback(lambda t: self._in_flight.discard(t))
-            except Exception as exc:
-                log_error(f"Error claiming schedule: {exc}")
+                task.add_done_callback(self._on_execution_done)
+
+            if len(schedules) < capacity:
                 break
+        return True
+
+    def _on_execution_done(self, task: "asyncio.Task[Any]") -> None:
+        self._in_flight.discard(task)
+        # The schedule was released with its next run time, and a slot is free again
+        if self._running and self._wakeup is not None:
+            self._wakeup.set()
 
     async def _execute_safe(self, schedule: Union[Schedule, Dict[str, Any]]) -> None:
         """Execute a schedule, catching all errors."""
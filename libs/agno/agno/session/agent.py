@@ -1,7 +1,7 @@
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass
-from typing import Any, Dict, List, Mapping, Optional, Union
+from dataclasses import asdict, dataclass, field, replace
+from typing import Any, Dict, List, Mapping, Optional, Set, Union
 
 from agno.models.message import Message
 from agno.run.agent import RunOutput
@@ -43,10 +43,24 @@ class AgentSession:
     # The unix timestamp when this session was last updated
     updated_at: Optional[int] = None
 
-    def to_dict(self) -> Dict[str, Any]:
-        session_dict = asdict(self)
-
-        session_dict["runs"] = [run.to_dict() for run in self.runs] if self.runs else None
+    # IDs of the runs added or updated since the session was last stored.
+    # Databases storing runs in a separate table only write these runs on upsert.
+    unsaved_run_ids: Set[str] = field(default_factory=set, init=False, repr=False, compare=False)
+    # Number of earlier runs not loaded, when the session was read with a run window
+    runs_offset: int = field(default=0, init=False, repr=False, compare=False)
+    # Earlier runs kept serialized, when the session was read with a run window. They are stored back as-is.
+    previous_runs: Optional[List[Dict[str, Any]]] = field(default=None, init=False, repr=False, compare=False)
+
+    def to_dict(self, include_runs: bool = True) -> Dict[str, Any]:
+        # Runs are serialized separately, so they are not deep-copied by asdict
+        session_dict = asdict(replace(self, runs=None))
+        for key in ("unsaved_run_ids", "runs_offset", "previous_runs"):
+            session_dict.pop(key, None)
+
+        if include_runs and (self.runs or self.previous_runs):
+            session_dict["runs"] = (self.previous_runs or []) + [run.to_dict() for run in self.runs or []]
+        else:
+            session_dict["runs"] = None
         session_dict["summary"] = self.summary.to_dict() if self.summary else None
 
         return session_dict
@@ -103,6 +117,8 @@ class AgentSession:
                 break
         else:
             self.runs.append(run)
+        if run.run_id is not None:
+            self.unsaved_run_ids.add(run.run_id)
 
         log_debug("Added RunOutput to Agent Session")
 
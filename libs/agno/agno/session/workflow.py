@@ -1,8 +1,8 @@
 from __future__ import annotations
 
 import time
-from dataclasses import dataclass
-from typing import Any, Dict, List, Mapping, Optional, Tuple, Union
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Mapping, Optional, Set, Tuple, Union
 
 from pydantic import BaseModel
 
@@ -43,13 +43,21 @@ class WorkflowSession:
     # The unix timestamp when this session was last updated
     updated_at: Optional[int] = None
 
-    def to_dict(self) -> Dict[str, Any]:
+    # IDs of the runs added or updated since the session was last stored.
+    # Databases storing runs in a separate table only write these runs on upsert.
+    unsaved_run_ids: Set[str] = field(default_factory=set, init=False, repr=False, compare=False)
+    # Number of earlier runs not loaded, when the session was read with a run window
+    runs_offset: int = field(default=0, init=False, repr=False, compare=False)
+    # Earlier runs kept serialized, when the session was read with a run window. They are stored back as-is.
+    previous_runs: Optional[List[Dict[str, Any]]] = field(default=None, init=False, repr=False, compare=False)
+
+    def to_dict(self, include_runs: bool = True) -> Dict[str, Any]:
         """Convert to dictionary for storage, serializing runs to dicts"""
 
         runs_data = None
-        if self.runs:
-            runs_data = []
-            for run in self.runs:
+        if include_runs and (self.runs or self.previous_runs):
+            runs_data = list(self.previous_runs or [])
+            for run in self.runs or []:
                 try:
                     runs_data.append(run.to_dict())
                 except Exception as e:
@@ -141,6 +149,8 @@ class WorkflowSession:
                 break
         else:
             self.runs.append(run)
+        if run.run_id is not None:
+            self.unsaved_run_ids.add(run.run_id)
 
     def get_workflow_history(self, num_runs: Optional[int] = None) -> List[Tuple[str, str]]:
         """Get workflow history as structured data (input, response pairs)
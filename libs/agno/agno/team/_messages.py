@@ -45,7 +45,7 @@ from agno.utils.log import (
     log_debug,
     log_warning,
 )
-from agno.utils.message import filter_tool_calls, get_text_from_message
+from agno.utils.message import copy_history_messages, filter_tool_calls, get_text_from_message
 from agno.utils.team import (
     get_member_id,
 )
@@ -844,8 +844,6 @@ def _get_run_messages(
 
     # 3. Add history to run_messages
     if add_history_to_context:
-        from copy import deepcopy
-
         # Only skip messages from history when system_message_role is NOT a standard conversation role.
         # Standard conversation roles ("user", "assistant", "tool") should never be filtered
         # to preserve conversation continuity.
@@ -859,12 +857,8 @@ def _get_run_messages(
         )
 
         if len(history) > 0:
-            # Create a deep copy of the history messages to avoid modifying the original messages
-            history_copy = [deepcopy(msg) for msg in history]
-
-            # Tag each message as coming from history
-            for _msg in history_copy:
-                _msg.from_history = True
+            # Copy the history messages, tagged as coming from history, to avoid modifying the original messages
+            history_copy = copy_history_messages(history)
 
             # Filter tool calls from history messages
             if team.max_tool_calls_from_history is not None:
@@ -976,8 +970,6 @@ async def _aget_run_messages(
 
     # 3. Add history to run_messages
     if add_history_to_context:
-        from copy import deepcopy
-
         # Only skip messages from history when system_message_role is NOT a standard conversation role.
         # Standard conversation roles ("user", "assistant", "tool") should never be filtered
         # to preserve conversation continuity.
@@ -990,12 +982,8 @@ async def _aget_run_messages(
         )
 
         if len(history) > 0:
-            # Create a deep copy of the history messages to avoid modifying the original messages
-            history_copy = [deepcopy(msg) for msg in history]
-
-            # Tag each message as coming from history
-            for _msg in history_copy:
-                _msg.from_history = True
+            # Copy the history messages, tagged as coming from history, to avoid modifying the original messages
+            history_copy = copy_history_messages(history)
 
             # Filter tool calls from history messages
             if team.max_tool_calls_from_history is not None:
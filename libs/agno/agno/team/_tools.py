@@ -43,6 +43,7 @@ from agno.utils.log import (
     log_debug,
     log_warning,
 )
+from agno.utils.message import copy_history_messages
 from agno.utils.team import (
     get_member_id,
     get_team_member_interactions_str,
@@ -430,14 +431,8 @@ def _get_history_for_member_agent(
     )
 
     if len(history) > 0:
-        # Create a deep copy of the history messages to avoid modifying the original messages
-        history_copy = [deepcopy(msg) for msg in history]
-
-        # Tag each message as coming from history
-        for _msg in history_copy:
-            _msg.from_history = True
-
-        return history_copy
+        # Copy the history messages, tagged as coming from history, to avoid modifying the original messages
+        return copy_history_messages(history)
     return []
 
 
@@ -0,0 +1,216 @@
+import asyncio
+import json
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from pathlib import Path
+from time import time
+from typing import Any, Dict, Optional, Tuple
+
+from agno.utils.log import log_error
+
+
+class ToolCache(ABC):
+    """Base class for the backends storing cached tool call results.
+
+    A cache can be shared by several functions, toolkits and agents. Identical calls running at the same time are
+    coalesced: the first call runs the tool while the others wait for its result (single-flight).
+    """
+
+    def __init__(self, max_entries: Optional[int] = None):
+        """
+        Args:
+            max_entries (Optional[int]): Maximum number of results to keep. Unbounded if not set.
+        """
+        self.max_entries = max_entries
+        # Calls currently running, with the event set when they finish
+        self._in_flight: Dict[str, threading.Event] = {}
+        self._in_flight_lock = threading.Lock()
+
+    @abstractmethod
+    def get(self, key: str, ttl: Optional[int] = None) -> Optional[Any]:
+        """Get a cached result, or None if it is missing or older than `ttl` seconds."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def set(self, key: str, result: Any) -> None:
+        """Store a result, evicting older results if the cache is full."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Delete a cached result."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Delete all cached results."""
+        raise NotImplementedError
+
+    def acquire(self, key: str, ttl: Optional[int] = None) -> Optional[Any]:
+        """Get the cached result of a call, first waiting for an identical call that is already running.
+
+        Returns the cached result if there is one. Otherwise the caller now owns the call: it runs it and must call
+        `release` when done, even if it fails.
+        """
+        while True:
+            cached_result = self.get(key, ttl=ttl)
+            if cached_result is not None:
+                return cached_result
+            running_call = self._start(key)
+            if running_call is None:
+                return None
+            running_call.wait()
+
+    async def aacquire(self, key: str, ttl: Optional[int] = None) -> Optional[Any]:
+        """Async version of `acquire`, waiting for the running call without blocking the event loop."""
+        while True:
+            cached_result = self.get(key, ttl=ttl)
+            if cached_result is not None:
+                return cached_result
+            running_call = self._start(key)
+            if running_call is None:
+                return None
+            await asyncio.to_thread(running_call.wait)
+
+    def release(self, key: str) -> None:
+        """Mark the call as finished, waking up the identical calls waiting for it."""
+        with self._in_flight_lock:
+            running_call = self._in_flight.pop(key, None)
+        if running_call is not None:
+            running_call.set()
+
+    def _start(self, key: str) -> Optional[threading.Event]:
+        """Register the call as running. Returns None if registered, or the event of the identical running call."""
+        with self._in_flight_lock:
+            running_call = self._in_flight.get(key)
+            if running_call is None:
+                self._in_flight[key] = threading.Event()
+            return running_call
+
+
+class InMemoryToolCache(ToolCache):
+    """Keeps tool call results in memory, evicting the least recently used results first."""
+
+    def __init__(self, max_entries: Optional[int] = 1000):
+        """
+        Args:
+            max_entries (Optional[int]): Maximum number of results to keep. Defaults to 1000.
+        """
+        super().__init__(max_entries=max_entries)
+        # Results with the time they were stored, in least recently used order
+        self._results: "OrderedDict[str, Tuple[Any, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str, ttl: Optional[int] = None) -> Optional[Any]:
+        with self._lock:
+            cached = self._results.get(key)
+            if cached is None:
+                return None
+            result, timestamp = cached
+            if ttl is not None and time() - timestamp > ttl:
+                del self._results[key]
+                return None
+            self._results.move_to_end(key)
+            return result
+
+    def set(self, key: str, result: Any) -> None:
+        with self._lock:
+            self._results.pop(key, None)
+            self._results[key] = (result, time())
+            while self.max_entries is not None and len(self._results) > self.max_entries:
+                self._results.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._results.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._results.clear()
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+
+class FileToolCache(ToolCache):
+    """Stores each tool call result in its own JSON file, so results persist across processes.
+
+    When full, the least recently written results are deleted first.
+    """
+
+    def __init__(self, cache_dir: str, max_entries: Optional[int] = None):
+        """
+        Args:
+            cache_dir (str): Directory for the cache files.
+            max_entries (Optional[int]): Maximum number of results to keep. Unbounded if not set.
+        """
+        super().__init__(max_entries=max_entries)
+        self.cache_dir = Path(cache_dir)
+
+    def get_file_path(self, key: str) -> Path:
+        """Get the file path for a cache key."""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key: str, ttl: Optional[int] = None) -> Optional[Any]:
+        cache_path = self.get_file_path(key)
+        if not cache_path.exists():
+            return None
+
+        try:
+            with cache_path.open("r") as f:
+                cache_data = json.load(f)
+
+            if ttl is None or time() - cache_data.get("timestamp", 0) <= ttl:
+                return cache_data.get("result")
+
+            # Remove expired entry
+            cache_path.unlink(missing_ok=True)
+        except Exception as e:
+            log_error(f"Error reading cache: {e}")
+
+        return None
+
+    def set(self, key: str, result: Any) -> None:
+        try:
+            with open(self.get_file_path(key), "w") as f:
+                json.dump({"timestamp": time(), "result": result}, f)
+        except Exception as e:
+            log_error(f"Error writing cache: {e}")
+            return
+
+        if self.max_entries is not None:
+            self._evict()
+
+    def _evict(self) -> None:
+        """Delete the least recently written results beyond max_entries."""
+        cache_files = list(self.cache_dir.glob("*.json"))
+        if self.max_entries is None or len(cache_files) <= self.max_entries:
+            return
+        cache_files.sort(key=lambda cache_file: cache_file.stat().st_mtime, reverse=True)
+        for cache_file in cache_files[self.max_entries :]:
+            cache_file.unlink(missing_ok=True)
+
+    def delete(self, key: str) -> None:
+        self.get_file_path(key).unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        if self.cache_dir.exists():
+            for cache_file in self.cache_dir.glob("*.json"):
+                cache_file.unlink(missing_ok=True)
+
+
+# Default file caches by directory, so functions using the same directory share their in-flight calls
+_default_caches: Dict[str, FileToolCache] = {}
+_default_caches_lock = threading.Lock()
+
+
+def get_default_tool_cache(cache_dir: str) -> FileToolCache:
+    """Get the shared file cache for a directory."""
+    with _default_caches_lock:
+        cache = _default_caches.get(cache_dir)
+        if cache is None:
+            cache = FileToolCache(cache_dir=cache_dir)
+            _default_caches[cache_dir] = cache
+        return cache
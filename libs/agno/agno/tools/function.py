@@ -5,12 +5,13 @@ from typing import Any, Callable, Dict, List, Literal, Optional, Sequence, Type,
 
 from docstring_parser import parse
 from packaging.version import Version
-from pydantic import BaseModel, Field, validate_call
+from pydantic import BaseModel, ConfigDict, Field, validate_call
 
 from agno.exceptions import AgentRunException
 from agno.media import Audio, File, Image, Video
 from agno.run import RunContext
-from agno.utils.log import log_debug, log_error, log_exception, log_warning
+from agno.tools.cache import FileToolCache, ToolCache, get_default_tool_cache
+from agno.utils.log import log_debug, log_exception, log_warning
 
 T = TypeVar("T")
 
@@ -132,6 +133,8 @@ class UserFeedbackQuestion:
 class Function(BaseModel):
     """Model for storing functions that can be called by an agent."""
 
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
     # The name of the function to be called.
     # Must be a-z, A-Z, 0-9, or contain underscores and dashes, with a maximum length of 64.
     name: str
@@ -191,6 +194,9 @@ class Function(BaseModel):
     cache_results: bool = False
     cache_dir: Optional[str] = None
     cache_ttl: int = 3600
+    # Backend for the cached results, shared by copies of the function.
+    # Defaults to a file cache in cache_dir, shared by the functions using the same directory.
+    cache: Optional[ToolCache] = None
 
     # --*-- FOR INTERNAL USE ONLY --*--
     # The agent that the function is associated with
@@ -655,53 +661,37 @@ class Function(BaseModel):
         key_str = f"{self.name}:{args_str}:{kwargs_str}"
         return md5(key_str.encode()).hexdigest()
 
-    def _get_cache_file_path(self, cache_key: str) -> str:
-        """Get the full path for the cache file."""
+    def _get_cache_dir(self) -> str:
+        """Get the directory for the cache files of this function."""
         from pathlib import Path
         from tempfile import gettempdir
 
         base_cache_dir = self.cache_dir or Path(gettempdir()) / "agno_cache"
-        func_cache_dir = Path(base_cache_dir) / "functions" / self.name
-        func_cache_dir.mkdir(parents=True, exist_ok=True)
-        return str(func_cache_dir / f"{cache_key}.json")
+        return str(Path(base_cache_dir) / "functions" / self.name)
+
+    def _get_tool_cache(self) -> ToolCache:
+        """Get the backend for the cached results."""
+        if self.cache is not None:
+            return self.cache
+        return get_default_tool_cache(self._get_cache_dir())
+
+    def _get_cache_file_path(self, cache_key: str) -> str:
+        """Get the full path for the cache file."""
+        return str(get_default_tool_cache(self._get_cache_dir()).get_file_path(cache_key))
 
     def _get_cached_result(self, cache_file: str) -> Optional[Any]:
         """Retrieve cached result if valid."""
-        import json
         from pathlib import Path
-        from time import time
 
         cache_path = Path(cache_file)
-        if not cache_path.exists():
-            return None
-
-        try:
-            with cache_path.open("r") as f:
-                cache_data = json.load(f)
-
-            timestamp = cache_data.get("timestamp", 0)
-            result = cache_data.get("result")
-
-            if time() - timestamp <= self.cache_ttl:
-                return result
-
-            # Remove expired entry
-            cache_path.unlink()
-        except Exception as e:
-            log_error(f"Error reading cache: {e}")
-
-        return None
+        return FileToolCache(cache_dir=str(cache_path.parent)).get(cache_path.stem, ttl=self.cache_ttl)
 
     def _save_to_cache(self, cache_file: str, result: Any):
         """Save result to cache."""
-        import json
-        from time import time
+        from pathlib import Path
 
-        try:
-            with open(cache_file, "w") as f:
-                json.dump({"timestamp": time(), "result": result}, f)
-        except Exception as e:
-            log_error(f"Error writing cache: {e}")
+        cache_path = Path(cache_file)
+        FileToolCache(cache_dir=str(cache_path.parent)).set(cache_path.stem, result)
 
 
 class FunctionExecutionResult(BaseModel):
@@ -937,10 +927,13 @@ class FunctionCall(BaseModel):
         entrypoint_args = self._build_entrypoint_args()
 
         # Check cache if enabled and not a generator function
+        tool_cache: Optional[ToolCache] = None
+        cache_key: Optional[str] = None
         if self.function.cache_results and not isgeneratorfunction(self.function.entrypoint):
+            tool_cache = self.function._get_tool_cache()
             cache_key = self.function._get_cache_key(entrypoint_args, self.arguments)
-            cache_file = self.function._get_cache_file_path(cache_key)
-            cached_result = self.function._get_cached_result(cache_file)
+            # Waits for an identical call that is already running, and reuses its result
+            cached_result = tool_cache.acquire(cache_key, ttl=self.function.cache_ttl)
 
             if cached_result is not None:
                 log_debug(f"Cache hit for: {self.get_call_str()}")
@@ -972,10 +965,8 @@ class FunctionCall(BaseModel):
             else:
                 self.result = result
                 # Only cache non-generator results
-                if self.function.cache_results:
-                    cache_key = self.function._get_cache_key(entrypoint_args, self.arguments)
-                    cache_file = self.function._get_cache_file_path(cache_key)
-                    self.function._save_to_cache(cache_file, self.result)
+                if tool_cache is not None and cache_key is not None:
+                    tool_cache.set(cache_key, self.result)
 
                 updated_session_state = None
                 if entrypoint_args.get("run_context") is not None:
@@ -1002,6 +993,8 @@ class FunctionCall(BaseModel):
             execution_result = FunctionExecutionResult(status="failure", error=str(e))
 
         finally:
+            if tool_cache is not None and cache_key is not None:
+                tool_cache.release(cache_key)
             self._handle_post_hook()
 
         if exception_to_raise is not None:
@@ -1148,12 +1141,15 @@ class FunctionCall(BaseModel):
         entrypoint_args = self._build_entrypoint_args()
 
         # Check cache if enabled and not a generator function
+        tool_cache: Optional[ToolCache] = None
+        cache_key: Optional[str] = None
         if self.function.cache_results and not (
             isasyncgenfunction(self.function.entrypoint) or isgeneratorfunction(self.function.entrypoint)
         ):
+            tool_cache = self.function._get_tool_cache()
             cache_key = self.function._get_cache_key(entrypoint_args, self.arguments)
-            cache_file = self.function._get_cache_file_path(cache_key)
-            cached_result = self.function._get_cached_result(cache_file)
+            # Waits for an identical call that is already running, and reuses its result
+            cached_result = await tool_cache.aacquire(cache_key, ttl=self.function.cache_ttl)
             if cached_result is not None:
                 log_debug(f"Cache hit for: {self.get_call_str()}")
                 self.result = cached_result
@@ -1185,10 +1181,12 @@ class FunctionCall(BaseModel):
                     self.result = result  # Sync function, result is already computed
 
             # Only cache if not a generator
-            if self.function.cache_results and not (isgenerator(self.result) or isasyncgen(self.result)):
-                cache_key = self.function._get_cache_key(entrypoint_args, self.arguments)
-                cache_file = self.function._get_cache_file_path(cache_key)
-                self.function._save_to_cache(cache_file, self.result)
+            if (
+                tool_cache is not None
+                and cache_key is not None
+                and not (isgenerator(self.result) or isasyncgen(self.result))
+            ):
+                tool_cache.set(cache_key, self.result)
 
             # For generators, don't capture updated_session_state -
             # session_state is passed by reference, so mutations made during
@@ -1222,6 +1220,8 @@ class FunctionCall(BaseModel):
             execution_result = FunctionExecutionResult(status="failure", error=str(e))
 
         finally:
+            if tool_cache is not None and cache_key is not None:
+                tool_cache.release(cache_key)
             if iscoroutinefunction(self.function.post_hook):
                 await self._handle_post_hook_async()
             else:
@@ -590,6 +590,7 @@ class MCPTools(Toolkit):
                         cache_results=self.cache_results,
                         cache_dir=self.cache_dir,
                         cache_ttl=self.cache_ttl,
+                        cache=self.cache,
                     )
 
                     # Register the Function with the toolkit
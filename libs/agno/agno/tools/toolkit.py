@@ -3,6 +3,7 @@ from inspect import iscoroutinefunction
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
 
+from agno.tools.cache import ToolCache
 from agno.tools.function import Function
 from agno.utils.log import log_debug, log_error, log_warning, logger
 
@@ -28,6 +29,7 @@ class Toolkit:
         cache_results: bool = False,
         cache_ttl: int = 3600,
         cache_dir: Optional[str] = None,
+        cache: Optional[ToolCache] = None,
         auto_register: bool = True,
     ):
         """Initialize a new Toolkit.
@@ -47,6 +49,7 @@ class Toolkit:
             cache_results (bool): Enable in-memory caching of function results.
             cache_ttl (int): Time-to-live for cached results in seconds.
             cache_dir (Optional[str]): Directory to store cache files. Defaults to system temp dir.
+            cache (Optional[ToolCache]): Cache backend for function results, shared by all functions in the toolkit.
             auto_register (bool): Whether to automatically register all methods in the class.
             stop_after_tool_call_tools (Optional[List[str]]): List of function names that should stop the agent after execution.
             show_result_tools (Optional[List[str]]): List of function names whose results should be shown.
@@ -79,6 +82,7 @@ class Toolkit:
         self.cache_results: bool = cache_results
         self.cache_ttl: int = cache_ttl
         self.cache_dir: Optional[str] = cache_dir
+        self.cache: Optional[ToolCache] = cache
 
         # Automatically register all methods if auto_register is True
         if auto_register:
@@ -188,6 +192,7 @@ class Toolkit:
                 cache_results=self.cache_results,
                 cache_dir=self.cache_dir,
                 cache_ttl=self.cache_ttl,
+                cache=self.cache,
                 requires_confirmation=tool_name in self.requires_confirmation_tools,
                 external_execution=tool_name in self.external_execution_required_tools,
                 stop_after_tool_call=tool_name in self.stop_after_tool_call_tools,
@@ -292,6 +297,7 @@ class Toolkit:
             cache_results=function.cache_results if function.cache_results else self.cache_results,
             cache_dir=function.cache_dir if function.cache_dir else self.cache_dir,
             cache_ttl=function.cache_ttl if function.cache_ttl != 3600 else self.cache_ttl,
+            cache=function.cache if function.cache is not None else self.cache,
         )
 
         if is_async:
@@ -3,15 +3,19 @@ Custom OpenTelemetry SpanExporter that writes traces to Agno database.
 """
 
 import asyncio
+import threading
 from collections import defaultdict
-from typing import Dict, List, Sequence, Union
+from concurrent.futures import Future
+from concurrent.futures import wait as wait_futures
+from copy import copy
+from typing import Any, Dict, List, Optional, Sequence, Set, Union
 
 from opentelemetry.sdk.trace import ReadableSpan  # type: ignore
 from opentelemetry.sdk.trace.export import SpanExporter, SpanExportResult  # type: ignore
 
 from agno.db.base import AsyncBaseDb, BaseDb
 from agno.remote.base import RemoteDb
-from agno.tracing.schemas import Span, create_trace_from_spans
+from agno.tracing.schemas import Span, Trace, create_trace_from_spans
 from agno.utils.log import logger
 
 
@@ -28,6 +32,14 @@ class DatabaseSpanExporter(SpanExporter):
         self.db = db
         self._shutdown = False
 
+        # Async databases are written to from a dedicated event loop, running for the lifetime of the exporter
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
+        self._loop_lock = threading.Lock()
+        self._loop_db: Optional[AsyncBaseDb] = None
+        # Async exports scheduled without waiting for them
+        self._pending_exports: Set[Future] = set()
+
     def export(self, spans: Sequence[ReadableSpan]) -> SpanExportResult:
         """
         Export spans to the database.
@@ -86,71 +98,145 @@ class DatabaseSpanExporter(SpanExporter):
             logger.error(f"Failed to export spans to database: {e}", exc_info=True)
             return SpanExportResult.FAILURE
 
+    def _get_traces(self, spans_by_trace: Dict[str, List[Span]]) -> List[Trace]:
+        """Create the trace records (aggregates of their spans) of the exported spans"""
+        traces = [create_trace_from_spans(spans) for spans in spans_by_trace.values()]
+        return [trace for trace in traces if trace]
+
     def _export_sync(self, spans_by_trace: Dict[str, List[Span]]) -> None:
         """Export traces and spans to synchronous database"""
         try:
-            # Create trace and span records for each trace
-            for trace_id, spans in spans_by_trace.items():
-                # Create trace record (aggregate of all spans)
-                trace = create_trace_from_spans(spans)
-                if trace:
-                    self.db.upsert_trace(trace)  # type: ignore
-
-                # Create span records
-                self.db.create_spans(spans)  # type: ignore
+            # Write the traces and spans of all traces at once
+            self.db.upsert_traces(self._get_traces(spans_by_trace))  # type: ignore
+            self.db.create_spans([span for spans in spans_by_trace.values() for span in spans])  # type: ignore
 
         except Exception as e:
             logger.error(f"Failed to export sync traces: {e}", exc_info=True)
             raise
 
     def _export_async(self, spans_by_trace: Dict[str, List[Span]]) -> None:
-        """Handle async database export"""
+        """Handle async database export, on the exporter event loop"""
+        future = asyncio.run_coroutine_threadsafe(self._do_async_export(spans_by_trace), self._get_loop())
         try:
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                # We're in an async context, schedule the coroutine
-                asyncio.create_task(self._do_async_export(spans_by_trace))
-            else:
-                # No running loop, run in new loop
-                loop.run_until_complete(self._do_async_export(spans_by_trace))
+            asyncio.get_running_loop()
         except RuntimeError:
-            # No event loop, create new one
+            # Called from a span processor thread: wait for the export
             try:
-                asyncio.run(self._do_async_export(spans_by_trace))
+                future.result()
             except Exception as e:
                 logger.error(f"Failed to export async traces: {e}", exc_info=True)
+            return
+
+        # We're in an async context: don't block its event loop
+        self._pending_exports.add(future)
+        future.add_done_callback(self._pending_exports.discard)
+
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        """Get the exporter event loop, starting it on a daemon thread if needed"""
+        with self._loop_lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                self._loop_thread = threading.Thread(target=loop.run_forever, name="agno-trace-exporter", daemon=True)
+                self._loop_thread.start()
+                self._loop = loop
+            return self._loop
+
+    def _get_loop_db(self) -> AsyncBaseDb:
+        """Get the async database used on the exporter event loop.
+
+        Pooled async connections can only be used on the event loop that opened them, so the exporter uses a
+        copy of the database with its own engine. The engine is built from the pool, dialect and options of the
+        database engine, and its pool lives as long as the exporter loop, so connections are reused across exports.
+        In-memory SQLite databases only exist on their own connection, so they are used as they are.
+        """
+        if self._loop_db is None:
+            db = copy(self.db)
+            db_engine = getattr(self.db, "db_engine", None)
+            try:
+                from sqlalchemy.engine import Engine
+                from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker
+            except ImportError:
+                AsyncEngine = None  # type: ignore
+
+            if (
+                AsyncEngine is not None
+                and isinstance(db_engine, AsyncEngine)
+                and not self._is_in_memory_sqlite(db_engine.url)
+            ):
+                sync_engine = db_engine.sync_engine
+                loop_engine = AsyncEngine(
+                    Engine(
+                        # A new pool with the same settings, connect args and event listeners
+                        sync_engine.pool.recreate(),
+                        sync_engine.dialect,
+                        sync_engine.url,
+                        logging_name=sync_engine.logging_name,
+                        echo=sync_engine.echo,
+                        hide_parameters=sync_engine.hide_parameters,
+                        execution_options=sync_engine.get_execution_options(),
+                    )
+                )
+                db.db_engine = loop_engine  # type: ignore
+                db.async_session_factory = async_sessionmaker(bind=loop_engine, expire_on_commit=False)  # type: ignore
+            # Other async databases, like Mongo, already create their clients per event loop
+            self._loop_db = db  # type: ignore
+        return self._loop_db  # type: ignore
+
+    @staticmethod
+    def _is_in_memory_sqlite(url: Any) -> bool:
+        """Whether the URL points to an in-memory SQLite database"""
+        if url.get_backend_name() != "sqlite":
+            return False
+        return url.database in (None, "", ":memory:") or url.query.get("mode") == "memory"
 
     async def _do_async_export(self, spans_by_trace: Dict[str, List[Span]]) -> None:
         """Actually perform the async export"""
         try:
-            # Create trace and span records for each trace
-            for trace_id, spans in spans_by_trace.items():
-                # Create trace record (aggregate of all spans)
-                trace = create_trace_from_spans(spans)
-                if trace:
-                    create_trace_result = self.db.upsert_trace(trace)  # type: ignore
-                    if create_trace_result is not None:
-                        await create_trace_result
-
-                # Create span records
-                create_spans_result = self.db.create_spans(spans)  # type: ignore
-                if create_spans_result is not None:
-                    await create_spans_result
+            db = self._get_loop_db()
+
+            # Write the traces and spans of all traces at once
+            upsert_traces_result = db.upsert_traces(self._get_traces(spans_by_trace))
+            if upsert_traces_result is not None:
+                await upsert_traces_result
+
+            create_spans_result = db.create_spans([span for spans in spans_by_trace.values() for span in spans])
+            if create_spans_result is not None:
+                await create_spans_result
 
         except Exception as e:
             logger.error(f"Failed to do async export: {e}", exc_info=True)
             raise
 
+    async def _close_loop_db(self) -> None:
+        db_engine = getattr(self._loop_db, "db_engine", None)
+        if db_engine is not None and db_engine is not getattr(self.db, "db_engine", None):
+            await db_engine.dispose()
+
     def shutdown(self) -> None:
         """Shutdown the exporter"""
         self._shutdown = True
+        self.force_flush()
+
+        with self._loop_lock:
+            loop, loop_thread = self._loop, self._loop_thread
+            self._loop, self._loop_thread = None, None
+        if loop is not None:
+            try:
+                asyncio.run_coroutine_threadsafe(self._close_loop_db(), loop).result(timeout=5)
+            except Exception as e:
+                logger.warning(f"Failed to close the trace exporter database connections: {e}")
+            loop.call_soon_threadsafe(loop.stop)
+            if loop_thread is not None:
+                loop_thread.join(timeout=5)
+            self._loop_db = None
+
         logger.debug("DatabaseSpanExporter shutdown")
 
     def force_flush(self, timeout_millis: int = 30000) -> bool:
         """
         Force flush any pending spans.
 
-        Since we write immediately to the database, this is a no-op.
+        Spans are written during export, so this only waits for the async exports scheduled from an event loop.
 
         Args:
             timeout_millis: Timeout in milliseconds
@@ -158,4 +244,8 @@ class DatabaseSpanExporter(SpanExporter):
         Returns:
             True if flush was successful
         """
-        return True
+        pending_exports = list(self._pending_exports)
+        if not pending_exports:
+            return True
+        _, not_done = wait_futures(pending_exports, timeout=timeout_millis / 1000)
+        return not not_done
@@ -1,4 +1,3 @@
-from copy import deepcopy
 from typing import Dict, List, Union
 
 from pydantic import BaseModel
@@ -7,6 +6,22 @@ from agno.models.message import Message
 from agno.utils.log import log_debug
 
 
+def copy_history_messages(messages: List[Message]) -> List[Message]:
+    """
+    Copy messages from history to add them to a run, tagged with from_history=True.
+
+    The copies are shallow: they share content, media and tool calls with the stored messages instead of
+    duplicating them, so these values must be replaced rather than modified in place.
+
+    Args:
+        messages: Messages from history
+
+    Returns:
+        List[Message]: The tagged copies
+    """
+    return [message.model_copy(update={"from_history": True}) for message in messages]
+
+
 def filter_tool_calls(messages: List[Message], max_tool_calls: int) -> None:
     """
     Filter messages (in-place) to keep only the most recent N tool calls.
@@ -40,8 +55,8 @@ def filter_tool_calls(messages: List[Message], max_tool_calls: int) -> None:
                 filtered_messages.append(msg)
         elif msg.role == "assistant" and msg.tool_calls:
             # Filter tool_calls within the assistant message
-            # Use deepcopy to ensure complete isolation of the filtered message
-            filtered_msg = deepcopy(msg)
+            # Copy the message so the original keeps its tool_calls, which are replaced below
+            filtered_msg = msg.model_copy()
             # Filter tool_calls
             if filtered_msg.tool_calls is not None:
                 filtered_msg.tool_calls = [
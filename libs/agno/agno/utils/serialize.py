@@ -1,8 +1,22 @@
 """JSON serialization utilities for handling datetime and enum objects."""
 
+import json
+from copy import deepcopy
+from dataclasses import asdict, fields, is_dataclass
 from datetime import date, datetime, time
 from enum import Enum
-from typing import Any
+from typing import Any, Dict, FrozenSet, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
+# Values dataclasses.asdict() returns as they are
+_ATOMIC_TYPES = frozenset({type(None), bool, int, float, complex, str, bytes})
+
+# Names of the fields serialized for each dataclass and set of excluded fields
+_field_names: Dict[Tuple[type, FrozenSet[str]], Tuple[str, ...]] = {}
 
 
 def json_serializer(obj: Any) -> Any:
@@ -30,3 +44,64 @@ def json_serializer(obj: Any) -> Any:
 
     # Fallback to string
     return str(obj)
+
+
+def dataclass_to_dict(obj: Any, exclude: FrozenSet[str] = frozenset()) -> Dict[str, Any]:
+    """Convert a dataclass instance to a dict of its non-None fields, like `dataclasses.asdict`.
+
+    Unlike `asdict`, excluded fields are never copied, and the field names of each class are only resolved once.
+
+    Args:
+        obj: Dataclass instance to convert
+        exclude: Names of the fields to leave out
+
+    Returns:
+        Dictionary of the fields that are not excluded and not None
+    """
+    key = (type(obj), exclude)
+    names = _field_names.get(key)
+    if names is None:
+        names = tuple(f.name for f in fields(obj) if f.name not in exclude)
+        _field_names[key] = names
+
+    _dict = {}
+    for name in names:
+        value = getattr(obj, name)
+        if value is not None:
+            _dict[name] = _copy_value(value)
+    return _dict
+
+
+def _copy_value(value: Any) -> Any:
+    # Same conversion as dataclasses.asdict() applies to field values
+    if type(value) in _ATOMIC_TYPES:
+        return value
+    if is_dataclass(value) and not isinstance(value, type):
+        return asdict(value)
+    if isinstance(value, tuple) and hasattr(value, "_fields"):
+        return type(value)(*[_copy_value(v) for v in value])
+    if isinstance(value, (list, tuple)):
+        return type(value)(_copy_value(v) for v in value)
+    if isinstance(value, dict):
+        return type(value)((_copy_value(k), _copy_value(v)) for k, v in value.items())
+    return deepcopy(value)
+
+
+def json_dumps_bytes(obj: Any) -> bytes:
+    """Serialize an object to compact UTF-8 encoded JSON.
+
+    Uses `orjson` when it is installed, and the standard `json` module otherwise, or when `orjson` cannot
+    serialize the object (e.g. integers larger than 64 bits).
+
+    Args:
+        obj: Object to serialize
+
+    Returns:
+        The JSON document as bytes
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, default=json_serializer, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass
+    return json.dumps(obj, separators=(",", ":"), default=json_serializer, ensure_ascii=False).encode("utf-8")
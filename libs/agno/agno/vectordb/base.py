@@ -5,6 +5,9 @@ from agno.knowledge.document import Document
 from agno.utils.log import log_warning
 from agno.utils.string import generate_id
 
+# Metadata key of the hash Knowledge stores with each document, to only rewrite the chunks of content that changed
+CHUNK_HASH_KEY = "chunk_hash"
+
 
 class VectorDb(ABC):
     """Base class for Vector Databases"""
@@ -108,6 +111,20 @@ class VectorDb(ABC):
     async def async_exists(self) -> bool:
         raise NotImplementedError
 
+    def get_chunk_hashes(self, content_hash: str) -> Optional[Dict[str, Optional[str]]]:
+        """
+        Get the chunk hash stored in the metadata of each document with the given content hash.
+
+        Vector databases that return None do not support it, and content upserted into them is rewritten in full.
+
+        Args:
+            content_hash (str): The content hash of the documents
+
+        Returns:
+            Optional[Dict[str, Optional[str]]]: The chunk hash of each document, keyed by the id used by delete_by_id
+        """
+        return None
+
     def optimize(self) -> None:
         raise NotImplementedError
 
@@ -0,0 +1,212 @@
+"""In-process BM25 keyword search, to give hybrid search to vector databases without full-text search."""
+
+import heapq
+import json
+import math
+import os
+import re
+import threading
+from collections import Counter, defaultdict
+from pathlib import Path
+from typing import Callable, Container, Dict, Iterable, List, Optional, Tuple
+
+from agno.utils.log import log_debug, log_warning
+
+
+def tokenize(text: str) -> List[str]:
+    """Split a text into lowercase word tokens."""
+    return re.findall(r"\w+", text.lower())
+
+
+class BM25Index:
+    """Inverted index ranking documents against keyword queries with BM25.
+
+    Documents are added and removed incrementally by id. With a `path`, every change is persisted as an immutable
+    segment file, and the segments are merged into one once there are more than `max_segments`.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        k1: float = 1.5,
+        b: float = 0.75,
+        tokenizer: Optional[Callable[[str], List[str]]] = None,
+        max_segments: int = 16,
+    ):
+        """
+        Args:
+            path (Optional[str]): Directory to persist the segments in. The index is kept in memory if not set.
+            k1 (float): BM25 term frequency saturation.
+            b (float): BM25 document length normalization.
+            tokenizer (Optional[Callable[[str], List[str]]]): Splits texts into terms. Defaults to `tokenize`.
+            max_segments (int): Number of segments above which they are merged.
+        """
+        self.path: Optional[Path] = Path(path) if path is not None else None
+        self.k1 = k1
+        self.b = b
+        self.tokenizer: Callable[[str], List[str]] = tokenizer or tokenize
+        self.max_segments = max_segments
+
+        self._lock = threading.RLock()
+        # term -> document id -> term frequency
+        self._postings: Dict[str, Dict[str, int]] = {}
+        # document id -> term frequencies
+        self._documents: Dict[str, Dict[str, int]] = {}
+        self._lengths: Dict[str, int] = {}
+        self._total_length = 0
+        self._segments: List[Path] = []
+
+        if self.path is not None:
+            self._load()
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def __contains__(self, doc_id: object) -> bool:
+        return doc_id in self._documents
+
+    # -- Writes --
+
+    def add(self, doc_id: str, text: str) -> None:
+        """Add a document, replacing the document with the same id."""
+        self.add_many([(doc_id, text)])
+
+    def add_many(self, documents: Iterable[Tuple[str, str]]) -> None:
+        """Add documents as (id, text) pairs, replacing the documents with the same ids."""
+        entries = [{"id": doc_id, "terms": dict(Counter(self.tokenizer(text)))} for doc_id, text in documents]
+        if not entries:
+            return
+        with self._lock:
+            for entry in entries:
+                self._apply(entry)
+            self._write_segment(entries)
+
+    def remove(self, doc_id: str) -> None:
+        """Remove a document."""
+        self.remove_many([doc_id])
+
+    def remove_many(self, doc_ids: Iterable[str]) -> None:
+        """Remove documents. Unknown ids are ignored."""
+        with self._lock:
+            entries = [{"id": doc_id, "deleted": True} for doc_id in doc_ids if doc_id in self._documents]
+            for entry in entries:
+                self._apply(entry)
+            self._write_segment(entries)
+
+    def clear(self) -> None:
+        """Remove all documents."""
+        with self._lock:
+            self._postings = {}
+            self._documents = {}
+            self._lengths = {}
+            self._total_length = 0
+            for segment in self._segments:
+                segment.unlink(missing_ok=True)
+            self._segments = []
+
+    def _apply(self, entry: Dict) -> None:
+        doc_id = entry["id"]
+        previous_terms = self._documents.pop(doc_id, None)
+        if previous_terms is not None:
+            for term in previous_terms:
+                postings = self._postings[term]
+                del postings[doc_id]
+                if not postings:
+                    del self._postings[term]
+            self._total_length -= self._lengths.pop(doc_id)
+
+        if entry.get("deleted"):
+            return
+        terms: Dict[str, int] = entry["terms"]
+        for term, count in terms.items():
+            self._postings.setdefault(term, {})[doc_id] = count
+        self._documents[doc_id] = terms
+        length = sum(terms.values())
+        self._lengths[doc_id] = length
+        self._total_length += length
+
+    # -- Reads --
+
+    def scores(self, query: str, doc_ids: Optional[Container[str]] = None) -> Dict[str, float]:
+        """Get the BM25 scores of the documents matching at least one query term.
+
+        Args:
+            query (str): The keyword query.
+            doc_ids (Optional[Container[str]]): Ids of the documents to score. All documents if not set.
+        """
+        with self._lock:
+            scores: Dict[str, float] = defaultdict(float)
+            if not self._documents:
+                return scores
+
+            document_count = len(self._documents)
+            average_length = max(self._total_length / document_count, 1)
+            for term in set(self.tokenizer(query)):
+                postings = self._postings.get(term)
+                if not postings:
+                    continue
+                idf = math.log(1 + (document_count - len(postings) + 0.5) / (len(postings) + 0.5))
+                for doc_id, frequency in postings.items():
+                    if doc_ids is not None and doc_id not in doc_ids:
+                        continue
+                    length_norm = 1 - self.b + self.b * self._lengths[doc_id] / average_length
+                    scores[doc_id] += idf * frequency * (self.k1 + 1) / (frequency + self.k1 * length_norm)
+            return scores
+
+    def search(self, query: str, limit: int = 10, doc_ids: Optional[Container[str]] = None) -> List[Tuple[str, float]]:
+        """Get the ids and scores of the best matching documents, best first.
+
+        Args:
+            query (str): The keyword query.
+            limit (int): Maximum number of results.
+            doc_ids (Optional[Container[str]]): Ids of the documents to search. All documents if not set.
+        """
+        scores = self.scores(query, doc_ids=doc_ids)
+        return heapq.nlargest(limit, scores.items(), key=lambda item: item[1])
+
+    # -- Segments --
+
+    def _load(self) -> None:
+        for temp_file in self.path.glob("segment-*.tmp"):  # type: ignore
+            temp_file.unlink(missing_ok=True)
+        self._segments = sorted(self.path.glob("segment-*.jsonl"))  # type: ignore
+        for segment in self._segments:
+            with open(segment, "r", encoding="utf-8") as f:
+                for line in f:
+                    self._apply(json.loads(line))
+        log_debug(f"Loaded BM25 index of {len(self._documents)} documents from {len(self._segments)} segments")
+
+    def _write_segment(self, entries: List[Dict]) -> None:
+        """Persist entries as a new segment. Segments are written to a temporary file, then renamed."""
+        if self.path is None or not entries:
+            return
+
+        self.path.mkdir(parents=True, exist_ok=True)
+        sequence = int(self._segments[-1].stem.split("-")[1]) + 1 if self._segments else 0
+        segment = self.path / f"segment-{sequence:010d}.jsonl"
+        temp_file = segment.with_suffix(".tmp")
+        with open(temp_file, "w", encoding="utf-8") as f:
+            f.write("".join(json.dumps(entry) + "\n" for entry in entries))
+        os.replace(temp_file, segment)
+        self._segments.append(segment)
+
+        if len(self._segments) > self.max_segments:
+            self.merge_segments()
+
+    def merge_segments(self) -> None:
+        """Merge all segments into one holding the current documents."""
+        with self._lock:
+            if self.path is None or len(self._segments) <= 1:
+                return
+            previous_segments = self._segments
+            self._segments = previous_segments[-1:]
+            try:
+                # The merged segment is read last, so the previous segments can be deleted after it is written
+                self._write_segment([{"id": doc_id, "terms": terms} for doc_id, terms in self._documents.items()])
+            except Exception as e:
+                log_warning(f"Error merging BM25 index segments: {e}")
+                self._segments = previous_segments
+                return
+            for segment in previous_segments:
+                segment.unlink(missing_ok=True)
+            self._segments = self._segments[1:]
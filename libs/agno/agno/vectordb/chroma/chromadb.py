@@ -1,6 +1,5 @@
 import asyncio
 import json
-from collections import defaultdict
 from concurrent.futures import ThreadPoolExecutor
 from hashlib import md5
 from typing import Any, Dict, List, Mapping, Optional, Tuple, Union, cast
@@ -18,40 +17,15 @@ except ImportError:
 from agno.filters import FilterExpr
 from agno.knowledge.document import Document
 from agno.knowledge.embedder import Embedder
+from agno.knowledge.embedder.batch import async_embed_documents, embed_documents
 from agno.knowledge.reranker.base import Reranker
 from agno.utils.log import log_debug, log_error, log_info, log_warning, logger
 from agno.vectordb.base import VectorDb
 from agno.vectordb.distance import Distance
+from agno.vectordb.score import reciprocal_rank_fusion
 from agno.vectordb.search import SearchType
 
 
-def reciprocal_rank_fusion(
-    ranked_lists: List[List[Tuple[str, float]]],
-    k: int = 60,
-) -> List[Tuple[str, float]]:
-    """
-    Combine multiple ranked lists using Reciprocal Rank Fusion (RRF).
-
-    RRF is a simple yet effective method for combining multiple rankings.
-    The formula is: RRF(d) = sum(1 / (k + rank_i(d))) for each ranking i
-
-    Args:
-        ranked_lists: List of ranked results, each as [(doc_id, score), ...]
-        k: RRF constant (default 60, as per original paper by Cormack et al.)
-
-    Returns:
-        Fused ranking as [(doc_id, rrf_score), ...] sorted by score descending
-    """
-    rrf_scores: Dict[str, float] = defaultdict(float)
-
-    for ranked_list in ranked_lists:
-        for rank, (doc_id, _) in enumerate(ranked_list, start=1):
-            rrf_scores[doc_id] += 1.0 / (k + rank)
-
-    sorted_results = sorted(rrf_scores.items(), key=lambda x: x[1], reverse=True)
-    return sorted_results
-
-
 class ChromaDb(VectorDb):
     """
     ChromaDb class for managing vector operations with ChromaDB.
@@ -249,8 +223,9 @@ class ChromaDb(VectorDb):
         if not self._collection:
             self._collection = self.client.get_collection(name=self.collection_name)
 
+        embed_documents(self.embedder, documents)
+
         for document in documents:
-            document.embed(embedder=self.embedder)
             cleaned_content = document.content.replace("\x00", "\ufffd")
             doc_id = md5(cleaned_content.encode()).hexdigest()
 
@@ -296,47 +271,7 @@ class ChromaDb(VectorDb):
         if not self._collection:
             self._collection = self.client.get_collection(name=self.collection_name)
 
-        if self.embedder.enable_batch and hasattr(self.embedder, "async_get_embeddings_batch_and_usage"):
-            # Use batch embedding when enabled and supported
-            try:
-                # Extract content from all documents
-                doc_contents = [doc.content for doc in documents]
-
-                # Get batch embeddings and usage
-                embeddings, usages = await self.embedder.async_get_embeddings_batch_and_usage(doc_contents)
-
-                # Process documents with pre-computed embeddings
-                for j, doc in enumerate(documents):
-                    try:
-                        if j < len(embeddings):
-                            doc.embedding = embeddings[j]
-                            doc.usage = usages[j] if j < len(usages) else None
-                    except Exception as e:
-                        logger.error(f"Error assigning batch embedding to document '{doc.name}': {e}")
-
-            except Exception as e:
-                # Check if this is a rate limit error - don't fall back as it would make things worse
-                error_str = str(e).lower()
-                is_rate_limit = any(
-                    phrase in error_str
-                    for phrase in ["rate limit", "too many requests", "429", "trial key", "api calls / minute"]
-                )
-
-                if is_rate_limit:
-                    logger.error(f"Rate limit detected during batch embedding. {e}")
-                    raise e
-                else:
-                    logger.warning(f"Async batch embedding failed, falling back to individual embeddings: {e}")
-                    # Fall back to individual embedding
-                    embed_tasks = [doc.async_embed(embedder=self.embedder) for doc in documents]
-                    await asyncio.gather(*embed_tasks, return_exceptions=True)
-        else:
-            # Use individual embedding
-            try:
-                embed_tasks = [document.async_embed(embedder=self.embedder) for document in documents]
-                await asyncio.gather(*embed_tasks, return_exceptions=True)
-            except Exception as e:
-                logger.error(f"Error processing document: {e}")
+        await async_embed_documents(self.embedder, documents)
 
         for document in documents:
             cleaned_content = document.content.replace("\x00", "\ufffd")
@@ -408,8 +343,9 @@ class ChromaDb(VectorDb):
         if not self._collection:
             self._collection = self.client.get_collection(name=self.collection_name)
 
+        embed_documents(self.embedder, documents)
+
         for document in documents:
-            document.embed(embedder=self.embedder)
             cleaned_content = document.content.replace("\x00", "\ufffd")
             doc_id = md5(cleaned_content.encode()).hexdigest()
 
@@ -460,44 +396,7 @@ class ChromaDb(VectorDb):
         if not self._collection:
             self._collection = self.client.get_collection(name=self.collection_name)
 
-        if self.embedder.enable_batch and hasattr(self.embedder, "async_get_embeddings_batch_and_usage"):
-            # Use batch embedding when enabled and supported
-            try:
-                # Extract content from all documents
-                doc_contents = [doc.content for doc in documents]
-
-                # Get batch embeddings and usage
-                embeddings, usages = await self.embedder.async_get_embeddings_batch_and_usage(doc_contents)
-
-                # Process documents with pre-computed embeddings
-                for j, doc in enumerate(documents):
-                    try:
-                        if j < len(embeddings):
-                            doc.embedding = embeddings[j]
-                            doc.usage = usages[j] if j < len(usages) else None
-                    except Exception as e:
-                        logger.error(f"Error assigning batch embedding to document '{doc.name}': {e}")
-
-            except Exception as e:
-                # Check if this is a rate limit error - don't fall back as it would make things worse
-                error_str = str(e).lower()
-                is_rate_limit = any(
-                    phrase in error_str
-                    for phrase in ["rate limit", "too many requests", "429", "trial key", "api calls / minute"]
-                )
-
-                if is_rate_limit:
-                    logger.error(f"Rate limit detected during batch embedding. {e}")
-                    raise e
-                else:
-                    logger.warning(f"Async batch embedding failed, falling back to individual embeddings: {e}")
-                    # Fall back to individual embedding
-                    embed_tasks = [doc.async_embed(embedder=self.embedder) for doc in documents]
-                    await asyncio.gather(*embed_tasks, return_exceptions=True)
-        else:
-            # Use individual embedding
-            embed_tasks = [document.async_embed(embedder=self.embedder) for document in documents]
-            await asyncio.gather(*embed_tasks, return_exceptions=True)
+        await async_embed_documents(self.embedder, documents)
 
         for document in documents:
             cleaned_content = document.content.replace("\x00", "\ufffd")
@@ -1,4 +1,3 @@
-import asyncio
 import json
 from hashlib import md5
 from os import getenv
@@ -13,6 +12,7 @@ except ImportError:
 from agno.filters import FilterExpr
 from agno.knowledge.document import Document
 from agno.knowledge.embedder import Embedder
+from agno.knowledge.embedder.batch import async_embed_documents, embed_documents
 from agno.knowledge.reranker.base import Reranker
 from agno.utils.log import log_debug, log_info, log_warning, logger
 from agno.vectordb.base import VectorDb
@@ -310,8 +310,13 @@ class LanceDb(VectorDb):
             return
 
         log_debug(f"Inserting {len(documents)} documents")
-        data = []
 
+        # Only embed the documents without a valid embedding
+        # This prevents duplicate embedding when called from async_insert or async_upsert
+        # Check for both None and empty list (async embedding failures return [])
+        embed_documents(self.embedder, [document for document in documents if not document.embedding])
+
+        data = []
         for document in documents:
             # Add filters to document metadata if provided
             if filters:
@@ -319,11 +324,6 @@ class LanceDb(VectorDb):
                 meta_data.update(filters)
                 document.meta_data = meta_data
 
-            # Only embed if the document doesn't already have a valid embedding
-            # This prevents duplicate embedding when called from async_insert or async_upsert
-            # Check for both None and empty list (async embedding failures return [])
-            if document.embedding is None or (isinstance(document.embedding, list) and len(document.embedding) == 0):
-                document.embed(embedder=self.embedder)
             cleaned_content = document.content.replace("\x00", "\ufffd")
             # Include content_hash in ID to ensure uniqueness across different content hashes
             base_id = document.id or md5(cleaned_content.encode()).hexdigest()
@@ -380,39 +380,8 @@ class LanceDb(VectorDb):
         log_debug(f"Inserting {len(documents)} documents")
 
         # Still do async embedding for performance
-        if self.embedder.enable_batch and hasattr(self.embedder, "async_get_embeddings_batch_and_usage"):
-            try:
-                doc_contents = [doc.content for doc in documents]
-                embeddings, usages = await self.embedder.async_get_embeddings_batch_and_usage(doc_contents)
-
-                for j, doc in enumerate(documents):
-                    if j < len(embeddings):
-                        doc.embedding = embeddings[j]
-                        doc.usage = usages[j] if j < len(usages) else None
-            except Exception as e:
-                error_str = str(e).lower()
-                is_rate_limit = any(
-                    phrase in error_str
-                    for phrase in ["rate limit", "too many requests", "429", "trial key", "api calls / minute"]
-                )
-                if is_rate_limit:
-                    logger.error(f"Rate limit detected during batch embedding. {e}")
-                    raise e
-                else:
-                    logger.warning(f"Async batch embedding failed, falling back to individual embeddings: {e}")
-                    embed_tasks = [doc.async_embed(embedder=self.embedder) for doc in documents]
-                    results = await asyncio.gather(*embed_tasks, return_exceptions=True)
-                    # Log any embedding failures (they will be re-tried in sync insert)
-                    for i, result in enumerate(results):
-                        if isinstance(result, Exception):
-                            log_warning(f"Async embedding failed for document {i}, will retry in sync insert: {result}")
-        else:
-            embed_tasks = [doc.async_embed(embedder=self.embedder) for doc in documents]
-            results = await asyncio.gather(*embed_tasks, return_exceptions=True)
-            # Log any embedding failures (they will be re-tried in sync insert)
-            for i, result in enumerate(results):
-                if isinstance(result, Exception):
-                    log_warning(f"Async embedding failed for document {i}, will retry in sync insert: {result}")
+        # Documents that failed async embedding are re-tried in sync insert
+        await async_embed_documents(self.embedder, documents)
 
         # Use sync insert to avoid sync/async table synchronization issues
         # Sync insert will re-embed any documents that failed async embedding
@@ -444,39 +413,8 @@ class LanceDb(VectorDb):
         """
         if len(documents) > 0:
             # Do async embedding for performance
-            if self.embedder.enable_batch and hasattr(self.embedder, "async_get_embeddings_batch_and_usage"):
-                try:
-                    doc_contents = [doc.content for doc in documents]
-                    embeddings, usages = await self.embedder.async_get_embeddings_batch_and_usage(doc_contents)
-                    for j, doc in enumerate(documents):
-                        if j < len(embeddings):
-                            doc.embedding = embeddings[j]
-                            doc.usage = usages[j] if j < len(usages) else None
-                except Exception as e:
-                    error_str = str(e).lower()
-                    is_rate_limit = any(
-                        phrase in error_str
-                        for phrase in ["rate limit", "too many requests", "429", "trial key", "api calls / minute"]
-                    )
-                    if is_rate_limit:
-                        raise e
-                    else:
-                        logger.warning(f"Async batch embedding failed, falling back to individual embeddings: {e}")
-                        embed_tasks = [doc.async_embed(embedder=self.embedder) for doc in documents]
-                        results = await asyncio.gather(*embed_tasks, return_exceptions=True)
-                        # Log any embedding failures (they will be re-tried in sync upsert)
-                        for i, result in enumerate(results):
-                            if isinstance(result, Exception):
-                                log_warning(
-                                    f"Async embedding failed for document {i}, will retry in sync upsert: {result}"
-                                )
-            else:
-                embed_tasks = [doc.async_embed(embedder=self.embedder) for doc in documents]
-                results = await asyncio.gather(*embed_tasks, return_exceptions=True)
-                # Log any embedding failures (they will be re-tried in sync upsert)
-                for i, result in enumerate(results):
-                    if isinstance(result, Exception):
-                        log_warning(f"Async embedding failed for document {i}, will retry in sync upsert: {result}")
+            # Documents that failed async embedding are re-tried in sync upsert
+            await async_embed_documents(self.embedder, documents)
 
         # Use sync upsert for reliability
         # Sync upsert (via insert) will re-embed any documents that failed async embedding
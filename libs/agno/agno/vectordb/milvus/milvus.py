@@ -12,6 +12,7 @@ except ImportError:
 from agno.filters import FilterExpr
 from agno.knowledge.document import Document
 from agno.knowledge.embedder import Embedder
+from agno.knowledge.embedder.batch import async_embed_documents, embed_documents
 from agno.knowledge.reranker.base import Reranker
 from agno.utils.log import log_debug, log_error, log_info, log_warning
 from agno.vectordb.base import VectorDb
@@ -390,7 +391,6 @@ class Milvus(VectorDb):
     def _insert_hybrid_document(self, content_hash: str, document: Document) -> None:
         """Insert a document with both dense and sparse vectors."""
         data = self._prepare_document_data(content_hash=content_hash, document=document, include_vectors=True)
-        document.embed(embedder=self.embedder)
         self.client.insert(
             collection_name=self.collection,
             data=data,
@@ -411,12 +411,13 @@ class Milvus(VectorDb):
         """Insert documents based on search type."""
         log_debug(f"Inserting {len(documents)} documents")
 
+        embed_documents(self.embedder, documents)
+
         if self.search_type == SearchType.hybrid:
             for document in documents:
                 self._insert_hybrid_document(content_hash=content_hash, document=document)
         else:
             for document in documents:
-                document.embed(embedder=self.embedder)
                 if not document.embedding:
                     log_debug(f"Skipping document without embedding: {document.name} ({document.meta_data})")
                     continue
@@ -451,44 +452,7 @@ class Milvus(VectorDb):
         """Insert documents asynchronously based on search type."""
         log_info(f"Inserting {len(documents)} documents asynchronously")
 
-        if self.embedder.enable_batch and hasattr(self.embedder, "async_get_embeddings_batch_and_usage"):
-            # Use batch embedding when enabled and supported
-            try:
-                # Extract content from all documents
-                doc_contents = [doc.content for doc in documents]
-
-                # Get batch embeddings and usage
-                embeddings, usages = await self.embedder.async_get_embeddings_batch_and_usage(doc_contents)
-
-                # Process documents with pre-computed embeddings
-                for j, doc in enumerate(documents):
-                    try:
-                        if j < len(embeddings):
-                            doc.embedding = embeddings[j]
-                            doc.usage = usages[j] if j < len(usages) else None
-                    except Exception as e:
-                        log_error(f"Error assigning batch embedding to document '{doc.name}': {e}")
-
-            except Exception as e:
-                # Check if this is a rate limit error - don't fall back as it would make things worse
-                error_str = str(e).lower()
-                is_rate_limit = any(
-                    phrase in error_str
-                    for phrase in ["rate limit", "too many requests", "429", "trial key", "api calls / minute"]
-                )
-
-                if is_rate_limit:
-                    log_error(f"Rate limit detected during batch embedding. {e}")
-                    raise e
-                else:
-                    log_error(f"Async batch embedding failed, falling back to individual embeddings: {e}")
-                    # Fall back to individual embedding
-                    embed_tasks = [doc.async_embed(embedder=self.embedder) for doc in documents]
-                    await asyncio.gather(*embed_tasks, return_exceptions=True)
-        else:
-            # Use individual embedding
-            embed_tasks = [document.async_embed(embedder=self.embedder) for document in documents]
-            await asyncio.gather(*embed_tasks, return_exceptions=True)
+        await async_embed_documents(self.embedder, documents)
 
         if self.search_type == SearchType.hybrid:
             await asyncio.gather(
@@ -497,7 +461,6 @@ class Milvus(VectorDb):
         else:
 
             async def process_document(document):
-                document.embed(embedder=self.embedder)
                 if not document.embedding:
                     log_debug(f"Skipping document without embedding: {document.name} ({document.meta_data})")
                     return None
@@ -550,9 +513,10 @@ class Milvus(VectorDb):
         """
         log_debug(f"Upserting {len(documents)} documents")
 
+        embed_documents(self.embedder, documents)
+
         if self.search_type == SearchType.hybrid:
             for document in documents:
-                document.embed(embedder=self.embedder)
                 data = self._prepare_document_data(content_hash=content_hash, document=document, include_vectors=True)
                 self.client.upsert(
                     collection_name=self.collection,
@@ -561,7 +525,6 @@ class Milvus(VectorDb):
                 log_debug(f"Upserted hybrid document: {document.name} ({document.meta_data})")
         else:
             for document in documents:
-                document.embed(embedder=self.embedder)
                 cleaned_content = document.content.replace("\x00", "\ufffd")
                 doc_id = md5(cleaned_content.encode()).hexdigest()
 
@@ -590,44 +553,7 @@ class Milvus(VectorDb):
     ) -> None:
         log_debug(f"Upserting {len(documents)} documents asynchronously")
 
-        if self.embedder.enable_batch and hasattr(self.embedder, "async_get_embeddings_batch_and_usage"):
-            # Use batch embedding when enabled and supported
-            try:
-                # Extract content from all documents
-                doc_contents = [doc.content for doc in documents]
-
-                # Get batch embeddings and usage
-                embeddings, usages = await self.embedder.async_get_embeddings_batch_and_usage(doc_contents)
-
-                # Process documents with pre-computed embeddings
-                for j, doc in enumerate(documents):
-                    try:
-                        if j < len(embeddings):
-                            doc.embedding = embeddings[j]
-                            doc.usage = usages[j] if j < len(usages) else None
-                    except Exception as e:
-                        log_error(f"Error assigning batch embedding to document '{doc.name}': {e}")
-
-            except Exception as e:
-                # Check if this is a rate limit error - don't fall back as it would make things worse
-                error_str = str(e).lower()
-                is_rate_limit = any(
-                    phrase in error_str
-                    for phrase in ["rate limit", "too many requests", "429", "trial key", "api calls / minute"]
-                )
-
-                if is_rate_limit:
-                    log_error(f"Rate limit detected during batch embedding. {e}")
-                    raise e
-                else:
-                    log_error(f"Async batch embedding failed, falling back to individual embeddings: {e}")
-                    # Fall back to individual embedding
-                    embed_tasks = [doc.async_embed(embedder=self.embedder) for doc in documents]
-                    await asyncio.gather(*embed_tasks, return_exceptions=True)
-        else:
-            # Use individual embedding
-            embed_tasks = [document.async_embed(embedder=self.embedder) for document in documents]
-            await asyncio.gather(*embed_tasks, return_exceptions=True)
+        await async_embed_documents(self.embedder, documents)
 
         if self.search_type == SearchType.hybrid:
 
@@ -0,0 +1,6 @@
+from agno.vectordb.numpydb.numpy_db import NumpyDb, SearchType
+
+__all__ = [
+    "NumpyDb",
+    "SearchType",
+]
@@ -0,0 +1,704 @@
+import json
+import os
+import threading
+from hashlib import md5
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+from uuid import uuid4
+
+try:
+    import numpy as np
+except ImportError:
+    raise ImportError("`numpy` not installed. Please install using `pip install numpy`")
+
+from agno.filters import FilterExpr
+from agno.knowledge.document import Document
+from agno.knowledge.embedder import Embedder
+from agno.knowledge.embedder.batch import async_embed_documents, embed_documents
+from agno.knowledge.reranker.base import Reranker
+from agno.utils.log import log_debug, log_error, log_info, log_warning
+from agno.vectordb.base import CHUNK_HASH_KEY, VectorDb
+from agno.vectordb.bm25 import BM25Index
+from agno.vectordb.distance import Distance
+from agno.vectordb.search import SearchType
+
+RECORDS_FILE = "records.jsonl"
+
+
+def _matches_filter(filter_expr: Dict[str, Any], meta_data: Dict[str, Any]) -> bool:
+    """Check if metadata matches a filter expression, in its dictionary representation."""
+    op = filter_expr["op"]
+    if op == "EQ":
+        return meta_data.get(filter_expr["key"]) == filter_expr["value"]
+    elif op == "IN":
+        return meta_data.get(filter_expr["key"]) in filter_expr["values"]
+    elif op in ("GT", "LT"):
+        value = meta_data.get(filter_expr["key"])
+        try:
+            return value > filter_expr["value"] if op == "GT" else value < filter_expr["value"]  # type: ignore
+        except TypeError:
+            return False
+    elif op == "NOT":
+        return not _matches_filter(filter_expr["condition"], meta_data)
+    elif op == "AND":
+        return all(_matches_filter(condition, meta_data) for condition in filter_expr["conditions"])
+    elif op == "OR":
+        return any(_matches_filter(condition, meta_data) for condition in filter_expr["conditions"])
+    else:
+        raise ValueError(f"Unknown filter operator: {op}")
+
+
+class NumpyDb(VectorDb):
+    """
+    NumpyDb class for managing vector operations in-process, without an external service.
+
+    Embeddings are kept in a float32 matrix and searched exactly. With a `path`, the matrix is a memory-mapped file
+    and the records are kept in a JSONL sidecar file, both appended to on insert. Deleted rows are tombstoned until
+    the store is compacted. Without a `path`, everything is kept in memory.
+
+    Args:
+        path: Directory to store the vectors and records in. Everything is kept in memory if not set.
+        name: Name of the vector database.
+        description: Description of the vector database.
+        embedder: The embedder to use when embedding the document contents.
+        search_type: The search type to use when searching for documents.
+        distance: The distance metric to use when searching for documents.
+        reranker: The reranker to use when reranking documents.
+        similarity_threshold: Minimum similarity (0.0-1.0) of the documents returned by vector search.
+        vector_score_weight: Weight of the vector similarity in hybrid search, the BM25 score gets the rest.
+        compaction_threshold: Share of deleted rows after which the store is compacted. Never compacted
+            automatically if not set.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        name: Optional[str] = None,
+        description: Optional[str] = None,
+        id: Optional[str] = None,
+        embedder: Optional[Embedder] = None,
+        search_type: SearchType = SearchType.vector,
+        distance: Distance = Distance.cosine,
+        reranker: Optional[Reranker] = None,
+        similarity_threshold: Optional[float] = None,
+        vector_score_weight: float = 0.5,
+        compaction_threshold: Optional[float] = 0.25,
+    ):
+        if id is None and path is not None:
+            from agno.utils.string import generate_id
+
+            id = generate_id(f"numpydb#{Path(path).resolve()}")
+
+        super().__init__(id=id, name=name, description=description, similarity_threshold=similarity_threshold)
+
+        # Embedder for embedding the document contents
+        if embedder is None:
+            from agno.knowledge.embedder.openai import OpenAIEmbedder
+
+            embedder = OpenAIEmbedder()
+            log_info("Embedder not provided, using OpenAIEmbedder as default.")
+        self.embedder: Embedder = embedder
+        if self.embedder.dimensions is None:
+            raise ValueError("Embedder.dimensions must be set.")
+        self.dimensions: int = self.embedder.dimensions
+
+        if not 0 <= vector_score_weight <= 1:
+            raise ValueError("vector_score_weight must be between 0 and 1")
+
+        self.path: Optional[Path] = Path(path) if path is not None else None
+        self.search_type: SearchType = search_type
+        self.distance: Distance = distance
+        self.reranker: Optional[Reranker] = reranker
+        self.vector_score_weight: float = vector_score_weight
+        self.compaction_threshold: Optional[float] = compaction_threshold
+
+        self._lock = threading.RLock()
+        self._reset()
+        if self.path is not None and (self.path / RECORDS_FILE).exists():
+            self._load()
+
+    # -- Storage --
+
+    def _reset(self) -> None:
+        """Forget all rows."""
+        self._created = False
+        # Records of the rows, None for deleted rows
+        self._records: List[Optional[Dict[str, Any]]] = []
+        self._vectors: np.ndarray = np.empty((0, self.dimensions), dtype=np.float32)
+        self._norms: np.ndarray = np.empty(0, dtype=np.float32)
+        self._alive: np.ndarray = np.empty(0, dtype=bool)
+        self._deleted_count = 0
+        # Document id -> row
+        self._rows_by_id: Dict[str, int] = {}
+        # Built on the first keyword or hybrid search
+        self._keyword_index: Optional[BM25Index] = None
+        self._vectors_file: Optional[str] = None
+
+    def _load(self) -> None:
+        """Load the rows stored in `path`."""
+        records: List[Optional[Dict[str, Any]]] = []
+        records_path = self.path / RECORDS_FILE  # type: ignore
+        with open(records_path, "rb") as f:
+            valid_size = 0
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    entry = None
+                if entry is None or not line.endswith(b"\n"):
+                    # A line cut by a crash while writing. Drop it so that the next writes are readable.
+                    log_warning(f"Ignoring invalid line in {records_path}")
+                    os.truncate(records_path, valid_size)
+                    break
+                valid_size += len(line)
+                op = entry["op"]
+                if op == "header":
+                    if entry["dimensions"] != self.dimensions:
+                        raise ValueError(
+                            f"NumpyDb at {self.path} stores {entry['dimensions']} dimensional vectors, "
+                            f"but the embedder has {self.dimensions} dimensions"
+                        )
+                    self._vectors_file = entry["vectors_file"]
+                elif op == "insert":
+                    records.append(entry["record"])
+                elif op == "update":
+                    records[entry["row"]] = entry["record"]
+                elif op == "delete":
+                    for row in entry["rows"]:
+                        records[row] = None
+
+        vectors_path = self._vectors_path()
+        row_size = self.dimensions * np.dtype(np.float32).itemsize
+        stored_rows = vectors_path.stat().st_size // row_size if vectors_path.exists() else 0
+        if stored_rows < len(records):
+            log_warning(f"Ignoring {len(records) - stored_rows} records without vectors in {self.path}")
+            records = records[:stored_rows]
+        elif stored_rows > len(records):
+            # Vectors appended by a write whose records were not written
+            os.truncate(vectors_path, len(records) * row_size)
+
+        self._created = True
+        self._records = records
+        self._map_vectors()
+        self._norms = np.linalg.norm(self._vectors, axis=1).astype(np.float32)
+        self._alive = np.array([record is not None for record in records], dtype=bool)
+        self._deleted_count = len(records) - int(self._alive.sum())
+        self._rows_by_id = {record["id"]: row for row, record in enumerate(records) if record is not None}
+        log_debug(f"Loaded {len(self._rows_by_id)} documents from {self.path}")
+
+    def _vectors_path(self) -> Path:
+        return self.path / self._vectors_file  # type: ignore
+
+    def _map_vectors(self) -> None:
+        """Memory-map the stored vectors."""
+        if len(self._records) == 0:
+            self._vectors = np.empty((0, self.dimensions), dtype=np.float32)
+        else:
+            self._vectors = np.memmap(
+                self._vectors_path(), dtype=np.float32, mode="r", shape=(len(self._records), self.dimensions)
+            )
+
+    def _write_files(self, records: List[Optional[Dict[str, Any]]], vectors: "np.ndarray") -> None:
+        """Write new files for the given rows. Replacing the records file switches to the new vectors file."""
+        previous_vectors_file = self._vectors_file
+        self._vectors_file = f"vectors-{uuid4().hex}.f32"
+        self.path.mkdir(parents=True, exist_ok=True)  # type: ignore
+        with open(self._vectors_path(), "wb") as f:
+            f.write(np.ascontiguousarray(vectors, dtype=np.float32).tobytes())
+            f.flush()
+            os.fsync(f.fileno())
+
+        records_path = self.path / RECORDS_FILE  # type: ignore
+        temp_path = records_path.with_suffix(".jsonl.tmp")
+        with open(temp_path, "w", encoding="utf-8") as f:
+            header = {"op": "header", "dimensions": self.dimensions, "vectors_file": self._vectors_file}
+            f.write(json.dumps(header) + "\n")
+            for record in records:
+                f.write(json.dumps({"op": "insert", "record": record}) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, records_path)
+
+        if previous_vectors_file is not None and previous_vectors_file != self._vectors_file:
+            (self.path / previous_vectors_file).unlink(missing_ok=True)  # type: ignore
+
+    def _log(self, entries: Iterable[Dict[str, Any]]) -> None:
+        """Append entries to the records file."""
+        if self.path is None:
+            return
+        with open(self.path / RECORDS_FILE, "a", encoding="utf-8") as f:
+            f.write("".join(json.dumps(entry) + "\n" for entry in entries))
+
+    def _append(self, records: List[Dict[str, Any]], vectors: "np.ndarray") -> None:
+        """Append rows. Vectors are written before their records, so a crash can't leave records without vectors."""
+        if not self._created:
+            self.create()
+
+        first_row = len(self._records)
+        if self.path is not None:
+            with open(self._vectors_path(), "ab") as f:
+                f.write(vectors.tobytes())
+            self._log({"op": "insert", "record": record} for record in records)
+            self._records.extend(records)
+            self._map_vectors()
+        else:
+            self._records.extend(records)
+            self._vectors = np.concatenate([self._vectors, vectors])
+
+        self._norms = np.concatenate([self._norms, np.linalg.norm(vectors, axis=1).astype(np.float32)])
+        self._alive = np.concatenate([self._alive, np.ones(len(records), dtype=bool)])
+        for row, record in enumerate(records, start=first_row):
+            self._rows_by_id[record["id"]] = row
+        if self._keyword_index is not None:
+            self._keyword_index.add_many((record["id"], record["content"]) for record in records)
+
+    def _delete_rows(self, rows: List[int]) -> None:
+        """Tombstone rows, compacting the store if too many rows are deleted."""
+        rows = [row for row in rows if self._records[row] is not None]
+        if not rows:
+            return
+
+        for row in rows:
+            record = self._records[row]
+            self._records[row] = None
+            self._alive[row] = False
+            self._rows_by_id.pop(record["id"], None)  # type: ignore
+            if self._keyword_index is not None:
+                self._keyword_index.remove(record["id"])  # type: ignore
+        self._deleted_count += len(rows)
+        self._log([{"op": "delete", "rows": rows}])
+
+        if self.compaction_threshold is not None and self._deleted_count > self.compaction_threshold * len(
+            self._records
+        ):
+            self.optimize()
+
+    def _find_rows(self, **fields: Any) -> List[int]:
+        """Get the rows whose records have the given field values."""
+        return [
+            row
+            for row, record in enumerate(self._records)
+            if record is not None and all(record.get(key) == value for key, value in fields.items())
+        ]
+
+    def optimize(self) -> None:
+        """Compact the store, dropping the deleted rows."""
+        with self._lock:
+            if self._deleted_count == 0:
+                return
+            keep = np.flatnonzero(self._alive)
+            records = [self._records[row] for row in keep]
+            vectors = np.array(self._vectors[keep], dtype=np.float32).reshape(len(keep), self.dimensions)
+            norms = self._norms[keep]
+
+            if self.path is not None:
+                # Unmap the vectors file before replacing it
+                self._vectors = vectors
+                self._write_files(records, vectors)
+                self._records = records
+                self._map_vectors()
+            else:
+                self._records = records
+                self._vectors = vectors
+
+            self._norms = norms
+            self._alive = np.ones(len(records), dtype=bool)
+            log_debug(f"Compacted NumpyDb, dropped {self._deleted_count} deleted rows")
+            self._deleted_count = 0
+            self._rows_by_id = {record["id"]: row for row, record in enumerate(records)}  # type: ignore
+            self._keyword_index = None
+
+    # -- Lifecycle --
+
+    def create(self) -> None:
+        """Create the store if it does not exist."""
+        with self._lock:
+            if self.exists():
+                return
+            if self.path is not None:
+                self._write_files([], np.empty((0, self.dimensions), dtype=np.float32))
+            self._created = True
+
+    async def async_create(self) -> None:
+        self.create()
+
+    def exists(self) -> bool:
+        if self.path is not None:
+            return (self.path / RECORDS_FILE).exists()
+        return self._created
+
+    async def async_exists(self) -> bool:
+        return self.exists()
+
+    def drop(self) -> None:
+        """Delete the store and its files."""
+        with self._lock:
+            if self.path is not None and self.exists():
+                vectors_path = self._vectors_path() if self._vectors_file else None
+                self._vectors = np.empty((0, self.dimensions), dtype=np.float32)
+                (self.path / RECORDS_FILE).unlink(missing_ok=True)
+                if vectors_path is not None:
+                    vectors_path.unlink(missing_ok=True)
+                log_debug(f"Deleted NumpyDb files in {self.path}")
+            self._reset()
+
+    async def async_drop(self) -> None:
+        self.drop()
+
+    def delete(self) -> bool:
+        """Delete all documents."""
+        with self._lock:
+            exists, vectors_file = self.exists(), self._vectors_file
+            self._reset()
+            if self.path is not None and exists:
+                self._vectors_file = vectors_file
+                self._write_files([], np.empty((0, self.dimensions), dtype=np.float32))
+            self._created = exists
+            return True
+
+    def get_count(self) -> int:
+        return len(self._rows_by_id)
+
+    # -- Writes --
+
+    def _build_records(
+        self, content_hash: str, documents: List[Document], filters: Optional[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        # Records by id: documents with the same id within a batch keep the last one
+        records: Dict[str, Dict[str, Any]] = {}
+        for document in documents:
+            if not document.embedding or len(document.embedding) != self.dimensions:
+                log_error(f"Skipping document without a valid embedding: {document.name}")
+                continue
+
+            meta_data = dict(document.meta_data) if document.meta_data else {}
+            if filters:
+                meta_data.update(filters)
+
+            cleaned_content = document.content.replace("\x00", "\ufffd")
+            # Include content_hash in ID to ensure uniqueness across different content hashes
+            base_id = document.id or md5(cleaned_content.encode()).hexdigest()
+            record_id = md5(f"{base_id}_{content_hash}".encode()).hexdigest()
+            records.pop(record_id, None)
+            records[record_id] = {
+                "id": record_id,
+                "name": document.name,
+                "meta_data": meta_data,
+                "content": cleaned_content,
+                "usage": document.usage,
+                "content_id": document.content_id,
+                "content_hash": content_hash,
+                "embedding": document.embedding,
+            }
+        return list(records.values())
+
+    def _write(
+        self,
+        content_hash: str,
+        documents: List[Document],
+        filters: Optional[Dict[str, Any]] = None,
+        replace_content_hash: bool = False,
+    ) -> None:
+        """Add embedded documents, replacing the documents with the same ids."""
+        records = self._build_records(content_hash, documents, filters)
+        vectors = np.array([record.pop("embedding") for record in records], dtype=np.float32).reshape(
+            len(records), self.dimensions
+        )
+        with self._lock:
+            rows_to_delete = [self._rows_by_id[record["id"]] for record in records if record["id"] in self._rows_by_id]
+            if replace_content_hash:
+                rows_to_delete.extend(self._find_rows(content_hash=content_hash))
+            self._delete_rows(sorted(set(rows_to_delete)))
+            if records:
+                self._append(records, vectors)
+        log_debug(f"Inserted {len(records)} documents")
+
+    def insert(self, content_hash: str, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Insert documents into the store.
+
+        Args:
+            documents (List[Document]): List of documents to insert
+            filters (Optional[Dict[str, Any]]): Filters to add as metadata to documents
+        """
+        log_debug(f"Inserting {len(documents)} documents")
+        embed_documents(self.embedder, documents)
+        self._write(content_hash, documents, filters)
+
+    async def async_insert(
+        self, content_hash: str, documents: List[Document], filters: Optional[Dict[str, Any]] = None
+    ) -> None:
+        log_debug(f"Inserting {len(documents)} documents asynchronously")
+        await async_embed_documents(self.embedder, documents)
+        self._write(content_hash, documents, filters)
+
+    def upsert_available(self) -> bool:
+        return True
+
+    def upsert(self, content_hash: str, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Upsert documents, replacing the documents previously inserted with the same content hash.
+
+        Args:
+            documents (List[Document]): List of documents to upsert
+            filters (Optional[Dict[str, Any]]): Filters to add as metadata to documents
+        """
+        log_debug(f"Upserting {len(documents)} documents")
+        embed_documents(self.embedder, documents)
+        self._write(content_hash, documents, filters, replace_content_hash=True)
+
+    async def async_upsert(
+        self, content_hash: str, documents: List[Document], filters: Optional[Dict[str, Any]] = None
+    ) -> None:
+        log_debug(f"Upserting {len(documents)} documents asynchronously")
+        await async_embed_documents(self.embedder, documents)
+        self._write(content_hash, documents, filters, replace_content_hash=True)
+
+    def update_metadata(self, content_id: str, metadata: Dict[str, Any]) -> None:
+        """
+        Update the metadata for documents with the given content_id.
+
+        Args:
+            content_id (str): The content ID to update
+            metadata (Dict[str, Any]): The metadata to update
+        """
+        with self._lock:
+            entries = []
+            for row in self._find_rows(content_id=content_id):
+                record = dict(self._records[row])  # type: ignore
+                record["meta_data"] = {**(record.get("meta_data") or {}), **metadata}
+                self._records[row] = record
+                entries.append({"op": "update", "row": row, "record": record})
+            self._log(entries)
+        log_debug(f"Updated metadata for {len(entries)} documents with content_id: {content_id}")
+
+    # -- Deletes --
+
+    def _delete_where(self, description: str, **fields: Any) -> bool:
+        with self._lock:
+            rows = self._find_rows(**fields)
+            self._delete_rows(rows)
+        if rows:
+            log_info(f"Deleted {len(rows)} documents with {description}")
+        else:
+            log_info(f"No documents found with {description} to delete.")
+        return len(rows) > 0
+
+    def delete_by_id(self, id: str) -> bool:
+        return self._delete_where(f"id '{id}'", id=id)
+
+    def delete_by_name(self, name: str) -> bool:
+        return self._delete_where(f"name '{name}'", name=name)
+
+    def delete_by_content_id(self, content_id: str) -> bool:
+        return self._delete_where(f"content_id '{content_id}'", content_id=content_id)
+
+    def _delete_by_content_hash(self, content_hash: str) -> bool:
+        return self._delete_where(f"content_hash '{content_hash}'", content_hash=content_hash)
+
+    def delete_by_metadata(self, metadata: Dict[str, Any]) -> bool:
+        with self._lock:
+            rows = [
+                row
+                for row, record in enumerate(self._records)
+                if record is not None
+                and all(
+                    key in record["meta_data"] and record["meta_data"][key] == value for key, value in metadata.items()
+                )
+            ]
+            self._delete_rows(rows)
+        log_info(f"Deleted {len(rows)} documents with metadata '{metadata}'")
+        return len(rows) > 0
+
+    # -- Reads --
+
+    def name_exists(self, name: str) -> bool:
+        with self._lock:
+            return any(record is not None and record["name"] == name for record in self._records)
+
+    async def async_name_exists(self, name: str) -> bool:
+        return self.name_exists(name)
+
+    def id_exists(self, id: str) -> bool:
+        return id in self._rows_by_id
+
+    def content_hash_exists(self, content_hash: str) -> bool:
+        with self._lock:
+            return any(record is not None and record["content_hash"] == content_hash for record in self._records)
+
+    def get_chunk_hashes(self, content_hash: str) -> Optional[Dict[str, Optional[str]]]:
+        with self._lock:
+            return {
+                record["id"]: (record["meta_data"] or {}).get(CHUNK_HASH_KEY)
+                for record in self._records
+                if record is not None and record["content_hash"] == content_hash
+            }
+
+    def get_supported_search_types(self) -> List[str]:
+        return [SearchType.vector, SearchType.keyword, SearchType.hybrid]
+
+    def search(
+        self, query: str, limit: int = 5, filters: Optional[Union[Dict[str, Any], List[FilterExpr]]] = None
+    ) -> List[Document]:
+        """
+        Search for documents matching the query.
+
+        Args:
+            query (str): Query string to search for
+            limit (int): Maximum number of results to return
+            filters (Optional[Union[Dict[str, Any], List[FilterExpr]]]): Filters to apply before ranking
+
+        Returns:
+            List[Document]: List of matching documents
+        """
+        query_embedding = None
+        if self.search_type in [SearchType.vector, SearchType.hybrid]:
+            query_embedding = self.embedder.get_embedding(query)
+            if not query_embedding:
+                log_error(f"Error getting embedding for Query: {query}")
+                return []
+        return self._search(query, query_embedding, limit, filters)
+
+    async def async_search(
+        self, query: str, limit: int = 5, filters: Optional[Union[Dict[str, Any], List[FilterExpr]]] = None
+    ) -> List[Document]:
+        query_embedding = None
+        if self.search_type in [SearchType.vector, SearchType.hybrid]:
+            query_embedding = await self.embedder.async_get_embedding(query)
+            if not query_embedding:
+                log_error(f"Error getting embedding for Query: {query}")
+                return []
+        return self._search(query, query_embedding, limit, filters)
+
+    def _search(
+        self,
+        query: str,
+        query_embedding: Optional[List[float]],
+        limit: int,
+        filters: Optional[Union[Dict[str, Any], List[FilterExpr]]],
+    ) -> List[Document]:
+        if limit <= 0:
+            return []
+
+        with self._lock:
+            candidates = np.flatnonzero(self._alive & self._filter_mask(filters))
+            vector_ranks: Optional[np.ndarray] = None
+            vector_scores: Optional[np.ndarray] = None
+            keyword_scores: Optional[np.ndarray] = None
+
+            if self.search_type in [SearchType.keyword, SearchType.hybrid]:
+                keyword_scores = self._keyword_scores(query)[candidates]
+                if self.search_type == SearchType.keyword:
+                    candidates, keyword_scores = candidates[keyword_scores > 0], keyword_scores[keyword_scores > 0]
+            if self.search_type in [SearchType.vector, SearchType.hybrid]:
+                vector_ranks, vector_scores = self._vector_scores(query_embedding, candidates)  # type: ignore
+                if self.similarity_threshold is not None:
+                    above_threshold = vector_scores >= self.similarity_threshold
+                    candidates = candidates[above_threshold]
+                    vector_ranks, vector_scores = vector_ranks[above_threshold], vector_scores[above_threshold]
+                    if keyword_scores is not None:
+                        keyword_scores = keyword_scores[above_threshold]
+
+            scores: np.ndarray
+            if vector_scores is not None and keyword_scores is not None:
+                max_keyword_score = keyword_scores.max() if len(keyword_scores) else 0
+                normalized_keyword_scores = (
+                    keyword_scores / max_keyword_score if max_keyword_score > 0 else keyword_scores
+                )
+                scores = (
+                    self.vector_score_weight * vector_scores
+                    + (1 - self.vector_score_weight) * normalized_keyword_scores
+                )
+            elif vector_ranks is not None:
+                scores = vector_ranks
+            else:
+                scores = keyword_scores  # type: ignore
+
+            # Exact top-k, sorted by score and then by insertion order
+            if len(candidates) > limit:
+                top = np.argpartition(-scores, limit - 1)[:limit]
+            else:
+                top = np.arange(len(candidates))
+            top = top[np.lexsort((candidates[top], -scores[top]))]  # type: ignore
+
+            search_results = [
+                self._build_document(int(candidates[i]), float(vector_scores[i]) if vector_scores is not None else None)
+                for i in top
+            ]
+
+        if self.reranker and search_results:
+            search_results = self.reranker.rerank(query=query, documents=search_results)
+
+        log_info(f"Found {len(search_results)} documents")
+        return search_results
+
+    def _filter_mask(self, filters: Optional[Union[Dict[str, Any], List[FilterExpr]]]) -> "np.ndarray":
+        """Get the mask of the rows matching the filters."""
+        if not filters:
+            return np.ones(len(self._records), dtype=bool)
+
+        if isinstance(filters, dict):
+
+            def matches(meta_data: Dict[str, Any]) -> bool:
+                return all(key in meta_data and meta_data[key] == value for key, value in filters.items())  # type: ignore
+
+        else:
+            filter_exprs = [f.to_dict() if hasattr(f, "to_dict") else f for f in filters]
+
+            def matches(meta_data: Dict[str, Any]) -> bool:
+                return all(_matches_filter(filter_expr, meta_data) for filter_expr in filter_exprs)  # type: ignore
+
+        return np.fromiter(
+            (record is not None and matches(record["meta_data"] or {}) for record in self._records),
+            dtype=bool,
+            count=len(self._records),
+        )
+
+    def _keyword_scores(self, query: str) -> "np.ndarray":
+        if self._keyword_index is None:
+            self._keyword_index = BM25Index()
+            self._keyword_index.add_many(
+                (record["id"], record["content"]) for record in self._records if record is not None
+            )
+        scores = np.zeros(len(self._records), dtype=np.float32)
+        for doc_id, score in self._keyword_index.scores(query).items():
+            scores[self._rows_by_id[doc_id]] = score
+        return scores
+
+    def _vector_scores(self, query_embedding: List[float], rows: "np.ndarray") -> Tuple["np.ndarray", "np.ndarray"]:
+        """Get the raw scores of the rows for the query embedding, higher is closer, and their similarity (0.0-1.0).
+
+        Similarities are clipped for unnormalized vectors, so the rows are ranked by their raw scores.
+        """
+        query_vector = np.asarray(query_embedding, dtype=np.float32)
+        vectors = self._vectors if len(rows) == len(self._records) else self._vectors[rows]
+        inner_products = vectors @ query_vector
+        norms = self._norms[rows]
+        query_norm = float(np.linalg.norm(query_vector))
+
+        if self.distance == Distance.cosine:
+            denominators = norms * query_norm
+            cosines = np.divide(inner_products, denominators, out=np.zeros_like(inner_products), where=denominators > 0)
+            return cosines, np.clip(cosines, 0.0, 1.0)
+        elif self.distance == Distance.l2:
+            distances = np.sqrt(np.maximum(norms**2 - 2 * inner_products + query_norm**2, 0))
+            return -distances, 1.0 / (1.0 + distances)
+        elif self.distance == Distance.max_inner_product:
+            return inner_products, np.clip((inner_products + 1.0) / 2.0, 0.0, 1.0)
+        raise ValueError(f"Unknown distance metric: {self.distance}")
+
+    def _build_document(self, row: int, similarity_score: Optional[float]) -> Document:
+        record: Dict[str, Any] = self._records[row]  # type: ignore
+        meta_data = dict(record["meta_data"]) if record["meta_data"] else {}
+        if similarity_score is not None:
+            meta_data["similarity_score"] = similarity_score
+        return Document(
+            id=record["id"],
+            name=record["name"],
+            meta_data=meta_data,
+            content=record["content"],
+            embedder=self.embedder,
+            embedding=self._vectors[row].tolist(),
+            usage=record["usage"],
+            content_id=record["content_id"],
+        )
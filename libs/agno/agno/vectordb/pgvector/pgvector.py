@@ -27,9 +27,10 @@ except ImportError:
 from agno.filters import FilterExpr
 from agno.knowledge.document import Document
 from agno.knowledge.embedder import Embedder
+from agno.knowledge.embedder.batch import async_embed_documents, embed_documents
 from agno.knowledge.reranker.base import Reranker
 from agno.utils.log import log_debug, log_error, log_info, log_warning
-from agno.vectordb.base import VectorDb
+from agno.vectordb.base import CHUNK_HASH_KEY, VectorDb
 from agno.vectordb.distance import Distance
 from agno.vectordb.pgvector.index import HNSW, Ivfflat
 from agno.vectordb.score import normalize_score, score_to_distance_threshold
@@ -297,6 +298,20 @@ class PgVector(VectorDb):
         """
         return self._record_exists(self.table.c.content_hash, content_hash)
 
+    def get_chunk_hashes(self, content_hash: str) -> Optional[Dict[str, Optional[str]]]:
+        """
+        Get the chunk hash stored in the metadata of each record with the given content hash, keyed by record id.
+        """
+        try:
+            with self.Session() as sess:
+                stmt = select(self.table.c.id, self.table.c.meta_data[CHUNK_HASH_KEY].astext).where(
+                    self.table.c.content_hash == content_hash
+                )
+                return {row[0]: row[1] for row in sess.execute(stmt).fetchall()}
+        except Exception as e:
+            log_error(f"Error getting chunk hashes for content hash '{content_hash}': {e}")
+            return None
+
     def _clean_content(self, content: str) -> str:
         """
         Clean the content by replacing null characters.
@@ -331,6 +346,9 @@ class PgVector(VectorDb):
                     batch_docs = documents[i : i + batch_size]
                     log_debug(f"Processing batch starting at index {i}, size: {len(batch_docs)}")
                     try:
+                        # Embed all documents in the batch
+                        embed_documents(self.embedder, batch_docs)
+
                         # Prepare documents for insertion
                         batch_records = []
                         for doc in batch_docs:
@@ -367,7 +385,7 @@ class PgVector(VectorDb):
                     log_debug(f"Processing batch starting at index {i}, size: {len(batch_docs)}")
                     try:
                         # Embed all documents in the batch
-                        await self._async_embed_documents(batch_docs)
+                        await async_embed_documents(self.embedder, batch_docs)
 
                         # Prepare documents for insertion
                         batch_records = []
@@ -462,6 +480,9 @@ class PgVector(VectorDb):
                     batch_docs = documents[i : i + batch_size]
                     log_info(f"Processing batch starting at index {i}, size: {len(batch_docs)}")
                     try:
+                        # Embed all documents in the batch
+                        embed_documents(self.embedder, batch_docs)
+
                         # Prepare documents for upserting
                         batch_records_dict: Dict[str, Dict[str, Any]] = {}  # Use dict to deduplicate by ID
                         for doc in batch_docs:
@@ -507,7 +528,6 @@ class PgVector(VectorDb):
     def _get_document_record(
         self, doc: Document, filters: Optional[Dict[str, Any]] = None, content_hash: str = ""
     ) -> Dict[str, Any]:
-        doc.embed(embedder=self.embedder)
         cleaned_content = self._clean_content(doc.content)
         # Include content_hash in ID to ensure uniqueness across different content hashes
         # This allows the same URL/content to be inserted with different descriptions
@@ -530,76 +550,6 @@ class PgVector(VectorDb):
             "content_id": doc.content_id,
         }
 
-    async def _async_embed_documents(self, batch_docs: List[Document]) -> None:
-        """
-        Embed a batch of documents using either batch embedding or individual embedding.
-
-        Args:
-            batch_docs: List of documents to embed
-        """
-        if self.embedder.enable_batch and hasattr(self.embedder, "async_get_embeddings_batch_and_usage"):
-            # Use batch embedding when enabled and supported
-            try:
-                # Extract content from all documents
-                doc_contents = [doc.content for doc in batch_docs]
-
-                # Get batch embeddings and usage
-                embeddings, usages = await self.embedder.async_get_embeddings_batch_and_usage(doc_contents)
-
-                # Process documents with pre-computed embeddings
-                for j, doc in enumerate(batch_docs):
-                    try:
-                        if j < len(embeddings):
-                            doc.embedding = embeddings[j]
-                            doc.usage = usages[j] if j < len(usages) else None
-                    except Exception as e:
-                        log_error(f"Error assigning batch embedding to document '{doc.name}': {e}")
-
-            except Exception as e:
-                # Check if this is a rate limit error - don't fall back as it would make things worse
-                error_str = str(e).lower()
-                is_rate_limit = any(
-                    phrase in error_str
-                    for phrase in ["rate limit", "too many requests", "429", "trial key", "api calls / minute"]
-                )
-
-                if is_rate_limit:
-                    log_error(f"Rate limit detected during batch embedding.  {e}")
-                    raise e
-                else:
-                    log_warning(f"Async batch embedding failed, falling back to individual embeddings: {e}")
-                    # Fall back to individual embedding
-                    embed_tasks = [doc.async_embed(embedder=self.embedder) for doc in batch_docs]
-                    results = await asyncio.gather(*embed_tasks, return_exceptions=True)
-
-                    # Check for exceptions and handle them
-                    for i, result in enumerate(results):
-                        if isinstance(result, Exception):
-                            error_msg = str(result)
-                            # If it's an event loop closure error, log it but don't fail
-                            if "Event loop is closed" in error_msg or "RuntimeError" in type(result).__name__:
-                                log_warning(
-                                    f"Event loop closure during embedding for document {i}, but operation may have succeeded: {result}"
-                                )
-                            else:
-                                log_error(f"Error embedding document {i}: {result}")
-        else:
-            # Use individual embedding
-            embed_tasks = [doc.async_embed(embedder=self.embedder) for doc in batch_docs]
-            results = await asyncio.gather(*embed_tasks, return_exceptions=True)
-
-            # Check for exceptions and handle them
-            for i, result in enumerate(results):
-                if isinstance(result, Exception):
-                    error_msg = str(result)
-                    # If it's an event loop closure error, log it but don't fail
-                    if "Event loop is closed" in error_msg or "RuntimeError" in type(result).__name__:
-                        log_warning(
-                            f"Event loop closure during embedding for document {i}, but operation may have succeeded: {result}"
-                        )
-                    else:
-                        log_error(f"Error embedding document {i}: {result}")
-
     async def async_upsert(
         self,
         content_hash: str,
@@ -638,7 +588,7 @@ class PgVector(VectorDb):
                     log_info(f"Processing batch starting at index {i}, size: {len(batch_docs)}")
                     try:
                         # Embed all documents in the batch
-                        await self._async_embed_documents(batch_docs)
+                        await async_embed_documents(self.embedder, batch_docs)
 
                         # Prepare documents for upserting
                         batch_records_dict = {}  # Use dict to deduplicate by ID
@@ -12,6 +12,7 @@ except ImportError:
 from agno.filters import FilterExpr
 from agno.knowledge.document import Document
 from agno.knowledge.embedder import Embedder
+from agno.knowledge.embedder.batch import async_embed_documents, embed_documents
 from agno.knowledge.reranker.base import Reranker
 from agno.utils.log import log_debug, log_error, log_info, log_warning
 from agno.vectordb.base import VectorDb
@@ -317,6 +318,9 @@ class Qdrant(VectorDb):
             batch_size (int): Batch size for inserting documents
         """
         log_debug(f"Inserting {len(documents)} documents")
+        if self.search_type in [SearchType.vector, SearchType.hybrid]:
+            embed_documents(self.embedder, documents)
+
         points = []
         for document in documents:
             cleaned_content = document.content.replace("\x00", "\ufffd")
@@ -332,13 +336,11 @@ class Qdrant(VectorDb):
 
             if self.search_type == SearchType.vector:
                 # For vector search, maintain backward compatibility with unnamed vectors
-                document.embed(embedder=self.embedder)
                 vector = document.embedding  # type: ignore
             else:
                 # For other search types, use named vectors
                 vector = {}
                 if self.search_type in [SearchType.hybrid]:
-                    document.embed(embedder=self.embedder)
                     vector[self.dense_vector_name] = document.embedding
 
                 if self.search_type in [SearchType.keyword, SearchType.hybrid]:
@@ -389,46 +391,7 @@ class Qdrant(VectorDb):
 
         # Apply batch embedding when needed for vector or hybrid search
         if self.search_type in [SearchType.vector, SearchType.hybrid]:
-            if self.embedder.enable_batch and hasattr(self.embedder, "async_get_embeddings_batch_and_usage"):
-                # Use batch embedding when enabled and supported
-                try:
-                    # Extract content from all documents
-                    doc_contents = [doc.content for doc in documents]
-
-                    # Get batch embeddings and usage
-                    embeddings, usages = await self.embedder.async_get_embeddings_batch_and_usage(doc_contents)
-
-                    # Process documents with pre-computed embeddings
-                    for j, doc in enumerate(documents):
-                        try:
-                            if j < len(embeddings):
-                                doc.embedding = embeddings[j]
-                                doc.usage = usages[j] if j < len(usages) else None
-                        except Exception as e:
-                            log_error(f"Error assigning batch embedding to document '{doc.name}': {e}")
-
-                except Exception as e:
-                    # Check if this is a rate limit error - don't fall back as it would make things worse
-                    error_str = str(e).lower()
-                    is_rate_limit = any(
-                        phrase in error_str
-                        for phrase in ["rate limit", "too many requests", "429", "trial key", "api calls / minute"]
-                    )
-
-                    if is_rate_limit:
-                        log_error(f"Rate limit detected during batch embedding. {e}")
-                        raise e
-                    else:
-                        log_warning(f"Async batch embedding failed, falling back to individual embeddings: {e}")
-                        # Fall back to individual embedding
-                        for doc in documents:
-                            if self.search_type in [SearchType.vector, SearchType.hybrid]:
-                                await doc.async_embed(embedder=self.embedder)
-            else:
-                # Use individual embedding
-                for doc in documents:
-                    if self.search_type in [SearchType.vector, SearchType.hybrid]:
-                        await doc.async_embed(embedder=self.embedder)
+            await async_embed_documents(self.embedder, documents)
 
         async def process_document(document):
             cleaned_content = document.content.replace("\x00", "\ufffd")
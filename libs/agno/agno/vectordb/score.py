@@ -1,6 +1,8 @@
-"""Score normalization utilities for vector database distance metrics."""
+"""Score normalization and fusion utilities for vector database search."""
 
 import math
+from collections import defaultdict
+from typing import Dict, List, Optional, Sequence, Tuple
 
 from agno.vectordb.distance import Distance
 
@@ -104,3 +106,36 @@ def score_to_distance_threshold(similarity: float, metric: Distance) -> float:
         return score_to_max_inner_product(similarity)
     else:
         raise ValueError(f"Unknown distance metric: {metric}")
+
+
+def reciprocal_rank_fusion(
+    ranked_lists: List[List[Tuple[str, float]]],
+    k: int = 60,
+    weights: Optional[Sequence[float]] = None,
+) -> List[Tuple[str, float]]:
+    """
+    Combine multiple ranked lists using Reciprocal Rank Fusion (RRF).
+
+    RRF is a simple yet effective method for combining multiple rankings, e.g. of vector and keyword search.
+    The formula is: RRF(d) = sum(w_i / (k + rank_i(d))) for each ranking i
+
+    Args:
+        ranked_lists: List of ranked results, each as [(doc_id, score), ...]
+        k: RRF constant (default 60, as per original paper by Cormack et al.)
+        weights: Weight of each ranking (default 1.0 for all)
+
+    Returns:
+        Fused ranking as [(doc_id, rrf_score), ...] sorted by score descending
+    """
+    if weights is not None and len(weights) != len(ranked_lists):
+        raise ValueError("weights must have one value per ranked list")
+
+    rrf_scores: Dict[str, float] = defaultdict(float)
+
+    for i, ranked_list in enumerate(ranked_lists):
+        weight = weights[i] if weights is not None else 1.0
+        for rank, (doc_id, _) in enumerate(ranked_list, start=1):
+            rrf_scores[doc_id] += weight / (k + rank)
+
+    sorted_results = sorted(rrf_scores.items(), key=lambda x: x[1], reverse=True)
+    return sorted_results
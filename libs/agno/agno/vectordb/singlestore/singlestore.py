@@ -561,14 +561,14 @@ class SingleStore(VectorDb):
                 usage_json = json.dumps(document.usage)
 
                 # Convert embedding list to SingleStore VECTOR format
-                embeddings = f"[{','.join(map(str, document.embedding))}]" if document.embedding else None
+                embedding_str = f"[{','.join(map(str, document.embedding))}]" if document.embedding else None
 
                 stmt = mysql.insert(self.table).values(
                     id=_id,
                     name=document.name,
                     meta_data=meta_data_json,
                     content=cleaned_content,
-                    embedding=embeddings,
+                    embedding=embedding_str,
                     usage=usage_json,
                     content_hash=content_hash,
                     content_id=document.content_id,
@@ -647,7 +647,7 @@ class SingleStore(VectorDb):
                 usage_json = json.dumps(document.usage)
 
                 # Convert embedding list to SingleStore VECTOR format
-                embeddings = f"[{','.join(map(str, document.embedding))}]" if document.embedding else None
+                embedding_str = f"[{','.join(map(str, document.embedding))}]" if document.embedding else None
                 stmt = (
                     mysql.insert(self.table)
                     .values(
@@ -655,7 +655,7 @@ class SingleStore(VectorDb):
                         name=document.name,
                         meta_data=meta_data_json,
                         content=cleaned_content,
-                        embedding=embeddings,
+                        embedding=embedding_str,
                         usage=usage_json,
                         content_hash=content_hash,
                         content_id=document.content_id,
@@ -664,7 +664,7 @@ class SingleStore(VectorDb):
                         name=document.name,
                         meta_data=meta_data_json,
                         content=cleaned_content,
-                        embedding=embeddings,
+                        embedding=embedding_str,
                         usage=usage_json,
                         content_hash=content_hash,
                         content_id=document.content_id,
@@ -1360,12 +1360,58 @@ class Workflow:
         websocket_handler: Optional["WebSocketHandler"] = None,
     ) -> "WorkflowRunOutputEvent":
         """Handle workflow events for storage - similar to Team._handle_event"""
+        if not self._store_event(event, workflow_run_response):
+            return event
+
+        # Add to event buffer for reconnection support
+        buffer_run_id = self._get_buffer_run_id(event)
+        event_index = None
+        if buffer_run_id:
+            try:
+                from agno.os.managers import event_buffer
+
+                # add_event now returns the event_index
+                event_index = event_buffer.add_event(buffer_run_id, event)  # type: ignore
+            except Exception as e:
+                # Don't fail workflow execution if buffering fails
+                log_debug(f"Failed to add event to buffer: {e}")
+
+        self._broadcast_buffered_event(event, buffer_run_id, event_index, websocket_handler)
+        return event
+
+    async def _ahandle_event(
+        self,
+        event: "WorkflowRunOutputEvent",
+        workflow_run_response: WorkflowRunOutput,
+        websocket_handler: Optional["WebSocketHandler"] = None,
+    ) -> "WorkflowRunOutputEvent":
+        """Async version of _handle_event, which does not block the event loop while buffering the event"""
+        if not self._store_event(event, workflow_run_response):
+            return event
+
+        # Add to event buffer for reconnection support
+        buffer_run_id = self._get_buffer_run_id(event)
+        event_index = None
+        if buffer_run_id:
+            try:
+                from agno.os.managers import event_buffer
+
+                event_index = await event_buffer.aadd_event(buffer_run_id, event)  # type: ignore
+            except Exception as e:
+                # Don't fail workflow execution if buffering fails
+                log_debug(f"Failed to add event to buffer: {e}")
+
+        self._broadcast_buffered_event(event, buffer_run_id, event_index, websocket_handler)
+        return event
+
+    def _store_event(self, event: "WorkflowRunOutputEvent", workflow_run_response: WorkflowRunOutput) -> bool:
+        """Store the event on the run response. Returns False if the event is not buffered or broadcast."""
         from agno.run.agent import RunOutput
         from agno.run.base import BaseRunOutputEvent
         from agno.run.team import TeamRunOutput
 
         if isinstance(event, (RunOutput, TeamRunOutput)):
-            return event
+            return False
         if self.store_events:
             # Check if this event type should be skipped
             if self.events_to_skip:
@@ -1373,39 +1419,37 @@ class Workflow:
                 for skip_event in self.events_to_skip:
                     if isinstance(skip_event, str):
                         if event_type == skip_event:
-                            return event
+                            return False
                     else:
                         # It's a WorkflowRunEvent enum
                         if event_type == skip_event.value:
-                            return event
+                            return False
 
             # Store the event
             if isinstance(event, BaseRunOutputEvent):
                 if workflow_run_response.events is None:
                     workflow_run_response.events = []
                 workflow_run_response.events.append(event)
+        return True
 
-        # Add to event buffer for reconnection support
-        # Use workflow_run_id for agent/team events, run_id for workflow events
-        buffer_run_id = None
-        event_index = None
+    def _get_buffer_run_id(self, event: "WorkflowRunOutputEvent") -> Optional[str]:
+        """Use workflow_run_id for agent/team events, run_id for workflow events"""
         if hasattr(event, "workflow_run_id") and event.workflow_run_id:
             # Agent/Team event - use workflow_run_id
-            buffer_run_id = event.workflow_run_id
+            return event.workflow_run_id
         elif hasattr(event, "run_id") and event.run_id:
             # Workflow event - use run_id
-            buffer_run_id = event.run_id
-
-        if buffer_run_id:
-            try:
-                from agno.os.managers import event_buffer
-
-                # add_event now returns the event_index
-                event_index = event_buffer.add_event(buffer_run_id, event)  # type: ignore
-            except Exception as e:
-                # Don't fail workflow execution if buffering fails
-                log_debug(f"Failed to add event to buffer: {e}")
+            return event.run_id
+        return None
 
+    def _broadcast_buffered_event(
+        self,
+        event: "WorkflowRunOutputEvent",
+        buffer_run_id: Optional[str],
+        event_index: Optional[int],
+        websocket_handler: Optional["WebSocketHandler"] = None,
+    ) -> None:
+        """Broadcast a buffered event to the WebSocket of the run and to reconnected clients"""
         # Broadcast to WebSocket if available (async context only)
         # Include event_index for frontend reconnection support
         if websocket_handler:
@@ -1451,8 +1495,6 @@ class Workflow:
             except Exception as e:
                 log_debug(f"Failed to broadcast through manager: {e}")
 
-        return event
-
     def _enrich_event_with_workflow_context(
         self,
         event: Any,
@@ -2463,7 +2505,9 @@ class Workflow:
             workflow_id=workflow_run_response.workflow_id,
             session_id=workflow_run_response.session_id,
         )
-        yield self._handle_event(workflow_started_event, workflow_run_response, websocket_handler=websocket_handler)
+        yield await self._ahandle_event(
+            workflow_started_event, workflow_run_response, websocket_handler=websocket_handler
+        )
 
         if callable(self.steps):
             if iscoroutinefunction(self.steps):  # type: ignore
@@ -2609,7 +2653,7 @@ class Workflow:
                             enriched_event = self._enrich_event_with_workflow_context(
                                 event, workflow_run_response, step_index=i, step=step
                             )
-                            yield self._handle_event(
+                            yield await self._ahandle_event(
                                 enriched_event, workflow_run_response, websocket_handler=websocket_handler
                             )  # type: ignore
 
@@ -2619,7 +2663,7 @@ class Workflow:
                                 event, workflow_run_response, step_index=i, step=step
                             )
                             if self.stream_executor_events:
-                                yield self._handle_event(
+                                yield await self._ahandle_event(
                                     enriched_event, workflow_run_response, websocket_handler=websocket_handler
                                 )  # type: ignore
 
@@ -2720,7 +2764,7 @@ class Workflow:
                     session_id=session_id,
                     reason=str(e),
                 )
-                yield self._handle_event(
+                yield await self._ahandle_event(
                     cancelled_event,
                     workflow_run_response,
                     websocket_handler=websocket_handler,
@@ -2755,13 +2799,15 @@ class Workflow:
             step_results=workflow_run_response.step_results,  # type: ignore[arg-type]
             metadata=workflow_run_response.metadata,
         )
-        yield self._handle_event(workflow_completed_event, workflow_run_response, websocket_handler=websocket_handler)
+        yield await self._ahandle_event(
+            workflow_completed_event, workflow_run_response, websocket_handler=websocket_handler
+        )
 
         # Mark run as completed in event buffer
         try:
             from agno.os.managers import event_buffer
 
-            event_buffer.set_run_completed(
+            await event_buffer.aset_run_completed(
                 workflow_run_response.run_id,  # type: ignore
                 workflow_run_response.status or RunStatus.completed,
             )
@@ -2862,6 +2908,7 @@ class Workflow:
             try:
                 # Update status to RUNNING and save
                 workflow_run_response.status = RunStatus.running
+                workflow_session.upsert_run(run=workflow_run_response)
                 if self._has_async_db():
                     await self.asave_session(session=workflow_session)
                 else:
@@ -2892,6 +2939,7 @@ class Workflow:
                 logger.error(f"Background workflow execution failed: {e}")
                 workflow_run_response.status = RunStatus.error
                 workflow_run_response.content = f"Background execution failed: {str(e)}"
+                workflow_session.upsert_run(run=workflow_run_response)
                 if self._has_async_db():
                     await self.asave_session(session=workflow_session)
                 else:
@@ -3020,6 +3068,7 @@ class Workflow:
                 logger.error(f"Background streaming workflow execution failed: {e}")
                 workflow_run_response.status = RunStatus.error
                 workflow_run_response.content = f"Background streaming execution failed: {str(e)}"
+                workflow_session.upsert_run(run=workflow_run_response)
                 if self._has_async_db():
                     await self.asave_session(session=workflow_session)
                 else:
@@ -3320,6 +3369,7 @@ class Workflow:
                     agent_response.workflow_id = last_run.workflow_id
 
                 # Save the reloaded session (which has the updated run)
+                reloaded_session.upsert_run(run=last_run)
                 self.save_session(session=reloaded_session)
 
             else:
@@ -3424,6 +3474,7 @@ class Workflow:
                     agent_response.workflow_id = last_run.workflow_id
 
                 # Save the reloaded session (which has the updated run)
+                reloaded_session.upsert_run(run=last_run)
                 self.save_session(session=reloaded_session)
 
                 # Return the last run directly (WRO2 from inner workflow)
@@ -3725,6 +3776,7 @@ class Workflow:
                     agent_response.workflow_id = last_run.workflow_id
 
                 # Save the reloaded session (which has the updated run)
+                reloaded_session.upsert_run(run=last_run)
                 if self._has_async_db():
                     await self.asave_session(session=reloaded_session)
                 else:
@@ -3843,6 +3895,7 @@ class Workflow:
                     agent_response.workflow_id = last_run.workflow_id
 
                 # Save the reloaded session (which has the updated run)
+                reloaded_session.upsert_run(run=last_run)
                 if self._has_async_db():
                     await self.asave_session(session=reloaded_session)
                 else:
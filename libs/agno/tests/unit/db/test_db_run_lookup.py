@@ -0,0 +1,83 @@
+"""Tests for reading single runs of a session with get_run() and list_runs()."""
+
+import pytest
+
+from agno.db.base import SessionType
+from agno.db.in_memory import InMemoryDb
+from agno.db.sqlite import SqliteDb
+from agno.run.agent import RunOutput
+from agno.run.base import RunStatus
+from agno.session import AgentSession
+
+
+def _store_session(db) -> None:
+    session = AgentSession(session_id="s1", agent_id="a1", session_data={}, created_at=1)
+    for i in range(5):
+        status = RunStatus.completed if i % 2 else RunStatus.running
+        session.upsert_run(RunOutput(run_id=f"r{i}", agent_id="a1", session_id="s1", content=f"c{i}", status=status))
+    db.upsert_session(session)
+
+
+@pytest.fixture(params=["embedded", "runs_table", "in_memory"])
+def db(request, tmp_path):
+    if request.param == "in_memory":
+        db = InMemoryDb()
+    else:
+        runs_table = "agno_runs" if request.param == "runs_table" else None
+        db = SqliteDb(db_file=str(tmp_path / "agno.db"), runs_table=runs_table)
+    _store_session(db)
+    return db
+
+
+def test_get_run(db):
+    run = db.get_run("r3", session_id="s1", session_type=SessionType.AGENT)
+    assert run is not None
+    assert run["run_id"] == "r3"
+    assert run["content"] == "c3"
+
+    assert db.get_run("unknown", session_id="s1", session_type=SessionType.AGENT) is None
+    assert db.get_run("r3", session_id="unknown", session_type=SessionType.AGENT) is None
+    assert db.get_run("r3", session_id="s1", session_type=SessionType.TEAM) is None
+
+
+def test_list_runs(db):
+    runs = db.list_runs(session_id="s1", session_type=SessionType.AGENT)
+    assert [run["run_id"] for run in runs] == ["r0", "r1", "r2", "r3", "r4"]
+
+    runs = db.list_runs(session_id="s1", session_type=SessionType.AGENT, status="COMPLETED")
+    assert [run["run_id"] for run in runs] == ["r1", "r3"]
+
+    # The most recent runs are kept
+    runs = db.list_runs(session_id="s1", session_type=SessionType.AGENT, status="RUNNING", limit=2)
+    assert [run["run_id"] for run in runs] == ["r2", "r4"]
+
+    assert db.list_runs(session_id="unknown", session_type=SessionType.AGENT) == []
+    assert db.list_runs(session_id="s1", session_type=SessionType.TEAM) == []
+
+
+def test_list_runs_merges_runs_still_embedded_in_the_session_row(tmp_path):
+    db_file = str(tmp_path / "agno.db")
+    # Runs stored in the session row, before the runs table was configured
+    _store_session(SqliteDb(db_file=db_file))
+
+    db = SqliteDb(db_file=db_file, runs_table="agno_runs")
+    session = AgentSession(session_id="s1", agent_id="a1", session_data={}, created_at=1)
+    for i in range(6):
+        status = RunStatus.completed if i in (1, 5) else RunStatus.running
+        session.upsert_run(RunOutput(run_id=f"r{i}", agent_id="a1", session_id="s1", content=f"new{i}", status=status))
+    # Only some runs are in the runs table yet
+    session.unsaved_run_ids = {"r1", "r5"}
+    runs_table = db._get_table(table_type="runs", create_table_if_not_found=True)
+    with db.Session() as sess, sess.begin():
+        db._upsert_session_runs(sess, runs_table, session, SessionType.AGENT)
+
+    runs = db.list_runs(session_id="s1", session_type=SessionType.AGENT)
+    assert [run["content"] for run in runs] == ["c0", "new1", "c2", "c3", "c4", "new5"]
+    stored_session = db.get_session(session_id="s1", session_type=SessionType.AGENT, deserialize=False)
+    assert runs == stored_session["runs"]
+
+    # Statuses of the runs table version are used
+    runs = db.list_runs(session_id="s1", session_type=SessionType.AGENT, status="COMPLETED")
+    assert [run["run_id"] for run in runs] == ["r1", "r3", "r5"]
+    runs = db.list_runs(session_id="s1", session_type=SessionType.AGENT, status="RUNNING", limit=2)
+    assert [run["run_id"] for run in runs] == ["r2", "r4"]
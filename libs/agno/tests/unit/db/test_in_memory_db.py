@@ -0,0 +1,124 @@
+"""Tests for the indexed tables of InMemoryDb."""
+
+import copy
+import json
+import threading
+
+import pytest
+
+from agno.db.base import SessionType
+from agno.db.in_memory import InMemoryDb
+from agno.db.in_memory.table import InMemoryTable
+from agno.db.schemas.memory import UserMemory
+from agno.session import AgentSession, TeamSession
+
+
+def _session(session_id, user_id="alice", agent_id="agent-1", created_at=None):
+    return AgentSession(
+        session_id=session_id,
+        agent_id=agent_id,
+        user_id=user_id,
+        session_data={"session_name": f"Session {session_id}"},
+        created_at=created_at,
+    )
+
+
+def test_table_indexes_follow_updates():
+    table = InMemoryTable(index_fields=("id", "user_id"), order_field="created_at")
+    table.load(
+        [
+            {"id": "a", "user_id": "alice", "created_at": 30},
+            {"id": "b", "user_id": "bob", "created_at": 10},
+            {"id": "c", "user_id": "alice", "created_at": 20},
+        ]
+    )
+
+    [(row_id, _)] = table.find_rows(id="a")
+    table.replace(row_id, {"id": "a", "user_id": "bob", "created_at": 5})
+    table.delete(row_id for row_id, _ in table.find_rows(id="b"))
+
+    assert [r["id"] for r in table.find(user_id="alice")] == ["c"]
+    assert [r["id"] for r in table.find(user_id="bob")] == ["a"]
+    # Replaced rows keep their position
+    assert [r["id"] for r in table.records()] == ["a", "c"]
+    assert [r["id"] for r in table.find(start=10, end=20)] == ["c"]
+    assert table.first()["id"] == "a"
+    assert table.find(user_id="carol") == []
+
+
+def test_get_sessions_uses_filters_and_pagination():
+    db = InMemoryDb()
+    for i in range(5):
+        db.upsert_session(_session(f"s{i}", user_id="alice" if i % 2 == 0 else "bob", created_at=100 + i))
+    db.upsert_session(TeamSession(session_id="t1", team_id="team-1", user_id="alice", created_at=100))
+
+    sessions, total = db.get_sessions(
+        session_type=SessionType.AGENT,
+        user_id="alice",
+        start_timestamp=101,
+        sort_by="created_at",
+        sort_order="desc",
+        limit=1,
+        deserialize=False,
+    )
+    assert total == 2
+    assert [s["session_id"] for s in sessions] == ["s4"]
+
+    agent_sessions = db.get_sessions(session_type=SessionType.AGENT, component_id="agent-1")
+    assert [s.session_id for s in agent_sessions] == ["s0", "s1", "s2", "s3", "s4"]
+    assert [s.session_id for s in db.get_sessions(session_type=SessionType.TEAM)] == ["t1"]
+    assert db.get_sessions(session_type=SessionType.AGENT, component_id="agent-2") == []
+
+
+def test_returned_records_are_copies_by_default():
+    db = InMemoryDb()
+    db.upsert_session(_session("s1"))
+
+    session = db.get_session("s1", SessionType.AGENT, deserialize=False)
+    session["session_data"]["session_name"] = "Changed"
+
+    assert db.get_session("s1", SessionType.AGENT).session_data["session_name"] == "Session s1"
+
+
+def test_frozen_views():
+    db = InMemoryDb(frozen_views=True)
+    db.upsert_session(_session("s1"))
+    db.upsert_user_memory(UserMemory(memory="Likes tea", memory_id="m1", user_id="alice", topics=["drinks"]))
+
+    session = db.get_session("s1", SessionType.AGENT, deserialize=False)
+    with pytest.raises(TypeError):
+        session["session_data"]["session_name"] = "Changed"
+    with pytest.raises(TypeError):
+        session.pop("user_id")
+    [memory], _ = db.get_user_memories(user_id="alice", deserialize=False)
+    with pytest.raises(TypeError):
+        memory["topics"].append("food")
+
+    # Frozen views serialize as plain JSON, and copies of them are mutable
+    assert json.loads(json.dumps(session))["session_id"] == "s1"
+    session_copy = copy.deepcopy(session)
+    session_copy["session_data"]["session_name"] = "Changed"
+    assert type(session_copy["session_data"]) is dict
+
+    # Deserialized sessions are still independent, mutable objects
+    agent_session = db.get_session("s1", SessionType.AGENT)
+    agent_session.session_data["session_name"] = "Changed"
+    assert db.get_session("s1", SessionType.AGENT).session_data["session_name"] == "Session s1"
+
+
+def test_concurrent_upserts():
+    db = InMemoryDb()
+
+    def upsert_sessions(thread_id):
+        for i in range(50):
+            db.upsert_session(_session(f"s{i}", user_id="alice"))
+            db.upsert_user_memory(UserMemory(memory=f"Memory {i}", memory_id=f"m{thread_id}-{i}", user_id="alice"))
+
+    threads = [threading.Thread(target=upsert_sessions, args=(thread_id,)) for thread_id in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(db.get_sessions(session_type=SessionType.AGENT, user_id="alice")) == 50
+    assert len(db.get_user_memories(user_id="alice")) == 400
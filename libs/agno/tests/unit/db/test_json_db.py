@@ -0,0 +1,143 @@
+"""Tests for JsonDb and its append-only JSONL tables."""
+
+import json
+
+import pytest
+
+from agno.db.base import SessionType
+from agno.db.json import JsonDb
+from agno.db.json.table import JsonTable
+from agno.db.schemas.memory import UserMemory
+from agno.session import AgentSession
+
+
+@pytest.fixture
+def db(tmp_path):
+    return JsonDb(db_path=str(tmp_path))
+
+
+def _log_lines(db, table_name):
+    with open(db.db_path / f"{table_name}.jsonl") as f:
+        return f.read().splitlines()
+
+
+def _session(session_id, user_id="alice", name=None):
+    return AgentSession(
+        session_id=session_id,
+        agent_id="agent-1",
+        user_id=user_id,
+        session_data={"session_name": name} if name else {},
+    )
+
+
+def test_session_crud(db):
+    db.upsert_session(_session("s1"))
+    db.upsert_session(_session("s2", user_id="bob"))
+
+    session = db.get_session("s1", SessionType.AGENT)
+    assert session.session_id == "s1"
+    assert db.get_session("s1", SessionType.AGENT, user_id="bob") is None
+    assert len(db.get_sessions(session_type=SessionType.AGENT)) == 2
+
+    renamed = db.rename_session("s1", SessionType.AGENT, "Renamed", deserialize=False)
+    assert renamed["session_data"]["session_name"] == "Renamed"
+    assert db.get_session("s1", SessionType.AGENT).session_data["session_name"] == "Renamed"
+
+    # Sessions owned by another user are not overwritten or deleted
+    assert db.upsert_session(_session("s2", user_id="alice")) is None
+    assert db.delete_session("s2", user_id="alice") is False
+    db.delete_sessions(["s1", "s2"], user_id="alice")
+    assert [s.session_id for s in db.get_sessions(session_type=SessionType.AGENT)] == ["s2"]
+
+
+def test_upsert_session_of_another_component_checks_the_owner(db):
+    db.upsert_session(_session("s1", user_id="alice"))
+
+    # Another user's session with the same id, even for another agent, is refused
+    mallory_session = AgentSession(session_id="s1", agent_id="agent-2", user_id="mallory")
+    assert db.upsert_session(mallory_session) is None
+    session = db.get_session("s1", SessionType.AGENT)
+    assert session.user_id == "alice"
+    assert session.agent_id == "agent-1"
+
+    # The owner can store the session of another agent under the same id
+    alice_session = AgentSession(session_id="s1", agent_id="agent-2", user_id="alice")
+    assert db.upsert_session(alice_session) is not None
+    assert db.get_session("s1", SessionType.AGENT).agent_id == "agent-2"
+
+
+def test_updates_append_records_instead_of_rewriting(db):
+    db.upsert_session(_session("s1"))
+    db.upsert_session(_session("s2"))
+    db.upsert_session(_session("s1", name="Updated"))
+    db.delete_session("s2")
+
+    # Header, s1, s2, s1 update, s2 delete
+    assert len(_log_lines(db, db.session_table_name)) == 5
+    assert [s.session_id for s in db.get_sessions(session_type=SessionType.AGENT)] == ["s1"]
+
+
+def test_memory_crud(db):
+    db.upsert_user_memory(UserMemory(memory="Likes tea", memory_id="m1", user_id="alice"))
+    db.upsert_user_memory(UserMemory(memory="Likes coffee", memory_id="m1", user_id="alice"))
+    db.upsert_user_memory(UserMemory(memory="Likes jazz", memory_id="m2", user_id="bob"))
+
+    assert db.get_user_memory("m1").memory == "Likes coffee"
+    assert db.get_user_memory("m2", user_id="alice") is None
+
+    db.delete_user_memories(["m1", "m2"], user_id="alice")
+    assert db.get_user_memory("m1") is None
+    assert db.get_user_memory("m2") is not None
+
+    db.clear_memories()
+    assert db.get_user_memories() == []
+
+
+def test_tables_see_writes_from_other_instances(tmp_path):
+    writer = JsonDb(db_path=str(tmp_path))
+    reader = JsonDb(db_path=str(tmp_path))
+
+    writer.upsert_session(_session("s1"))
+    assert reader.get_session("s1", SessionType.AGENT) is not None
+
+    writer.upsert_session(_session("s1", name="Updated"))
+    writer._get_table(writer.session_table_name).compact()
+    writer.upsert_session(_session("s2"))
+
+    assert reader.get_session("s1", SessionType.AGENT).session_data["session_name"] == "Updated"
+    assert reader.get_session("s2", SessionType.AGENT) is not None
+
+
+def test_table_compacts_log(tmp_path):
+    table = JsonTable(path=tmp_path / "items.jsonl", primary_key="id", min_compaction_lines=10)
+    for version in range(20):
+        table.put({"id": "a", "version": version})
+
+    assert len(open(tmp_path / "items.jsonl").read().splitlines()) < 12
+    assert table.get("a") == {"id": "a", "version": 19}
+    assert JsonTable(path=tmp_path / "items.jsonl", primary_key="id").get("a") == {"id": "a", "version": 19}
+
+
+def test_table_ignores_cut_line(tmp_path):
+    path = tmp_path / "items.jsonl"
+    table = JsonTable(path=path, primary_key="id")
+    table.put({"id": "a"})
+    with open(path, "a") as f:
+        f.write('{"id": "b", "val')
+
+    reopened = JsonTable(path=path, primary_key="id")
+    assert [record["id"] for record in reopened.records()] == ["a"]
+
+    reopened.put({"id": "c"})
+    assert [record["id"] for record in JsonTable(path=path, primary_key="id").records()] == ["a", "c"]
+
+
+def test_legacy_json_file_is_imported(tmp_path):
+    legacy_sessions = [{"session_id": "s1", "session_type": "agent", "agent_id": "agent-1", "created_at": 1}]
+    with open(tmp_path / "agno_sessions.json", "w") as f:
+        json.dump(legacy_sessions, f)
+
+    db = JsonDb(db_path=str(tmp_path), session_table="agno_sessions")
+
+    assert db.get_session("s1", SessionType.AGENT).agent_id == "agent-1"
+    assert (tmp_path / "agno_sessions.jsonl").exists()
@@ -0,0 +1,131 @@
+"""Tests for loading a window of the latest session runs with get_session."""
+
+import pytest
+
+from agno.db.base import SessionType
+from agno.db.sqlite import SqliteDb
+from agno.db.utils import apply_runs_window, get_runs_window_start, get_unloaded_runs_count, set_previous_runs
+from agno.run.agent import RunOutput
+from agno.run.base import RunStatus
+from agno.session import AgentSession
+
+
+def _run_dict(run_id, status="COMPLETED", parent_run_id=None):
+    return {"run_id": run_id, "status": status, "parent_run_id": parent_run_id}
+
+
+def test_get_runs_window_start():
+    runs = [
+        _run_dict("r1"),
+        _run_dict("r2"),
+        _run_dict("r3", status="ERROR"),
+        _run_dict("m1", parent_run_id="r4"),
+        _run_dict("r4"),
+    ]
+    assert get_runs_window_start(runs, 1) == 4
+    # Errored runs and member runs are not counted as history runs
+    assert get_runs_window_start(runs, 2) == 1
+    assert get_runs_window_start(runs, 3) == 0
+    assert get_runs_window_start(runs, 10) == 0
+
+
+def test_get_runs_window_start_keeps_paused_runs():
+    runs = [_run_dict("r1"), _run_dict("r2", status="PAUSED"), _run_dict("r3"), _run_dict("r4")]
+    assert get_runs_window_start(runs, 1) == 1
+
+
+def test_apply_runs_window():
+    session = {"runs": [_run_dict("r1"), _run_dict("r2"), _run_dict("r3")]}
+    previous_runs = apply_runs_window(session, 2)
+    assert [run["run_id"] for run in previous_runs] == ["r1"]
+    assert [run["run_id"] for run in session["runs"]] == ["r2", "r3"]
+
+    session = {"runs": [_run_dict("r1")]}
+    assert apply_runs_window(session, None) == []
+    assert apply_runs_window(session, 5) == []
+    assert len(session["runs"]) == 1
+
+
+@pytest.fixture(params=[None, "agno_runs"], ids=["runs_column", "runs_table"])
+def db(request, tmp_path):
+    return SqliteDb(db_file=str(tmp_path / "agno.db"), runs_table=request.param)
+
+
+def _store_session(db, run_ids):
+    session = AgentSession(session_id="s1", agent_id="a1", session_data={}, created_at=1)
+    for run_id in run_ids:
+        session.upsert_run(
+            RunOutput(run_id=run_id, agent_id="a1", session_id="s1", content=run_id, status=RunStatus.completed)
+        )
+    db.upsert_session(session)
+    return session
+
+
+def test_get_session_with_last_n_runs(db):
+    _store_session(db, ["r1", "r2", "r3", "r4"])
+
+    session = db.get_session(session_id="s1", session_type=SessionType.AGENT, last_n_runs=2)
+    assert [run.run_id for run in session.runs] == ["r3", "r4"]
+
+    raw_session = db.get_session(session_id="s1", session_type=SessionType.AGENT, last_n_runs=2, deserialize=False)
+    assert [run["run_id"] for run in raw_session["runs"]] == ["r3", "r4"]
+
+
+def test_windowed_session_keeps_previous_runs_on_save(db):
+    _store_session(db, ["r1", "r2", "r3"])
+
+    session = db.get_session(session_id="s1", session_type=SessionType.AGENT, last_n_runs=1)
+    session.upsert_run(RunOutput(run_id="r4", agent_id="a1", session_id="s1", status=RunStatus.completed))
+    db.upsert_session(session)
+
+    stored = db.get_session(session_id="s1", session_type=SessionType.AGENT)
+    assert [run.run_id for run in stored.runs] == ["r1", "r2", "r3", "r4"]
+
+
+def test_get_session_window_keeps_paused_runs(db):
+    session = _store_session(db, ["r1", "r2", "r3"])
+    session.runs[0].status = RunStatus.paused
+    session.unsaved_run_ids.add("r1")
+    db.upsert_session(session)
+
+    session = db.get_session(session_id="s1", session_type=SessionType.AGENT, last_n_runs=1)
+    assert [run.run_id for run in session.runs] == ["r1", "r2", "r3"]
+
+
+def test_session_read_with_window_in_database():
+    session = set_previous_runs(AgentSession(session_id="s1"), runs_offset=3)
+    assert session.runs_offset == 3
+    assert get_unloaded_runs_count(session) == 3
+
+    # Earlier runs loaded with the session are stored back from the session
+    session = set_previous_runs(AgentSession(session_id="s1"), [_run_dict("r1")])
+    assert get_unloaded_runs_count(session) == 0
+
+
+def test_mysql_runs_window_statements():
+    from sqlalchemy import JSON, Column, MetaData, String, Table
+    from sqlalchemy.dialects import mysql
+
+    from agno.db.mysql.utils import get_runs_states_query, get_session_runs_update, select_session_with_runs_window
+
+    table = Table(
+        "agno_sessions",
+        MetaData(schema="ai"),
+        Column("session_id", String(128), primary_key=True),
+        Column("user_id", String(128)),
+        Column("runs", JSON),
+    )
+
+    states_query = str(get_runs_states_query(table, "s1").compile(dialect=mysql.dialect()))
+    assert "JSON_TABLE(s.runs, '$[*]'" in states_query
+
+    select_stmt = select_session_with_runs_window(table, 2).compile(dialect=mysql.dialect())
+    assert "json_extract(ai.agno_sessions.runs, %s) AS runs" in str(select_stmt)
+    assert select_stmt.params["json_extract_1"] == "$[2 to last]"
+
+    # The stored runs preceding the window are kept on upsert
+    session = set_previous_runs(AgentSession(session_id="s1"), runs_offset=2)
+    runs_update = get_session_runs_update(table, session, [_run_dict("r3")]).compile(dialect=mysql.dialect())
+    assert str(runs_update).startswith("json_merge_preserve(coalesce(json_extract(ai.agno_sessions.runs")
+    assert "$[0 to 1]" in runs_update.params.values()
+    assert get_session_runs_update(table, AgentSession(session_id="s1"), []) == []
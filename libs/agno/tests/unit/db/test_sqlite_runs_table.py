@@ -0,0 +1,129 @@
+"""Tests for storing session runs in a separate runs table with SqliteDb."""
+
+import pytest
+
+from agno.db.base import SessionType
+from agno.db.sqlite import SqliteDb
+from agno.run.agent import RunOutput
+from agno.run.team import TeamRunOutput
+from agno.session import AgentSession, TeamSession
+
+
+@pytest.fixture
+def db(tmp_path):
+    return SqliteDb(db_file=str(tmp_path / "agno.db"), runs_table="agno_runs")
+
+
+def _count_runs(db: SqliteDb) -> int:
+    with db.Session() as sess:
+        return len(sess.execute(db._get_table("runs").select()).fetchall())
+
+
+def test_upsert_only_writes_unsaved_runs(db):
+    session = AgentSession(session_id="s1", agent_id="a1", user_id="u1", session_data={}, created_at=1)
+    session.upsert_run(RunOutput(run_id="r1", agent_id="a1", session_id="s1", content="first"))
+    db.upsert_session(session)
+    assert session.unsaved_run_ids == set()
+
+    session.upsert_run(RunOutput(run_id="r2", agent_id="a1", session_id="s1", content="second"))
+    assert session.unsaved_run_ids == {"r2"}
+    db.upsert_session(session)
+
+    with db.Session() as sess:
+        session_row = sess.execute(db._get_table("sessions").select()).fetchone()
+    assert session_row._mapping["runs"] in (None, "null")
+    assert _count_runs(db) == 2
+
+
+def test_get_session_reads_runs_in_order(db):
+    session = AgentSession(session_id="s1", agent_id="a1", session_data={}, created_at=1)
+    for run_id in ["r1", "r2", "r3"]:
+        session.upsert_run(RunOutput(run_id=run_id, agent_id="a1", session_id="s1", content=run_id))
+        db.upsert_session(session)
+
+    # Updating an existing run keeps its position
+    session.upsert_run(RunOutput(run_id="r2", agent_id="a1", session_id="s1", content="updated"))
+    db.upsert_session(session)
+
+    stored = db.get_session(session_id="s1", session_type=SessionType.AGENT)
+    assert [run.run_id for run in stored.runs] == ["r1", "r2", "r3"]
+    assert stored.runs[1].content == "updated"
+    assert stored.unsaved_run_ids == set()
+
+
+def test_team_session_runs(db):
+    session = TeamSession(session_id="t1", team_id="team", session_data={}, created_at=1)
+    session.upsert_run(TeamRunOutput(run_id="tr1", team_id="team", session_id="t1"))
+    session.upsert_run(RunOutput(run_id="mr1", agent_id="member", session_id="t1", parent_run_id="tr1"))
+    db.upsert_session(session)
+
+    stored = db.get_session(session_id="t1", session_type=SessionType.TEAM)
+    assert [run.run_id for run in stored.runs] == ["tr1", "mr1"]
+
+
+def test_embedded_runs_are_moved_to_runs_table(tmp_path):
+    db_file = str(tmp_path / "agno.db")
+    legacy_db = SqliteDb(db_file=db_file)
+    session = AgentSession(session_id="s1", agent_id="a1", session_data={}, created_at=1)
+    session.upsert_run(RunOutput(run_id="r1", agent_id="a1", session_id="s1"))
+    legacy_db.upsert_session(session)
+
+    db = SqliteDb(db_file=db_file, runs_table="agno_runs")
+    stored = db.get_session(session_id="s1", session_type=SessionType.AGENT)
+    assert [run.run_id for run in stored.runs] == ["r1"]
+    assert stored.unsaved_run_ids == {"r1"}
+
+    stored.upsert_run(RunOutput(run_id="r2", agent_id="a1", session_id="s1"))
+    db.upsert_session(stored)
+
+    reloaded = db.get_session(session_id="s1", session_type=SessionType.AGENT)
+    assert [run.run_id for run in reloaded.runs] == ["r1", "r2"]
+    assert _count_runs(db) == 2
+
+
+def test_delete_session_deletes_runs(db):
+    for session_id in ["s1", "s2"]:
+        session = AgentSession(session_id=session_id, agent_id="a1", session_data={}, created_at=1)
+        session.upsert_run(RunOutput(run_id=f"{session_id}-r1", agent_id="a1", session_id=session_id))
+        db.upsert_session(session)
+
+    assert db.delete_session("s1") is True
+    assert _count_runs(db) == 1
+
+    db.delete_sessions(["s2"])
+    assert _count_runs(db) == 0
+
+
+def test_runs_table_serialization():
+    db = SqliteDb(db_url="sqlite://", runs_table="my_runs")
+    assert db.to_dict()["runs_table"] == "my_runs"
+    assert SqliteDb.from_dict(db.to_dict()).runs_table_name == "my_runs"
+
+
+def test_get_sessions_reads_runs_from_runs_table(db):
+    for session_id in ["s1", "s2"]:
+        session = AgentSession(session_id=session_id, agent_id="a1", session_data={}, created_at=1)
+        for i in range(2):
+            run_id = f"{session_id}-r{i}"
+            session.upsert_run(RunOutput(run_id=run_id, agent_id="a1", session_id=session_id, content=run_id))
+        db.upsert_session(session)
+
+    sessions = db.get_sessions(session_type=SessionType.AGENT, sort_by="session_id", sort_order="asc")
+    assert {session.session_id: [run.run_id for run in session.runs] for session in sessions} == {
+        "s1": ["s1-r0", "s1-r1"],
+        "s2": ["s2-r0", "s2-r1"],
+    }
+    assert all(session.unsaved_run_ids == set() for session in sessions)
+
+    sessions_raw, total_count = db.get_sessions(session_type=SessionType.AGENT, deserialize=False)
+    assert total_count == 2
+    assert sorted(run["run_id"] for session in sessions_raw for run in session["runs"]) == [
+        "s1-r0",
+        "s1-r1",
+        "s2-r0",
+        "s2-r1",
+    ]
+
+    renamed = db.rename_session(session_id="s1", session_type=SessionType.AGENT, session_name="renamed")
+    assert renamed.session_data["session_name"] == "renamed"
+    assert [run.run_id for run in renamed.runs] == ["s1-r0", "s1-r1"]
@@ -0,0 +1,73 @@
+"""Tests for claiming due schedules in batches with SqliteDb."""
+
+import time
+
+import pytest
+
+from agno.db.sqlite import SqliteDb
+
+
+def _schedule(schedule_id: str, next_run_at: int, **overrides):
+    schedule = {
+        "id": schedule_id,
+        "name": schedule_id,
+        "method": "POST",
+        "endpoint": "/agents/a1/runs",
+        "cron_expr": "* * * * *",
+        "timezone": "UTC",
+        "timeout_seconds": 3600,
+        "max_retries": 0,
+        "retry_delay_seconds": 60,
+        "enabled": True,
+        "next_run_at": next_run_at,
+        "locked_by": None,
+        "locked_at": None,
+        "created_at": 1,
+    }
+    schedule.update(overrides)
+    return schedule
+
+
+@pytest.fixture
+def now():
+    return int(time.time())
+
+
+@pytest.fixture
+def db(tmp_path, now):
+    db = SqliteDb(db_file=str(tmp_path / "agno.db"))
+    for i in range(5):
+        db.create_schedule(_schedule(f"due-{i}", now - 100 + i))
+    db.create_schedule(_schedule("disabled", now - 100, enabled=False))
+    db.create_schedule(_schedule("locked", now - 100, locked_by="other", locked_at=now))
+    db.create_schedule(_schedule("stale", now - 200, locked_by="other", locked_at=now - 1000))
+    db.create_schedule(_schedule("future", now + 600))
+    return db
+
+
+def test_claim_due_schedules(db):
+    claimed = db.claim_due_schedules("w1", limit=3)
+    assert [schedule["id"] for schedule in claimed] == ["stale", "due-0", "due-1"]
+    assert all(schedule["locked_by"] == "w1" for schedule in claimed)
+
+    claimed = db.claim_due_schedules("w2", limit=10)
+    assert [schedule["id"] for schedule in claimed] == ["due-2", "due-3", "due-4"]
+
+    assert db.claim_due_schedules("w3", limit=10) == []
+    assert db.claim_due_schedule("w3") is None
+
+
+def test_get_next_schedule_run_at(db, now):
+    assert db.get_next_schedule_run_at() == now - 100
+
+    db.claim_due_schedules("w1", limit=10)
+    assert db.get_next_schedule_run_at() == now + 600
+
+    db.release_schedule("due-0", next_run_at=now + 60)
+    assert db.get_next_schedule_run_at() == now + 60
+
+
+def test_without_schedules_table(tmp_path):
+    db = SqliteDb(db_file=str(tmp_path / "empty.db"))
+    assert db.claim_due_schedules("w1") == []
+    assert db.get_next_schedule_run_at() is None
@@ -210,3 +210,89 @@ def test_semantic_chunking_wrapper_dtype_float32(fake_chonkie_capturing):
 
     assert isinstance(result, np.ndarray)
     assert result.dtype == np.float32
+
+
+def test_semantic_chunking_wrapper_embeds_batches_once_per_text(fake_chonkie_capturing):
+    """Test that wrapper.embed_batch() makes one batch call for the distinct texts not embedded yet."""
+    batch_calls: List[List[str]] = []
+
+    @dataclass
+    class BatchEmbedder(Embedder):
+        dimensions: int = 4
+
+        def get_embedding(self, text: str) -> List[float]:
+            raise AssertionError("Texts should be embedded in batches")
+
+        def get_embeddings_batch_and_usage(self, texts: List[str]):
+            batch_calls.append(list(texts))
+            return [[float(len(text))] * self.dimensions for text in texts], [None] * len(texts)
+
+    sc = SemanticChunking(embedder=BatchEmbedder(), chunk_size=100)
+    _ = sc.chunk(Document(content="Test"))
+    wrapper = fake_chonkie_capturing["embedding_model"]
+
+    first = wrapper.embed_batch(["one.", "three.", "one."])
+    second = wrapper.embed_batch(["three.", "five!"])
+
+    assert batch_calls == [["one.", "three."], ["five!"]]
+    assert [embedding[0] for embedding in first] == [4.0, 6.0, 4.0]
+    assert wrapper.embed("five!")[0] == 5.0
+    assert len(second) == 2
+
+
+def test_semantic_chunking_wrapper_cache_is_cleared_after_each_document(fake_chonkie_capturing):
+    """Test that sentence embeddings are only cached within a document."""
+    call_log: List[str] = []
+
+    @dataclass
+    class TrackingEmbedder(Embedder):
+        dimensions: int = 4
+
+        def get_embedding(self, text: str) -> List[float]:
+            call_log.append(text)
+            return [0.1] * self.dimensions
+
+    sc = SemanticChunking(embedder=TrackingEmbedder(), chunk_size=100)
+    _ = sc.chunk(Document(content="Test"))
+    wrapper = fake_chonkie_capturing["embedding_model"]
+
+    # Embedders without a batch API are called once per text
+    wrapper.embed_batch(["a sentence", "another sentence"])
+    wrapper.embed("a sentence")
+    assert call_log == ["a sentence", "another sentence"]
+
+    _ = sc.chunk(Document(content="Next document"))
+    wrapper.embed("a sentence")
+    assert call_log == ["a sentence", "another sentence", "a sentence"]
+
+
+def test_semantic_chunking_wrapper_cache_is_per_thread(fake_chonkie_capturing):
+    """Test that documents chunked in other threads do not share or clear the cache."""
+    import threading
+
+    call_log: List[str] = []
+
+    @dataclass
+    class TrackingEmbedder(Embedder):
+        dimensions: int = 4
+
+        def get_embedding(self, text: str) -> List[float]:
+            call_log.append(text)
+            return [0.1] * self.dimensions
+
+    sc = SemanticChunking(embedder=TrackingEmbedder(), chunk_size=100)
+    _ = sc.chunk(Document(content="Test"))
+    wrapper = fake_chonkie_capturing["embedding_model"]
+    wrapper.embed_batch(["a sentence"])
+
+    def chunk_other_document():
+        wrapper.embed("a sentence")
+        wrapper.clear_cache()
+
+    thread = threading.Thread(target=chunk_other_document)
+    thread.start()
+    thread.join()
+
+    # The other thread embedded the text again, and its clear did not drop this thread's cache
+    wrapper.embed("a sentence")
+    assert call_log == ["a sentence", "a sentence"]
@@ -0,0 +1,206 @@
+"""Tests for the batched embedding stage shared by the vector databases."""
+
+import asyncio
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+from unittest.mock import MagicMock
+
+import pytest
+
+from agno.knowledge.document import Document
+from agno.knowledge.embedder.base import Embedder
+from agno.knowledge.embedder.batch import async_embed_documents, embed_documents
+
+
+@dataclass
+class FakeEmbedder(Embedder):
+    dimensions: Optional[int] = 2
+    failures: List[Exception] = field(default_factory=list)
+    batch_calls: List[List[str]] = field(default_factory=list)
+    single_calls: List[str] = field(default_factory=list)
+    delay: float = 0.0
+    max_active: int = 0
+    _active: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def get_embedding(self, text: str) -> List[float]:
+        return self.get_embedding_and_usage(text)[0]
+
+    def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        self.single_calls.append(text)
+        return [float(len(text)), 0.0], None
+
+    async def async_get_embedding(self, text: str) -> List[float]:
+        return self.get_embedding(text)
+
+    async def async_get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        return self.get_embedding_and_usage(text)
+
+    def get_embeddings_batch_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        with self._lock:
+            self._active += 1
+            self.max_active = max(self.max_active, self._active)
+        try:
+            time.sleep(self.delay)
+            self.batch_calls.append(list(texts))
+            if self.failures:
+                raise self.failures.pop(0)
+            usage = {"prompt_tokens": len(texts), "total_tokens": len(texts)}
+            return [[float(len(text)), 1.0] for text in texts], [usage] * len(texts)
+        finally:
+            with self._lock:
+                self._active -= 1
+
+    async def async_get_embeddings_batch_and_usage(
+        self, texts: List[str]
+    ) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        return self.get_embeddings_batch_and_usage(texts)
+
+
+def _documents(count: int) -> List[Document]:
+    return [Document(name=f"doc-{i}", content="x" * (i + 1)) for i in range(count)]
+
+
+def test_one_embedder_call_per_batch():
+    embedder = FakeEmbedder(enable_batch=True, batch_size=2)
+    documents = _documents(5)
+
+    usages = embed_documents(embedder, documents)
+
+    assert [len(batch) for batch in embedder.batch_calls] == [2, 2, 1]
+    assert embedder.single_calls == []
+    assert [doc.embedding for doc in documents] == [[float(i + 1), 1.0] for i in range(5)]
+    assert usages == [{"prompt_tokens": 2, "total_tokens": 2}] * 2 + [{"prompt_tokens": 1, "total_tokens": 1}]
+
+
+def test_batches_are_embedded_concurrently():
+    embedder = FakeEmbedder(enable_batch=True, batch_size=1, batch_concurrency=3, delay=0.05)
+    documents = _documents(6)
+
+    embed_documents(embedder, documents)
+
+    assert len(embedder.batch_calls) == 6
+    assert 1 < embedder.max_active <= 3
+    assert all(doc.embedding for doc in documents)
+
+
+def test_failed_batch_is_retried():
+    embedder = FakeEmbedder(
+        enable_batch=True, batch_size=10, batch_retries=2, batch_retry_delay=0, failures=[RuntimeError("boom")]
+    )
+    documents = _documents(3)
+
+    embed_documents(embedder, documents)
+
+    assert len(embedder.batch_calls) == 2
+    assert embedder.single_calls == []
+
+
+def test_failed_batch_falls_back_to_individual_embeddings():
+    embedder = FakeEmbedder(enable_batch=True, batch_size=10, failures=[RuntimeError("boom")])
+    documents = _documents(3)
+
+    assert embed_documents(embedder, documents) == [None]
+    assert len(embedder.single_calls) == 3
+    assert all(doc.embedding for doc in documents)
+
+
+def test_rate_limit_error_is_raised():
+    embedder = FakeEmbedder(
+        enable_batch=True, batch_retries=1, batch_retry_delay=0, failures=[RuntimeError("429 Too Many Requests")] * 2
+    )
+
+    with pytest.raises(RuntimeError, match="429"):
+        embed_documents(embedder, _documents(2))
+    assert embedder.single_calls == []
+
+
+def test_disabled_batching_embeds_documents_individually():
+    embedder = FakeEmbedder()
+    documents = _documents(3)
+
+    assert embed_documents(embedder, documents) == []
+    assert embedder.batch_calls == []
+    assert len(embedder.single_calls) == 3
+
+
+@pytest.mark.asyncio
+async def test_async_embed_documents_in_batches():
+    embedder = FakeEmbedder(enable_batch=True, batch_size=2, batch_concurrency=2)
+    documents = _documents(3)
+
+    usages = await async_embed_documents(embedder, documents)
+
+    assert sorted(len(batch) for batch in embedder.batch_calls) == [1, 2]
+    assert len(usages) == 2
+    assert all(doc.embedding for doc in documents)
+
+
+def test_objects_without_batch_settings_embed_documents_individually():
+    embedder = MagicMock()
+    embedder.get_embedding_and_usage.return_value = ([0.1, 0.2], None)
+    documents = _documents(2)
+
+    embed_documents(embedder, documents)
+
+    assert embedder.get_embedding_and_usage.call_count == 2
+    assert all(doc.embedding == [0.1, 0.2] for doc in documents)
+
+
+def test_error_embedding_a_document_is_raised():
+    embedder = MagicMock()
+    embedder.get_embedding_and_usage.side_effect = RuntimeError("embedding failed")
+
+    with pytest.raises(RuntimeError, match="embedding failed"):
+        embed_documents(embedder, _documents(2))
+
+
+@pytest.mark.asyncio
+async def test_async_error_embedding_a_document_is_raised():
+    embedder = FakeEmbedder(enable_batch=True, batch_size=10, failures=[RuntimeError("batch failed")])
+    embedder.async_get_embedding_and_usage = MagicMock(side_effect=RuntimeError("embedding failed"))  # type: ignore[method-assign]
+
+    # Like the sync stage, both with and without batching
+    with pytest.raises(RuntimeError, match="embedding failed"):
+        await async_embed_documents(embedder, _documents(2))
+    embedder.enable_batch = False
+    with pytest.raises(RuntimeError, match="embedding failed"):
+        await async_embed_documents(embedder, _documents(2))
+
+
+@pytest.mark.asyncio
+async def test_default_async_batch_is_bounded_by_batch_concurrency():
+    active = 0
+    max_active = 0
+
+    @dataclass
+    class SingleTextEmbedder(Embedder):
+        async def async_get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+            nonlocal active, max_active
+            active += 1
+            max_active = max(max_active, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return [float(len(text))], None
+
+    embeddings, _ = await SingleTextEmbedder(batch_concurrency=2).async_get_embeddings_batch_and_usage(
+        ["a", "bb", "ccc", "dddd", "eeeee"]
+    )
+
+    assert embeddings == [[1.0], [2.0], [3.0], [4.0], [5.0]]
+    assert max_active == 2
+
+
+def test_vector_db_insert_raises_when_embedding_fails():
+    from agno.vectordb.numpydb import NumpyDb
+
+    embedder = FakeEmbedder(enable_batch=True, batch_size=10, failures=[RuntimeError("batch failed")])
+    embedder.get_embedding_and_usage = MagicMock(side_effect=RuntimeError("embedding failed"))  # type: ignore[method-assign]
+    vector_db = NumpyDb(embedder=embedder)
+
+    with pytest.raises(RuntimeError, match="embedding failed"):
+        vector_db.insert("hash", _documents(2))
+    # Nothing was stored without an embedding
+    assert vector_db.get_count() == 0
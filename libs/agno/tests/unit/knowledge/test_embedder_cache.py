@@ -0,0 +1,123 @@
+"""Tests for the embedding cache in agno/knowledge/embedder/cache.py."""
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+import pytest
+
+from agno.knowledge.document import Document
+from agno.knowledge.embedder.base import Embedder
+from agno.knowledge.embedder.batch import embed_documents
+from agno.knowledge.embedder.cache import CachedEmbedder, InMemoryEmbeddingCache, SqliteEmbeddingCache
+
+
+@dataclass
+class CountingEmbedder(Embedder):
+    id: str = "counting"
+    dimensions: Optional[int] = 2
+    embedded_texts: List[str] = field(default_factory=list)
+
+    def get_embedding(self, text: str) -> List[float]:
+        return self.get_embedding_and_usage(text)[0]
+
+    def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        self.embedded_texts.append(text)
+        return [float(len(text)), 0.5], {"total_tokens": 1}
+
+    async def async_get_embedding(self, text: str) -> List[float]:
+        return self.get_embedding(text)
+
+    async def async_get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        return self.get_embedding_and_usage(text)
+
+
+@pytest.fixture(params=["in_memory", "sqlite"])
+def cache(request, tmp_path):
+    if request.param == "in_memory":
+        return InMemoryEmbeddingCache()
+    return SqliteEmbeddingCache(db_file=str(tmp_path / "embeddings.db"))
+
+
+def test_cached_embeddings_are_reused(cache):
+    embedder = CachedEmbedder(embedder=CountingEmbedder(), cache=cache)
+
+    assert embedder.get_embedding_and_usage("hello") == ([5.0, 0.5], {"total_tokens": 1})
+    assert embedder.get_embedding_and_usage("hello") == ([5.0, 0.5], None)
+
+    assert embedder.embedder.embedded_texts == ["hello"]
+    assert (cache.hits, cache.misses, cache.hit_rate) == (1, 1, 0.5)
+
+
+def test_batch_embeds_only_missing_texts(cache):
+    embedder = CachedEmbedder(embedder=CountingEmbedder(enable_batch=True, batch_size=10), cache=cache)
+    embedder.get_embedding("aa")
+
+    embeddings, usages = embedder.get_embeddings_batch_and_usage(["aa", "bbb", "bbb", "c"])
+
+    assert embeddings == [[2.0, 0.5], [3.0, 0.5], [3.0, 0.5], [1.0, 0.5]]
+    assert usages[0] is None and usages[1] is not None
+    assert embedder.embedder.embedded_texts == ["aa", "bbb", "c"]
+
+
+def test_reindexing_documents_hits_the_cache(cache):
+    embedder = CachedEmbedder(embedder=CountingEmbedder(enable_batch=True, batch_size=2), cache=cache)
+    documents = [Document(content=text) for text in ["one", "two", "three"]]
+
+    embed_documents(embedder, documents)
+    reloaded = [Document(content=text) for text in ["one", "two", "three", "four"]]
+    embed_documents(embedder, reloaded)
+
+    assert embedder.embedder.embedded_texts == ["one", "two", "three", "four"]
+    assert [doc.embedding for doc in reloaded[:3]] == [doc.embedding for doc in documents]
+
+
+def test_cache_keys_depend_on_the_model():
+    cache = InMemoryEmbeddingCache()
+    small = CachedEmbedder(embedder=CountingEmbedder(id="small"), cache=cache)
+    large = CachedEmbedder(embedder=CountingEmbedder(id="large"), cache=cache)
+
+    small.get_embedding("text")
+    large.get_embedding("text")
+
+    assert large.embedder.embedded_texts == ["text"]
+    assert len(cache) == 2
+
+
+def test_failed_embeddings_are_not_cached():
+    @dataclass
+    class FailingEmbedder(CountingEmbedder):
+        def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+            return [], None
+
+    cache = InMemoryEmbeddingCache()
+    CachedEmbedder(embedder=FailingEmbedder(), cache=cache).get_embedding("text")
+
+    assert len(cache) == 0
+
+
+def test_in_memory_cache_evicts_least_recently_used():
+    cache = InMemoryEmbeddingCache(max_entries=2)
+    cache.set_many({"a": [1.0], "b": [2.0]})
+    cache.get_many(["a"])
+    cache.set_many({"c": [3.0]})
+
+    assert cache.get_many(["a", "b", "c"]) == {"a": [1.0], "c": [3.0]}
+
+
+def test_sqlite_cache_is_shared_across_instances(tmp_path):
+    db_file = str(tmp_path / "embeddings.db")
+    SqliteEmbeddingCache(db_file=db_file).set_many({"a": [0.25, 1.5]})
+
+    assert SqliteEmbeddingCache(db_file=db_file).get_many(["a", "b"]) == {"a": [0.25, 1.5]}
+
+
+@pytest.mark.asyncio
+async def test_async_embeddings_are_cached(cache):
+    embedder = CachedEmbedder(embedder=CountingEmbedder(), cache=cache)
+
+    await embedder.async_get_embedding("hello")
+    embeddings, usages = await embedder.async_get_embeddings_batch_and_usage(["hello", "world"])
+
+    assert embeddings == [[5.0, 0.5], [5.0, 0.5]]
+    assert usages == [None, {"total_tokens": 1}]
+    assert embedder.embedder.embedded_texts == ["hello", "world"]
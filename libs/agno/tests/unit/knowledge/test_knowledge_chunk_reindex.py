@@ -0,0 +1,115 @@
+"""Tests for chunk-level re-indexing of content inserted again into Knowledge."""
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+import pytest
+
+from agno.knowledge.chunking.document import DocumentChunking
+from agno.knowledge.embedder.base import Embedder
+from agno.knowledge.knowledge import Knowledge
+from agno.knowledge.reader.text_reader import TextReader
+from agno.vectordb.base import CHUNK_HASH_KEY
+from agno.vectordb.numpydb import NumpyDb
+
+PARAGRAPHS = ["Cats sleep most of the day.", "Dogs like long walks.", "Parrots can learn words."]
+
+
+@dataclass
+class CountingEmbedder(Embedder):
+    dimensions: Optional[int] = 3
+    embedded_texts: List[str] = field(default_factory=list)
+
+    def get_embedding(self, text: str) -> List[float]:
+        self.embedded_texts.append(text)
+        return [float(len(text)), float(text.count(" ")) + 1.0, 1.0]
+
+    def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        return self.get_embedding(text), None
+
+    async def async_get_embedding(self, text: str) -> List[float]:
+        return self.get_embedding(text)
+
+    async def async_get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        return self.get_embedding_and_usage(text)
+
+
+@pytest.fixture
+def embedder():
+    return CountingEmbedder()
+
+
+@pytest.fixture
+def knowledge(embedder):
+    return Knowledge(vector_db=NumpyDb(embedder=embedder))
+
+
+def _reader() -> TextReader:
+    return TextReader(chunking_strategy=DocumentChunking(chunk_size=40, overlap=0))
+
+
+def _stored_contents(knowledge: Knowledge) -> List[str]:
+    vector_db = knowledge.vector_db
+    return sorted(record["content"] for record in vector_db._records if record is not None)  # type: ignore[union-attr]
+
+
+def test_reinsert_only_writes_changed_chunks(knowledge, embedder):
+    knowledge.insert(name="pets", text_content="\n\n".join(PARAGRAPHS), reader=_reader())
+    assert len(embedder.embedded_texts) == 3
+
+    embedder.embedded_texts.clear()
+    edited = [PARAGRAPHS[0], "Dogs like short walks.", PARAGRAPHS[2]]
+    knowledge.insert(name="pets", text_content="\n\n".join(edited), reader=_reader())
+
+    assert embedder.embedded_texts == ["Dogs like short walks."]
+    assert _stored_contents(knowledge) == sorted(edited)
+
+    embedder.embedded_texts.clear()
+    knowledge.insert(name="pets", text_content="\n\n".join(edited[:2]), reader=_reader())
+
+    assert embedder.embedded_texts == []
+    assert _stored_contents(knowledge) == sorted(edited[:2])
+
+
+def test_chunk_hashes_are_stored_with_documents(knowledge):
+    knowledge.insert(name="pets", text_content="\n\n".join(PARAGRAPHS), reader=_reader())
+
+    stored = [record for record in knowledge.vector_db._records if record is not None]
+    chunk_hashes = knowledge.vector_db.get_chunk_hashes(stored[0]["content_hash"])
+    assert len(chunk_hashes) == 3
+    assert sorted(chunk_hashes.values()) == sorted(record["meta_data"][CHUNK_HASH_KEY] for record in stored)
+    assert knowledge.vector_db.get_chunk_hashes("unknown") == {}
+
+
+def test_chunks_without_hashes_are_rewritten(knowledge, embedder):
+    knowledge.insert(name="pets", text_content="\n\n".join(PARAGRAPHS), reader=_reader(), upsert=False)
+    embedder.embedded_texts.clear()
+
+    knowledge.insert(name="pets", text_content="\n\n".join(PARAGRAPHS), reader=_reader())
+
+    assert len(embedder.embedded_texts) == 3
+    assert _stored_contents(knowledge) == sorted(PARAGRAPHS)
+
+    # Once hashes are stored, an unchanged content is not embedded again
+    embedder.embedded_texts.clear()
+    knowledge.insert(name="pets", text_content="\n\n".join(PARAGRAPHS), reader=_reader())
+    assert embedder.embedded_texts == []
+
+
+def test_duplicated_chunks_are_kept(knowledge):
+    knowledge.insert(name="pets", text_content="\n\n".join(PARAGRAPHS[:1] * 2), reader=_reader())
+    knowledge.insert(name="pets", text_content="\n\n".join(PARAGRAPHS[:1] * 3), reader=_reader())
+
+    assert _stored_contents(knowledge) == PARAGRAPHS[:1] * 3
+
+
+@pytest.mark.asyncio
+async def test_async_reinsert_only_writes_changed_chunks(knowledge, embedder):
+    await knowledge.ainsert(name="pets", text_content="\n\n".join(PARAGRAPHS), reader=_reader())
+    embedder.embedded_texts.clear()
+
+    edited = PARAGRAPHS + ["Fish swim in schools."]
+    await knowledge.ainsert(name="pets", text_content="\n\n".join(edited), reader=_reader())
+
+    assert embedder.embedded_texts == ["Fish swim in schools."]
+    assert _stored_contents(knowledge) == sorted(edited)
@@ -0,0 +1,198 @@
+"""Tests for the staged ingestion pipeline of insert_many() and ainsert_many()."""
+
+import asyncio
+import threading
+import time
+from typing import List
+
+import pytest
+
+from agno.knowledge import IngestionPipeline, IngestionStats
+from agno.knowledge.document import Document
+from agno.knowledge.knowledge import Knowledge
+from agno.vectordb.base import VectorDb
+
+
+class RecordingVectorDb(VectorDb):
+    """VectorDb stub that records inserted documents and can hold writes until released."""
+
+    def __init__(self, fail_on: str = ""):
+        self.inserted: List[Document] = []
+        self.fail_on = fail_on
+        self.release = threading.Event()
+        self.release.set()
+        self.write_threads: set = set()
+        self.checked_hashes: List[str] = []
+        self._lock = threading.Lock()
+
+    def _insert(self, documents: List[Document]) -> None:
+        if any(self.fail_on and self.fail_on in document.content for document in documents):
+            raise RuntimeError("write failed")
+        self.release.wait(timeout=5)
+        with self._lock:
+            self.inserted.extend(documents)
+            self.write_threads.add(threading.current_thread().name)
+
+    def create(self) -> None:
+        pass
+
+    async def async_create(self) -> None:
+        pass
+
+    def name_exists(self, name: str) -> bool:
+        return False
+
+    async def async_name_exists(self, name: str) -> bool:
+        return False
+
+    def id_exists(self, id: str) -> bool:
+        return False
+
+    def content_hash_exists(self, content_hash: str) -> bool:
+        # Called by every read, before the documents are handed to the write stage
+        self.checked_hashes.append(content_hash)
+        return False
+
+    def insert(self, content_hash: str, documents: List[Document], filters=None) -> None:
+        self._insert(documents)
+
+    async def async_insert(self, content_hash: str, documents: List[Document], filters=None) -> None:
+        await asyncio.sleep(0)
+        self._insert(documents)
+
+    def upsert_available(self) -> bool:
+        return False
+
+    def upsert(self, content_hash: str, documents: List[Document], filters=None) -> None:
+        self._insert(documents)
+
+    async def async_upsert(self, content_hash: str, documents: List[Document], filters=None) -> None:
+        self._insert(documents)
+
+    def search(self, query: str, limit: int = 5, filters=None) -> List[Document]:
+        return []
+
+    async def async_search(self, query: str, limit: int = 5, filters=None) -> List[Document]:
+        return []
+
+    def drop(self) -> None:
+        pass
+
+    async def async_drop(self) -> None:
+        pass
+
+    def exists(self) -> bool:
+        return True
+
+    async def async_exists(self) -> bool:
+        return True
+
+    def delete(self) -> bool:
+        return True
+
+    def delete_by_id(self, id: str) -> bool:
+        return True
+
+    def delete_by_name(self, name: str) -> bool:
+        return True
+
+    def delete_by_metadata(self, metadata) -> bool:
+        return True
+
+    def update_metadata(self, content_id: str, metadata) -> None:
+        pass
+
+    def delete_by_content_id(self, content_id: str) -> bool:
+        return True
+
+    def get_supported_search_types(self):
+        return ["vector"]
+
+
+def test_pipeline_inserts_texts_and_directory_files(tmp_path):
+    (tmp_path / "nested").mkdir()
+    for i in range(3):
+        (tmp_path / f"file_{i}.txt").write_text(f"file {i}")
+    (tmp_path / "nested" / "deep.txt").write_text("deep file")
+    (tmp_path / "skipped.md").write_text("skipped file")
+    (tmp_path / "nested" / "skipped.md").write_text("skipped file")
+
+    vector_db = RecordingVectorDb()
+    knowledge = Knowledge(vector_db=vector_db)
+    progress: List[int] = []
+    pipeline = IngestionPipeline(
+        read_workers=3, write_workers=2, on_progress=lambda stats: progress.append(stats.contents_completed)
+    )
+
+    knowledge.insert_many(
+        paths=[str(tmp_path)],
+        text_contents=["first text", "second text"],
+        exclude=["*.md"],
+        pipeline=pipeline,
+    )
+
+    contents = sorted(document.content for document in vector_db.inserted)
+    assert contents == ["deep file", "file 0", "file 1", "file 2", "first text", "second text"]
+    assert vector_db.write_threads and not any(name == "MainThread" for name in vector_db.write_threads)
+    assert progress[-1] == 6
+
+
+def test_reading_continues_while_writes_are_in_flight():
+    vector_db = RecordingVectorDb()
+    vector_db.release.clear()
+    knowledge = Knowledge(vector_db=vector_db)
+    stats: List[IngestionStats] = []
+    pipeline = IngestionPipeline(read_workers=2, write_workers=1, queue_size=10, on_progress=stats.append)
+
+    thread = threading.Thread(
+        target=knowledge.insert_many,
+        kwargs={"text_contents": [f"text {i}" for i in range(5)], "pipeline": pipeline},
+    )
+    thread.start()
+    # All contents are read while the writer is held on the first one
+    for _ in range(500):
+        if len(vector_db.checked_hashes) == 5:
+            break
+        time.sleep(0.01)
+    assert len(vector_db.checked_hashes) == 5
+    assert thread.is_alive()
+    assert vector_db.inserted == []
+
+    vector_db.release.set()
+    thread.join(timeout=5)
+    assert not thread.is_alive()
+    assert stats[-1].contents_read == 5
+    assert stats[-1].contents_completed == 5
+    assert stats[-1].documents_written == 5
+    assert stats[-1].write_idle_seconds >= 0
+
+
+def test_pipeline_reports_failed_writes():
+    vector_db = RecordingVectorDb(fail_on="broken")
+    knowledge = Knowledge(vector_db=vector_db)
+    stats: List[IngestionStats] = []
+
+    knowledge.insert_many(
+        text_contents=["fine", "broken", "also fine"],
+        pipeline=IngestionPipeline(write_workers=1, on_progress=stats.append),
+    )
+
+    assert stats[-1].contents_completed == 2
+    assert stats[-1].contents_failed == 1
+    assert sorted(document.content for document in vector_db.inserted) == ["also fine", "fine"]
+
+
+@pytest.mark.asyncio
+async def test_ainsert_many_with_pipeline():
+    vector_db = RecordingVectorDb()
+    knowledge = Knowledge(vector_db=vector_db)
+    stats: List[IngestionStats] = []
+
+    await knowledge.ainsert_many(
+        [{"text_content": f"text {i}"} for i in range(6)],
+        pipeline=IngestionPipeline(read_workers=3, write_workers=2, queue_size=1, on_progress=stats.append),
+    )
+
+    assert sorted(document.content for document in vector_db.inserted) == [f"text {i}" for i in range(6)]
+    assert stats[-1].contents_completed == 6
+    assert stats[-1].documents_per_second > 0
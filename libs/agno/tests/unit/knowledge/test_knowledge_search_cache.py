@@ -0,0 +1,212 @@
+"""Tests for the search result cache of Knowledge."""
+
+from typing import Any, Dict, List
+from unittest.mock import patch
+
+import pytest
+
+from agno.filters import EQ
+from agno.knowledge import SearchCache
+from agno.knowledge.document import Document
+from agno.knowledge.knowledge import Knowledge
+from agno.vectordb.base import VectorDb
+
+
+class CountingVectorDb(VectorDb):
+    """VectorDb stub that counts searches."""
+
+    def __init__(self):
+        self.search_calls: List[Dict[str, Any]] = []
+
+    def create(self) -> None:
+        pass
+
+    async def async_create(self) -> None:
+        pass
+
+    def name_exists(self, name: str) -> bool:
+        return False
+
+    async def async_name_exists(self, name: str) -> bool:
+        return False
+
+    def id_exists(self, id: str) -> bool:
+        return False
+
+    def content_hash_exists(self, content_hash: str) -> bool:
+        return False
+
+    def insert(self, content_hash: str, documents: List[Document], filters=None) -> None:
+        pass
+
+    async def async_insert(self, content_hash: str, documents: List[Document], filters=None) -> None:
+        pass
+
+    def upsert(self, content_hash: str, documents: List[Document], filters=None) -> None:
+        pass
+
+    async def async_upsert(self, content_hash: str, documents: List[Document], filters=None) -> None:
+        pass
+
+    def search(self, query: str, limit: int = 5, filters=None) -> List[Document]:
+        self.search_calls.append({"query": query, "limit": limit, "filters": filters})
+        return [Document(name="result", content=f"result for {query}", meta_data={"rank": 1})]
+
+    async def async_search(self, query: str, limit: int = 5, filters=None) -> List[Document]:
+        return self.search(query, limit, filters)
+
+    def drop(self) -> None:
+        pass
+
+    async def async_drop(self) -> None:
+        pass
+
+    def exists(self) -> bool:
+        return True
+
+    async def async_exists(self) -> bool:
+        return True
+
+    def delete(self) -> bool:
+        return True
+
+    def delete_by_id(self, id: str) -> bool:
+        return True
+
+    def delete_by_name(self, name: str) -> bool:
+        return True
+
+    def delete_by_metadata(self, metadata) -> bool:
+        return True
+
+    def delete_by_content_id(self, content_id: str) -> bool:
+        return True
+
+    def get_supported_search_types(self):
+        return ["vector"]
+
+
+@pytest.fixture
+def vector_db():
+    return CountingVectorDb()
+
+
+@pytest.fixture
+def knowledge(vector_db):
+    return Knowledge(vector_db=vector_db, search_cache=SearchCache())
+
+
+def test_repeated_search_is_served_from_cache(knowledge, vector_db):
+    first = knowledge.search("What do cats eat?")
+    second = knowledge.search("  what do  CATS eat? ")
+
+    assert len(vector_db.search_calls) == 1
+    assert [document.content for document in second] == [document.content for document in first]
+    assert knowledge.search_cache.hits == 1
+    assert knowledge.search_cache.misses == 1
+    assert knowledge.search_cache.hit_rate == 0.5
+
+
+def test_cache_key_includes_filters_and_limit(knowledge, vector_db):
+    knowledge.search("cats", filters={"type": "pet"})
+    knowledge.search("cats", filters={"type": "wild"})
+    knowledge.search("cats", filters=[EQ("type", "pet")])
+    knowledge.search("cats", filters={"type": "pet"}, max_results=3)
+    knowledge.search("cats", filters={"type": "pet"})
+
+    assert len(vector_db.search_calls) == 4
+
+
+def test_cached_documents_are_copies(knowledge):
+    documents = knowledge.search("cats")
+    documents[0].meta_data["rank"] = 99
+    documents[0].reranking_score = 0.1
+
+    cached = knowledge.search("cats")
+    assert cached[0].meta_data == {"rank": 1}
+    assert cached[0].reranking_score is None
+
+
+def test_cache_is_cleared_when_content_changes(knowledge, vector_db):
+    knowledge.search("cats")
+    knowledge.insert(text_content="Cats eat fish")
+    knowledge.search("cats")
+    assert len(vector_db.search_calls) == 2
+
+    knowledge.remove_vectors_by_name("result")
+    knowledge.search("cats")
+    assert len(vector_db.search_calls) == 3
+
+
+def test_results_of_search_started_before_clear_are_not_stored(knowledge, vector_db):
+    original_search = vector_db.search
+
+    def search_during_insert(*args, **kwargs):
+        # The content changes while the vector db is being searched
+        knowledge.search_cache.clear()
+        return original_search(*args, **kwargs)
+
+    with patch.object(vector_db, "search", side_effect=search_during_insert):
+        knowledge.search("cats")
+
+    assert len(knowledge.search_cache) == 0
+
+
+@pytest.mark.parametrize(
+    "remove",
+    [
+        lambda knowledge: knowledge.remove_content_by_id("content-1"),
+        lambda knowledge: knowledge.remove_vector_by_id("doc-1"),
+        lambda knowledge: knowledge.remove_vectors_by_name("result"),
+        lambda knowledge: knowledge.remove_vectors_by_metadata({"type": "pet"}),
+    ],
+)
+def test_search_during_delete_is_not_cached(knowledge, vector_db, remove):
+    def search_before_delete(*args, **kwargs):
+        # A search runs while the vector db is deleting, before the documents are gone
+        knowledge.search("cats")
+        return True
+
+    for method in ["delete_by_content_id", "delete_by_id", "delete_by_name", "delete_by_metadata"]:
+        setattr(vector_db, method, search_before_delete)
+    remove(knowledge)
+
+    knowledge.search("cats")
+    assert len(vector_db.search_calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_async_search_during_delete_is_not_cached(knowledge, vector_db):
+    def search_before_delete(content_id):
+        knowledge.search("cats")
+        return True
+
+    vector_db.delete_by_content_id = search_before_delete
+    await knowledge.aremove_content_by_id("content-1")
+
+    await knowledge.asearch("cats")
+    assert len(vector_db.search_calls) == 2
+
+
+def test_cache_ttl_and_max_entries(vector_db):
+    cache = SearchCache(max_entries=2, ttl=60)
+    knowledge = Knowledge(vector_db=vector_db, search_cache=cache)
+    for query in ["cats", "dogs", "birds"]:
+        knowledge.search(query)
+    assert len(cache) == 2
+
+    knowledge.search("cats")
+    assert len(vector_db.search_calls) == 4
+
+    with patch("agno.knowledge.search_cache.time", return_value=10**12):
+        knowledge.search("dogs")
+    assert len(vector_db.search_calls) == 5
+
+
+@pytest.mark.asyncio
+async def test_async_search_uses_cache(knowledge, vector_db):
+    await knowledge.asearch("cats")
+    knowledge.search("cats")
+    await knowledge.asearch("cats")
+
+    assert len(vector_db.search_calls) == 1
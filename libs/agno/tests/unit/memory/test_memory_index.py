@@ -0,0 +1,177 @@
+"""Tests for the memory indexes and the semantic search of MemoryManager."""
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+from unittest.mock import MagicMock
+
+import pytest
+
+from agno.db.schemas import UserMemory
+from agno.knowledge.embedder.base import Embedder
+from agno.memory import InMemoryMemoryIndex, MemoryManager, VectorDbMemoryIndex
+from agno.memory.manager import MemorySearchResponse
+
+VOCABULARY = ["cat", "dog", "coffee", "tea", "python", "hiking"]
+
+
+@dataclass
+class KeywordEmbedder(Embedder):
+    """Embeds texts as the counts of a few words, so similarities are predictable."""
+
+    dimensions: Optional[int] = len(VOCABULARY)
+    embedded_texts: List[str] = field(default_factory=list)
+
+    def get_embedding(self, text: str) -> List[float]:
+        self.embedded_texts.append(text)
+        words = text.lower().split()
+        return [float(sum(word.startswith(term) for word in words)) + 0.01 for term in VOCABULARY]
+
+    def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        return self.get_embedding(text), None
+
+    async def async_get_embedding(self, text: str) -> List[float]:
+        return self.get_embedding(text)
+
+    async def async_get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        return self.get_embedding_and_usage(text)
+
+
+@pytest.fixture
+def memories() -> List[UserMemory]:
+    return [
+        UserMemory(memory_id="m1", user_id="u1", memory="I have a cat named Tom"),
+        UserMemory(memory_id="m2", user_id="u1", memory="I drink coffee every morning"),
+        UserMemory(memory_id="m3", user_id="u1", memory="I write python at work"),
+        UserMemory(memory_id="m4", user_id="u1", memory="I go hiking with my dog", topics=["hobbies"]),
+        UserMemory(memory_id="m5", user_id="u2", memory="I prefer tea to coffee"),
+    ]
+
+
+@pytest.fixture
+def mock_db(memories):
+    db = MagicMock()
+    db.get_user_memories = MagicMock(
+        side_effect=lambda user_id=None: [memory for memory in memories if user_id in (None, memory.user_id)]
+    )
+    return db
+
+
+def test_in_memory_index_search(memories):
+    index = InMemoryMemoryIndex(embedder=KeywordEmbedder())
+    index.upsert(memories)
+
+    assert len(index) == 5
+    assert index.search("u1", "what coffee do I drink", limit=1) == ["m2"]
+    assert index.search("u2", "coffee", limit=5) == ["m5"]
+    assert index.search("unknown", "coffee") == []
+
+
+def test_in_memory_index_update_and_delete(memories):
+    index = InMemoryMemoryIndex(embedder=KeywordEmbedder())
+    index.upsert(memories)
+
+    index.upsert([UserMemory(memory_id="m1", user_id="u1", memory="I switched to tea")])
+    assert index.search("u1", "tea", limit=1) == ["m1"]
+
+    index.delete("u1", ["m1", "m2"])
+    assert len(index) == 3
+    assert index.search("u1", "python", limit=5)[0] == "m3"
+    assert sorted(index.search("u1", "python", limit=5)) == ["m3", "m4"]
+    assert index.search("u1", "hiking dog", limit=1) == ["m4"]
+
+    index.clear("u1")
+    assert index.search("u1", "python") == []
+    assert len(index) == 1
+
+
+def test_refresh_only_embeds_changed_memories(memories):
+    embedder = KeywordEmbedder()
+    index = InMemoryMemoryIndex(embedder=embedder)
+    index.refresh("u1", memories[:4])
+    assert len(embedder.embedded_texts) == 4
+
+    embedder.embedded_texts.clear()
+    changed = [
+        UserMemory(memory_id="m1", user_id="u1", memory="I have two cats"),
+        *memories[1:3],
+    ]
+    index.refresh("u1", changed)
+
+    assert embedder.embedded_texts == ["I have two cats"]
+    assert len(index) == 3
+
+
+def test_vector_db_memory_index(memories):
+    from agno.vectordb.numpydb import NumpyDb
+
+    vector_db = NumpyDb(embedder=KeywordEmbedder())
+    index = VectorDbMemoryIndex(vector_db=vector_db)
+    index.upsert(memories)
+    index.upsert([UserMemory(memory_id="m3", user_id="u1", memory="I write python and drink tea")])
+
+    assert vector_db.get_count() == 5
+    assert index.search("u1", "tea", limit=1) == ["m3"]
+    assert index.search("u2", "coffee", limit=5) == ["m5"]
+
+    # A new index over the same vector database finds the memories already indexed
+    other_index = VectorDbMemoryIndex(vector_db=vector_db)
+    other_index.refresh("u2", memories[4:])
+    assert vector_db.get_count() == 5
+
+    index.delete("u1", ["m3"])
+    assert "m3" not in index.search("u1", "python tea", limit=5)
+
+
+def test_semantic_search_indexes_memories_on_first_search(mock_db):
+    manager = MemoryManager(db=mock_db, memory_index=InMemoryMemoryIndex(embedder=KeywordEmbedder()))
+
+    results = manager.search_user_memories(query="dog", retrieval_method="semantic", user_id="u1", limit=2)
+
+    assert len(results) == 2
+    assert results[0].memory_id == "m4"
+
+
+def test_semantic_search_requires_query_and_index(mock_db):
+    with pytest.raises(ValueError, match="Query is required"):
+        MemoryManager(db=mock_db).search_user_memories(retrieval_method="semantic", user_id="u1")
+
+    with pytest.raises(ValueError, match="memory_index"):
+        MemoryManager(db=mock_db).search_user_memories(query="cat", retrieval_method="semantic", user_id="u1")
+
+
+def test_memories_are_indexed_on_write(mock_db):
+    index = InMemoryMemoryIndex(embedder=KeywordEmbedder())
+    manager = MemoryManager(db=mock_db, memory_index=index)
+
+    manager.add_user_memory(UserMemory(memory_id="new", memory="I like tea"), user_id="u3")
+    assert index.search("u3", "tea") == ["new"]
+
+    manager.delete_user_memory(memory_id="new", user_id="u3")
+    assert index.search("u3", "tea") == []
+
+
+def test_agentic_search_only_sends_candidates_to_model(mock_db):
+    model = MagicMock()
+    model.supports_native_structured_outputs = True
+    model.response.return_value = MagicMock(parsed=MemorySearchResponse(memory_ids=["m2"]), content=None)
+    manager = MemoryManager(
+        db=mock_db,
+        memory_index=InMemoryMemoryIndex(embedder=KeywordEmbedder()),
+        memory_search_candidates=2,
+    )
+    manager.model = model
+
+    results = manager.search_user_memories(query="coffee", retrieval_method="agentic", user_id="u1")
+
+    assert [memory.memory_id for memory in results] == ["m2"]
+    system_message = model.response.call_args.kwargs["messages"][0].content
+    assert system_message.count("ID: ") == 2
+    assert "ID: m2" in system_message
+
+
+@pytest.mark.asyncio
+async def test_async_upsert_and_search(memories):
+    index = InMemoryMemoryIndex(embedder=KeywordEmbedder())
+    await index.arefresh("u1", memories[:4])
+
+    assert await index.asearch("u1", "python", limit=1) == ["m3"]
@@ -0,0 +1,162 @@
+"""Tests for the model response cache backends in agno/models/cache.py."""
+
+import os
+from copy import deepcopy
+from time import time
+from unittest.mock import patch
+
+import pytest
+
+os.environ.setdefault("OPENAI_API_KEY", "test-key-for-testing")
+
+from agno.agent import Agent
+from agno.db.sqlite import SqliteDb
+from agno.models.cache import DbModelCache, FileModelCache, InMemoryModelCache, SqliteModelCache
+from agno.models.metrics import Metrics
+from agno.models.openai.chat import OpenAIChat
+from agno.models.response import ModelResponse
+
+
+def _entry(content: str, timestamp=None):
+    return {"timestamp": timestamp or int(time()), "is_streaming": False, "result": {"content": content}}
+
+
+@pytest.fixture(params=["file", "in_memory", "sqlite", "db"])
+def cache(request, tmp_path):
+    if request.param == "file":
+        return FileModelCache(cache_dir=str(tmp_path / "cache"), ttl=60)
+    if request.param == "in_memory":
+        return InMemoryModelCache(ttl=60)
+    if request.param == "sqlite":
+        return SqliteModelCache(db_file=str(tmp_path / "cache.db"), ttl=60)
+    return DbModelCache(db=SqliteDb(db_file=str(tmp_path / "agno.db")), ttl=60)
+
+
+def test_get_set_and_metrics(cache):
+    assert cache.get("k1") is None
+    cache.set("k1", _entry("one"))
+    assert cache.get("k1")["result"]["content"] == "one"
+
+    # Expired entries are misses
+    cache.set("k2", _entry("two", timestamp=int(time()) - 120))
+    assert cache.get("k2") is None
+
+    assert cache.metrics.model_cache_hits == 1
+    assert cache.metrics.model_cache_misses == 2
+
+    cache.clear()
+    assert cache.get("k1") is None
+
+
+def test_in_memory_cache_evicts_least_recently_used():
+    cache = InMemoryModelCache(max_entries=2)
+    cache.set("a", _entry("a"))
+    cache.set("b", _entry("b"))
+    cache.get("a")
+    cache.set("c", _entry("c"))
+
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+
+
+def test_in_memory_cache_max_bytes():
+    entry_size = len(str(_entry("a")))
+    cache = InMemoryModelCache(max_entries=None, max_bytes=entry_size * 2)
+    for key in ["a", "b", "c"]:
+        cache.set(key, _entry(key))
+
+    assert len(cache) == 2
+    assert cache.total_bytes <= entry_size * 2
+    assert cache.get("a") is None
+
+
+def test_in_memory_cache_returns_copies():
+    cache = InMemoryModelCache()
+    cache.set("a", _entry("a"))
+    cache.get("a")["result"]["content"] = "changed"
+    assert cache.get("a")["result"]["content"] == "a"
+
+
+def test_sqlite_cache_evicts_and_persists(tmp_path):
+    db_file = str(tmp_path / "cache.db")
+    cache = SqliteModelCache(db_file=db_file, max_entries=2)
+    cache.set("a", _entry("a"))
+    cache.set("b", _entry("b"))
+    cache.get("a")
+    cache.set("c", _entry("c"))
+    assert len(cache) == 2
+    cache.close()
+
+    reopened = SqliteModelCache(db_file=db_file, max_entries=2)
+    assert reopened.get("b") is None
+    assert reopened.get("a")["result"]["content"] == "a"
+    assert reopened.get("c")["result"]["content"] == "c"
+
+
+def test_db_cache_max_entries(tmp_path):
+    cache = DbModelCache(db=SqliteDb(db_file=str(tmp_path / "agno.db")), max_entries=2)
+    for key in ["a", "b", "c"]:
+        cache.set(key, _entry(key))
+
+    assert len(cache) == 2
+    assert cache.get("a") is None
+    assert cache.get("c")["result"]["content"] == "c"
+    # Entries are kept in their own table
+    assert cache.db.get_learnings() == []
+
+
+def test_db_cache_evicts_expired_entries(tmp_path):
+    cache = DbModelCache(db=SqliteDb(db_file=str(tmp_path / "agno.db")), ttl=60)
+    cache.set("old", _entry("old", timestamp=int(time()) - 120))
+    cache.set("new", _entry("new"))
+    assert len(cache) == 1
+
+
+def test_model_uses_cache_backend():
+    cache = InMemoryModelCache()
+    model = OpenAIChat(id="gpt-4o-mini", cache_response=True, cache=cache)
+    model._save_model_response_to_cache("key", ModelResponse(content="hello"))
+
+    cached = model._get_cached_model_response("key")
+    assert model._model_response_from_cache(cached).content == "hello"
+    assert cache.metrics.model_cache_hits == 1
+
+    # Copies of the model share the cache
+    assert deepcopy(model).cache is cache
+
+
+def test_default_cache_follows_model_settings(tmp_path):
+    model = OpenAIChat(id="gpt-4o-mini", cache_response=True, cache_dir=str(tmp_path / "one"))
+    first_cache = model._get_model_cache()
+    assert model._get_model_cache() is first_cache
+
+    model.cache_dir = str(tmp_path / "two")
+    model.cache_ttl = 60
+    second_cache = model._get_model_cache()
+    assert isinstance(second_cache, FileModelCache)
+    assert second_cache.cache_dir == tmp_path / "two"
+    assert second_cache.ttl == 60
+
+
+def test_agent_run_counts_cache_hits_and_misses():
+    model = OpenAIChat(id="gpt-4o-mini", cache_response=True, cache=InMemoryModelCache())
+    agent = Agent(model=model)
+
+    def mock_invoke(*args, **kwargs):
+        return ModelResponse(role="assistant", content="hello")
+
+    with patch.object(model, "invoke", side_effect=mock_invoke) as invoke:
+        first_run = agent.run("Hi")
+        second_run = agent.run("Hi")
+
+    assert invoke.call_count == 1
+    assert second_run.content == "hello"
+    assert (first_run.metrics.model_cache_hits, first_run.metrics.model_cache_misses) == (0, 1)
+    assert (second_run.metrics.model_cache_hits, second_run.metrics.model_cache_misses) == (1, 0)
+
+
+def test_metrics_add_cache_counters():
+    total = Metrics(model_cache_hits=1, model_cache_misses=2) + Metrics(model_cache_hits=3)
+    assert total.model_cache_hits == 4
+    assert total.model_cache_misses == 2
@@ -0,0 +1,102 @@
+"""Tests for running the function calls of a model response in parallel threads in Model.run_function_calls."""
+
+import os
+import threading
+import time
+from typing import List
+
+import pytest
+
+os.environ.setdefault("OPENAI_API_KEY", "test-key-for-testing")
+
+from agno.models.message import Message
+from agno.models.openai.chat import OpenAIChat
+from agno.models.response import ModelResponse, ModelResponseEvent
+from agno.tools.function import Function, FunctionCall
+
+
+@pytest.fixture
+def model():
+    return OpenAIChat(id="gpt-4o-mini")
+
+
+def _function_call(entrypoint, call_id: str, **function_kwargs) -> FunctionCall:
+    function = Function.from_callable(entrypoint)
+    for key, value in function_kwargs.items():
+        setattr(function, key, value)
+    function.process_entrypoint()
+    return FunctionCall(function=function, arguments={"value": call_id}, call_id=call_id)
+
+
+def _run(model, function_calls: List[FunctionCall], **kwargs):
+    function_call_results: List[Message] = []
+    events = list(
+        model.run_function_calls(function_calls=function_calls, function_call_results=function_call_results, **kwargs)
+    )
+    return events, function_call_results
+
+
+def test_function_calls_run_in_parallel_and_keep_order(model):
+    barrier = threading.Barrier(3, timeout=5)
+
+    def wait_for_all(value: str) -> str:
+        """Waits until all calls are running."""
+        barrier.wait()
+        return value
+
+    def slow_first(value: str) -> str:
+        """Finishes last."""
+        barrier.wait()
+        time.sleep(0.05)
+        return value
+
+    function_calls = [
+        _function_call(slow_first, "a"),
+        _function_call(wait_for_all, "b"),
+        _function_call(wait_for_all, "c"),
+    ]
+    _, function_call_results = _run(model, function_calls, max_concurrency=3)
+
+    assert [result.tool_call_id for result in function_call_results] == ["a", "b", "c"]
+    assert [result.content for result in function_call_results] == ["a", "b", "c"]
+
+
+def test_function_calls_run_sequentially_by_default(model):
+    thread_ids = []
+
+    def record_thread(value: str) -> str:
+        """Records the thread it runs in."""
+        thread_ids.append(threading.get_ident())
+        return value
+
+    _run(model, [_function_call(record_thread, "a"), _function_call(record_thread, "b")])
+    assert thread_ids == [threading.get_ident()] * 2
+
+
+def test_parallel_function_calls_respect_limit_and_pauses(model):
+    executed = []
+
+    def tool(value: str) -> str:
+        """Records its execution."""
+        executed.append(value)
+        return value
+
+    function_calls = [
+        _function_call(tool, "a"),
+        _function_call(tool, "b", requires_confirmation=True),
+        _function_call(tool, "c"),
+        _function_call(tool, "d"),
+    ]
+    events, function_call_results = _run(model, function_calls, max_concurrency=4, function_call_limit=3)
+
+    assert sorted(executed) == ["a", "c"]
+    assert [result.tool_call_id for result in function_call_results] == ["a", "c", "d"]
+    assert function_call_results[-1].tool_call_error is True
+
+    paused_events = [
+        event
+        for event in events
+        if isinstance(event, ModelResponse) and event.event == ModelResponseEvent.tool_call_paused.value
+    ]
+    assert len(paused_events) == 1
+    assert paused_events[0].tool_executions[0].tool_call_id == "b"
@@ -0,0 +1,166 @@
+"""Tests for the event log backends of the AgentOS events buffer."""
+
+import asyncio
+import threading
+from unittest.mock import MagicMock
+
+import fakeredis
+import pytest
+
+from agno.os.event_log import InMemoryEventLog, RedisEventLog, SqliteEventLog
+from agno.os.managers import EventsBuffer, WebSocketManager
+from agno.run.agent import RunContentEvent
+from agno.run.base import RunStatus
+from agno.run.workflow import WorkflowStartedEvent
+
+
+@pytest.fixture(params=["memory", "sqlite", "redis"])
+def event_log(request, tmp_path):
+    if request.param == "memory":
+        return InMemoryEventLog()
+    if request.param == "sqlite":
+        return SqliteEventLog(db_file=str(tmp_path / "events.db"), poll_interval=0.05)
+    return RedisEventLog(redis_client=fakeredis.FakeRedis())
+
+
+def test_append_and_read_from_cursor(event_log):
+    assert event_log.append("run_1", WorkflowStartedEvent(run_id="run_1", workflow_name="flow")) == 0
+    assert event_log.append("run_1", RunContentEvent(run_id="agent_run", content="Hello")) == 1
+    assert event_log.append("run_2", RunContentEvent(run_id="run_2", content="Other")) == 0
+
+    events = event_log.read("run_1")
+    assert [sequence for sequence, _ in events] == [0, 1]
+    assert isinstance(events[0][1], WorkflowStartedEvent)
+    assert events[0][1].workflow_name == "flow"
+    assert isinstance(events[1][1], RunContentEvent)
+    assert events[1][1].content == "Hello"
+
+    assert [sequence for sequence, _ in event_log.read("run_1", after=0)] == [1]
+    assert event_log.read("run_1", after=1) == []
+    assert event_log.count("run_1") == 2
+    assert event_log.get_status("run_1") == RunStatus.running
+
+
+def test_trimmed_events_keep_their_sequence(event_log):
+    for i in range(5):
+        event_log.append("run_1", RunContentEvent(run_id="run_1", content=str(i)), max_events=2)
+
+    assert [(sequence, event.content) for sequence, event in event_log.read("run_1")] == [(3, "3"), (4, "4")]
+    assert event_log.count("run_1") == 5
+
+
+def test_finished_runs_are_cleaned_up(event_log):
+    event_log.set_status("unknown", RunStatus.completed)
+    assert event_log.get_status("unknown") is None
+
+    event_log.append("run_1", RunContentEvent(run_id="run_1", content="Hello"))
+    event_log.append("run_2", RunContentEvent(run_id="run_2", content="Hello"))
+    event_log.set_status("run_1", RunStatus.completed)
+
+    assert event_log.get_finished_runs(finished_before=0) == []
+    assert event_log.get_finished_runs(finished_before=10**12) == ["run_1"]
+
+    event_log.delete("run_1")
+    assert event_log.get_status("run_1") is None
+    assert event_log.read("run_1") == []
+
+
+@pytest.mark.asyncio
+async def test_follow_events_until_run_finishes(event_log):
+    buffer = EventsBuffer(event_log=event_log)
+    buffer.add_event("run_1", RunContentEvent(run_id="run_1", content="0"))
+
+    async def produce():
+        for i in range(1, 3):
+            await asyncio.sleep(0.05)
+            buffer.add_event("run_1", RunContentEvent(run_id="run_1", content=str(i)))
+        buffer.set_run_completed("run_1", RunStatus.completed)
+
+    producer = asyncio.create_task(produce())
+    followed = [
+        (index, event.content)
+        async for index, event in buffer.follow_events("run_1", last_event_index=0, wait_timeout=5)
+    ]
+    await producer
+
+    assert followed == [(1, "1"), (2, "2")]
+    assert buffer.local_runs == set()
+
+
+@pytest.mark.asyncio
+async def test_async_methods_do_not_block_the_event_loop(event_log):
+    loop_thread = threading.get_ident()
+    append_threads = []
+    original_append = event_log.append
+
+    def append(*args, **kwargs):
+        append_threads.append(threading.get_ident())
+        return original_append(*args, **kwargs)
+
+    event_log.append = append
+    buffer = EventsBuffer(event_log=event_log)
+    assert await buffer.aadd_event("run_1", RunContentEvent(run_id="run_1", content="0")) == 0
+    assert await buffer.aadd_event("run_1", RunContentEvent(run_id="run_1", content="1")) == 1
+
+    # Backends doing blocking I/O are called in a thread, the in-memory log on the event loop
+    assert all((thread == loop_thread) is (not event_log.blocking) for thread in append_threads)
+    assert [event.content for _, event in await buffer.aget_indexed_events("run_1", last_event_index=0)] == ["1"]
+    assert await buffer.aget_event_count("run_1") == 2
+
+    await buffer.aset_run_completed("run_1", RunStatus.completed)
+    assert await buffer.aget_run_status("run_1") == RunStatus.completed
+    assert buffer.local_runs == set()
+
+
+@pytest.mark.asyncio
+async def test_forwarding_tasks_are_cancelled_on_disconnect():
+    manager = WebSocketManager()
+    websocket = MagicMock()
+    forwarding_task = asyncio.create_task(asyncio.sleep(60))
+    finished_task = asyncio.create_task(asyncio.sleep(0))
+    manager.add_forwarding_task(websocket, forwarding_task)
+    manager.add_forwarding_task(websocket, finished_task)
+
+    await finished_task
+    await asyncio.sleep(0)
+    assert manager.forwarding_tasks[websocket] == {forwarding_task}
+
+    await manager.disconnect_websocket(websocket)
+    with pytest.raises(asyncio.CancelledError):
+        await forwarding_task
+    assert manager.forwarding_tasks == {}
+
+
+@pytest.mark.asyncio
+async def test_run_resumes_on_another_worker(tmp_path):
+    db_file = str(tmp_path / "events.db")
+    running_worker = EventsBuffer(event_log=SqliteEventLog(db_file=db_file, poll_interval=0.05))
+    other_worker = EventsBuffer(event_log=SqliteEventLog(db_file=db_file, poll_interval=0.05))
+
+    running_worker.add_event("run_1", RunContentEvent(run_id="run_1", content="first"))
+    assert other_worker.get_run_status("run_1") == RunStatus.running
+    assert "run_1" not in other_worker.local_runs
+    assert [event.content for event in other_worker.get_events("run_1")] == ["first"]
+
+    async def produce():
+        await asyncio.sleep(0.1)
+        running_worker.add_event("run_1", RunContentEvent(run_id="run_1", content="second"))
+        running_worker.set_run_completed("run_1", RunStatus.completed)
+
+    producer = asyncio.create_task(produce())
+    followed = [event.content async for _, event in other_worker.follow_events("run_1", last_event_index=0)]
+    await producer
+
+    assert followed == ["second"]
+    assert other_worker.get_run_status("run_1") == RunStatus.completed
+
+
+def test_events_buffer_defaults_to_memory():
+    buffer = EventsBuffer(max_events_per_run=2)
+    assert isinstance(buffer.event_log, InMemoryEventLog)
+    for i in range(3):
+        assert buffer.add_event("run_1", RunContentEvent(run_id="run_1", content=str(i))) == i
+
+    assert [event.content for event in buffer.get_events("run_1")] == ["1", "2"]
+    assert [event.content for event in buffer.get_events("run_1", last_event_index=1)] == ["2"]
+    assert buffer.get_events("run_1", last_event_index=2) == []
@@ -265,6 +265,96 @@ class TestAgentDeepCopy:
         assert copy.workflow_id is None
 
 
+# ============================================================================
+# Agent Shallow Copy Tests
+# ============================================================================
+
+
+class TestAgentShallowCopy:
+    """Tests for Agent.shallow_copy() method."""
+
+    def test_shallow_copy_shares_configuration(self):
+        """shallow_copy shares the model and settings with the original."""
+        from agno.models.openai import OpenAIChat
+
+        model = OpenAIChat(id="gpt-4o-mini")
+        agent = Agent(name="test", id="test-id", model=model, instructions=["Be brief"])
+
+        copy = agent.shallow_copy()
+
+        assert copy is not agent
+        assert copy.model is model
+        assert copy.instructions is agent.instructions
+
+    def test_shallow_copy_copies_toolkits(self):
+        """Each copy gets its own toolkits, so toolkit state is not shared between requests."""
+        from agno.tools.toolkit import Toolkit
+
+        class CursorTools(Toolkit):
+            def __init__(self):
+                self.cursor = None
+                super().__init__(name="cursor_tools", tools=[self.move])
+
+            def move(self, position: str) -> str:
+                self.cursor = position
+                return position
+
+        toolkit = CursorTools()
+        agent = Agent(name="test", id="test-id", tools=[toolkit])
+
+        copy = agent.shallow_copy()
+        copy.tools[0].cursor = "request-1"
+
+        assert copy.tools[0] is not toolkit
+        assert toolkit.cursor is None
+
+    def test_shallow_copy_isolates_run_state(self):
+        """shallow_copy isolates the state a run or caller may mutate."""
+        agent = Agent(
+            name="test",
+            id="test-id",
+            session_state={"items": []},
+            dependencies={"key": "value"},
+            metadata={"key": "original"},
+            tools=[],
+        )
+        agent._cached_session = "cached_value"  # type: ignore
+        agent._callable_tools_cache["key"] = []
+
+        copy = agent.shallow_copy()
+        copy.session_state["items"].append("item")
+        copy.dependencies["key"] = "changed"
+        copy.metadata["key"] = "changed"
+        copy.tools.append(lambda: None)
+
+        assert agent.session_state == {"items": []}
+        assert agent.dependencies == {"key": "value"}
+        assert agent.metadata == {"key": "original"}
+        assert agent.tools == []
+        assert copy._cached_session is None
+        assert copy._callable_tools_cache == {}
+
+    def test_shallow_copy_shares_background_executor(self):
+        """Copies reuse the background thread pool of the original."""
+        agent = Agent(name="test", id="test-id")
+
+        assert agent.shallow_copy().background_executor is agent.background_executor
+
+    def test_shallow_copy_with_update_and_reasoning_agent(self):
+        """shallow_copy applies updates and copies the reasoning agent."""
+        reasoner = Agent(name="reasoner", id="reasoner-id", metadata={"count": 0})
+        agent = Agent(name="main", id="main-id", reasoning_agent=reasoner)
+        agent.team_id = "team-id"
+
+        copy = agent.shallow_copy(update={"team_id": None})
+
+        assert copy.team_id is None
+        assert agent.team_id == "team-id"
+        assert copy.reasoning_agent is not reasoner
+        copy.reasoning_agent.metadata["count"] = 1
+        assert reasoner.metadata["count"] == 0
+
+
 # ============================================================================
 # Team Deep Copy Tests
 # ============================================================================
@@ -457,3 +457,77 @@ async def test_pdf_reader_async_sanitize_content_disabled(sample_pdf_path):
     documents = await reader.async_read(sample_pdf_path)
 
     assert len(documents) > 0
+
+
+def _create_text_pdf(page_texts) -> BytesIO:
+    """Create a PDF with one line of text per page."""
+    objects = [b"<< /Type /Catalog /Pages 2 0 R >>", b"", b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    page_ids = []
+    for text in page_texts:
+        stream = f"BT /F1 12 Tf 72 720 Td ({text}) Tj ET".encode()
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream))
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Contents %d 0 R "
+            b"/Resources << /Font << /F1 3 0 R >> >> >>" % len(objects)
+        )
+        page_ids.append(len(objects))
+    kids = " ".join(f"{page_id} 0 R" for page_id in page_ids)
+    objects[1] = f"<< /Type /Pages /Kids [{kids}] /Count {len(page_ids)} >>".encode()
+
+    pdf = b"%PDF-1.4\n"
+    offsets = []
+    for number, obj in enumerate(objects, start=1):
+        offsets.append(len(pdf))
+        pdf += b"%d 0 obj\n%s\nendobj\n" % (number, obj)
+    xref_offset = len(pdf)
+    pdf += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    pdf += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    pdf += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref_offset)
+
+    buffer = BytesIO(pdf)
+    buffer.name = "numbered.pdf"
+    return buffer
+
+
+NUMBERED_PAGES = [f"Content of page {i} {i}" for i in range(1, 26)]
+
+
+def test_pdf_reader_parallel_pages_match_sequential_read(tmp_path):
+    pdf_path = tmp_path / "numbered.pdf"
+    pdf_path.write_bytes(_create_text_pdf(NUMBERED_PAGES).getvalue())
+
+    sequential = PDFReader(chunk=False).read(pdf_path)
+    parallel = PDFReader(chunk=False, max_workers=2, pages_per_shard=4).read(pdf_path)
+    parallel_from_stream = PDFReader(chunk=False, max_workers=2, pages_per_shard=4).read(
+        _create_text_pdf(NUMBERED_PAGES)
+    )
+
+    assert len(sequential) == 25
+    assert [doc.content for doc in parallel] == [doc.content for doc in sequential]
+    assert [doc.content for doc in parallel_from_stream] == [doc.content for doc in sequential]
+    assert [doc.meta_data["page"] for doc in parallel] == list(range(1, 26))
+    assert parallel[11].content == "<start page 12>\nContent of page 12\n<end page 12>"
+
+
+@pytest.mark.asyncio
+async def test_pdf_reader_async_parallel_pages(tmp_path):
+    pdf_path = tmp_path / "numbered.pdf"
+    pdf_path.write_bytes(_create_text_pdf(NUMBERED_PAGES).getvalue())
+
+    documents = await PDFReader(chunk=False, max_workers=2, pages_per_shard=10).async_read(pdf_path)
+
+    assert [doc.meta_data["page"] for doc in documents] == list(range(1, 26))
+
+
+@pytest.mark.parametrize("max_workers", [None, 2])
+def test_pdf_reader_iter_read_yields_page_ranges(max_workers):
+    reader = PDFReader(chunk=False, max_workers=max_workers, pages_per_shard=10)
+
+    page_ranges = list(reader.iter_read(_create_text_pdf(NUMBERED_PAGES)))
+
+    assert [len(documents) for documents in page_ranges] == [10, 10, 5]
+    documents = [doc for documents in page_ranges for doc in documents]
+    assert [doc.content for doc in documents] == [doc.content for doc in reader.read(_create_text_pdf(NUMBERED_PAGES))]
+    # The page numbering detected on the first range is applied to the following ones
+    assert documents[20].content == "<start page 21>\nContent of page 21\n<end page 21>"
+    assert documents[20].meta_data["page"] == 21
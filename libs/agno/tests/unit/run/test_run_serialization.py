@@ -0,0 +1,84 @@
+"""Tests for the serialization of run events and run outputs without dataclasses.asdict()."""
+
+import json
+from dataclasses import asdict
+from datetime import datetime
+
+from agno.models.metrics import Metrics
+from agno.models.response import ToolExecution
+from agno.run.agent import RunContentEvent, RunOutput, ToolCallCompletedEvent
+from agno.run.base import RunStatus
+from agno.run.team import TeamRunOutput
+from agno.run.workflow import StepCompletedEvent, WorkflowRunOutput
+from agno.utils.serialize import dataclass_to_dict, json_dumps_bytes
+
+
+def _tool() -> ToolExecution:
+    return ToolExecution(tool_call_id="call_1", tool_name="search", tool_args={"query": "cats"}, result="found")
+
+
+def test_dataclass_to_dict_matches_asdict():
+    event = ToolCallCompletedEvent(
+        run_id="run_1", agent_id="agent_1", content={"nested": [1, {"a": None}]}, tool=_tool(), created_at=1
+    )
+
+    expected = {k: v for k, v in asdict(event).items() if v is not None and k != "tool"}
+    assert dataclass_to_dict(event, exclude=frozenset({"tool"})) == expected
+
+
+def test_dataclass_to_dict_copies_values():
+    content = {"items": [1, 2]}
+    event = RunContentEvent(run_id="run_1", content=content)
+
+    _dict = dataclass_to_dict(event)
+    _dict["content"]["items"].append(3)
+    assert content == {"items": [1, 2]}
+
+
+def test_run_event_to_dict_serializes_nested_objects():
+    event = ToolCallCompletedEvent(run_id="run_1", tool=_tool(), content="héllo", created_at=1)
+
+    _dict = event.to_dict()
+    assert _dict["tool"] == _tool().to_dict()
+    assert "images" not in _dict
+    assert json.loads(event.to_json_bytes()) == json.loads(event.to_json(indent=None))
+    assert event.to_json(separators=(",", ":"), indent=None).encode() == event.to_json_bytes()
+
+
+def test_run_outputs_to_dict():
+    run_output = RunOutput(
+        run_id="run_1",
+        content="Hello",
+        tools=[_tool()],
+        metrics=Metrics(input_tokens=3),
+        events=[RunContentEvent(run_id="run_1", content="Hello")],
+        status=RunStatus.completed,
+    )
+    _dict = run_output.to_dict()
+    assert _dict["content"] == "Hello"
+    assert _dict["tools"] == [_tool().to_dict()]
+    assert _dict["events"][0]["content"] == "Hello"
+    assert _dict["metrics"]["input_tokens"] == 3
+    assert RunOutput.from_dict(json.loads(run_output.to_json())).content == "Hello"
+
+    team_output = TeamRunOutput(run_id="run_2", content="Hi", status=RunStatus.completed)
+    assert team_output.to_dict()["status"] == RunStatus.completed.value
+
+    workflow_output = WorkflowRunOutput(run_id="run_3", content="Done", status=RunStatus.completed)
+    assert workflow_output.to_dict()["content"] == "Done"
+
+    step_event = StepCompletedEvent(run_id="run_3", step_name="step", content="Done")
+    assert step_event.to_dict()["step_name"] == "step"
+
+
+def test_json_dumps_bytes():
+    data = {"text": "héllo", "date": datetime(2025, 1, 1, 12, 0), "status": RunStatus.completed, 1: "one"}
+
+    assert json.loads(json_dumps_bytes(data)) == {
+        "text": "héllo",
+        "date": "2025-01-01T12:00:00",
+        "status": "COMPLETED",
+        "1": "one",
+    }
+    # Falls back to the json module for values orjson does not support
+    assert json.loads(json_dumps_bytes({"big": 2**70})) == {"big": 2**70}
@@ -6,6 +6,9 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from agno.db.schemas.scheduler import Schedule
+from agno.run.agent import RunOutput
+from agno.run.base import RunStatus
 from agno.scheduler.executor import ScheduleExecutor, _to_form_value
 
 
@@ -326,3 +329,85 @@ class TestExecutorExecute:
         mock_db.update_schedule_run.assert_called()
         cancel_call = mock_db.update_schedule_run.call_args
         assert cancel_call[1]["status"] == "cancelled"
+
+
+class TestExecutorInProcess:
+    """Test running the agents, teams and workflows of an AgentOS without the HTTP loopback."""
+
+    @pytest.fixture
+    def executor(self):
+        return ScheduleExecutor(base_url="http://localhost:8000", internal_service_token="tok", agent_os=MagicMock())
+
+    @pytest.fixture
+    def component(self):
+        component = MagicMock()
+        component.arun = AsyncMock(return_value=RunOutput(run_id="r1", content="done", status=RunStatus.completed))
+        return component
+
+    @staticmethod
+    def _schedule(payload):
+        return Schedule(
+            id="sched-1",
+            name="test-schedule",
+            cron_expr="* * * * *",
+            endpoint="/agents/my-agent/runs",
+            method="POST",
+            payload=payload,
+        )
+
+    @pytest.mark.asyncio
+    async def test_runs_local_agent_in_process(self, executor, component):
+        payload = {"message": "Hello", "session_id": "s1", "session_state": {"count": 1}, "stream": True, "debug": True}
+        with patch("agno.os.utils.get_agent_by_id", return_value=component) as get_agent:
+            result = await executor._call_endpoint(self._schedule(payload))
+
+        assert result["status"] == "success"
+        assert result["session_id"] == "s1"
+        assert result["output"] == {"content": "done", "content_type": "str"}
+        assert get_agent.call_args.kwargs["create_fresh"] is True
+
+        call_kwargs = component.arun.call_args.kwargs
+        assert call_kwargs["input"] == "Hello"
+        assert call_kwargs["session_id"] == "s1"
+        assert call_kwargs["run_id"] == result["run_id"]
+        assert call_kwargs["stream"] is False
+        assert call_kwargs["session_state"] == {"count": 1}
+        assert call_kwargs["debug"] is True
+        # No HTTP client was needed
+        assert executor._client is None
+
+    @pytest.mark.asyncio
+    async def test_failed_run(self, executor, component):
+        component.arun.return_value = RunOutput(run_id="r1", content="boom", status=RunStatus.error)
+        with patch("agno.os.utils.get_agent_by_id", return_value=component):
+            result = await executor._call_endpoint(self._schedule({"message": "Hello"}))
+
+        assert result["status"] == "failed"
+        assert "ERROR" in result["error"]
+
+    @pytest.mark.asyncio
+    async def test_run_timeout(self, executor, component):
+        async def slow_run(**kwargs):
+            await asyncio.sleep(10)
+
+        component.arun = slow_run
+        schedule = self._schedule({"message": "Hello"})
+        schedule.timeout_seconds = 0.05  # type: ignore[assignment]
+        with patch("agno.os.utils.get_agent_by_id", return_value=component):
+            result = await executor._call_endpoint(schedule)
+
+        assert result["status"] == "failed"
+        assert "timed out" in result["error"]
+
+    @pytest.mark.asyncio
+    async def test_remote_agent_uses_http(self, executor):
+        from agno.agent.remote import RemoteAgent
+
+        background_result = {"status": "success", "run_id": "r1"}
+        background_run = AsyncMock(return_value=background_result)
+        with patch("agno.os.utils.get_agent_by_id", return_value=MagicMock(spec=RemoteAgent)):
+            with patch.object(executor, "_background_run", background_run), patch.object(executor, "_get_client"):
+                result = await executor._call_endpoint(self._schedule({"message": "Hello"}))
+
+        assert result is background_result
+        background_run.assert_called_once()
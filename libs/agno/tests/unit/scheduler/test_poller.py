@@ -1,12 +1,13 @@
 """Tests for the SchedulePoller."""
 
 import asyncio
+import time
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
 from agno.db.schemas.scheduler import Schedule
-from agno.scheduler.poller import SchedulePoller
+from agno.scheduler.poller import SchedulePoller, notify_schedule_change
 
 
 def _make_schedule_dict(**overrides):
@@ -30,6 +31,22 @@ def mock_db():
     return db
 
 
+@pytest.fixture
+def batch_claim_db():
+    db = MagicMock()
+    db.claim_due_schedules = MagicMock(return_value=[])
+    db.claim_due_schedule = MagicMock(return_value=None)
+    return db
+
+
+@pytest.fixture
+def single_claim_db():
+    db = MagicMock()
+    db.claim_due_schedules = MagicMock(side_effect=NotImplementedError)
+    db.claim_due_schedule = MagicMock(return_value=None)
+    return db
+
+
 @pytest.fixture
 def mock_executor():
     executor = MagicMock()
@@ -241,3 +258,122 @@ class TestPollerExecuteSafe:
         poller = SchedulePoller(db=mock_db, executor=executor)
         # Should not raise
         await poller._execute_safe({"id": "s1"})
+
+
+class TestPollerBatchClaim:
+    @pytest.mark.asyncio
+    async def test_claims_in_batches_up_to_capacity(self, batch_claim_db, mock_executor):
+        batches = [[_make_schedule_dict(id=f"s{i}") for i in range(3)], []]
+        batch_claim_db.claim_due_schedules = MagicMock(side_effect=batches)
+
+        poller = SchedulePoller(db=batch_claim_db, executor=mock_executor, max_concurrent=3)
+        poller._running = True
+        caught_up = await poller._poll_once()
+        await asyncio.sleep(0.05)
+
+        # The batch filled the capacity, so claiming stopped without a second query
+        assert caught_up is False
+        batch_claim_db.claim_due_schedules.assert_called_once_with(poller.worker_id, limit=3)
+        assert mock_executor.execute.call_count == 3
+        batch_claim_db.claim_due_schedule.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_async_batch_claim(self, batch_claim_db, mock_executor):
+        async def claim_due_schedules(worker_id, limit):
+            return [_make_schedule_dict(id="s1")]
+
+        batch_claim_db.claim_due_schedules = claim_due_schedules
+
+        poller = SchedulePoller(db=batch_claim_db, executor=mock_executor)
+        poller._running = True
+        assert await poller._poll_once() is True
+        await asyncio.sleep(0.05)
+        mock_executor.execute.assert_called_once()
+        batch_claim_db.claim_due_schedule.assert_not_called()
+
+
+class TestPollerSingleClaim:
+    @pytest.mark.asyncio
+    async def test_falls_back_to_single_claims(self, single_claim_db, mock_executor):
+        single_claim_db.claim_due_schedule = MagicMock(side_effect=[_make_schedule_dict(), None, None])
+        poller = SchedulePoller(db=single_claim_db, executor=mock_executor)
+        poller._running = True
+
+        await poller._poll_once()
+        await poller._poll_once()
+        await asyncio.sleep(0.05)
+
+        # Batch claiming is only attempted once
+        single_claim_db.claim_due_schedules.assert_called_once()
+        assert single_claim_db.claim_due_schedule.call_count == 3
+        mock_executor.execute.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_db_without_batch_claim(self, mock_executor):
+        mock_db = MagicMock(spec=["claim_due_schedule"])
+        mock_db.claim_due_schedule = MagicMock(side_effect=[_make_schedule_dict(), None])
+
+        poller = SchedulePoller(db=mock_db, executor=mock_executor)
+        poller._running = True
+        assert await poller._poll_once() is True
+        await asyncio.sleep(0.05)
+        assert mock_db.claim_due_schedule.call_count == 2
+        mock_executor.execute.assert_called_once()
+
+
+class TestPollerWakeup:
+    @pytest.mark.asyncio
+    async def test_waits_until_next_schedule_is_due(self, mock_db, mock_executor):
+        poller = SchedulePoller(db=mock_db, executor=mock_executor, poll_interval=60)
+
+        mock_db.get_next_schedule_run_at = MagicMock(return_value=int(time.time()) + 5)
+        assert 3 < await poller._get_wait_seconds() <= 5
+
+        # A schedule that is due but was not claimed is retried after a short wait
+        mock_db.get_next_schedule_run_at = MagicMock(return_value=int(time.time()) - 5)
+        assert await poller._get_wait_seconds() == 1
+
+        mock_db.get_next_schedule_run_at = MagicMock(return_value=int(time.time()) + 3600)
+        assert await poller._get_wait_seconds() == 60
+
+        mock_db.get_next_schedule_run_at = MagicMock(return_value=None)
+        assert await poller._get_wait_seconds() == 60
+
+        mock_db.get_next_schedule_run_at = MagicMock(side_effect=NotImplementedError)
+        assert await poller._get_wait_seconds() == 60
+
+    @pytest.mark.asyncio
+    async def test_unclaimable_due_schedule_does_not_busy_loop(self, batch_claim_db, mock_executor):
+        # A due schedule locked by another worker is never returned by the claim
+        batch_claim_db.get_next_schedule_run_at = MagicMock(return_value=int(time.time()) - 5)
+        poller = SchedulePoller(db=batch_claim_db, executor=mock_executor, poll_interval=15)
+        await poller.start()
+        await asyncio.sleep(0.3)
+        await poller.stop()
+
+        assert batch_claim_db.claim_due_schedules.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_notify_wakes_the_poll_loop(self, mock_db, mock_executor):
+        mock_db.get_next_schedule_run_at = MagicMock(return_value=None)
+        poller = SchedulePoller(db=mock_db, executor=mock_executor, poll_interval=100)
+        await poller.start()
+        await asyncio.sleep(0.05)
+        assert mock_db.claim_due_schedule.call_count == 1
+
+        notify_schedule_change(mock_db)
+        await asyncio.sleep(0.05)
+        assert mock_db.claim_due_schedule.call_count == 2
+
+        # Notifications from other threads are delivered too
+        await asyncio.get_running_loop().run_in_executor(None, poller.notify)
+        await asyncio.sleep(0.05)
+        assert mock_db.claim_due_schedule.call_count == 3
+
+        # Pollers of other DBs are not woken
+        notify_schedule_change(MagicMock())
+        await asyncio.sleep(0.05)
+        assert mock_db.claim_due_schedule.call_count == 3
+
+        await poller.stop()
+        notify_schedule_change(mock_db)
@@ -0,0 +1,149 @@
+"""Tests for the tool result cache backends in agno/tools/cache.py."""
+
+import asyncio
+import os
+import threading
+import time
+
+from agno.tools.cache import FileToolCache, InMemoryToolCache, get_default_tool_cache
+from agno.tools.function import Function, FunctionCall
+from agno.tools.toolkit import Toolkit
+
+
+def _function_call(function: Function, value: str) -> FunctionCall:
+    return FunctionCall(function=function, arguments={"value": value})
+
+
+def test_in_memory_cache_evicts_least_recently_used():
+    cache = InMemoryToolCache(max_entries=2)
+    cache.set("a", "a")
+    cache.set("b", "b")
+    cache.get("a")
+    cache.set("c", "c")
+
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert cache.get("a") == "a"
+
+
+def test_in_memory_cache_ttl():
+    cache = InMemoryToolCache()
+    cache.set("a", "a")
+    assert cache.get("a", ttl=60) == "a"
+    cache._results["a"] = ("a", time.time() - 120)
+    assert cache.get("a", ttl=60) is None
+    assert len(cache) == 0
+
+
+def test_file_cache_evicts_oldest_results(tmp_path):
+    cache = FileToolCache(cache_dir=str(tmp_path), max_entries=2)
+    for index, key in enumerate(["a", "b", "c"]):
+        cache.set(key, key)
+        os.utime(cache.get_file_path(key), (index, index))
+    cache.set("d", "d")
+
+    assert sorted(path.stem for path in tmp_path.glob("*.json")) == ["c", "d"]
+    assert cache.get("d", ttl=60) == "d"
+
+
+def test_default_cache_is_shared_by_directory(tmp_path):
+    assert get_default_tool_cache(str(tmp_path)) is get_default_tool_cache(str(tmp_path))
+
+
+def test_identical_concurrent_calls_run_once():
+    calls = []
+    started = threading.Event()
+
+    def slow_tool(value: str) -> str:
+        """Slow tool."""
+        calls.append(value)
+        started.set()
+        time.sleep(0.1)
+        return value.upper()
+
+    function = Function.from_callable(slow_tool)
+    function.cache_results = True
+    function.cache = InMemoryToolCache()
+    function.process_entrypoint()
+
+    results = []
+
+    def run():
+        function_call = _function_call(function, "a")
+        function_call.execute()
+        results.append(function_call.result)
+
+    threads = [threading.Thread(target=run) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert calls == ["a"]
+    assert results == ["A"] * 4
+
+
+def test_failed_call_lets_waiting_call_run():
+    calls = []
+
+    def flaky_tool(value: str) -> str:
+        """Fails on the first call."""
+        calls.append(value)
+        if len(calls) == 1:
+            raise ValueError("failed")
+        return value
+
+    function = Function.from_callable(flaky_tool)
+    function.cache_results = True
+    function.cache = InMemoryToolCache()
+    function.process_entrypoint()
+
+    assert _function_call(function, "a").execute().status == "failure"
+    assert _function_call(function, "a").execute().result == "a"
+    assert _function_call(function, "a").execute().result == "a"
+    assert len(calls) == 2
+
+
+def test_identical_concurrent_async_calls_run_once():
+    calls = []
+
+    async def slow_tool(value: str) -> str:
+        """Slow async tool."""
+        calls.append(value)
+        await asyncio.sleep(0.1)
+        return value.upper()
+
+    function = Function.from_callable(slow_tool)
+    function.cache_results = True
+    function.cache = InMemoryToolCache()
+    function.process_entrypoint()
+
+    async def run_all():
+        function_calls = [_function_call(function, "a") for _ in range(3)] + [_function_call(function, "b")]
+        await asyncio.gather(*(function_call.aexecute() for function_call in function_calls))
+        return [function_call.result for function_call in function_calls]
+
+    assert asyncio.run(run_all()) == ["A", "A", "A", "B"]
+    assert sorted(calls) == ["a", "b"]
+
+
+def test_toolkit_cache_is_shared_by_functions():
+    def first_tool(value: str) -> str:
+        """First tool."""
+        return value
+
+    def second_tool(value: str) -> str:
+        """Second tool."""
+        return value
+
+    cache = InMemoryToolCache()
+    toolkit = Toolkit(tools=[first_tool, second_tool], cache_results=True, cache=cache)
+
+    assert all(function.cache is cache for function in toolkit.functions.values())
+    function = toolkit.functions["first_tool"]
+    function.process_entrypoint()
+    _function_call(function, "a").execute()
+    assert len(cache) == 1
+
+    # Copies of a function keep the shared cache
+    assert function.model_copy(deep=True).cache is cache
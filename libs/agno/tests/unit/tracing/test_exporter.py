@@ -0,0 +1,110 @@
+"""Tests for DatabaseSpanExporter."""
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("opentelemetry.sdk")
+
+from opentelemetry.sdk.trace import TracerProvider  # noqa: E402
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor  # noqa: E402
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter  # noqa: E402
+
+from agno.db.sqlite import AsyncSqliteDb, SqliteDb  # noqa: E402
+from agno.tracing.exporter import DatabaseSpanExporter  # noqa: E402
+
+
+def _finished_spans(num_traces=3, spans_per_trace=2):
+    collector = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(collector))
+    tracer = provider.get_tracer("test")
+    for i in range(num_traces):
+        with tracer.start_as_current_span(f"Agent.run {i}"):
+            for j in range(spans_per_trace - 1):
+                with tracer.start_as_current_span(f"tool {j}"):
+                    pass
+    return collector.get_finished_spans()
+
+
+def test_sync_export_writes_all_traces_at_once(tmp_path, monkeypatch):
+    db = SqliteDb(db_file=str(tmp_path / "traces.db"))
+    exporter = DatabaseSpanExporter(db=db)
+    calls = []
+    upsert_traces = db.upsert_traces
+    monkeypatch.setattr(db, "upsert_traces", lambda traces: calls.append(len(traces)) or upsert_traces(traces))
+
+    exporter.export(_finished_spans())
+
+    assert calls == [3]
+    traces, total = db.get_traces(limit=10)
+    assert total == 3
+    assert sum(len(db.get_spans(trace_id=trace.trace_id)) for trace in traces) == 6
+
+
+def test_async_export_reuses_exporter_loop(tmp_path):
+    db = AsyncSqliteDb(db_file=str(tmp_path / "traces.db"))
+    exporter = DatabaseSpanExporter(db=db)
+
+    exporter.export(_finished_spans(num_traces=2))
+    loop = exporter._loop
+    exporter.export(_finished_spans(num_traces=1))
+
+    assert exporter._loop is loop
+    # The exporter writes with its own engine, leaving the pool of the database to the application loop
+    assert exporter._loop_db.db_engine is not db.db_engine
+    traces, total = asyncio.run(db.get_traces(limit=10))
+    assert total == 3
+
+    exporter.shutdown()
+    assert not exporter._loop_thread
+
+
+def test_async_export_from_event_loop_does_not_block(tmp_path):
+    db = AsyncSqliteDb(db_file=str(tmp_path / "traces.db"))
+    exporter = DatabaseSpanExporter(db=db)
+
+    async def export():
+        exporter.export(_finished_spans(num_traces=2))
+
+    asyncio.run(export())
+
+    assert exporter.force_flush()
+    assert not exporter._pending_exports
+    assert asyncio.run(db.get_traces(limit=10))[1] == 2
+    exporter.shutdown()
+
+
+def test_async_export_keeps_engine_options(tmp_path):
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    db_engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'traces.db'}", connect_args={"timeout": 7}, pool_recycle=123
+    )
+    db = AsyncSqliteDb(db_engine=db_engine)
+    exporter = DatabaseSpanExporter(db=db)
+
+    exporter.export(_finished_spans(num_traces=1))
+
+    loop_engine = exporter._loop_db.db_engine
+    assert loop_engine is not db_engine
+    assert loop_engine.sync_engine.pool._recycle == 123
+    assert loop_engine.sync_engine.dialect is db_engine.sync_engine.dialect
+    assert asyncio.run(db.get_traces(limit=10))[1] == 1
+    exporter.shutdown()
+
+
+def test_async_export_to_in_memory_sqlite():
+    db = AsyncSqliteDb(db_url="sqlite+aiosqlite:///:memory:")
+    exporter = DatabaseSpanExporter(db=db)
+
+    async def export():
+        exporter.export(_finished_spans(num_traces=2))
+
+    asyncio.run(export())
+    assert exporter.force_flush()
+
+    # The traces are written to the same in-memory database
+    assert exporter._loop_db.db_engine is db.db_engine
+    assert asyncio.run(db.get_traces(limit=10))[1] == 2
+    exporter.shutdown()
@@ -0,0 +1,45 @@
+from agno.media import Image
+from agno.models.message import Message
+from agno.utils.message import copy_history_messages, filter_tool_calls
+
+
+def _history():
+    return [
+        Message(role="user", content="What is the weather?", images=[Image(url="https://example.com/image.png")]),
+        Message(
+            role="assistant",
+            content="Checking",
+            tool_calls=[
+                {"id": "call_1", "type": "function", "function": {"name": "get_weather", "arguments": "{}"}},
+                {"id": "call_2", "type": "function", "function": {"name": "get_time", "arguments": "{}"}},
+            ],
+        ),
+        Message(role="tool", tool_call_id="call_1", content="Sunny"),
+        Message(role="tool", tool_call_id="call_2", content="Noon"),
+    ]
+
+
+def test_copy_history_messages_tags_copies_without_duplicating_content():
+    history = _history()
+
+    copies = copy_history_messages(history)
+
+    assert all(message.from_history for message in copies)
+    assert not any(message.from_history for message in history)
+    assert copies[0] is not history[0]
+    # Content, media and tool calls are shared with the stored messages
+    assert copies[0].images is history[0].images
+    assert copies[1].tool_calls is history[1].tool_calls
+
+
+def test_filter_tool_calls_on_history_copies_keeps_stored_messages():
+    history = _history()
+    copies = copy_history_messages(history)
+
+    filter_tool_calls(copies, max_tool_calls=1)
+
+    assert [message.role for message in copies] == ["user", "assistant", "tool"]
+    assert [tool_call["id"] for tool_call in copies[1].tool_calls] == ["call_2"]
+    assert copies[1].from_history is True
+    assert len(history) == 4
+    assert [tool_call["id"] for tool_call in history[1].tool_calls] == ["call_1", "call_2"]
@@ -0,0 +1,95 @@
+import pytest
+
+from agno.vectordb.bm25 import BM25Index, tokenize
+from agno.vectordb.score import reciprocal_rank_fusion
+
+DOCUMENTS = [
+    ("tom_kha", "Tom Kha Gai is a Thai coconut soup with chicken"),
+    ("pad_thai", "Pad Thai is a stir-fried rice noodle dish"),
+    ("green_curry", "Green curry is a spicy Thai curry with coconut milk"),
+    ("ramen", "Ramen is a Japanese noodle soup"),
+]
+
+
+def test_tokenize():
+    assert tokenize("Stir-fried Rice, NOODLES!") == ["stir", "fried", "rice", "noodles"]
+
+
+def test_search_ranks_by_bm25():
+    index = BM25Index()
+    index.add_many(DOCUMENTS)
+
+    assert len(index) == 4
+    assert [doc_id for doc_id, _ in index.search("coconut curry")] == ["green_curry", "tom_kha"]
+    assert [doc_id for doc_id, _ in index.search("noodle soup", limit=1)] == ["ramen"]
+    assert index.search("sushi") == []
+
+
+def test_search_restricted_to_ids():
+    index = BM25Index()
+    index.add_many(DOCUMENTS)
+
+    results = index.search("noodle", doc_ids={"pad_thai", "tom_kha"})
+    assert [doc_id for doc_id, _ in results] == ["pad_thai"]
+
+
+def test_add_replaces_and_remove_deletes():
+    index = BM25Index()
+    index.add_many(DOCUMENTS)
+
+    index.add("ramen", "Ramen is a Japanese curry")
+    assert "ramen" in index
+    assert [doc_id for doc_id, _ in index.search("noodle")] == ["pad_thai"]
+
+    index.remove_many(["green_curry", "unknown"])
+    assert "green_curry" not in index
+    assert [doc_id for doc_id, _ in index.search("curry")] == ["ramen"]
+
+    index.clear()
+    assert len(index) == 0
+    assert index.search("curry") == []
+
+
+def test_segments_are_persisted_and_merged(tmp_path):
+    index = BM25Index(path=str(tmp_path), max_segments=3)
+    for doc_id, text in DOCUMENTS:
+        index.add(doc_id, text)
+    # The fourth segment triggered a merge
+    assert len(list(tmp_path.glob("segment-*.jsonl"))) == 1
+
+    index.remove("pad_thai")
+    assert len(list(tmp_path.glob("segment-*.jsonl"))) == 2
+    reopened = BM25Index(path=str(tmp_path))
+    assert len(reopened) == 3
+    assert reopened.search("coconut curry") == index.search("coconut curry")
+
+    reopened.merge_segments()
+    assert len(list(tmp_path.glob("segment-*.jsonl"))) == 1
+    assert BM25Index(path=str(tmp_path)).search("noodle") == [("ramen", pytest.approx(index.search("noodle")[0][1]))]
+
+    reopened.clear()
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_unfinished_segment_is_ignored(tmp_path):
+    index = BM25Index(path=str(tmp_path))
+    index.add_many(DOCUMENTS)
+    (tmp_path / "segment-0000000001.tmp").write_text('{"id": "cut')
+
+    reopened = BM25Index(path=str(tmp_path))
+    assert len(reopened) == 4
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_reciprocal_rank_fusion_weights():
+    vector_results = [("a", 0.9), ("b", 0.8)]
+    keyword_results = [("b", 3.0), ("c", 2.0)]
+
+    assert [doc_id for doc_id, _ in reciprocal_rank_fusion([vector_results, keyword_results])][0] == "b"
+
+    fused = reciprocal_rank_fusion([vector_results, keyword_results], k=60, weights=[1.0, 0.0])
+    assert [doc_id for doc_id, _ in fused] == ["a", "b", "c"]
+    assert fused[0][1] == pytest.approx(1.0 / 61)
+
+    with pytest.raises(ValueError):
+        reciprocal_rank_fusion([vector_results], weights=[1.0, 1.0])
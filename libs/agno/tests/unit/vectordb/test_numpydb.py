@@ -0,0 +1,194 @@
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+import pytest
+
+from agno.filters import AND, EQ, IN, NOT
+from agno.knowledge.document import Document
+from agno.knowledge.embedder.base import Embedder
+from agno.vectordb.distance import Distance
+from agno.vectordb.numpydb import NumpyDb
+from agno.vectordb.search import SearchType
+
+VOCABULARY = ["coconut", "noodle", "curry", "soup", "rice", "spicy"]
+
+
+@dataclass
+class KeywordEmbedder(Embedder):
+    """Embeds texts as the counts of a few words, so similarities are predictable."""
+
+    dimensions: Optional[int] = len(VOCABULARY)
+
+    def get_embedding(self, text: str) -> List[float]:
+        words = text.lower().split()
+        return [float(sum(word.startswith(term) for word in words)) + 0.01 for term in VOCABULARY]
+
+    def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        return self.get_embedding(text), None
+
+    async def async_get_embedding(self, text: str) -> List[float]:
+        return self.get_embedding(text)
+
+    async def async_get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        return self.get_embedding_and_usage(text)
+
+
+@pytest.fixture
+def sample_documents() -> List[Document]:
+    return [
+        Document(
+            content="Tom Kha Gai is a Thai coconut soup with chicken",
+            meta_data={"cuisine": "Thai", "type": "soup", "spice": 1},
+            name="tom_kha",
+            content_id="c1",
+        ),
+        Document(
+            content="Pad Thai is a stir-fried rice noodle dish",
+            meta_data={"cuisine": "Thai", "type": "noodles", "spice": 2},
+            name="pad_thai",
+            content_id="c2",
+        ),
+        Document(
+            content="Green curry is a spicy Thai curry with coconut milk",
+            meta_data={"cuisine": "Thai", "type": "curry", "spice": 3},
+            name="green_curry",
+            content_id="c3",
+        ),
+        Document(
+            content="Ramen is a Japanese noodle soup",
+            meta_data={"cuisine": "Japanese", "type": "soup", "spice": 1},
+            name="ramen",
+            content_id="c4",
+        ),
+    ]
+
+
+@pytest.fixture(params=["memory", "disk"])
+def numpy_db(request, tmp_path):
+    path = str(tmp_path / "numpydb") if request.param == "disk" else None
+    db = NumpyDb(path=path, embedder=KeywordEmbedder())
+    db.create()
+    return db
+
+
+def test_insert_and_vector_search(numpy_db, sample_documents):
+    numpy_db.insert(content_hash="hash1", documents=sample_documents)
+
+    assert numpy_db.get_count() == 4
+    results = numpy_db.search("curry", limit=2)
+    assert [doc.name for doc in results] == ["green_curry", "tom_kha"]
+    assert 0 < results[1].meta_data["similarity_score"] < results[0].meta_data["similarity_score"] <= 1
+    assert results[0].content_id == "c3"
+
+
+def test_filters_are_applied_before_ranking(numpy_db, sample_documents):
+    numpy_db.insert(content_hash="hash1", documents=sample_documents)
+
+    results = numpy_db.search("coconut curry", limit=5, filters={"type": "soup"})
+    assert [doc.name for doc in results] == ["tom_kha", "ramen"]
+
+    results = numpy_db.search(
+        "noodle", limit=5, filters=[AND(IN("type", ["soup", "noodles"]), NOT(EQ("cuisine", "Japanese")))]
+    )
+    assert [doc.name for doc in results] == ["pad_thai", "tom_kha"]
+
+
+def test_keyword_and_hybrid_search(tmp_path, sample_documents):
+    keyword_db = NumpyDb(embedder=KeywordEmbedder(), search_type=SearchType.keyword)
+    keyword_db.insert(content_hash="hash1", documents=sample_documents)
+    assert [doc.name for doc in keyword_db.search("japanese ramen")] == ["ramen"]
+
+    hybrid_db = NumpyDb(embedder=KeywordEmbedder(), search_type=SearchType.hybrid, vector_score_weight=0.5)
+    hybrid_db.insert(content_hash="hash1", documents=sample_documents)
+    assert hybrid_db.search("Thai coconut soup", limit=1)[0].name == "tom_kha"
+
+
+def test_deletes_and_upserts(numpy_db, sample_documents):
+    numpy_db.insert(content_hash="hash1", documents=sample_documents[:2])
+    numpy_db.insert(content_hash="hash2", documents=sample_documents[2:])
+
+    assert numpy_db.delete_by_name("pad_thai") is True
+    assert numpy_db.delete_by_name("pad_thai") is False
+    assert numpy_db.delete_by_metadata({"cuisine": "Japanese"}) is True
+    assert not numpy_db.name_exists("ramen")
+
+    numpy_db.upsert(content_hash="hash2", documents=[Document(content="Massaman curry", name="massaman")])
+    assert [doc.name for doc in numpy_db.search("curry", limit=5)] == ["massaman", "tom_kha"]
+    assert numpy_db.content_hash_exists("hash2")
+
+    numpy_db.update_metadata("c1", {"rating": 5})
+    assert numpy_db.search("coconut soup", limit=1)[0].meta_data["rating"] == 5
+
+
+def test_duplicate_ids_in_a_batch_keep_the_last_document(numpy_db):
+    documents = [
+        Document(id="x", content="Tom Kha Gai is a coconut soup", name="first"),
+        Document(id="x", content="Green curry is a spicy curry", name="second"),
+    ]
+    numpy_db.upsert(content_hash="hash1", documents=documents)
+
+    assert numpy_db.get_count() == 1
+    results = numpy_db.search("curry soup", limit=5)
+    assert [doc.name for doc in results] == ["second"]
+
+
+def test_store_is_persisted_and_compacted(tmp_path, sample_documents):
+    path = str(tmp_path / "numpydb")
+    db = NumpyDb(path=path, embedder=KeywordEmbedder(), compaction_threshold=None)
+    db.insert(content_hash="hash1", documents=sample_documents)
+    db.delete_by_content_id("c2")
+    db.update_metadata("c1", {"rating": 5})
+
+    reopened = NumpyDb(path=path, embedder=KeywordEmbedder(), compaction_threshold=None)
+    assert reopened.get_count() == 3
+    assert not reopened.name_exists("pad_thai")
+    assert reopened.search("coconut soup", limit=1)[0].meta_data["rating"] == 5
+
+    reopened.optimize()
+    assert len(list((tmp_path / "numpydb").glob("vectors-*.f32"))) == 1
+    reopened.insert(content_hash="hash2", documents=[Document(content="Massaman curry", name="massaman")])
+
+    compacted = NumpyDb(path=path, embedder=KeywordEmbedder())
+    assert compacted.get_count() == 4
+    assert [doc.name for doc in compacted.search("curry", limit=2)] == ["massaman", "green_curry"]
+
+
+def test_interrupted_write_is_ignored(tmp_path, sample_documents):
+    path = tmp_path / "numpydb"
+    db = NumpyDb(path=str(path), embedder=KeywordEmbedder())
+    db.insert(content_hash="hash1", documents=sample_documents[:2])
+    # Vectors written without their records, then a cut record line
+    with open(next(path.glob("vectors-*.f32")), "ab") as f:
+        f.write(b"\x00" * 4 * len(VOCABULARY))
+    with open(path / "records.jsonl", "a") as f:
+        f.write('{"op": "insert", "rec')
+
+    reopened = NumpyDb(path=str(path), embedder=KeywordEmbedder())
+    assert reopened.get_count() == 2
+    reopened.insert(content_hash="hash2", documents=sample_documents[2:3])
+    assert NumpyDb(path=str(path), embedder=KeywordEmbedder()).search("curry", limit=1)[0].name == "green_curry"
+
+
+def test_distance_metrics_rank_closest_first(sample_documents):
+    for distance in Distance:
+        db = NumpyDb(embedder=KeywordEmbedder(), distance=distance)
+        db.insert(content_hash="hash1", documents=sample_documents)
+        assert db.search("rice noodle", limit=1)[0].name == "pad_thai"
+
+
+def test_drop(tmp_path, sample_documents):
+    db = NumpyDb(path=str(tmp_path / "numpydb"), embedder=KeywordEmbedder())
+    db.insert(content_hash="hash1", documents=sample_documents)
+    db.drop()
+
+    assert not db.exists()
+    assert list((tmp_path / "numpydb").iterdir()) == []
+    assert db.search("curry") == []
+
+
+@pytest.mark.asyncio
+async def test_async_insert_and_search(numpy_db, sample_documents):
+    await numpy_db.async_insert(content_hash="hash1", documents=sample_documents)
+
+    results = await numpy_db.async_search("rice noodle", limit=1)
+    assert results[0].name == "pad_thai"
@@ -0,0 +1,36 @@
+"""Tests for the run status stored by background workflow runs."""
+
+import asyncio
+
+import pytest
+
+from agno.db.base import SessionType
+from agno.db.sqlite import SqliteDb
+from agno.run.base import RunStatus
+from agno.workflow import Step, Workflow
+
+
+def failing_step(step_input):
+    raise ValueError("boom")
+
+
+@pytest.mark.asyncio
+async def test_failed_background_run_is_stored_as_error(tmp_path):
+    db = SqliteDb(db_file=str(tmp_path / "agno.db"), runs_table="agno_runs")
+    workflow = Workflow(name="failing", db=db, steps=[Step(name="fail", executor=failing_step, max_retries=0)])
+
+    run_output = await workflow.arun(input="hi", background=True, session_id="s1")
+    assert run_output.status == RunStatus.pending
+
+    stored_run = None
+    for _ in range(100):
+        await asyncio.sleep(0.02)
+        session = db.get_session(session_id="s1", session_type=SessionType.WORKFLOW)
+        stored_run = session.runs[0] if session is not None and session.runs else None
+        if stored_run is not None and stored_run.status == RunStatus.error:
+            break
+
+    assert stored_run is not None
+    assert stored_run.run_id == run_output.run_id
+    assert stored_run.status == RunStatus.error
+    assert stored_run.content == "Background execution failed: boom"